@@ -121,6 +121,10 @@ if(RPU_USE_FASTMOD)
   add_compile_definitions(RPU_USE_FASTMOD)
 endif()
 
+if(RPU_USE_DOUBLE)
+  add_compile_definitions(RPU_USE_DOUBLE)
+endif()
+
 if(RPU_DEBUG)
   add_compile_definitions(RPU_DEBUG)
 endif()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""aihwkit example 24: memory and speed of the hardware-aware weight modifier.
+
+Hardware-aware training of a large analog layer with the weight modifier
+either storing a full modified copy of the weights (default) or generating
+the modified weights lazily per block of rows in forward and backward
+(``lazy_block_size``). For each modifier type, the increase of the peak
+memory during training and the time per training step are printed. Each
+setting runs in a new process, so that the peak memory is not shared.
+
+Note:
+    The memory is measured with the ``resource`` module (Unix only).
+"""
+# pylint: disable=invalid-name
+
+from multiprocessing import get_context
+from resource import getrusage, RUSAGE_SELF
+from time import time
+
+# Imports from PyTorch.
+from torch import manual_seed, randn
+
+# Imports from aihwkit.
+from aihwkit.nn import AnalogLinear
+from aihwkit.optim import AnalogSGD
+from aihwkit.simulator.configs import InferenceRPUConfig
+from aihwkit.simulator.configs.utils import WeightModifierType
+
+SIZE = 4096
+BATCH_SIZE = 10
+N_STEPS = 5
+
+
+def benchmark(modifier_type: WeightModifierType, lazy_block_size: int) -> None:
+    """Train a layer with the given modifier and print memory and time."""
+    manual_seed(2022)
+
+    rpu_config = InferenceRPUConfig()
+    rpu_config.modifier.type = modifier_type
+    rpu_config.modifier.std_dev = 0.05
+    rpu_config.modifier.res = 1 / 32
+    rpu_config.modifier.pdrop = 0.1
+    rpu_config.modifier.lazy_block_size = lazy_block_size
+
+    model = AnalogLinear(SIZE, SIZE, bias=False, rpu_config=rpu_config)
+    opt = AnalogSGD(model.parameters(), lr=0.01)
+    opt.regroup_param_groups(model)
+    x = randn(BATCH_SIZE, SIZE)
+
+    # Peak resident memory in MB (kB on Linux).
+    memory = getrusage(RUSAGE_SELF).ru_maxrss / 1024
+    start = time()
+    for _ in range(N_STEPS):
+        opt.zero_grad()
+        model(x).sum().backward()
+        opt.step()
+    duration = (time() - start) / N_STEPS
+    memory = getrusage(RUSAGE_SELF).ru_maxrss / 1024 - memory
+
+    print('{:<12} lazy_block_size={:<4}  memory: +{:5.1f} MB  step: {:6.1f} ms'.format(
+        modifier_type.name, lazy_block_size, memory, duration * 1000))
+
+
+if __name__ == '__main__':
+    context = get_context('spawn')
+    for wm_type in [WeightModifierType.ADD_NORMAL,
+                    WeightModifierType.MULT_NORMAL,
+                    WeightModifierType.DISCRETIZE]:
+        for block_size in [0, 256]:
+            process = context.Process(target=benchmark, args=(wm_type, block_size))
+            process.start()
+            process.join()
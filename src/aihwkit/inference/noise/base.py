@@ -13,8 +13,8 @@
 
 """Base class for the phenomenological noise models for inference."""
 
-from typing import List, Tuple
-from torch import Tensor
+from typing import List, Sequence, Tuple
+from torch import stack, Tensor
 from torch.autograd import no_grad
 
 from aihwkit.inference.converter.base import BaseConductanceConverter
@@ -118,6 +118,40 @@ class BaseNoiseModel:
 
         return noisy_weights
 
+    @no_grad()
+    def apply_drift_noise_sweep(
+            self,
+            weights: Tensor,
+            nu_drift_list: List[Tensor],
+            t_inference_list: Sequence[float]
+    ) -> Tensor:
+        """Apply the expected drift noise to weights for several inference times.
+
+        The weights are converted to conductances only once and the
+        drift of all time points is generated at once using
+        :meth:`~apply_drift_noise_to_conductance_sweep`.
+
+        Args:
+            weights: weights tensor (usually with programming noise already applied)
+            nu_drift_list: list of drift nu for each conductance slice
+            t_inference_list: assumed times of inference (in sec)
+
+        Returns:
+            ``[len(t_inference_list), *weights.shape]`` tensor with the
+            drifted weights of each inference time
+        """
+        target_conductances, params = self.g_converter.convert_to_conductances(weights)
+
+        noisy_conductances = []
+        for g_target, nu_drift in zip(target_conductances, nu_drift_list):
+            noisy_conductances.append(
+                self.apply_drift_noise_to_conductance_sweep(g_target, nu_drift,
+                                                            t_inference_list))
+
+        noisy_weights = self.g_converter.convert_back_to_weights(noisy_conductances, params)
+
+        return noisy_weights
+
     @no_grad()
     def generate_drift_coefficients(self, g_target: Tensor) -> Tensor:
         """Generate drift coefficients ``nu`` based on the target conductances."""
@@ -154,3 +188,30 @@ class BaseNoiseModel:
             conductance Tensor with applied noise and drift
         """
         raise NotImplementedError
+
+    @no_grad()
+    def apply_drift_noise_to_conductance_sweep(
+            self,
+            g_prog: Tensor,
+            nu_drift: Tensor,
+            t_inference_list: Sequence[float]
+    ) -> Tensor:
+        r"""Apply the noise and drift for several inference time points.
+
+        Note:
+            The default implementation calls
+            :meth:`~apply_drift_noise_to_conductance` for each time
+            point. Noise models can override it to generate all time
+            points at once.
+
+        Args:
+            g_prog: Tensor of conductance values after programming (in :math:`\muS`)
+            nu_drift: drift nu
+            t_inference_list: assumed times of inference (in sec)
+
+        Returns:
+            ``[len(t_inference_list), *g_prog.shape]`` conductance Tensor
+            with applied noise and drift
+        """
+        return stack([self.apply_drift_noise_to_conductance(g_prog, nu_drift, t_inference)
+                      for t_inference in t_inference_list])
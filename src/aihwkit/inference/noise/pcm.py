@@ -13,11 +13,12 @@
 """Phenomenological noise models for PCM devices for inference."""
 
 from copy import deepcopy
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from numpy import log as numpy_log
 from numpy import sqrt
 from torch import abs as torch_abs
+from torch import mul as torch_mul
 from torch import clamp, log, randn_like, Tensor
 from torch.autograd import no_grad
 
@@ -147,3 +148,38 @@ class PCMLikeNoiseModel(BaseNoiseModel):
             g_final = g_prog
 
         return g_final.clamp(min=0.0)
+
+    @no_grad()
+    def apply_drift_noise_to_conductance_sweep(
+            self,
+            g_prog: Tensor,
+            nu_drift: Tensor,
+            t_inference_list: Sequence[float]
+    ) -> Tensor:
+        """Apply the noise and drift for all inference time points at once.
+
+        The time independent factors are computed only once and the
+        drifted conductances are written into one pre-allocated tensor.
+        """
+        q_s = (0.0088 / ((torch_abs(g_prog) /
+                          self.g_max) ** 0.65).clamp(min=1e-3)).clamp(max=0.2)
+        g_final = g_prog.new_empty((len(t_inference_list),) + g_prog.shape)
+
+        for g_t, t_inference in zip(g_final, t_inference_list):
+            t = t_inference + self.t_0
+
+            # drift
+            if t > self.t_0:
+                torch_mul(nu_drift, - numpy_log(t / self.t_0), out=g_t)
+                g_t.exp_().mul_(g_prog)
+            else:
+                g_t.copy_(g_prog)
+
+            # expected accumulated 1/f noise since start of programming at t=0
+            if t > 0:
+                sig_noise = sqrt(numpy_log((t + self.t_read) / (2 * self.t_read)))
+                noise = randn_like(g_prog).mul_(q_s)
+                noise.mul_(torch_abs(g_t)).mul_(self.read_noise_scale * sig_noise)
+                g_t.add_(noise)
+
+        return g_final.clamp_(min=0.0)
@@ -12,11 +12,13 @@
 
 """Autograd functions for aihwkit."""
 
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
-from torch import Tensor, empty_like
+from torch import Tensor, empty_like, split
 from torch.autograd import Function
+from aihwkit.optim.analog_optimizer import join_update, submit_update, update_tile
 from aihwkit.optim.context import AnalogContext
+from aihwkit.optim.concurrent import map_tiles
 
 
 class AnalogFunctionBase(Function):
@@ -35,6 +37,9 @@ class AnalogFunctionBase(Function):
         Note: Indexed versions can used when analog_ctx.use_indexed is
         set to True.
         """
+        # Wait for the background update of a previous backward pass.
+        join_update(analog_ctx)
+
         # Store in context for using during `backward()`.
         analog_tile = analog_ctx.analog_tile
         ctx.analog_ctx = analog_ctx
@@ -61,6 +66,7 @@ class AnalogFunctionBase(Function):
     ) -> Tuple[Optional[Tensor], Optional[Tensor], Optional[Tensor], Optional[Tensor]]:
         """Execute the backward pass in the analog tile."""
         analog_ctx = ctx.analog_ctx
+        join_update(analog_ctx)
         analog_tile = analog_ctx.analog_tile
         input_, = ctx.saved_tensors
 
@@ -85,10 +91,17 @@ class AnalogFunctionBase(Function):
             else:
                 analog_tile.update(input_, grad_output)
             analog_tile.reset_delta_weights()
+        elif analog_ctx.async_update and not analog_tile.is_cuda:
+            # Update in a background worker (for analog training)
+            submit_update(analog_ctx, input_, grad_output, use_indexed)
+        elif analog_ctx.eager_update or analog_ctx.async_update:
+            # Update directly and release the activations (for analog training,
+            # also for CUDA tiles with async update, as they use the CUDA stream)
+            update_tile(analog_tile, input_, grad_output, use_indexed,
+                        analog_ctx.update_chunk_size)
         else:
             # Store activation and errors for optimizer (for analog training)
-            analog_ctx.analog_input.append(input_)
-            analog_ctx.analog_grad_output.append(grad_output)
+            analog_ctx.store_gradient(input_, grad_output)
 
         return None, grad_input, shared_weights_grad, None
 
@@ -125,3 +138,136 @@ class AnalogIndexedFunction(AnalogFunctionBase):
         analog_ctx.use_indexed = True
         return AnalogFunctionBase.forward(
             ctx, analog_ctx, input_, shared_weights, is_test)
+
+
+class AnalogMappedFunction(Function):
+    """Function that computes the tile grid of a mapped layer concurrently.
+
+    The forward and backward passes of all the tiles of the grid are
+    dispatched to a worker pool (see
+    :func:`~aihwkit.optim.concurrent.map_tiles`). The input is split
+    along ``split_dim`` into the ``in_sizes`` parts. The outputs of
+    all tiles are returned in row-major order of the grid, so that the
+    (digital) output scaling can be applied by the module. The partial
+    gradients of the input are reduced in place.
+
+    The trailing arguments are the analog contexts of the tiles
+    followed by the shared weights of the tiles (in the same order).
+    """
+    # pylint: disable=arguments-differ, abstract-method, too-many-locals
+
+    @staticmethod
+    def forward(
+            ctx: Any,
+            in_sizes: List[int],
+            split_dim: int,
+            max_workers: int,
+            use_indexed: bool,
+            is_test: bool,
+            input_: Tensor,
+            *args: Any) -> Tuple[Tensor, ...]:
+        """Execute the forward pass in all the analog tiles."""
+        n_tiles = len(args) // 2
+        analog_ctxs = args[:n_tiles]
+        shared_weights = args[n_tiles:]
+        n_out = n_tiles // len(in_sizes)
+
+        ctx.in_sizes = in_sizes
+        ctx.split_dim = split_dim
+        ctx.max_workers = max_workers
+        ctx.analog_ctxs = analog_ctxs
+        ctx.shared_weights = shared_weights
+        ctx.save_for_backward(input_)
+
+        def _forward(item: Tuple[AnalogContext, Tensor, Optional[Tensor]]) -> Tensor:
+            analog_ctx, x_input, tile_shared_weights = item
+            join_update(analog_ctx)
+            analog_tile = analog_ctx.analog_tile
+            analog_ctx.use_indexed = use_indexed
+            if tile_shared_weights is not None:
+                analog_tile.ensure_shared_weights(tile_shared_weights)
+                analog_ctx.use_torch_update = True
+            else:
+                analog_ctx.use_torch_update = False
+
+            if use_indexed:
+                return analog_tile.forward_indexed(x_input, is_test)
+            return analog_tile.forward(x_input, is_test)
+
+        splits = split(input_, in_sizes, dim=split_dim)
+        items = [(analog_ctx, splits[idx // n_out], tile_shared_weights)
+                 for idx, (analog_ctx, tile_shared_weights)
+                 in enumerate(zip(analog_ctxs, shared_weights))]
+
+        return tuple(map_tiles(_forward, items, max_workers))
+
+    @staticmethod
+    def backward(
+            ctx: Any,
+            *grad_outputs: Tensor,
+    ) -> Tuple[Optional[Tensor], ...]:
+        """Execute the backward pass in all the analog tiles."""
+        input_, = ctx.saved_tensors
+        n_out = len(ctx.analog_ctxs) // len(ctx.in_sizes)
+
+        def _backward(
+                item: Tuple[AnalogContext, Tensor, Tensor, Optional[Tensor]]
+        ) -> Tuple[Tensor, Optional[Tensor]]:
+            analog_ctx, x_input, grad_output, tile_shared_weights = item
+            join_update(analog_ctx)
+            analog_tile = analog_ctx.analog_tile
+            use_indexed = analog_ctx.use_indexed
+
+            if tile_shared_weights is not None:
+                analog_tile.ensure_shared_weights(tile_shared_weights)
+
+            if use_indexed:
+                grad_input = analog_tile.backward_indexed(grad_output)
+            else:
+                grad_input = analog_tile.backward(grad_output)
+
+            shared_weights_grad = None
+            if analog_ctx.use_torch_update:
+                # Grad computed directly (for inference training)
+                shared_weights_grad = empty_like(tile_shared_weights)
+                analog_tile.set_delta_weights(shared_weights_grad)
+                if use_indexed:
+                    analog_tile.update_indexed(x_input, grad_output)
+                else:
+                    analog_tile.update(x_input, grad_output)
+                analog_tile.reset_delta_weights()
+            elif analog_ctx.async_update and not analog_tile.is_cuda:
+                # Update in a background worker (for analog training)
+                submit_update(analog_ctx, x_input, grad_output, use_indexed)
+            elif analog_ctx.eager_update or analog_ctx.async_update:
+                # Update directly and release the activations (for analog training,
+                # also for CUDA tiles with async update, as they use the CUDA stream)
+                update_tile(analog_tile, x_input, grad_output, use_indexed,
+                            analog_ctx.update_chunk_size)
+            else:
+                # Store activation and errors for optimizer (for analog training)
+                analog_ctx.store_gradient(x_input, grad_output)
+
+            return grad_input, shared_weights_grad
+
+        splits = split(input_, ctx.in_sizes, dim=ctx.split_dim)
+        items = [(analog_ctx, splits[idx // n_out], grad_output, tile_shared_weights)
+                 for idx, (analog_ctx, grad_output, tile_shared_weights)
+                 in enumerate(zip(ctx.analog_ctxs, grad_outputs, ctx.shared_weights))]
+        results = map_tiles(_backward, items, ctx.max_workers)
+
+        # Reduce the partial gradients of the input in place.
+        grad_input = input_.new_empty(input_.size())
+        start = 0
+        for idx, in_size in enumerate(ctx.in_sizes):
+            grad_slice = grad_input.narrow(ctx.split_dim, start, in_size)
+            grad_slice.copy_(results[idx * n_out][0])
+            for grad_partial, _ in results[idx * n_out + 1:(idx + 1) * n_out]:
+                grad_slice.add_(grad_partial)
+            start += in_size
+
+        shared_weights_grads = tuple(shared_weights_grad for _, shared_weights_grad in results)
+        analog_ctxs_grads = (None, ) * len(ctx.analog_ctxs)
+
+        return (None, None, None, None, None, grad_input) + analog_ctxs_grads \
+            + shared_weights_grads
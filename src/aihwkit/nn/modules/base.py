@@ -12,11 +12,11 @@
 
 """Base class for analog Modules."""
 from typing import (
-    Any, Dict, List, Optional, Tuple, NamedTuple, Union,
+    Any, Callable, Dict, List, Optional, Sequence, Tuple, NamedTuple, Union,
     Generator, TYPE_CHECKING
 )
 
-from torch import Tensor, no_grad, ones, float32
+from torch import Tensor, no_grad, ones
 from torch.nn import Module, Parameter
 from torch import device as torch_device
 
@@ -27,6 +27,7 @@ from aihwkit.simulator.configs.configs import (
 )
 from aihwkit.simulator.configs.utils import MappingParameter
 from aihwkit.simulator.tiles import InferenceTile
+from aihwkit.simulator.tiles.checkpoint import AnalogTileCheckpoint
 from aihwkit.optim.context import AnalogContext
 
 if TYPE_CHECKING:
@@ -83,6 +84,7 @@ class AnalogModuleBase(Module):
         self._analog_tile_counter = 0
         self._registered_helper_parameter = []  # type: list
         self._load_rpu_config = True
+        self._analog_checkpoint_writer = None  # type: Optional[Callable]
 
         if mapping is None:
             mapping = MappingParameter()
@@ -130,7 +132,7 @@ class AnalogModuleBase(Module):
         mapping = tile.rpu_config.mapping
         if mapping.learn_out_scaling_alpha:
             if tile.out_scaling_alpha is None:
-                tile.out_scaling_alpha = Parameter(ones([1], device=tile.device, dtype=float32))
+                tile.out_scaling_alpha = Parameter(ones([1], device=tile.device, dtype=tile.dtype))
             elif not isinstance(tile.out_scaling_alpha, Parameter):
                 tile.out_scaling_alpha = Parameter(tile.out_scaling_alpha)
             par_name = self.ANALOG_OUT_SCALING_ALPHA_PREFIX + str(self._analog_tile_counter)
@@ -393,6 +395,12 @@ class AnalogModuleBase(Module):
     def _set_load_rpu_config_state(self, load_rpu_config: bool = True) -> None:
         self._load_rpu_config = load_rpu_config
 
+    def _set_analog_checkpoint_writer(
+            self,
+            checkpoint_writer: Optional[Callable[['BaseTile'], AnalogTileCheckpoint]] = None
+    ) -> None:
+        self._analog_checkpoint_writer = checkpoint_writer
+
     def load_state_dict(self,  # pylint: disable=arguments-differ
                         state_dict: 'OrderedDict[str, Tensor]',
                         strict: bool = True,
@@ -450,16 +458,7 @@ class AnalogModuleBase(Module):
                 key = prefix + 'analog_tile_state'
 
             if key in state_dict:
-                analog_state = state_dict.pop(key).copy()
-
-                if not self._load_rpu_config:
-                    if analog_tile.rpu_config.__class__ != analog_state['rpu_config'].__class__:
-                        raise ModuleError("RPU config mismatch during loading: "
-                                          "Tried to replace "
-                                          f"{analog_state['rpu_config'].__class__.__name__} "
-                                          f"with {analog_tile.rpu_config.__class__.__name__}")
-                    analog_state['rpu_config'] = analog_tile.rpu_config
-                analog_tile.__setstate__(analog_state)
+                self.load_analog_tile_state(analog_tile, state_dict.pop(key))
 
             elif strict:
                 missing_keys.append(key)
@@ -483,6 +482,39 @@ class AnalogModuleBase(Module):
         for key in rm_keys:
             missing_keys.remove(key)
 
+    def load_analog_tile_state(
+            self,
+            analog_tile: 'BaseTile',
+            analog_state: Union[Dict, AnalogTileCheckpoint]
+    ) -> None:
+        """Load the state of an analog tile of this module.
+
+        Args:
+            analog_tile: the analog tile to load.
+            analog_state: the tile state, or the header of a tile state
+                saved in a streaming checkpoint, whose arrays are
+                memory-mapped. Headers are loaded only once.
+
+        Raises:
+            ModuleError: in case the rpu_config class mismatches.
+        """
+        if isinstance(analog_state, AnalogTileCheckpoint):
+            if analog_state.is_loaded:
+                return
+            analog_state.is_loaded = True
+            analog_state = analog_state.load()
+        else:
+            analog_state = analog_state.copy()
+
+        if not self._load_rpu_config:
+            if analog_tile.rpu_config.__class__ != analog_state['rpu_config'].__class__:
+                raise ModuleError("RPU config mismatch during loading: "
+                                  "Tried to replace "
+                                  f"{analog_state['rpu_config'].__class__.__name__} "
+                                  f"with {analog_tile.rpu_config.__class__.__name__}")
+            analog_state['rpu_config'] = analog_tile.rpu_config
+        analog_tile.__setstate__(analog_state)
+
     def state_dict(
             self,
             destination: Any = None,
@@ -494,8 +526,13 @@ class AnalogModuleBase(Module):
 
         current_state = super().state_dict(destination, prefix, keep_vars)
 
+        # Streaming checkpoints write the tile arrays to separate files.
+        checkpoint_writer = getattr(self, '_analog_checkpoint_writer', None)
         for name, analog_tile in self.named_analog_tiles():
-            analog_state = analog_tile.__getstate__()
+            if checkpoint_writer is not None:
+                analog_state = checkpoint_writer(analog_tile)
+            else:
+                analog_state = analog_tile.__getstate__()
             analog_state_name = prefix + self.ANALOG_STATE_PREFIX + name
             current_state[analog_state_name] = analog_state
 
@@ -517,6 +554,65 @@ class AnalogModuleBase(Module):
             if isinstance(analog_tile, InferenceTile):
                 analog_tile.drift_weights(t_inference)
 
+    def drift_analog_weights_sweep(
+            self,
+            t_inference_list: Sequence[float]
+    ) -> Generator[float, None, None]:
+        """(Program) and drift the analog weights to several inference times.
+
+        The drifted weights of all time points are generated at once per
+        tile and the tiles are set to each time point in turn, see
+        :meth:`~aihwkit.simulator.tiles.InferenceTile.drift_weights_sweep`.
+
+        Args:
+            t_inference_list: assumed times of inference (in sec)
+
+        Yields:
+            the inference time the analog weights are currently drifted to.
+
+        Raises:
+            ModuleError: if the layer is not in evaluation mode.
+        """
+        if self.training:
+            raise ModuleError('drift_analog_weights_sweep can only be applied in '
+                              'evaluation mode')
+        sweeps = [analog_tile.drift_weights_sweep(t_inference_list)
+                  for analog_tile in self.analog_tiles()
+                  if isinstance(analog_tile, InferenceTile)]
+        # Each step of the zip sets the weights of all sweeps to the next time.
+        for t_inference, *_ in zip(t_inference_list, *sweeps):
+            yield t_inference
+
+    def program_analog_weights_ensemble(
+            self,
+            n_realizations: int,
+            t_inference: float = 0.0
+    ) -> None:
+        """Program and drift an ensemble of analog weight realizations.
+
+        See
+        :meth:`~aihwkit.simulator.tiles.InferenceTile.program_weights_ensemble`.
+
+        Args:
+            n_realizations: number of weight realizations.
+            t_inference: assumed time of inference (in sec)
+
+        Raises:
+            ModuleError: if the layer is not in evaluation mode.
+        """
+        if self.training:
+            raise ModuleError('program_analog_weights_ensemble can only be applied in '
+                              'evaluation mode')
+        for analog_tile in self.analog_tiles():
+            if isinstance(analog_tile, InferenceTile):
+                analog_tile.program_weights_ensemble(n_realizations, t_inference)
+
+    def clear_analog_weights_ensemble(self) -> None:
+        """Remove the ensemble of analog weight realizations."""
+        for analog_tile in self.analog_tiles():
+            if isinstance(analog_tile, InferenceTile):
+                analog_tile.clear_weights_ensemble()
+
     def program_analog_weights(self) -> None:
         """Program the analog weights.
 
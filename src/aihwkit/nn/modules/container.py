@@ -12,14 +12,19 @@
 
 """Analog Modules that contain children Modules."""
 
-from typing import Callable, Optional, Union, Any, NamedTuple, TYPE_CHECKING
+from typing import (
+    Callable, Generator, Iterable, List, Optional, Sequence, Tuple, Union, Any,
+    NamedTuple, TYPE_CHECKING
+)
 from collections import OrderedDict
 
 from torch import device as torch_device
+from torch import no_grad
 from torch.nn import Sequential
 
 from aihwkit.exceptions import ModuleError, TileError
 from aihwkit.nn.modules.base import AnalogModuleBase
+from aihwkit.simulator.tiles import InferenceTile
 
 if TYPE_CHECKING:
     from torch import Tensor  # pylint: disable=ungrouped-imports
@@ -226,6 +231,163 @@ class AnalogSequential(Sequential):
 
         self._apply_to_analog(lambda m: m.drift_analog_weights(t_inference))
 
+    def drift_analog_weights_sweep(
+            self,
+            t_inference_list: Sequence[float]
+    ) -> Generator[float, None, None]:
+        """(Program) and drift all analog inference layers to several inference times.
+
+        The model is drifted to each time point in turn, so that it can
+        be evaluated once per time point::
+
+            for t_inference in model.drift_analog_weights_sweep(t_inference_list):
+                accuracy[t_inference] = evaluate(model, test_loader)
+
+        Args:
+            t_inference_list: assumed times of inference (in sec)
+
+        Yields:
+            the inference time the analog weights are currently drifted to.
+
+        Raises:
+            ModuleError: if the layer is not in evaluation mode.
+        """
+        if self.training:
+            raise ModuleError('drift_analog_weights_sweep can only be applied in '
+                              'evaluation mode')
+
+        sweeps = []  # type: List[Generator[float, None, None]]
+        self._apply_to_analog(lambda m: sweeps.append(
+            m.drift_analog_weights_sweep(t_inference_list)))
+        # Each step of the zip sets the weights of all sweeps to the next time.
+        for t_inference, *_ in zip(t_inference_list, *sweeps):
+            yield t_inference
+
+    def program_analog_weights_ensemble(
+            self,
+            n_realizations: int,
+            t_inference: float = 0.0
+    ) -> None:
+        """Program and drift an ensemble of realizations of all analog
+        inference layers of a given model.
+
+        The ensemble is evaluated with :meth:`forward_ensemble`, until
+        it is removed with :meth:`clear_analog_weights_ensemble`.
+
+        Args:
+            n_realizations: number of weight realizations.
+            t_inference: assumed time of inference (in sec)
+
+        Raises:
+            ModuleError: if the layer is not in evaluation mode.
+        """
+        if self.training:
+            raise ModuleError('program_analog_weights_ensemble can only be applied in '
+                              'evaluation mode')
+
+        self._apply_to_analog(
+            lambda m: m.program_analog_weights_ensemble(n_realizations, t_inference))
+
+    def clear_analog_weights_ensemble(self) -> None:
+        """Remove the ensemble of realizations of all analog inference layers."""
+        self._apply_to_analog(lambda m: m.clear_analog_weights_ensemble())
+
+    def get_ensemble_size(self) -> int:
+        """Return the number of weight realizations of the ensemble.
+
+        Returns:
+            The number of realizations of the inference tiles.
+
+        Raises:
+            ModuleError: if no ensemble was programmed or the inference
+                tiles have a different number of realizations.
+        """
+        sizes = set()
+        for module in self.modules():
+            if isinstance(module, AnalogModuleBase):
+                sizes.update(analog_tile.get_ensemble_size()
+                             for analog_tile in module.analog_tiles()
+                             if isinstance(analog_tile, InferenceTile))
+        if len(sizes) != 1 or 0 in sizes:
+            raise ModuleError('No common ensemble of the inference tiles. Use '
+                              'program_analog_weights_ensemble first')
+
+        return sizes.pop()
+
+    def forward_ensemble(self, x_input: 'Tensor') -> 'Tensor':
+        """Evaluate all realizations of the ensemble with one model pass.
+
+        The mini-batch is repeated for each realization, so that each
+        analog inference tile evaluates the ``k``-th repetition with its
+        ``k``-th weight realization. The digital layers process the
+        repeated mini-batch at once, while each analog tile computes the
+        realizations one after another.
+
+        Args:
+            x_input: ``[N, ...]`` input mini-batch (batch first).
+
+        Returns:
+            ``[n_realizations, N, ...]`` outputs of each realization.
+
+        Raises:
+            ModuleError: if the layer is not in evaluation mode, or
+                contains analog RNN layers (which expect the sequence
+                first).
+        """
+        # Import the RNN layers dynamically to avoid import cycles.
+        # pylint: disable=import-outside-toplevel
+        from aihwkit.nn.modules.rnn.layers import AnalogRNNLayer, AnalogBidirRNNLayer
+
+        if self.training:
+            raise ModuleError('forward_ensemble can only be applied in '
+                              'evaluation mode')
+        if any(isinstance(module, (AnalogRNNLayer, AnalogBidirRNNLayer))
+               for module in self.modules()):
+            raise ModuleError('forward_ensemble needs the batch as first dimension, '
+                              'which is not the case for analog RNN layers')
+
+        n_realizations = self.get_ensemble_size()
+        x_repeated = x_input.repeat(n_realizations, *([1] * (x_input.dim() - 1)))
+        output = self(x_repeated)
+
+        return output.view(n_realizations, x_input.size(0), *output.shape[1:])
+
+    def ensemble_accuracy(
+            self,
+            data: Iterable[Tuple['Tensor', 'Tensor']]
+    ) -> Tuple['Tensor', 'Tensor', 'Tensor']:
+        """Classification accuracy of each realization of the ensemble.
+
+        Each mini-batch is evaluated only once for all realizations, using
+        :meth:`forward_ensemble`.
+
+        Args:
+            data: iterable of ``(inputs, labels)`` mini-batches, for
+                example a ``DataLoader``.
+
+        Returns:
+            The ``[n_realizations]`` accuracies, and their mean and
+            standard deviation.
+
+        Raises:
+            ModuleError: if no mini-batch is given.
+        """
+        n_correct = None  # type: Optional[Tensor]
+        n_total = 0
+        with no_grad():
+            for x_input, labels in data:
+                output = self.forward_ensemble(x_input)
+                correct = (output.argmax(-1) == labels.unsqueeze(0)).sum(1)
+                n_correct = correct if n_correct is None else n_correct + correct
+                n_total += labels.numel()
+
+        if n_correct is None:
+            raise ModuleError('No data given')
+
+        accuracies = n_correct.double() / n_total
+
+        return accuracies, accuracies.mean(), accuracies.std()
+
     def program_analog_weights(self) -> None:
         """Program all analog inference layers of a given model.
 
@@ -12,7 +12,8 @@
 
 """Convolution layers."""
 
-from typing import Optional, Tuple, Union, List
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple, Union, List
 
 from torch import Tensor, arange, cat, float64, int32, ones
 from torch.nn import Unfold
@@ -25,6 +26,66 @@ from aihwkit.nn.modules.base import AnalogModuleBase, RPUConfigAlias
 from aihwkit.simulator.configs import SingleRPUConfig
 
 
+class FoldIndicesCache:
+    """Least recently used cache of the fold indices of a convolution.
+
+    The fold indices and image sizes are keyed by the shape of an input
+    sample and the device, so that switching between input shapes (e.g.
+    variable resolutions or different training and evaluation shapes)
+    does not re-calculate them.
+
+    Args:
+        max_size: maximal number of cached input shapes.
+    """
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()  # type: OrderedDict
+
+    @staticmethod
+    def get_key(x_input: Tensor) -> Tuple:
+        """Return the cache key of an input.
+
+        Args:
+            x_input: the input tensor.
+
+        Returns:
+            The shape of an input sample and the device of the input.
+        """
+        return (tuple(x_input.shape[1:]), x_input.device)
+
+    def get(self, key: Tuple, calculate: Callable[[], Any]) -> Any:
+        """Return the cached value of a key, calculating it if needed.
+
+        Args:
+            key: the cache key (see :meth:`get_key`).
+            calculate: function that calculates the value on a miss.
+
+        Returns:
+            The cached value.
+        """
+        if key in self._items:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+        self.misses += 1
+        value = calculate()
+        self._items[key] = value
+        while len(self._items) > max(self.max_size, 1):
+            self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all cached values (the counters are kept)."""
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class _AnalogConvNd(AnalogModuleBase, _ConvNd):
     """Base class for convolution layers."""
 
@@ -107,6 +168,8 @@ class _AnalogConvNd(AnalogModuleBase, _ConvNd):
         self.register_helper('fold_indices')
         self.input_size = 0
         self.register_helper('input_size')
+        self.fold_indices_cache = FoldIndicesCache()
+        self.fold_indices_key = None  # type: Optional[Tuple]
         self.tensor_view = (-1,)  # type: Tuple[int, ...]
 
         # Unregister weight/bias as a parameter but keep it for syncs
@@ -135,11 +198,19 @@ class _AnalogConvNd(AnalogModuleBase, _ConvNd):
             self.set_weights(self.weight, self.bias)
 
     def recalculate_indexes(self, x_input: Tensor) -> None:
-        """Calculate and set the indexes of the analog tile."""
+        """Calculate and set the indexes of the analog tile.
 
-        self.fold_indices, image_sizes, self.input_size = \
-            self._calculate_indexes(x_input, self.in_channels)
-        self.analog_tile.set_indexed(self.fold_indices, image_sizes)
+        The indexes are taken from the ``fold_indices_cache`` if the
+        shape of the input was used before. In this case, the tile
+        re-uses its gather plans of the cached indexes.
+        """
+        key = FoldIndicesCache.get_key(x_input)
+        misses = self.fold_indices_cache.misses
+        self.fold_indices, image_sizes, self.input_size = self.fold_indices_cache.get(
+            key, lambda: self._calculate_indexes(x_input, self.in_channels))
+        self.fold_indices_key = key
+        self.analog_tile.set_indexed(self.fold_indices, image_sizes,
+                                     keep_plans=self.fold_indices_cache.misses == misses)
 
     def _calculate_indexes(self, x_input: Tensor,
                            in_channels: int) -> Tuple[Tensor, List[int], int]:
@@ -158,8 +229,8 @@ class _AnalogConvNd(AnalogModuleBase, _ConvNd):
 
     def forward(self, x_input: Tensor) -> Tensor:
         """Compute the forward pass."""
-        input_size = x_input.numel() / x_input.size(0)
-        if self.input_size != input_size or not self.analog_tile.is_indexed():
+        if (self.fold_indices_key != FoldIndicesCache.get_key(x_input)
+                or not self.analog_tile.is_indexed()):
             self.recalculate_indexes(x_input)
 
         out = AnalogIndexedFunction.apply(
@@ -20,8 +20,10 @@ from torch.nn.functional import pad
 from torch.nn.modules.conv import _ConvNd, Conv1d, Conv2d, Conv3d
 from torch.nn.modules.utils import _single, _pair, _triple
 
-from aihwkit.nn.functions import AnalogIndexedFunction
+from aihwkit.nn.functions import AnalogIndexedFunction, AnalogMappedFunction
 from aihwkit.nn.modules.base import AnalogModuleBase, RPUConfigAlias
+from aihwkit.nn.modules.conv import FoldIndicesCache
+from aihwkit.optim.concurrent import get_tile_workers
 from aihwkit.exceptions import ModuleError
 from aihwkit.simulator.configs import SingleRPUConfig
 
@@ -131,6 +133,8 @@ class _AnalogConvNdMapped(AnalogModuleBase, _ConvNd):
         self.register_helper('input_size')
         self.fold_indices_lst = []  # type: List[Tensor]
         self.register_helper('fold_indices_lst')
+        self.fold_indices_cache = FoldIndicesCache()
+        self.fold_indices_key = None  # type: Optional[Tuple]
         self.tensor_view = (-1,)  # type: Tuple[int, ...]
 
         # Unregister weight/bias as a parameter but keep it as a
@@ -207,6 +211,9 @@ class _AnalogConvNdMapped(AnalogModuleBase, _ConvNd):
     def recalculate_indexes(self, x_input: Tensor) -> None:
         """Calculate and set the indexes of the analog tile.
 
+        The indexes are taken from the ``fold_indices_cache`` if the
+        shape of the input was used before.
+
         Args:
             x_input: the input tensor.
 
@@ -218,22 +225,42 @@ class _AnalogConvNdMapped(AnalogModuleBase, _ConvNd):
         self.input_size = x_input.numel() / x_input.size(0)
         if x_input.ndim < 3:
             raise ModuleError("Expect >2-dim inputs to convolutions")
-        channel_dim = 1
+
+        key = FoldIndicesCache.get_key(x_input)
+        misses = self.fold_indices_cache.misses
+        indexes = self.fold_indices_cache.get(key, lambda: self._calculate_split_indexes(x_input))
+        keep_plans = self.fold_indices_cache.misses == misses
+        self.fold_indices_key = key
         self.fold_indices_lst = []
-        splits = split(x_input, self.in_sizes, dim=channel_dim)
-        for x, in_channels, in_tiles in zip(splits, self.in_sizes, self.analog_tile_array):
-            fold_indices, image_sizes, _ = self._calculate_indexes(x, in_channels)
+        for (fold_indices, image_sizes), in_tiles in zip(indexes, self.analog_tile_array):
             self.fold_indices_lst.append(fold_indices)
 
             for analog_tile in in_tiles:
-                analog_tile.set_indexed(fold_indices, image_sizes)
+                analog_tile.set_indexed(fold_indices, image_sizes, keep_plans)
+
+    def _calculate_split_indexes(self, x_input: Tensor) -> List[Tuple[Tensor, List[int]]]:
+        """Calculate the fold indexes and sizes of each split of the input channels.
+
+        Args:
+            x_input: the input tensor.
+
+        Returns:
+            List of the fold indices and image sizes of each split.
+        """
+        channel_dim = 1
+        splits = split(x_input, self.in_sizes, dim=channel_dim)
+        indexes = []
+        for x, in_channels in zip(splits, self.in_sizes):
+            fold_indices, image_sizes, _ = self._calculate_indexes(x, in_channels)
+            indexes.append((fold_indices, image_sizes))
+        return indexes
 
     def forward(self, x_input: Tensor) -> Tensor:
         """Compute the forward pass."""
         # pylint: disable=arguments-differ,arguments-renamed
 
-        input_size = x_input.numel() / x_input.size(0)
-        if self.input_size != input_size or not self.analog_tile_array[0][0].is_indexed():
+        if (self.fold_indices_key != FoldIndicesCache.get_key(x_input)
+                or not self.analog_tile_array[0][0].is_indexed()):
             self.recalculate_indexes(x_input)
 
         if self.analog_tile_count() == 1:
@@ -250,12 +277,14 @@ class _AnalogConvNdMapped(AnalogModuleBase, _ConvNd):
 
         # mapped version
         channel_dim = 1
+        max_workers = get_tile_workers(self.analog_tile_array[0][0])
+        if max_workers > 1:
+            return self._forward_concurrent(x_input, channel_dim, max_workers)
+
         splits = split(x_input, self.in_sizes, dim=channel_dim)
         result = None  # type: Tensor
         for idx, (x, in_tiles) in enumerate(zip(splits, self.analog_tile_array)):
             out_result = []
-            input_size = x.numel() / x.size(0)
-
             for analog_tile in in_tiles:
                 output = AnalogIndexedFunction.apply(
                     analog_tile.get_analog_ctx(), x,
@@ -274,6 +303,40 @@ class _AnalogConvNdMapped(AnalogModuleBase, _ConvNd):
             return result + self.bias.view(*self.tensor_view)
         return result
 
+    def _forward_concurrent(self, x_input: Tensor, channel_dim: int, max_workers: int) -> Tensor:
+        """Compute the forward pass of all tiles concurrently.
+
+        Args:
+            x_input: input tensor
+            channel_dim: dimension of the channels
+            max_workers: number of worker threads
+
+        Returns:
+            The output tensor.
+        """
+        analog_tiles = [analog_tile for in_tiles in self.analog_tile_array
+                        for analog_tile in in_tiles]
+        outputs = AnalogMappedFunction.apply(
+            self.in_sizes, channel_dim, max_workers, True, not self.training, x_input,
+            *[analog_tile.get_analog_ctx() for analog_tile in analog_tiles],
+            *[analog_tile.shared_weights for analog_tile in analog_tiles])
+
+        # Reduce the partial sums in place.
+        n_out = len(self.out_sizes)
+        outputs = [analog_tile.apply_out_scaling(output, self.tensor_view)
+                   for output, analog_tile in zip(outputs, analog_tiles)]
+        result = cat(outputs[:n_out], channel_dim)
+        for idx in range(1, len(self.in_sizes)):
+            out_start = 0
+            for output, out_size in zip(outputs[idx * n_out:(idx + 1) * n_out], self.out_sizes):
+                result.narrow(channel_dim, out_start, out_size).add_(output)
+                out_start += out_size
+
+        # add bias to final result
+        if self.digital_bias:
+            return result + self.bias.view(*self.tensor_view)
+        return result
+
     def set_weights(
             self,
             weight: Tensor,
@@ -17,8 +17,9 @@ from typing import Optional, Tuple, List
 from torch import Tensor, cat, split, no_grad
 from torch.nn import Linear
 
-from aihwkit.nn.functions import AnalogFunction
+from aihwkit.nn.functions import AnalogFunction, AnalogMappedFunction
 from aihwkit.nn.modules.base import AnalogModuleBase, RPUConfigAlias
+from aihwkit.optim.concurrent import get_tile_workers
 from aihwkit.simulator.configs import SingleRPUConfig
 from aihwkit.exceptions import ModuleError
 
@@ -305,6 +306,10 @@ class AnalogLinearMapped(AnalogModuleBase, Linear):
 
         # mapped version
         last_dim = x_input.ndim - 1
+        max_workers = get_tile_workers(self.analog_tile_array[0][0])
+        if max_workers > 1:
+            return self._forward_concurrent(x_input, last_dim, max_workers)
+
         splits = split(x_input, self.in_sizes, dim=last_dim)
         result = None  # type: Tensor
         for idx, (x, in_tiles) in enumerate(zip(splits, self.analog_tile_array)):
@@ -328,6 +333,40 @@ class AnalogLinearMapped(AnalogModuleBase, Linear):
             return result.add_(self.bias)
         return result
 
+    def _forward_concurrent(self, x_input: Tensor, last_dim: int, max_workers: int) -> Tensor:
+        """Compute the forward pass of all tiles concurrently.
+
+        Args:
+            x_input: input tensor
+            last_dim: dimension of the features
+            max_workers: number of worker threads
+
+        Returns:
+            The output tensor.
+        """
+        analog_tiles = [analog_tile for in_tiles in self.analog_tile_array
+                        for analog_tile in in_tiles]
+        outputs = AnalogMappedFunction.apply(
+            self.in_sizes, last_dim, max_workers, False, not self.training, x_input,
+            *[analog_tile.get_analog_ctx() for analog_tile in analog_tiles],
+            *[analog_tile.shared_weights for analog_tile in analog_tiles])
+
+        # Reduce the partial sums in place.
+        n_out = len(self.out_sizes)
+        outputs = [analog_tile.apply_out_scaling(output, (-1, ))
+                   for output, analog_tile in zip(outputs, analog_tiles)]
+        result = cat(outputs[:n_out], last_dim)
+        for idx in range(1, len(self.in_sizes)):
+            out_start = 0
+            for output, out_size in zip(outputs[idx * n_out:(idx + 1) * n_out], self.out_sizes):
+                result.narrow(last_dim, out_start, out_size).add_(output)
+                out_start += out_size
+
+        # add bias to final result
+        if self.digital_bias:
+            return result.add_(self.bias)
+        return result
+
     def extra_repr(self) -> str:
         """Set the extra representation of the module.
 
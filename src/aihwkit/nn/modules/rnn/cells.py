@@ -72,13 +72,41 @@ class AnalogVanillaRNNCell(AnalogSequential):
         device = self.weight_ih.get_analog_tile_devices()[0]
         return zeros(batch_size, self.hidden_size, device=device)
 
+    def project_input(self, input_: Tensor) -> Tensor:
+        """Computes the input projection of a whole sequence.
+
+        The input projection does not depend on the recurrent state, so
+        that ``weight_ih`` is applied to all time steps with one forward
+        of the tile.
+
+        Args:
+            input_: input sequence of shape ``[T, N, input_size]``
+
+        Returns:
+           Projected inputs of shape ``[T, N, out_features]``, to be used
+           with :meth:`forward_projected`
+        """
+        return self.weight_ih(input_.reshape(-1, input_.size(-1))).view(
+            input_.size(0), input_.size(1), -1)
+
     def forward(
             self,
             input_: Tensor,
             state: Tensor
     ) -> Tuple[Tensor, Tensor]:
         # pylint: disable=arguments-differ
-        igates = self.weight_ih(input_)
+        return self.forward_projected(self.weight_ih(input_), state)
+
+    def forward_projected(self, igates: Tensor, state: Tensor) -> Tuple[Tensor, Tensor]:
+        """Computes one step from the projected input.
+
+        Args:
+            igates: projected input of the time step (see :meth:`project_input`)
+            state: recurrent state
+
+        Returns:
+           Output and new state
+        """
         hgates = self.weight_hh(state)
 
         out = tanh(igates + hgates)
@@ -135,12 +163,45 @@ class AnalogLSTMCell(AnalogSequential):
         return LSTMState(zeros(batch_size, self.hidden_size, device=device),
                          zeros(batch_size, self.hidden_size, device=device))
 
+    def project_input(self, input_: Tensor) -> Tensor:
+        """Computes the input projection of a whole sequence.
+
+        The input projection does not depend on the recurrent state, so
+        that ``weight_ih`` is applied to all time steps with one forward
+        of the tile.
+
+        Args:
+            input_: input sequence of shape ``[T, N, input_size]``
+
+        Returns:
+           Projected inputs of shape ``[T, N, out_features]``, to be used
+           with :meth:`forward_projected`
+        """
+        return self.weight_ih(input_.reshape(-1, input_.size(-1))).view(
+            input_.size(0), input_.size(1), -1)
+
     def forward(self, input_: Tensor,
                 state: Tuple[Tensor, Tensor]) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
 
         # pylint: disable=arguments-differ
+        return self.forward_projected(self.weight_ih(input_), state)
+
+    def forward_projected(
+            self,
+            igates: Tensor,
+            state: Tuple[Tensor, Tensor]
+    ) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
+        """Computes one step from the projected input.
+
+        Args:
+            igates: projected input of the time step (see :meth:`project_input`)
+            state: recurrent state
+
+        Returns:
+           Output and new state
+        """
         h_x, c_x = state
-        gates = self.weight_ih(input_) + self.weight_hh(h_x)
+        gates = igates + self.weight_hh(h_x)
         in_gate, forget_gate, cell_gate, out_gate = gates.chunk(4, 1)
 
         in_gate = sigmoid(in_gate)
@@ -270,11 +331,38 @@ class AnalogGRUCell(AnalogSequential):
         device = self.weight_ih.get_analog_tile_devices()[0]
         return zeros(batch_size, self.hidden_size, device=device)
 
+    def project_input(self, input_: Tensor) -> Tensor:
+        """Computes the input projection of a whole sequence.
+
+        The input projection does not depend on the recurrent state, so
+        that ``weight_ih`` is applied to all time steps with one forward
+        of the tile.
+
+        Args:
+            input_: input sequence of shape ``[T, N, input_size]``
+
+        Returns:
+           Projected inputs of shape ``[T, N, out_features]``, to be used
+           with :meth:`forward_projected`
+        """
+        return self.weight_ih(input_.reshape(-1, input_.size(-1))).view(
+            input_.size(0), input_.size(1), -1)
+
     def forward(self, input_: Tensor, state: Tensor) -> Tuple[Tensor, Tensor]:
 
         # pylint: disable=arguments-differ
+        return self.forward_projected(self.weight_ih(input_), state)
+
+    def forward_projected(self, g_i: Tensor, state: Tensor) -> Tuple[Tensor, Tensor]:
+        """Computes one step from the projected input.
 
-        g_i = self.weight_ih(input_)
+        Args:
+            g_i: projected input of the time step (see :meth:`project_input`)
+            state: recurrent state
+
+        Returns:
+           Output and new state
+        """
         g_h = self.weight_hh(state)
         i_r, i_i, i_n = g_i.chunk(3, 1)
         h_r, h_i, h_n = g_h.chunk(3, 1)
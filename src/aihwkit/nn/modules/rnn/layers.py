@@ -12,10 +12,11 @@
 
 """ Analog RNN layers """
 
-from typing import Any, List, Tuple, Type, Union
+from typing import Any, Callable, List, Tuple, Type, Union
 from torch import Tensor, stack, jit, cat
 from torch.nn import ModuleList
 from aihwkit.nn import AnalogSequential
+from aihwkit.simulator.configs.utils import WeightModifierType
 
 
 class AnalogRNNLayer(AnalogSequential):
@@ -25,12 +26,56 @@ class AnalogRNNLayer(AnalogSequential):
         cell: RNNCell type (AnalogLSTMCell/AnalogGRUCell/AnalogVanillaRNNCell/
               AnalogLSTMCellSingleRPU)
         cell_args: arguments to RNNCell (e.g. input_size, hidden_size, rpu_configs)
+
+    Attributes:
+        hoist_input: whether to compute the input projection of the whole
+            sequence with one forward (if supported by the cell, see
+            ``AnalogLSTMCell.project_input``), so that only the recurrent
+            weights are used inside the recurrence. In training mode, the
+            input is not hoisted if the input weights are modified in each
+            forward (see :meth:`modifies_input_weights`).
     """
     # pylint: disable=abstract-method
 
     def __init__(self, cell: Type, *cell_args: Any):
         super().__init__()
         self.cell = cell(*cell_args)
+        self.hoist_input = False
+
+    def get_steps(self, input_: Tensor) -> Tuple[List[Tensor], Callable]:
+        """Returns the inputs of the time steps and the step function.
+
+        Args:
+            input_: input sequence
+
+        Returns:
+            Inputs of the time steps (projected inputs if ``hoist_input``
+            is set) and the function to compute one step
+        """
+        if (self.hoist_input and hasattr(self.cell, 'project_input')
+                and not self.modifies_input_weights()):
+            return list(self.cell.project_input(input_).unbind(0)), self.cell.forward_projected
+        return list(input_.unbind(0)), self.cell
+
+    def modifies_input_weights(self) -> bool:
+        """Returns whether the input weights are modified in each forward.
+
+        In training mode, the weight modifier (if not ``COPY`` or with
+        ``pdrop`` set) draws a new realization of the weights in each
+        forward of a tile. The hoisted input projection would use a
+        single realization for all time steps instead of one per step.
+
+        Returns:
+            Whether the input weights of the cell are modified in each forward
+        """
+        if not self.training or not hasattr(self.cell, 'weight_ih'):
+            return False
+        for analog_tile in self.cell.weight_ih.analog_tiles():
+            modifier = getattr(analog_tile.rpu_config, 'modifier', None)
+            if modifier is not None and (modifier.type != WeightModifierType.COPY
+                                         or modifier.pdrop > 0.0):
+                return True
+        return False
 
     def get_zero_state(self, batch_size: int) -> Tensor:
         """Returns a zeroed state.
@@ -48,49 +93,36 @@ class AnalogRNNLayer(AnalogSequential):
             state: Union[Tuple[Tensor, Tensor], Tensor]
     ) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
         # pylint: disable=arguments-differ
-        inputs = input_.unbind(0)
+        inputs, step = self.get_steps(input_)
         outputs = jit.annotate(List[Tensor], [])
         for input_item in inputs:
-            out, state = self.cell(input_item, state)
+            out, state = step(input_item, state)
             outputs += [out]
         return stack(outputs), state
 
 
-class AnalogReverseRNNLayer(AnalogSequential):
+class AnalogReverseRNNLayer(AnalogRNNLayer):
     """ Analog RNN layer for direction.
 
     Args:
         cell: RNNCell type (AnalogLSTMCell/AnalogGRUCell/AnalogVanillaRNNCell)
         cell_args: arguments to RNNCell (e.g. input_size, hidden_size, rpu_configs)
     """
-    def __init__(self, cell: Type, *cell_args: Any):
-        super().__init__()
-        self.cell = cell(*cell_args)
 
     @staticmethod
     def reverse(lst: List[Tensor]) -> List[Tensor]:
         """ Reverses the list of input tensors. """
         return lst[::-1]
 
-    def get_zero_state(self, batch_size: int) -> Tensor:
-        """Returns a zeroed state.
-
-        Args:
-            batch_size: batch size of the input
-
-        Returns:
-           Zeroed state tensor
-        """
-        return self.cell.get_zero_state(batch_size)
-
     def forward(self, input_: Tensor,
                 state: Union[Tuple[Tensor, Tensor], Tensor]
                 ) -> Tuple[Tensor, Union[Tuple[Tensor, Tensor], Tensor]]:
         # pylint: disable=arguments-differ
-        inputs = self.reverse(input_.unbind(0))
+        inputs, step = self.get_steps(input_)
+        inputs = self.reverse(inputs)
         outputs = jit.annotate(List[Tensor], [])
         for input_values in inputs:
-            out, state = self.cell(input_values, state)
+            out, state = step(input_values, state)
             outputs += [out]
         return stack(self.reverse(outputs)), state
 
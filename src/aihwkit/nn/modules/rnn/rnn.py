@@ -129,6 +129,10 @@ class AnalogRNN(AnalogSequential):
         num_layers: number of serially connected RNN layers
         bidir: if True, becomes a bidirectional RNN
         dropout: dropout applied to output of all RNN layers except last
+        hoist_input: whether to compute the input projections of the
+            whole sequence with one forward of the ``weight_ih`` tiles,
+            and only use the ``weight_hh`` tiles inside the recurrence
+            (for cells with separate input weights)
     """
     # pylint: disable=abstract-method, too-many-arguments
 
@@ -143,7 +147,8 @@ class AnalogRNN(AnalogSequential):
             xavier: bool = False,
             num_layers: int = 1,
             bidir: bool = False,
-            dropout: float = 0.0
+            dropout: float = 0.0,
+            hoist_input: bool = False
             ):
         super().__init__()
 
@@ -162,8 +167,25 @@ class AnalogRNN(AnalogSequential):
                               rpu_config, realistic_read_write])
         self.hidden_size = hidden_size
         self.num_layers = num_layers
+        self.set_hoist_input(hoist_input)
         self.reset_parameters(xavier)
 
+    def set_hoist_input(self, hoist_input: bool = True) -> None:
+        """Sets whether to compute the input projections of whole sequences.
+
+        Args:
+            hoist_input: whether to compute the input projection of the
+                whole sequence with one forward of the ``weight_ih``
+                tiles. The input projection does not depend on the
+                recurrent state, so the results are the same as with
+                the per-step projections, unless the weights are
+                modified in each forward (weight modifier in training
+                mode), in which case the input is not hoisted.
+        """
+        for module in self.modules():
+            if isinstance(module, AnalogRNNLayer):
+                module.hoist_input = hoist_input
+
     def init_layers(
             self,
             weight_init_fn: Callable,
@@ -13,14 +13,103 @@
 """Analog-aware inference optimizer."""
 
 from types import new_class
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type, TYPE_CHECKING
 
-from torch import cat
+from torch import Tensor, cat
 from torch.optim import Optimizer, SGD
 from torch.autograd import no_grad
 
+from aihwkit.optim.concurrent import get_executor, get_tile_workers, map_tiles
 from aihwkit.optim.context import AnalogContext
 
+if TYPE_CHECKING:
+    from aihwkit.simulator.tiles.base import BaseTile
+
+
+def submit_update(
+        analog_ctx: AnalogContext,
+        x_input: Tensor,
+        d_input: Tensor,
+        use_indexed: bool = False
+) -> None:
+    """Submit the update of the tile of a context to a background worker.
+
+    The update waits for the previously submitted update of the same
+    tile, so that the updates of a tile are applied in order.
+
+    Args:
+        analog_ctx: the analog context of the tile.
+        x_input: activations. If ``in_trans`` is set, transposed.
+        d_input: errors. If ``out_trans`` is set, transposed.
+        use_indexed: whether to use the indexed (convolution) update.
+    """
+    analog_tile = analog_ctx.analog_tile
+    gradient_trace = analog_ctx.gradient_trace
+    previous_update = gradient_trace.pending_update
+    chunk_size = analog_ctx.update_chunk_size
+
+    def _update() -> None:
+        if previous_update is not None:
+            previous_update.result()
+        update_tile(analog_tile, x_input, d_input, use_indexed, chunk_size)
+
+    executor = get_executor(max(get_tile_workers(analog_tile), 1))
+    gradient_trace.pending_update = executor.submit(_update)
+
+
+def join_update(analog_ctx: AnalogContext) -> None:
+    """Wait for the background updates of the tile of a context.
+
+    Args:
+        analog_ctx: the analog context of the tile.
+
+    Raises:
+        Exception: the exception raised by a background update.
+    """
+    gradient_trace = analog_ctx.gradient_trace
+    pending_update = gradient_trace.pending_update
+    if pending_update is not None:
+        gradient_trace.pending_update = None
+        pending_update.result()
+
+
+@no_grad()
+def update_tile(
+        analog_tile: 'BaseTile',
+        x_input: Tensor,
+        d_input: Tensor,
+        use_indexed: bool = False,
+        chunk_size: int = 0
+) -> None:
+    """Update the tile, streaming the batch in chunks if requested.
+
+    The batch is split into chunks of at most ``chunk_size`` rows, where
+    an item of the batch (e.g. an image of a convolution) is never split.
+
+    Args:
+        analog_tile: the analog tile.
+        x_input: activations. If ``in_trans`` is set, transposed.
+        d_input: errors. If ``out_trans`` is set, transposed.
+        use_indexed: whether to use the indexed (convolution) update.
+        chunk_size: maximal number of rows of one update (0 if the
+            update is not chunked).
+    """
+    update = analog_tile.update_indexed if use_indexed else analog_tile.update
+
+    x_dim = -1 if analog_tile.in_trans and not use_indexed else 0
+    d_dim = -1 if analog_tile.out_trans and not use_indexed else 0
+    n_items = d_input.size(d_dim)
+    rows_per_item = d_input.numel() // max(n_items * analog_tile.out_size, 1)
+    items_per_chunk = max(chunk_size // max(rows_per_item, 1), 1)
+
+    if chunk_size <= 0 or n_items <= items_per_chunk:
+        update(x_input, d_input)
+        return
+
+    for x_chunk, d_chunk in zip(x_input.split(items_per_chunk, x_dim),
+                                d_input.split(items_per_chunk, d_dim)):
+        update(x_chunk.contiguous(), d_chunk.contiguous())
+
 
 class AnalogOptimizerMixin:
     """Mixin for analog optimizers.
@@ -30,11 +119,24 @@ class AnalogOptimizerMixin:
     ``AnalogOptimizer`` or torch ``Optimizer``.
     """
 
+    update_chunk_size = 0
+    """Maximal number of (unfolded) rows of one analog update (see
+    :class:`AnalogSGD`)."""
+
+    eager_update = False
+    """Whether the analog tiles are updated in the backward pass (see
+    :class:`AnalogSGD`)."""
+
+    async_update = False
+    """Whether the analog tiles are updated in background workers (see
+    :class:`AnalogSGD`)."""
+
     def regroup_param_groups(self, *_: Any) -> None:
         """Reorganize the parameter groups, isolating analog layers.
 
         Update the `param_groups` of the optimizer, moving the parameters for
-        each analog layer to a new single group.
+        each analog layer to a new single group. The update options of the
+        optimizer are set in the analog contexts.
         """
         # Create the new param groups.
         analog_param_groups = []
@@ -45,6 +147,9 @@ class AnalogOptimizerMixin:
                 if isinstance(param, AnalogContext):
                     param.analog_tile.set_learning_rate(
                         self.defaults['lr'])  # type: ignore[attr-defined]
+                    param.update_chunk_size = self.update_chunk_size
+                    param.eager_update = self.eager_update
+                    param.async_update = self.async_update
                     analog_param_groups.append({
                         'params': [param],
                     })
@@ -81,7 +186,14 @@ class AnalogOptimizerMixin:
         # Update non-analog parameters using the given optimizer
         ret = super().step(closure)  # type: ignore[misc]
 
+        # Wait for the background updates.
+        for group in self.param_groups:
+            for param in group['params']:
+                if isinstance(param, AnalogContext):
+                    join_update(param)
+
         # Update analog parameters
+        update_ctxs = []
         for group in self.param_groups:
             learning_rate = group.get('lr')
 
@@ -106,18 +218,13 @@ class AnalogOptimizerMixin:
                         # Forward never used.
                         continue
 
-                    if analog_ctx.use_indexed:
-                        for x_input, d_input in zip(analog_ctx.analog_input,
-                                                    analog_ctx.analog_grad_output):
-                            analog_tile.update_indexed(x_input, d_input)
-                    else:
-                        x_input = cat(analog_ctx.analog_input,
-                                      axis=-1 if analog_tile.in_trans else 0)
-                        d_input = cat(analog_ctx.analog_grad_output,
-                                      axis=-1 if analog_tile.out_trans else 0)
-                        analog_tile.update(x_input, d_input)
-
-                    analog_ctx.reset()
+                    update_ctxs.append(analog_ctx)
+
+        # Tiles are updated concurrently if requested in their mapping.
+        max_workers = max((get_tile_workers(analog_ctx.analog_tile)
+                           for analog_ctx in update_ctxs), default=0)
+        map_tiles(self._update_tile, update_ctxs, max_workers)
+
         # Apply post-update step operations (diffuse, decay, etc).
         # (only here because of unknown params order and shared weights)
         for group in self.param_groups:
@@ -127,6 +234,33 @@ class AnalogOptimizerMixin:
 
         return ret
 
+    @staticmethod
+    def _update_tile(analog_ctx: AnalogContext) -> None:
+        """Update the tile with the stored activations and errors.
+
+        Args:
+            analog_ctx: the analog context of the tile.
+        """
+        analog_tile = analog_ctx.analog_tile
+        chunk_size = analog_ctx.update_chunk_size
+        if analog_ctx.gradient_trace.n_buffered > 0:
+            update_tile(analog_tile, *analog_ctx.get_gradient(), chunk_size=chunk_size)
+
+        if analog_ctx.use_indexed or chunk_size > 0:
+            # Stream the stored items to the tile without concatenating.
+            for x_input, d_input in zip(analog_ctx.analog_input,
+                                        analog_ctx.analog_grad_output):
+                update_tile(analog_tile, x_input, d_input, analog_ctx.use_indexed,
+                            chunk_size)
+        elif analog_ctx.analog_input:
+            x_input = cat(analog_ctx.analog_input,
+                          axis=-1 if analog_tile.in_trans else 0)
+            d_input = cat(analog_ctx.analog_grad_output,
+                          axis=-1 if analog_tile.out_trans else 0)
+            analog_tile.update(x_input, d_input)
+
+        analog_ctx.reset()
+
     def set_learning_rate(self, learning_rate: float = 0.1) -> None:
         """Update the learning rate to a new value.
 
@@ -206,4 +340,56 @@ class AnalogOptimizer(AnalogOptimizerMixin, Optimizer):
 
 
 class AnalogSGD(AnalogOptimizerMixin, SGD):
-    """Implements analog-aware stochastic gradient descent."""
+    """Implements analog-aware stochastic gradient descent.
+
+    The update options are set in the analog contexts of the tiles in
+    :meth:`regroup_param_groups`.
+
+    Args:
+        params: iterable of parameters to optimize.
+        args: positional arguments of ``torch.optim.SGD``.
+        update_chunk_size: maximal number of (unfolded) rows that are given
+            to a tile in one analog update. If larger than 0, the stored
+            activations and errors are streamed to the tile in chunks of
+            at most this number of rows (or at least one image for
+            convolutions), instead of being concatenated first. This
+            bounds the peak memory of the optimizer step. The pulsed
+            updates are applied sample by sample either way.
+        eager_update: whether to update the analog tiles directly in the
+            backward pass (in chunks, see ``update_chunk_size``), releasing
+            the activations immediately instead of storing them until the
+            optimizer step. The learning rate set in the last optimizer
+            step is used.
+        async_update: whether to update the analog tiles in background
+            workers as soon as the backward pass of a tile is finished.
+            The updates overlap with the backward passes of the earlier
+            layers, and :meth:`step` waits for them to finish (re-raising
+            their exceptions) before the post update step. The updates of
+            a tile are applied in the order of the backward passes, with
+            the learning rate set in the last optimizer step. The number
+            of background workers is given by the ``tile_workers`` of the
+            ``mapping`` field of the ``rpu_config`` (at least one). CUDA
+            tiles are updated eagerly instead (as for ``eager_update``),
+            as they use the current CUDA stream.
+        kwargs: keyword arguments of ``torch.optim.SGD``.
+
+    Caution:
+        With ``eager_update`` or ``async_update`` the weights (might)
+        change during the backward pass, thus later backward passes of
+        the same tile (e.g. for earlier time steps of recurrent networks)
+        use the updated weights.
+    """
+
+    def __init__(
+            self,
+            params: Any,
+            *args: Any,
+            update_chunk_size: int = 0,
+            eager_update: bool = False,
+            async_update: bool = False,
+            **kwargs: Any
+    ):
+        self.update_chunk_size = update_chunk_size
+        self.eager_update = eager_update
+        self.async_update = async_update
+        super().__init__(params, *args, **kwargs)
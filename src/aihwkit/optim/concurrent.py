@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Concurrent execution of analog tiles."""
+
+from concurrent.futures import ThreadPoolExecutor
+from os import getpid
+from threading import Lock
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING
+
+from torch.autograd import no_grad
+
+if TYPE_CHECKING:
+    from aihwkit.simulator.tiles.base import BaseTile
+
+_EXECUTORS = {}  # type: Dict[Tuple[int, int], ThreadPoolExecutor]
+_EXECUTORS_LOCK = Lock()
+
+
+def get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared worker pool with the given number of workers.
+
+    The pools are created once per process (and number of workers) and
+    are re-used for all the tiles.
+
+    Args:
+        max_workers: number of worker threads.
+
+    Returns:
+        The worker pool.
+    """
+    key = (getpid(), max_workers)
+    with _EXECUTORS_LOCK:
+        if key not in _EXECUTORS:
+            _EXECUTORS[key] = ThreadPoolExecutor(max_workers=max_workers,
+                                                 thread_name_prefix='aihwkit_tile')
+        return _EXECUTORS[key]
+
+
+def get_tile_workers(analog_tile: 'BaseTile') -> int:
+    """Return the number of workers to be used for the given tile.
+
+    Args:
+        analog_tile: the analog tile.
+
+    Returns:
+        The number of workers as specified in the ``mapping`` field of
+        the ``rpu_config`` of the tile. CUDA tiles are always computed
+        sequentially (0 workers), as they use the current CUDA stream.
+    """
+    if analog_tile.is_cuda:
+        return 0
+    mapping = getattr(analog_tile.rpu_config, 'mapping', None)
+    if mapping is None:
+        return 0
+    return mapping.tile_workers
+
+
+def map_tiles(function: Callable, items: Sequence, max_workers: int) -> List[Any]:
+    """Apply a function to a sequence of (tile) items.
+
+    The items are dispatched to a worker pool if ``max_workers`` is
+    larger than 1, otherwise the function is applied sequentially.
+
+    Note:
+        The tile bindings release the GIL, thus different tiles are
+        computed concurrently. The items are hence expected to refer
+        to different tiles.
+
+    Args:
+        function: function to apply to each of the items.
+        items: the items (typically tuples that contain an analog tile).
+        max_workers: number of worker threads.
+
+    Returns:
+        List of the results in the order of the ``items``.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+
+    def _call(item: Any) -> Any:
+        # Grad mode is thread local.
+        with no_grad():
+            return function(item)
+
+    return list(get_executor(max_workers).map(_call, items))
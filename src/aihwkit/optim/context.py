@@ -12,7 +12,8 @@
 
 """Parameter context for analog tiles."""
 
-from typing import Optional, Type, Union, Any, TYPE_CHECKING
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple, Type, Union, Any, TYPE_CHECKING
 
 from torch import ones, dtype, Tensor, no_grad
 from torch.nn import Parameter
@@ -22,8 +23,118 @@ if TYPE_CHECKING:
     from aihwkit.simulator.tiles.base import BaseTile
 
 
+class GradientTrace:
+    """Activations and errors of the backward passes of an analog tile.
+
+    For tiles that are not transposed and not indexed, they are written
+    directly into contiguous buffers that grow as needed and are re-used
+    across the updates. Otherwise they are stored in the ``analog_input``
+    and ``analog_grad_output`` lists. The trace also holds the pending
+    background update of the tile, if any.
+    """
+
+    def __init__(self) -> None:
+        self.analog_input = []  # type: list
+        self.analog_grad_output = []  # type: list
+        self.input_buffer = None  # type: Optional[Tensor]
+        self.grad_output_buffer = None  # type: Optional[Tensor]
+        self.n_buffered = 0
+        self.pending_update = None  # type: Optional[Future]
+
+    def __getstate__(self) -> Dict:
+        """Get the state for pickling (without the buffers)."""
+        current_dict = self.__dict__.copy()
+        current_dict['input_buffer'] = None
+        current_dict['grad_output_buffer'] = None
+        current_dict['n_buffered'] = 0
+        current_dict['pending_update'] = None
+
+        return current_dict
+
+    def reset(self) -> None:
+        """Reset the stored activations and errors (keeping the buffers)."""
+        self.analog_input = []
+        self.analog_grad_output = []
+        self.n_buffered = 0
+
+    def release(self) -> None:
+        """Reset the stored activations and errors and free the buffers."""
+        self.reset()
+        self.input_buffer = None
+        self.grad_output_buffer = None
+
+    def has_gradient(self) -> bool:
+        """Return whether activations and errors were stored."""
+        return len(self.analog_input) > 0 or self.n_buffered > 0
+
+    def append(self, input_: Tensor, grad_output: Tensor) -> None:
+        """Append the activations and errors to the lists.
+
+        Args:
+            input_: input of the forward pass.
+            grad_output: gradient of the output.
+        """
+        self.analog_input.append(input_)
+        self.analog_grad_output.append(grad_output)
+
+    def store(self, x_input: Tensor, d_input: Tensor) -> None:
+        """Copy the activations and errors into the buffers.
+
+        Args:
+            x_input: ``[N, in_size]`` activations.
+            d_input: ``[N, out_size]`` errors.
+        """
+        start = self.n_buffered
+        end = start + x_input.size(0)
+        self._reserve(end, x_input, d_input)
+
+        with no_grad():
+            self.input_buffer[start:end].copy_(x_input)  # type: ignore
+            self.grad_output_buffer[start:end].copy_(d_input)  # type: ignore
+        self.n_buffered = end
+
+    def get_buffered(self) -> Tuple[Tensor, Tensor]:
+        """Return views of the buffered activations and errors."""
+        return (self.input_buffer[:self.n_buffered],  # type: ignore
+                self.grad_output_buffer[:self.n_buffered])  # type: ignore
+
+    @staticmethod
+    def _fits(buffer: Optional[Tensor], n_rows: int, values: Tensor) -> bool:
+        """Return whether a buffer can hold ``n_rows`` rows like ``values``."""
+        return (buffer is not None
+                and buffer.size(0) >= n_rows
+                and buffer.size(1) == values.size(1)
+                and buffer.dtype == values.dtype
+                and buffer.device == values.device)
+
+    def _reserve(self, n_rows: int, x_input: Tensor, d_input: Tensor) -> None:
+        """Grow the buffers (at least doubling) to hold ``n_rows`` rows."""
+        input_buffer = self.input_buffer
+        grad_output_buffer = self.grad_output_buffer
+        input_fits = self._fits(input_buffer, n_rows, x_input)
+        grad_output_fits = self._fits(grad_output_buffer, n_rows, d_input)
+        if input_fits and grad_output_fits:
+            return
+
+        n_rows = max(n_rows, 2 * input_buffer.size(0)) if input_buffer is not None else n_rows
+        self.input_buffer = x_input.new_empty((n_rows, x_input.size(1)))
+        self.grad_output_buffer = d_input.new_empty((n_rows, d_input.size(1)))
+        if self.n_buffered > 0:
+            with no_grad():
+                self.input_buffer[:self.n_buffered].copy_(input_buffer[:self.n_buffered])
+                self.grad_output_buffer[:self.n_buffered].copy_(
+                    grad_output_buffer[:self.n_buffered])
+
+
 class AnalogContext(Parameter):
-    """Context for analog optimizer."""
+    """Context for analog optimizer.
+
+    The activations and errors of the backward passes are stored in the
+    ``gradient_trace`` (see :class:`GradientTrace`) for the update of the
+    optimizer. The contiguous buffers of the trace are kept across the
+    updates; use :meth:`release_buffers` to free their memory, e.g. after
+    training.
+    """
 
     def __new__(cls: Type['AnalogContext'], analog_tile: 'BaseTile',
                 parameter: Optional[Parameter] = None) -> 'AnalogContext':
@@ -40,10 +151,22 @@ class AnalogContext(Parameter):
         self.analog_tile = analog_tile
         self.use_torch_update = False
         self.use_indexed = False
-        self.analog_input = []  # type: list
-        self.analog_grad_output = []  # type: list
+        self.gradient_trace = GradientTrace()
+        self.update_chunk_size = 0
+        self.eager_update = False
+        self.async_update = False
         self.reset(analog_tile)
 
+    @property
+    def analog_input(self) -> list:
+        """Stored activations that are not buffered."""
+        return self.gradient_trace.analog_input
+
+    @property
+    def analog_grad_output(self) -> list:
+        """Stored errors that are not buffered."""
+        return self.gradient_trace.analog_grad_output
+
     def set_data(self, data: Tensor) -> None:
         """Set the data value of the Tensor."""
         # pylint: disable=attribute-defined-outside-init
@@ -56,17 +179,49 @@ class AnalogContext(Parameter):
         return self.data.detach()
 
     def reset(self, analog_tile: Optional['BaseTile'] = None) -> None:
-        """Reset the gradient trace and optionally sets the tile pointer."""
+        """Reset the gradient trace and optionally sets the tile pointer.
+
+        The gradient buffers are kept for the next updates, unless the
+        tile pointer is set.
+        """
         if analog_tile is not None:
             self.analog_tile = analog_tile
             self.analog_tile.analog_ctx = self
+            self.gradient_trace.release()
 
-        self.analog_input = []
-        self.analog_grad_output = []
+        self.gradient_trace.reset()
+
+    def release_buffers(self) -> None:
+        """Reset the gradient trace and free the memory of its buffers."""
+        self.gradient_trace.release()
 
     def has_gradient(self) -> bool:
         """Return whether a gradient trace was stored."""
-        return len(self.analog_input) > 0
+        return self.gradient_trace.has_gradient()
+
+    def store_gradient(self, input_: Tensor, grad_output: Tensor) -> None:
+        """Store the activations and errors of a backward pass for the update.
+
+        Args:
+            input_: input of the forward pass.
+            grad_output: gradient of the output.
+        """
+        analog_tile = self.analog_tile
+        if self.use_indexed or analog_tile.in_trans or analog_tile.out_trans:
+            self.gradient_trace.append(input_, grad_output)
+            return
+
+        self.gradient_trace.store(input_.reshape(-1, input_.size(-1)),
+                                  grad_output.reshape(-1, grad_output.size(-1)))
+
+    def get_gradient(self) -> Tuple[Tensor, Tensor]:
+        """Return the buffered activations and errors.
+
+        Returns:
+            Views of the ``[N, in_size]`` activations and ``[N, out_size]``
+            errors that were stored since the last reset.
+        """
+        return self.gradient_trace.get_buffered()
 
     def cuda(
             self,
@@ -24,7 +24,7 @@ from aihwkit.simulator.configs.helpers import (
 )
 from aihwkit.simulator.configs.utils import (
     IOParameters, PulseType, UpdateParameters, WeightClipParameter,
-    WeightModifierParameter, MappingParameter
+    WeightModifierParameter, MappingParameter, RPUDataType
 )
 from aihwkit.inference import (
     BaseDriftCompensation, BaseNoiseModel, GlobalDriftCompensation,
@@ -40,11 +40,14 @@ if TYPE_CHECKING:
 
 @dataclass
 class MapableRPU(_PrintableMixin):
-    """Defines the mapping parameters and utility factories"""
+    """Defines the mapping parameters, the data type and utility factories"""
 
     mapping: MappingParameter = field(default_factory=MappingParameter)
     """Parameter related to mapping weights to tiles for supporting modules."""
 
+    dtype: RPUDataType = RPUDataType.FLOAT
+    """Data type of the tiles (see :class:`~aihwkit.simulator.configs.utils.RPUDataType`)."""
+
     def get_linear(self) -> Union[Type['AnalogLinear'], Type['AnalogLinearMapped']]:
         """Returns a AnalogLinear module as specified """
         # pylint: disable=import-outside-toplevel
@@ -26,7 +26,7 @@ from aihwkit.simulator.configs.helpers import (
 )
 from aihwkit.simulator.configs.utils import (
     IOParameters, UpdateParameters, VectorUnitCellUpdatePolicy,
-    DriftParameter, SimpleDriftParameter
+    DriftParameter, SimpleDriftParameter, RPUDataType
 )
 from aihwkit.simulator.rpu_base import devices
 
@@ -49,9 +49,16 @@ class FloatingPointDevice(_PrintableMixin):
     drift: SimpleDriftParameter = field(default_factory=SimpleDriftParameter)
     """Parameter governing a power-law drift."""
 
-    def as_bindings(self) -> devices.FloatingPointTileParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        return parameters_to_bindings(self)
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.FloatingPointTileParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        return parameters_to_bindings(self, data_type)
 
     def requires_diffusion(self) -> bool:
         """Return whether device has diffusion enabled."""
@@ -263,9 +270,16 @@ class PulsedDevice(_PrintableMixin):
     respectively.
     """
 
-    def as_bindings(self) -> devices.PulsedResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        return parameters_to_bindings(self)
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.PulsedResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        return parameters_to_bindings(self, data_type)
 
     def requires_diffusion(self) -> bool:
         """Return whether device has diffusion enabled."""
@@ -285,8 +299,15 @@ class UnitCell(_PrintableMixin):
     unit_cell_devices: List = field(default_factory=list)
     """Devices that compose this unit cell."""
 
-    def as_bindings(self) -> devices.VectorResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.VectorResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
         raise NotImplementedError
 
     def requires_diffusion(self) -> bool:
@@ -323,9 +344,16 @@ class IdealDevice(_PrintableMixin):
     lifetime: float = 0.0
     r"""One over `decay_rate`, ie :math:`1/r_\text{decay}`."""
 
-    def as_bindings(self) -> devices.IdealResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        return parameters_to_bindings(self)
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.IdealResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        return parameters_to_bindings(self, data_type)
 
     def requires_diffusion(self) -> bool:
         """Return whether device has diffusion enabled."""
@@ -650,11 +678,18 @@ class SoftBoundsPmaxDevice(SoftBoundsDevice):
     dw_min: float = field(default_factory=lambda: None, metadata={'hide_if': None})  # type: ignore
     up_down: float = field(default_factory=lambda: None, metadata={'hide_if': None})  # type: ignore
 
-    def as_bindings(self) -> devices.PulsedResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.PulsedResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
         params = SoftBoundsDevice()
         for key, value in self.__dict__.items():
-            if key not in ['range_min', 'range_max', 'alpha', 'p_max']:
+            if key not in ['range_min', 'range_max', 'alpha', 'p_max'] and not key.startswith('_'):
                 setattr(params, key, value)
 
         b_factor = (self.range_max - self.range_min)/(1 - exp(-self.p_max * self.alpha))
@@ -663,7 +698,7 @@ class SoftBoundsPmaxDevice(SoftBoundsDevice):
         params.dw_min = b_factor * self.alpha
         params.up_down = 1 + 2 * self.range_min / b_factor
 
-        return parameters_to_bindings(params)
+        return parameters_to_bindings(params, data_type)
 
 
 @dataclass
@@ -1480,9 +1515,48 @@ class JARTv1bDevice(PulsedDevice):
     for ``rdisc`` during the random walk process.
     Read `Zhenming Yu & al., Asilomar, 2022`_ for more information."""
 
-    def as_bindings(self) -> devices.PulsedResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        return parameters_to_bindings(self)
+    lut_update: bool = False
+    """Whether to use tabulated pulses for the update.
+
+    The change of ``Ndisc`` by a single SET and RESET pulse is
+    precomputed on a (logarithmic) grid of ``Ndisc`` values when the
+    tile is created and is linearly interpolated during the update,
+    instead of integrating the model equations for each pulse.
+    Cycle-to-cycle variations are not supported in this mode. Only
+    used by the CPU tiles.
+    """
+
+    lut_size: int = 64
+    """Initial number of grid points of the pulse tables.
+
+    The grid is refined until the interpolation error is within
+    ``lut_tolerance``.
+    """
+
+    lut_tolerance: float = 1e-3
+    """Tolerance of the interpolation error of the pulse tables, relative
+    to the largest change of ``Ndisc`` by a single pulse."""
+
+    lut_dtod_resolution: float = 0.01
+    """Relative resolution of the device-to-device variations of the
+    pulse tables.
+
+    Devices whose ``Ndiscmax`` (or ``Ndiscmin``), ``ldisc`` and
+    ``rdisc`` area are within this relative resolution share a pulse
+    table. Smaller values are more accurate, but more tables have to
+    be computed.
+    """
+
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.PulsedResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        return parameters_to_bindings(self, data_type)
 
     def requires_diffusion(self) -> bool:
         """Diffusion not supported for RRAM."""
@@ -1527,15 +1601,22 @@ class VectorUnitCell(UnitCell):
     amounts (:math:`1/n`).
     """
 
-    def as_bindings(self) -> devices.VectorResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        vector_parameters = parameters_to_bindings(self)
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.VectorResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        vector_parameters = parameters_to_bindings(self, data_type)
 
         if not isinstance(self.unit_cell_devices, list):
             raise ConfigError('unit_cell_devices should be a list of devices')
 
         for param in self.unit_cell_devices:
-            device_parameters = param.as_bindings()
+            device_parameters = param.as_bindings(data_type)
             if not vector_parameters.append_parameter(device_parameters):
                 raise ConfigError('Could not add unit cell device parameter')
 
@@ -1587,9 +1668,16 @@ class ReferenceUnitCell(UnitCell):
         the default ``[1, -1]`` to implement the reference device subtraction.
     """
 
-    def as_bindings(self) -> devices.VectorResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        vector_parameters = parameters_to_bindings(self)
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.VectorResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        vector_parameters = parameters_to_bindings(self, data_type)
 
         if not isinstance(self.unit_cell_devices, list):
             raise ConfigError('unit_cell_devices should be a list of devices')
@@ -1603,7 +1691,7 @@ class ReferenceUnitCell(UnitCell):
             raise ConfigError('ReferenceUnitCell expects two unit_cell_devices')
 
         for param in self.unit_cell_devices:
-            device_parameters = param.as_bindings()
+            device_parameters = param.as_bindings(data_type)
             if not vector_parameters.append_parameter(device_parameters):
                 raise ConfigError('Could not add unit cell device parameter')
 
@@ -1702,14 +1790,20 @@ class OneSidedUnitCell(UnitCell):
     the negative updates instead of the positive half of the second
     device."""
 
-    def as_bindings(self) -> devices.OneSidedResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator
-        bindings object."""
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.OneSidedResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
         if not isinstance(self.unit_cell_devices, list):
             raise ConfigError('unit_cell_devices should be a list of devices')
 
-        onesided_parameters = parameters_to_bindings(self)
-        device_parameter0 = self.unit_cell_devices[0].as_bindings()
+        onesided_parameters = parameters_to_bindings(self, data_type)
+        device_parameter0 = self.unit_cell_devices[0].as_bindings(data_type)
 
         if len(self.unit_cell_devices) == 0 or len(self.unit_cell_devices) > 2:
             raise ConfigError('Need 1 or 2 unit_cell_devices')
@@ -1717,7 +1811,7 @@ class OneSidedUnitCell(UnitCell):
         if len(self.unit_cell_devices) == 1:
             device_parameter1 = device_parameter0
         else:
-            device_parameter1 = self.unit_cell_devices[1].as_bindings()
+            device_parameter1 = self.unit_cell_devices[1].as_bindings(data_type)
 
         # need to be exactly 2 and same parameters
         if not onesided_parameters.append_parameter(device_parameter0):
@@ -1934,17 +2028,24 @@ class TransferCompound(UnitCell):
     define the type of update used for each transfer event.
     """
 
-    def as_bindings(self) -> devices.TransferResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.TransferResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
         if not isinstance(self.unit_cell_devices, list):
             raise ConfigError('unit_cell_devices should be a list of devices')
 
         n_devices = len(self.unit_cell_devices)
 
-        transfer_parameters = parameters_to_bindings(self)
+        transfer_parameters = parameters_to_bindings(self, data_type)
 
-        param_fast = self.unit_cell_devices[0].as_bindings()
-        param_slow = self.unit_cell_devices[1].as_bindings()
+        param_fast = self.unit_cell_devices[0].as_bindings(data_type)
+        param_slow = self.unit_cell_devices[1].as_bindings(data_type)
 
         if not transfer_parameters.append_parameter(param_fast):
             raise ConfigError('Could not add unit cell device parameter')
@@ -2021,8 +2122,15 @@ class DigitalRankUpdateCell(_PrintableMixin):
                   ReferenceUnitCell] = field(default_factory=ConstantStepDevice)
     """(Analog) device that are used for forward and backward."""
 
-    def as_bindings(self) -> devices.AbstractResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.AbstractResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
         raise NotImplementedError
 
     def requires_diffusion(self) -> bool:
@@ -2123,10 +2231,17 @@ class MixedPrecisionCompound(DigitalRankUpdateCell):
     error vector. Quantization can be turned off by setting this to 0.
     """
 
-    def as_bindings(self) -> devices.MixedPrecResistiveDeviceParameter:
-        """Return a representation of this instance as a simulator bindings object."""
-        mixed_prec_parameter = parameters_to_bindings(self)
-        param_device = self.device.as_bindings()
+    def as_bindings(
+            self,
+            data_type: RPUDataType = RPUDataType.FLOAT
+    ) -> devices.MixedPrecResistiveDeviceParameter:
+        """Return a representation of this instance as a simulator bindings object.
+
+        Args:
+            data_type: data type of the simulator tile.
+        """
+        mixed_prec_parameter = parameters_to_bindings(self, data_type)
+        param_device = self.device.as_bindings(data_type)
 
         if not mixed_prec_parameter.set_device_parameter(param_device):
             raise ConfigError('Could not add device parameter')
@@ -15,17 +15,56 @@
 from dataclasses import Field, fields, is_dataclass
 from enum import Enum
 from textwrap import indent
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Type, TYPE_CHECKING
+from weakref import ref
 
+from torch import float64
+
+from aihwkit.exceptions import ConfigError
 from aihwkit.simulator.rpu_base import devices, tiles
 
+if TYPE_CHECKING:
+    from aihwkit.simulator.configs.utils import RPUDataType
+
+
+def get_bindings_class(bindings_class: Type, data_type: Optional['RPUDataType'] = None) -> Type:
+    """Return the bindings class for the given data type.
+
+    The double precision bindings classes have a ``Double`` suffix.
+    Bindings classes that do not depend on the data type are returned
+    unchanged.
+
+    Args:
+        bindings_class: the (single precision) bindings class.
+        data_type: the data type of the simulator tile.
+
+    Returns:
+        The bindings class.
+
+    Raises:
+        ConfigError: if double precision is requested, but aihwkit was
+            compiled without double precision tiles.
+    """
+    if data_type is None or data_type.as_torch() != float64:
+        return bindings_class
+
+    if not hasattr(tiles, 'FloatingPointTileDouble'):
+        raise ConfigError('aihwkit has not been compiled with double precision '
+                          'tiles (RPU_USE_DOUBLE)')
+
+    name = bindings_class.__name__ + 'Double'
+    for module in (devices, tiles):
+        if hasattr(module, name):
+            return getattr(module, name)
+    return bindings_class
+
 
-def parameters_to_bindings(params: Any) -> Any:
+def parameters_to_bindings(params: Any, data_type: Optional['RPUDataType'] = None) -> Any:
     """Convert a dataclass parameter into a bindings class."""
-    result = params.bindings_class()
+    result = get_bindings_class(params.bindings_class, data_type)()
     for field, value in params.__dict__.items():
         # Convert enums to the bindings enums.
-        if field in ('unit_cell_devices', 'device', 'mapping'):
+        if field in ('unit_cell_devices', 'device', 'mapping') or field.startswith('_'):
             # Exclude special fields that are not present in the bindings.
             continue
 
@@ -37,7 +76,7 @@ def parameters_to_bindings(params: Any) -> Any:
             enum_value = getattr(enum_class, value.value)
             setattr(result, field, enum_value)
         elif is_dataclass(value):
-            setattr(result, field, parameters_to_bindings(value))
+            setattr(result, field, parameters_to_bindings(value, data_type))
         else:
             setattr(result, field, value)
 
@@ -49,15 +88,16 @@ def tile_parameters_to_bindings(params: Any) -> Any:
     field_map = {'forward': 'forward_io',
                  'backward': 'backward_io'}
     excluded_fields = ('device', 'noise_model', 'drift_compensation',
-                       'clip', 'modifier', 'mapping')
+                       'clip', 'modifier', 'mapping', 'dtype')
 
-    result = params.bindings_class()
+    data_type = getattr(params, 'dtype', None)
+    result = get_bindings_class(params.bindings_class, data_type)()
     for field, value in params.__dict__.items():
         # Get the mapped field name, if needed.
         field = field_map.get(field, field)
 
         # Convert enums to the bindings enums.
-        if field in excluded_fields:
+        if field in excluded_fields or field.startswith('_'):
             # Exclude special fields that are not present in the bindings.
             continue
 
@@ -66,14 +106,73 @@ def tile_parameters_to_bindings(params: Any) -> Any:
             enum_value = getattr(enum_class, value.value)
             setattr(result, field, enum_value)
         elif is_dataclass(value):
-            setattr(result, field, parameters_to_bindings(value))
+            setattr(result, field, parameters_to_bindings(value, data_type))
         else:
             setattr(result, field, value)
 
     return result
 
 
-class _PrintableMixin:
+class _VersionedMixin:
+    """Helper class for counting the changes of config dataclasses.
+
+    Each assignment of a field increases the version of the dataclass
+    and of the dataclasses it is a field of, so that objects derived
+    from a (nested) config can be cached by version.
+
+    Note:
+        Only assignments are counted. In-place changes of list fields
+        (such as appending to ``unit_cell_devices``) are not detected.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith('_'):
+            return
+        self._link_child(value)
+        self._bump_version()
+
+    def __getstate__(self) -> Dict:
+        """Return the state without the (weak) parent references."""
+        state = self.__dict__.copy()
+        state.pop('_parents', None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Set the state and restore the parent references of the fields."""
+        self.__dict__.update(state)
+        for name, value in state.items():
+            if not name.startswith('_'):
+                self._link_child(value)
+
+    def _link_child(self, value: Any) -> None:
+        """Register this dataclass as parent of a (nested) config."""
+        children = value if isinstance(value, (list, tuple)) else [value]
+        for child in children:
+            if isinstance(child, _VersionedMixin):
+                parents = child.__dict__.setdefault('_parents', [])
+                if not any(parent() is self for parent in parents):
+                    parents.append(ref(self))
+
+    def _bump_version(self) -> None:
+        """Increase the version of this dataclass and of its parents."""
+        self.__dict__['_version'] = self.__dict__.get('_version', 0) + 1
+        for parent in self.__dict__.get('_parents', []):
+            parent_config = parent()
+            if parent_config is not None:
+                parent_config._bump_version()  # pylint: disable=protected-access
+
+    def get_version(self) -> int:
+        """Return the number of changes of this dataclass.
+
+        Returns:
+            The version, which is increased whenever a (nested) field
+            is assigned.
+        """
+        return self.__dict__.get('_version', 0)
+
+
+class _PrintableMixin(_VersionedMixin):
     """Helper class for pretty-printing of config dataclasses."""
     # pylint: disable=too-few-public-methods
 
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import ClassVar, Type
 
+from torch import dtype as torch_dtype, float32, float64
+
 from aihwkit.simulator.configs.helpers import _PrintableMixin
 from aihwkit.simulator.rpu_base import devices, tiles
 
@@ -239,6 +241,29 @@ class VectorUnitCellUpdatePolicy(Enum):
     """A single device is selected by random choice each mini-batch."""
 
 
+class RPUDataType(Enum):
+    """Data type of the analog tiles.
+
+    The inputs of the forward, backward and update passes of a tile
+    are expected to be of the given type.
+    """
+
+    FLOAT = 'float32'
+    """Single precision."""
+
+    DOUBLE = 'float64'
+    """Double precision.
+
+    Caution:
+        Double precision tiles are only available if aihwkit has been
+        compiled with ``RPU_USE_DOUBLE``.
+    """
+
+    def as_torch(self) -> torch_dtype:
+        """Return the corresponding torch data type."""
+        return float64 if self == RPUDataType.DOUBLE else float32
+
+
 # Specialized parameters.
 
 @dataclass
@@ -552,6 +577,24 @@ class WeightModifierParameter(_PrintableMixin):
     See :class:`WeightModifierType` for details.
     """
 
+    lazy_block_size: int = 0
+    """Number of weight rows that are modified at once during forward and
+    backward.
+
+    If larger than zero, the modified weights are not stored in a full
+    copy of the weight matrix, but re-generated (with the identical
+    values) for blocks of ``lazy_block_size`` rows within each forward
+    and backward pass. This reduces the memory at the cost of
+    modifying the weights in each pass.
+
+    Note:
+        Only supported on CPU tiles and without IR drop and
+        ``PCM_READ`` output weight noise (the full modified weights are
+        stored otherwise). The modification is generated from the
+        current weights, thus updates between forward and backward are
+        seen by the backward.
+    """
+
     type: WeightModifierType = WeightModifierType.COPY
     """Type of the weight modification."""
 
@@ -762,3 +805,25 @@ class MappingParameter(_PrintableMixin):
         Only relevant for ``Mapped`` modules such as
         :class:`aihwkit.nn.modules.linear_mapped.AnalogLinearMapped`.
     """
+
+    tile_workers: int = 0
+    """Number of worker threads that compute the tiles of a mapped
+    layer concurrently.
+
+    If larger than 1, the forward, backward and update passes of all
+    tiles of a mapped layer are dispatched to a worker pool and the
+    partial sums are reduced in place. Otherwise the tiles are computed
+    sequentially.
+
+    Note:
+        Each tile still uses the simulator threads (see
+        ``rpu_base.set_num_threads``), thus the number of simulator
+        threads might need to be reduced accordingly. CUDA tiles are
+        always computed sequentially.
+
+    Caution:
+        Only relevant for ``Mapped`` modules such as
+        :class:`aihwkit.nn.modules.linear_mapped.AnalogLinearMapped`,
+        and for the background updates of
+        :class:`aihwkit.optim.AnalogSGD` (``async_update``).
+    """
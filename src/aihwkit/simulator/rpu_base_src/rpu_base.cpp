@@ -43,6 +43,25 @@ PYBIND11_MODULE(rpu_base, m) {
     Return whether aihwkit was compiled with CUDA support.
     )pbdoc");
 
+  // Threading of the CPU simulator.
+  m.def(
+      "set_num_threads", [](int n_threads) { RPU::setNumThreads(n_threads); }, py::arg("n_threads"),
+      R"pbdoc(
+    Set the number of threads used by the CPU simulator.
+
+    The (OpenMP) parallel loops of the CPU tiles use this number of
+    threads. Non-positive values reset to the OpenMP default
+    (e.g. ``OMP_NUM_THREADS``). The threading of torch is not affected.
+
+    Args:
+        n_threads: number of threads.
+    )pbdoc");
+  m.def(
+      "get_num_threads", [] { return RPU::getNumThreads(); },
+      R"pbdoc(
+    Return the number of threads used by the CPU simulator.
+    )pbdoc");
+
 #ifdef RPU_USE_CUDA
   declare_rpu_tiles_cuda(m_tiles);
 #endif
@@ -42,14 +42,12 @@
 #include <pybind11/stl.h>
 #include <string>
 
-#ifdef RPU_USE_DOUBLE
-typedef double T;
-#else
-typedef float T;
-#endif
-
 namespace py = pybind11;
 
+/* The tiles and parameters are declared for float and (with
+   RPU_USE_DOUBLE) additionally for double, in which case the
+   class names have the "Double" suffix. */
+
 void declare_rpu_tiles(py::module &m);
 void declare_rpu_devices(py::module &m);
 #ifdef RPU_USE_CUDA
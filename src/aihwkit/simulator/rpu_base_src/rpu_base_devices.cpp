@@ -12,7 +12,7 @@
 
 #include "rpu_base.h"
 
-void declare_rpu_devices(py::module &m) {
+template <typename T> void declare_rpu_devices_typed(py::module &m, std::string type_name_add) {
 
   using AbstractParam = RPU::AbstractRPUDeviceMetaParameter<T>;
   using SimpleParam = RPU::SimpleRPUDeviceMetaParameter<T>;
@@ -349,7 +349,7 @@ void declare_rpu_devices(py::module &m) {
   /*
    * Python class definitions.
    */
-  py::class_<RPU::SimpleMetaParameter<T>>(m, "FloatingPointTileParameter")
+  py::class_<RPU::SimpleMetaParameter<T>>(m, ("FloatingPointTileParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def(
           "create_array", &RPU::SimpleMetaParameter<T>::createRPUArray, py::arg("x_size"),
@@ -366,7 +366,7 @@ void declare_rpu_devices(py::module &m) {
       .def_readwrite("lifetime", &RPU::SimpleMetaParameter<T>::lifetime)
       .def_readwrite("drift", &RPU::SimpleMetaParameter<T>::drift);
 
-  py::class_<RPU::PulsedMetaParameter<T>>(m, "AnalogTileParameter")
+  py::class_<RPU::PulsedMetaParameter<T>>(m, ("AnalogTileParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def(
           "create_array", [](RPU::PulsedMetaParameter<T> &self, int n_cols, int n_rows,
@@ -382,7 +382,8 @@ void declare_rpu_devices(py::module &m) {
       .def_readwrite("backward_io", &RPU::PulsedMetaParameter<T>::b_io)
       .def_readwrite("update", &RPU::PulsedMetaParameter<T>::up);
 
-  py::class_<RPU::PulsedUpdateMetaParameter<T>>(m, "AnalogTileUpdateParameter")
+  py::class_<RPU::PulsedUpdateMetaParameter<T>>(
+      m, ("AnalogTileUpdateParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("fixed_bl", &RPU::PulsedUpdateMetaParameter<T>::fixed_BL)
       .def_readwrite("desired_bl", &RPU::PulsedUpdateMetaParameter<T>::desired_BL)
@@ -395,7 +396,7 @@ void declare_rpu_devices(py::module &m) {
           "update_bl_management", &RPU::PulsedUpdateMetaParameter<T>::update_bl_management)
       .def_readwrite("x_res_implicit", &RPU::PulsedUpdateMetaParameter<T>::x_res_implicit);
 
-  py::class_<RPU::IOMetaParameter<T>>(m, "AnalogTileInputOutputParameter")
+  py::class_<RPU::IOMetaParameter<T>>(m, ("AnalogTileInputOutputParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("bm_test_negative_bound", &RPU::IOMetaParameter<T>::bm_test_negative_bound)
       .def_readwrite("bound_management", &RPU::IOMetaParameter<T>::bound_management)
@@ -420,7 +421,7 @@ void declare_rpu_devices(py::module &m) {
       .def_readwrite("ir_drop", &RPU::IOMetaParameter<T>::ir_drop)
       .def_readwrite("ir_drop_g_ratio", &RPU::IOMetaParameter<T>::ir_drop_Gw_div_gmax);
 
-  py::class_<RPU::DriftParameter<T>>(m, "DriftParameter")
+  py::class_<RPU::DriftParameter<T>>(m, ("DriftParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("nu", &RPU::DriftParameter<T>::nu)
       .def_readwrite("nu_dtod", &RPU::DriftParameter<T>::nu_dtod)
@@ -436,15 +437,16 @@ void declare_rpu_devices(py::module &m) {
 
   // device params
   py::class_<AbstractParam, PyAbstractParam, RPU::SimpleMetaParameter<T>>(
-      m, "AbstractResistiveDeviceParameter")
+      m, ("AbstractResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("construction_seed", &AbstractParam::construction_seed);
 
   py::class_<PulsedBaseParam, PyPulsedBaseParam, AbstractParam>(
-      m, "PulsedBaseResistiveDeviceParameter")
+      m, ("PulsedBaseResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>());
 
-  py::class_<SimpleParam, PySimpleParam, AbstractParam>(m, "IdealResistiveDeviceParameter")
+  py::class_<SimpleParam, PySimpleParam, AbstractParam>(
+      m, ("IdealResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def("__str__", [](SimpleParam &self) {
         std::stringstream ss;
@@ -452,7 +454,8 @@ void declare_rpu_devices(py::module &m) {
         return ss.str();
       });
 
-  py::class_<PulsedParam, PyPulsedParam, AbstractParam>(m, "PulsedResistiveDeviceParameter")
+  py::class_<PulsedParam, PyPulsedParam, AbstractParam>(
+      m, ("PulsedResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       // Properties from this class.
       .def_readwrite("corrupt_devices_prob", &PulsedParam::corrupt_devices_prob)
@@ -480,7 +483,7 @@ void declare_rpu_devices(py::module &m) {
       });
 
   py::class_<ConstantStepParam, PyConstantStepParam, PulsedParam>(
-      m, "ConstantStepResistiveDeviceParameter")
+      m, ("ConstantStepResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def(
           "__str__",
@@ -499,7 +502,7 @@ void declare_rpu_devices(py::module &m) {
         )pbdoc");
 
   py::class_<LinearStepParam, PyLinearStepParam, PulsedParam>(
-      m, "LinearStepResistiveDeviceParameter")
+      m, ("LinearStepResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("gamma_up", &LinearStepParam::ls_decrease_up)
       .def_readwrite("gamma_down", &LinearStepParam::ls_decrease_down)
@@ -529,7 +532,7 @@ void declare_rpu_devices(py::module &m) {
         )pbdoc");
 
   py::class_<SoftBoundsParam, PySoftBoundsParam, LinearStepParam>(
-      m, "SoftBoundsResistiveDeviceParameter")
+      m, ("SoftBoundsResistiveDeviceParameter" + type_name_add).c_str())
       .def_readwrite("mult_noise", &SoftBoundsParam::ls_mult_noise)
       .def_readwrite("write_noise_std", &SoftBoundsParam::write_noise_std)
       .def_readwrite("reverse_up", &SoftBoundsParam::ls_reverse_up)
@@ -552,7 +555,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<ExpStepParam, PyExpStepParam, PulsedParam>(m, "ExpStepResistiveDeviceParameter")
+  py::class_<ExpStepParam, PyExpStepParam, PulsedParam>(
+      m, ("ExpStepResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("A_up", &ExpStepParam::es_A_up)
       .def_readwrite("A_down", &ExpStepParam::es_A_down)
@@ -579,7 +583,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<JARTv1bParam, PyJARTv1bParam, PulsedParam>(m, "JARTv1bResistiveDeviceParameter")
+  py::class_<JARTv1bParam, PyJARTv1bParam, PulsedParam>(
+      m, ("JARTv1bResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("write_noise_std", &JARTv1bParam::real_write_noise_std)
       .def_readwrite("alpha0", &JARTv1bParam::alpha0)
@@ -671,6 +676,10 @@ void declare_rpu_devices(py::module &m) {
       .def_readwrite("w_max_dtod_lower_bound", &JARTv1bParam::w_max_dtod_lower_bound)
       .def_readwrite("w_min_dtod_upper_bound", &JARTv1bParam::w_min_dtod_upper_bound)
       .def_readwrite("w_min_dtod_lower_bound", &JARTv1bParam::w_min_dtod_lower_bound)
+      .def_readwrite("lut_update", &JARTv1bParam::lut_update)
+      .def_readwrite("lut_size", &JARTv1bParam::lut_size)
+      .def_readwrite("lut_tolerance", &JARTv1bParam::lut_tolerance)
+      .def_readwrite("lut_dtod_resolution", &JARTv1bParam::lut_dtod_resolution)
       .def(
           "__str__",
           [](JARTv1bParam &self) {
@@ -687,7 +696,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<VectorParam, PyVectorParam, PulsedBaseParam>(m, "VectorResistiveDeviceParameter")
+  py::class_<VectorParam, PyVectorParam, PulsedBaseParam>(
+      m, ("VectorResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("gamma_vec", &VectorParam::gamma_vec)
       .def_readwrite("update_policy", &VectorParam::update_policy)
@@ -717,7 +727,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<OneSidedParam, PyOneSidedParam, VectorParam>(m, "OneSidedResistiveDeviceParameter")
+  py::class_<OneSidedParam, PyOneSidedParam, VectorParam>(
+      m, ("OneSidedResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("refresh_every", &OneSidedParam::refresh_every)
       .def_readwrite("refresh_forward", &OneSidedParam::refresh_io)
@@ -742,7 +753,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<TransferParam, PyTransferParam, VectorParam>(m, "TransferResistiveDeviceParameter")
+  py::class_<TransferParam, PyTransferParam, VectorParam>(
+      m, ("TransferResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("gamma", &TransferParam::gamma)
       .def_readwrite("transfer_every", &TransferParam::transfer_every)
@@ -776,7 +788,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-  py::class_<MixedPrecParam, PyMixedPrecParam, SimpleParam>(m, "MixedPrecResistiveDeviceParameter")
+  py::class_<MixedPrecParam, PyMixedPrecParam, SimpleParam>(
+      m, ("MixedPrecResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("transfer_every", &MixedPrecParam::transfer_every)
       .def_readwrite("n_rows_per_transfer", &MixedPrecParam::n_rows_per_transfer)
@@ -801,7 +814,8 @@ void declare_rpu_devices(py::module &m) {
         return ss.str();
       });
 
-  py::class_<PowStepParam, PyPowStepParam, PulsedParam>(m, "PowStepResistiveDeviceParameter")
+  py::class_<PowStepParam, PyPowStepParam, PulsedParam>(
+      m, ("PowStepResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("pow_gamma", &PowStepParam::ps_gamma)
       .def_readwrite("pow_gamma_dtod", &PowStepParam::ps_gamma_dtod)
@@ -825,7 +839,7 @@ void declare_rpu_devices(py::module &m) {
         )pbdoc");
 
   py::class_<PiecewiseStepParam, PyPiecewiseStepParam, PulsedParam>(
-      m, "PiecewiseStepResistiveDeviceParameter")
+      m, ("PiecewiseStepResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("piecewise_up", &PiecewiseStepParam::piecewise_up_vec)
       .def_readwrite("piecewise_down", &PiecewiseStepParam::piecewise_down_vec)
@@ -846,9 +860,8 @@ void declare_rpu_devices(py::module &m) {
            float: weight granularity
         )pbdoc");
 
-
   py::class_<BufferedTransferParam, PyBufferedTransferParam, TransferParam>(
-      m, "BufferedTransferResistiveDeviceParameter")
+      m, ("BufferedTransferResistiveDeviceParameter" + type_name_add).c_str())
       .def(py::init<>())
       .def_readwrite("thres_scale", &BufferedTransferParam::thres_scale)
       .def_readwrite("momentum", &BufferedTransferParam::momentum)
@@ -868,6 +881,9 @@ void declare_rpu_devices(py::module &m) {
         Returns:
            float: weight granularity
         )pbdoc");
+}
+
+void declare_rpu_devices(py::module &m) {
 
   /**
    * Helper enums.
@@ -904,4 +920,9 @@ void declare_rpu_devices(py::module &m) {
       .value("NoneWithDevice", RPU::PulseType::NoneWithDevice)
       .value("MeanCount", RPU::PulseType::MeanCount)
       .value("DeterministicImplicit", RPU::PulseType::DeterministicImplicit);
+
+  declare_rpu_devices_typed<float>(m, "");
+#ifdef RPU_USE_DOUBLE
+  declare_rpu_devices_typed<double>(m, "Double");
+#endif
 }
@@ -18,52 +18,21 @@
   CHECK_CPU(x);                                                                                    \
   CHECK_CONTIGUOUS(x)
 
-void declare_rpu_tiles(py::module &m) {
+template <typename T> void declare_rpu_tiles_typed(py::module &m, std::string type_name_add) {
   using Class = RPU::RPUSimple<T>;
   using ClassPulsed = RPU::RPUPulsed<T>;
 
-  py::class_<RPU::WeightModifierParameter>(m, "WeightModifierParameter")
-      .def(py::init<>())
-      .def_readwrite("std_dev", &RPU::WeightModifierParameter::std_dev)
-      .def_readwrite("res", &RPU::WeightModifierParameter::res)
-      .def_readwrite("sto_round", &RPU::WeightModifierParameter::sto_round)
-      .def_readwrite("dorefa_clip", &RPU::WeightModifierParameter::dorefa_clip)
-      .def_readwrite("pdrop", &RPU::WeightModifierParameter::pdrop)
-      .def_readwrite("enable_during_test", &RPU::WeightModifierParameter::enable_during_test)
-      .def_readwrite("copy_last_column", &RPU::WeightModifierParameter::copy_last_column)
-      .def_readwrite("rel_to_actual_wmax", &RPU::WeightModifierParameter::rel_to_actual_wmax)
-      .def_readwrite("assumed_wmax", &RPU::WeightModifierParameter::assumed_wmax)
-      .def_readwrite("coeff0", &RPU::WeightModifierParameter::coeff0)
-      .def_readwrite("coeff1", &RPU::WeightModifierParameter::coeff1)
-      .def_readwrite("coeff2", &RPU::WeightModifierParameter::coeff2)
-      .def_readwrite("type", &RPU::WeightModifierParameter::type);
-
-  py::enum_<RPU::WeightModifierType>(m, "WeightModifierType")
-      .value("Copy", RPU::WeightModifierType::Copy)
-      .value("Discretize", RPU::WeightModifierType::Discretize)
-      .value("MultNormal", RPU::WeightModifierType::MultNormal)
-      .value("AddNormal", RPU::WeightModifierType::AddNormal)
-      .value("DiscretizeAddNormal", RPU::WeightModifierType::DiscretizeAddNormal)
-      .value("DoReFa", RPU::WeightModifierType::DoReFa)
-      .value("Poly", RPU::WeightModifierType::Poly);
-
-  py::class_<RPU::WeightClipParameter>(m, "WeightClipParameter")
-      .def(py::init<>())
-      .def_readwrite("fixed_value", &RPU::WeightClipParameter::fixed_value)
-      .def_readwrite("sigma", &RPU::WeightClipParameter::sigma)
-      .def_readwrite("type", &RPU::WeightClipParameter::type);
-
-  py::enum_<RPU::WeightClipType>(m, "WeightClipType")
-      .value("None", RPU::WeightClipType::None)
-      .value("FixedValue", RPU::WeightClipType::FixedValue)
-      .value("LayerGaussian", RPU::WeightClipType::LayerGaussian)
-      .value("AverageChannelMax", RPU::WeightClipType::AverageChannelMax);
-
   py::class_<Class>(
-      m, "FloatingPointTile",
+      m, ("FloatingPointTile" + type_name_add).c_str(),
       R"pbdoc(
     Floating point tile.
 
+    Note:
+        The GIL is released during the tile computations. Different
+        tiles can thus be used concurrently from several Python
+        threads, whereas calls to the same tile are serialized by the
+        tile lock.
+
     Args:
         x_size: ``X`` size of the tile.
         d_size: ``D`` size of the tile.
@@ -116,6 +85,27 @@ void declare_rpu_tiles(py::module &m) {
            Returns:
                int: the tile number of rows
            )pbdoc")
+      .def(
+          "set_random_seed", &Class::setRandomSeed, py::arg("seed"), py::arg("stream") = 0,
+          R"pbdoc(
+           Set the seed of the random number generator of the tile.
+
+           The CPU simulator uses a counter based generator, thus the noise
+           is reproducible for a given seed, stream and number of threads.
+
+           Args:
+               seed: the seed. If ``0``, a random seed is used.
+               stream: the stream of the generator. Tiles with the same seed
+                   but different streams draw independent random numbers.
+           )pbdoc")
+      .def(
+          "get_random_seed", &Class::getRandomSeed,
+          R"pbdoc(
+           Get the seed of the random number generator of the tile.
+
+           Returns:
+               the seed (``0`` if a random seed is used).
+           )pbdoc")
       .def(
           "set_learning_rate", &Class::setLearningRate, py::arg("learning_rate"),
           R"pbdoc(
@@ -137,7 +127,11 @@ void declare_rpu_tiles(py::module &m) {
             py::buffer_info weights_buffer = weights.request();
 
             // Call RPU function.
-            self.getWeights((T *)weights_buffer.ptr);
+            {
+              py::gil_scoped_release release;
+              std::lock_guard<std::mutex> lock(self.mutex_);
+              self.getWeights((T *)weights_buffer.ptr);
+            }
             return weights;
           },
           R"pbdoc(
@@ -167,6 +161,8 @@ void declare_rpu_tiles(py::module &m) {
             py::buffer_info weights_buffer = weights.request();
 
             // Call RPU function.
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setWeights((T *)weights_buffer.ptr);
           },
           py::arg("weights"),
@@ -182,6 +178,63 @@ void declare_rpu_tiles(py::module &m) {
                weights: ``[d_size, x_size]`` weight matrix.
            )pbdoc")
 
+      .def(
+          "set_weights",
+          [](Class &self, const torch::Tensor &weights) {
+            CHECK_TORCH_INPUT(weights);
+            if (weights.dim() != 2 || weights.size(0) != self.getDSize() ||
+                weights.size(1) != self.getXSize()) {
+              throw std::runtime_error(
+                  "Invalid weights dimensions: expected [" + std::to_string(self.getDSize()) + "," +
+                  std::to_string(self.getXSize()) + "] array");
+            }
+
+            // Call RPU function.
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
+            return self.setWeights(weights.data_ptr<T>());
+          },
+          py::arg("weights"),
+          R"pbdoc(
+           Set the tile weights exactly from a tensor.
+
+           Copies the ``weights`` tensor directly into the tile weights without
+           intermediate buffers.
+
+           Note:
+               This is **not** hardware realistic, and is used for debug purposes only.
+
+           Args:
+               weights: ``[d_size, x_size]`` contiguous CPU weight tensor.
+           )pbdoc")
+      .def(
+          "get_weights_view",
+          [](Class &self) {
+            std::lock_guard<std::mutex> lock(self.mutex_);
+            if (self.getSharedWeightsIf()) {
+              throw std::runtime_error(
+                  "Tile uses shared weights. Use the shared weights tensor instead.");
+            }
+            return torch::from_blob(
+                self.getWeightsPtr()[0], {self.getDSize(), self.getXSize()}, torch::dtype<T>());
+          },
+          py::keep_alive<0, 1>(),
+          R"pbdoc(
+           Return a view of the tile weights.
+
+           The returned tensor shares the memory of the tile weights (no copy
+           is made) and keeps the tile alive.
+
+           Caution:
+               The view should be treated as read-only. Writing to it bypasses
+               the device model of the tile. Use ``set_weights`` to set the weights.
+               Not available if the tile uses shared weights, and invalidated
+               if the tile starts to use shared weights.
+
+           Returns:
+               tensor: the ``[d_size, x_size]`` weight matrix.
+           )pbdoc")
+
       .def(
           "get_weights_realistic",
           [](Class &self) {
@@ -190,7 +243,11 @@ void declare_rpu_tiles(py::module &m) {
             py::buffer_info weights_buffer = weights.request();
 
             // Call RPU function.
-            self.getWeightsReal((T *)weights_buffer.ptr);
+            {
+              py::gil_scoped_release release;
+              std::lock_guard<std::mutex> lock(self.mutex_);
+              self.getWeightsReal((T *)weights_buffer.ptr);
+            }
             return weights;
           },
           R"pbdoc(
@@ -218,6 +275,8 @@ void declare_rpu_tiles(py::module &m) {
             py::buffer_info weights_buffer = weights.request();
 
             // Call RPU function.
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setWeightsReal((T *)weights_buffer.ptr, n_loops);
           },
           py::arg("weights"), py::arg("n_loops") = 10,
@@ -243,6 +302,7 @@ void declare_rpu_tiles(py::module &m) {
                   "Invalid weights dimensions: expected [" + std::to_string(self.getDSize()) + "," +
                   std::to_string(self.getXSize()) + "] array");
             }
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setSharedWeights(weights.data_ptr<T>());
           },
@@ -258,6 +318,7 @@ void declare_rpu_tiles(py::module &m) {
                   "Invalid delta weights dimensions: expected [" + std::to_string(self.getDSize()) +
                   "," + std::to_string(self.getXSize()) + "] array");
             }
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setDeltaWeights(delta_weights.data_ptr<T>());
           },
@@ -265,9 +326,45 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "reset_delta_weights",
           [](Class &self) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setDeltaWeights(nullptr);
           })
+      .def(
+          "set_test_weights",
+          [](Class &self, torch::Tensor weights) {
+            CHECK_TORCH_INPUT(weights);
+            if (weights.dim() != 2 || weights.size(0) != self.getDSize() ||
+                weights.size(1) != self.getXSize()) {
+              throw std::runtime_error(
+                  "Invalid weights dimensions: expected [" + std::to_string(self.getDSize()) + "," +
+                  std::to_string(self.getXSize()) + "] array");
+            }
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
+            return self.setTestWeights(weights.data_ptr<T>());
+          },
+          py::arg("weights"),
+          R"pbdoc(
+           Use the given weights in the forward pass during testing.
+
+           The tile weights are not changed and the given weights are not
+           copied, so that the tensor needs to be kept alive until
+           ``reset_test_weights`` is called.
+
+           Args:
+               weights: ``[d_size, x_size]`` contiguous CPU weight tensor.
+           )pbdoc")
+      .def(
+          "reset_test_weights",
+          [](Class &self) {
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
+            return self.setTestWeights(nullptr);
+          },
+          R"pbdoc(
+           Use the tile weights again in the forward pass during testing.
+           )pbdoc")
       .def(
           "get_shared_weights_if", &Class::getSharedWeightsIf,
           R"pbdoc(
@@ -281,6 +378,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "set_weights_uniform_random",
           [](Class &self, float min_value, float max_value) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setWeightsUniformRandom(min_value, max_value);
           },
@@ -295,6 +393,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "decay_weights",
           [](Class &self, float alpha = 1.0) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.decayWeights(alpha, false);
           },
@@ -312,6 +411,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "drift_weights",
           [](Class &self, float time_since_last_call) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.driftWeights(time_since_last_call);
           },
@@ -334,6 +434,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "clip_weights",
           [](Class &self, ::RPU::WeightClipParameter &wclip_par) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.clipWeights(wclip_par);
           },
@@ -349,6 +450,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "modify_weights",
           [](Class &self, ::RPU::WeightModifierParameter &wmpar) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.modifyFBWeights(wmpar);
           },
@@ -364,6 +466,7 @@ void declare_rpu_tiles(py::module &m) {
       .def(
           "diffuse_weights",
           [](Class &self) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.diffuseWeights();
           },
@@ -376,9 +479,33 @@ void declare_rpu_tiles(py::module &m) {
 
            An analog tile will have a possible non-ideal version of this diffusion.
            )pbdoc")
+      .def(
+          "post_update_step",
+          [](Class &self, bool diffuse, bool decay, ::RPU::WeightClipParameter &wclip_par) {
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
+            self.postUpdateStep(diffuse, decay, wclip_par);
+          },
+          py::arg("diffuse") = false, py::arg("decay") = false,
+          py::arg("weight_clipper_params") = ::RPU::WeightClipParameter(),
+          R"pbdoc(
+           Operators applied once per mini-batch after the update.
+
+           Diffuses, decays (with ``alpha=1``) and clips the weights
+           (in this order), as ``diffuse_weights``, ``decay_weights``
+           and ``clip_weights`` would, but in one sweep over the
+           weights on the CPU.
+
+           Args:
+               diffuse: whether to diffuse the weights.
+               decay: whether to decay the weights.
+               weight_clipper_params: parameters of the clipping (no
+                   clipping by default).
+           )pbdoc")
       .def(
           "reset_columns",
           [](Class &self, int start_col, int n_cols, T reset_prob) {
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.resetCols(start_col, n_cols, reset_prob);
           },
@@ -428,6 +555,7 @@ void declare_rpu_tiles(py::module &m) {
             torch::Tensor d_output = torch::empty(dims, x_input.options());
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.forward(
                 x_input.template data_ptr<T>(), d_output.template data_ptr<T>(), bias, m_batch,
@@ -497,6 +625,7 @@ void declare_rpu_tiles(py::module &m) {
             torch::Tensor x_output = torch::empty(dims, d_input.options());
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.backward(
                 d_input.template data_ptr<T>(), x_output.template data_ptr<T>(), bias, m_batch,
@@ -572,6 +701,7 @@ void declare_rpu_tiles(py::module &m) {
             }
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.update(
                 x_input.template data_ptr<T>(), d_input.template data_ptr<T>(), bias, m_batch,
@@ -614,6 +744,7 @@ void declare_rpu_tiles(py::module &m) {
             int d_image_size = ((d_tensor.numel() / d_tensor.size(0)) / d_tensor.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.forwardIndexed(
                 x_input.template data_ptr<T>(), d_tensor.template data_ptr<T>(), x_input.numel(),
@@ -647,6 +778,7 @@ void declare_rpu_tiles(py::module &m) {
             int d_image_size = ((d_input.numel() / d_input.size(0)) / d_input.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.backwardIndexed(
                 d_input.template data_ptr<T>(), x_tensor.template data_ptr<T>(), x_tensor.numel(),
@@ -679,6 +811,7 @@ void declare_rpu_tiles(py::module &m) {
             int d_image_size = d_input.numel() / (d_input.size(0) * d_input.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.updateIndexed(
                 x_input.template data_ptr<T>(), d_input.template data_ptr<T>(), x_input.numel(),
@@ -697,12 +830,13 @@ void declare_rpu_tiles(py::module &m) {
            )pbdoc")
       .def(
           "set_matrix_indices",
-          [](Class &self, const torch::Tensor &indices) {
+          [](Class &self, const torch::Tensor &indices, bool keep_plans) {
             CHECK_CONTIGUOUS(indices);
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
-            self.setMatrixIndices(indices.data_ptr<int>());
+            self.setMatrixIndices(indices.data_ptr<int>(), keep_plans);
           },
-          py::arg("indices"),
+          py::arg("indices"), py::arg("keep_plans") = false,
           R"pbdoc(
            Sets the index vector for the ``*_indexed`` functionality.
 
@@ -711,6 +845,8 @@ void declare_rpu_tiles(py::module &m) {
 
            Args:
                indices: int torch::Tensor
+               keep_plans: whether to re-use the cached gather plans of
+                   the indices (their content must not have changed)
           )pbdoc")
       .def(
           "has_matrix_indices", [](Class &self) { return self.hasMatrixIndices(); },
@@ -745,16 +881,18 @@ void declare_rpu_tiles(py::module &m) {
 
             // TODO choose correct tensor options (CPU, float32) probably standard though
             if (!v.size()) {
-              return torch::empty({0});
+              return torch::empty({0}, torch::dtype<T>());
             }
             torch::Tensor hidden_parameters =
-                torch::empty({(int)v.size(), self.getDSize(), self.getXSize()});
+                torch::empty({(int)v.size(), self.getDSize(), self.getXSize()}, torch::dtype<T>());
 
             std::vector<T *> data_ptrs(v.size());
             size_t size = self.getDSize() * self.getXSize();
             for (size_t i = 0; i < v.size(); i++) {
               data_ptrs[i] = hidden_parameters.data_ptr<T>() + i * size;
             }
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(self.mutex_);
             self.getDeviceParameter(data_ptrs);
 
             return hidden_parameters;
@@ -790,6 +928,7 @@ void declare_rpu_tiles(py::module &m) {
             for (size_t i = 0; i < v.size(); i++) {
               data_ptrs[i] = hidden_parameters.data_ptr<T>() + i * size;
             }
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setDeviceParameter(data_ptrs);
           },
@@ -821,7 +960,7 @@ void declare_rpu_tiles(py::module &m) {
            )pbdoc");
 
   py::class_<ClassPulsed, Class>(
-      m, "AnalogTile",
+      m, ("AnalogTile" + type_name_add).c_str(),
       R"pbdoc(
     Analog tile.
 
@@ -830,5 +969,92 @@ void declare_rpu_tiles(py::module &m) {
         d_size: ``D`` size of the tile.
     )pbdoc")
       .def(py::init<int, int>(), py::arg("x_size"), py::arg("d_size"))
-      .def("get_parameters", &ClassPulsed::getMetaPar);
+      .def("get_parameters", &ClassPulsed::getMetaPar)
+      .def(
+          "get_bm_iterations", &ClassPulsed::getBMIterations,
+          R"pbdoc(
+           Return the number of bound management iterations of the last forward pass.
+
+           Only the samples of the batch that did not pass the bound test are
+           re-computed in each further iteration.
+
+           Returns:
+               int: the number of iterations (``1`` if no sample was re-computed).
+           )pbdoc")
+      .def(
+          "get_transfer_timings",
+          [](ClassPulsed &self) {
+            double update_time = 0.0, transfer_time = 0.0;
+            int n_transfers = 0;
+            {
+              py::gil_scoped_release release;
+              std::lock_guard<std::mutex> lock(self.mutex_);
+              auto *rpu_device =
+                  dynamic_cast<const RPU::TransferRPUDevice<T> *>(&self.getRPUDevice());
+              if (rpu_device == nullptr) {
+                throw std::runtime_error("Timings are only available for transfer devices.");
+              }
+              rpu_device->getTimings(update_time, transfer_time, n_transfers);
+            }
+            py::dict timings;
+            timings["update_time"] = update_time;
+            timings["transfer_time"] = transfer_time;
+            timings["n_transfers"] = n_transfers;
+            return timings;
+          },
+          R"pbdoc(
+           Return the accumulated timings of a transfer device.
+
+           Returns:
+               dict: the wall-clock time (in sec) spent in the gradient
+               updates (``update_time``) and in the transfers
+               (``transfer_time``), and the number of transfers
+               (``n_transfers``).
+           )pbdoc");
+}
+
+void declare_rpu_tiles(py::module &m) {
+
+  py::class_<RPU::WeightModifierParameter>(m, "WeightModifierParameter")
+      .def(py::init<>())
+      .def_readwrite("std_dev", &RPU::WeightModifierParameter::std_dev)
+      .def_readwrite("res", &RPU::WeightModifierParameter::res)
+      .def_readwrite("sto_round", &RPU::WeightModifierParameter::sto_round)
+      .def_readwrite("dorefa_clip", &RPU::WeightModifierParameter::dorefa_clip)
+      .def_readwrite("pdrop", &RPU::WeightModifierParameter::pdrop)
+      .def_readwrite("enable_during_test", &RPU::WeightModifierParameter::enable_during_test)
+      .def_readwrite("copy_last_column", &RPU::WeightModifierParameter::copy_last_column)
+      .def_readwrite("rel_to_actual_wmax", &RPU::WeightModifierParameter::rel_to_actual_wmax)
+      .def_readwrite("assumed_wmax", &RPU::WeightModifierParameter::assumed_wmax)
+      .def_readwrite("coeff0", &RPU::WeightModifierParameter::coeff0)
+      .def_readwrite("coeff1", &RPU::WeightModifierParameter::coeff1)
+      .def_readwrite("coeff2", &RPU::WeightModifierParameter::coeff2)
+      .def_readwrite("lazy_block_size", &RPU::WeightModifierParameter::lazy_block_size)
+      .def_readwrite("type", &RPU::WeightModifierParameter::type);
+
+  py::enum_<RPU::WeightModifierType>(m, "WeightModifierType")
+      .value("Copy", RPU::WeightModifierType::Copy)
+      .value("Discretize", RPU::WeightModifierType::Discretize)
+      .value("MultNormal", RPU::WeightModifierType::MultNormal)
+      .value("AddNormal", RPU::WeightModifierType::AddNormal)
+      .value("DiscretizeAddNormal", RPU::WeightModifierType::DiscretizeAddNormal)
+      .value("DoReFa", RPU::WeightModifierType::DoReFa)
+      .value("Poly", RPU::WeightModifierType::Poly);
+
+  py::class_<RPU::WeightClipParameter>(m, "WeightClipParameter")
+      .def(py::init<>())
+      .def_readwrite("fixed_value", &RPU::WeightClipParameter::fixed_value)
+      .def_readwrite("sigma", &RPU::WeightClipParameter::sigma)
+      .def_readwrite("type", &RPU::WeightClipParameter::type);
+
+  py::enum_<RPU::WeightClipType>(m, "WeightClipType")
+      .value("None", RPU::WeightClipType::None)
+      .value("FixedValue", RPU::WeightClipType::FixedValue)
+      .value("LayerGaussian", RPU::WeightClipType::LayerGaussian)
+      .value("AverageChannelMax", RPU::WeightClipType::AverageChannelMax);
+
+  declare_rpu_tiles_typed<float>(m, "");
+#ifdef RPU_USE_DOUBLE
+  declare_rpu_tiles_typed<double>(m, "Double");
+#endif
 }
@@ -23,21 +23,16 @@
   CHECK_CUDA(x);                                                                                   \
   CHECK_CUDA_CONTIGUOUS(x)
 
-void declare_rpu_tiles_cuda(py::module &m) {
+template <typename T> void declare_rpu_tiles_cuda_typed(py::module &m, std::string type_name_add) {
   using Class = RPU::RPUCudaSimple<T>;
   using ClassPulsed = RPU::RPUCudaPulsed<T>;
 
-  /*
-   * Helper bindings.
-   */
-  py::class_<cudaStream_t>(m, "cudaStream_t");
-
   /*
    * RPU definitions.
    */
 
   py::class_<Class, RPU::RPUSimple<T>>(
-      m, "CudaFloatingPointTile",
+      m, ("CudaFloatingPointTile" + type_name_add).c_str(),
       R"pbdoc(
     Floating point tile (CUDA).
 
@@ -68,10 +63,17 @@ void declare_rpu_tiles_cuda(py::module &m) {
                   std::to_string(weights.device().index()));
             }
 
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setSharedWeights(weights.data_ptr<T>());
           },
           py::arg("weights"))
+      .def(
+          "get_weights_view",
+          [](Class &self) -> torch::Tensor {
+            throw std::runtime_error(
+                "Weight views are not supported for CUDA tiles. Use the shared weights instead.");
+          })
       .def(
           "set_delta_weights",
           [](Class &self, torch::Tensor delta_weights) {
@@ -90,6 +92,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
                   std::to_string(delta_weights.device().index()));
             }
 
+            py::gil_scoped_release release;
             std::lock_guard<std::mutex> lock(self.mutex_);
             return self.setDeltaWeights(delta_weights.data_ptr<T>());
           },
@@ -129,6 +132,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             torch::Tensor d_output = torch::empty(dims, x_input.options());
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream()); // TODO: better way to get the stream?
@@ -201,6 +205,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             torch::Tensor x_output = torch::empty(dims, d_input.options());
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream());
@@ -278,6 +283,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             }
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream());
@@ -323,6 +329,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             int d_image_size = ((d_tensor.numel() / d_tensor.size(0)) / d_tensor.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream());
@@ -358,6 +365,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             int d_image_size = ((d_input.numel() / d_input.size(0)) / d_input.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream());
@@ -392,6 +400,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
             int d_image_size = d_input.numel() / (d_input.size(0) * d_input.size(1));
 
             // Call RPU function.
+            py::gil_scoped_release release;
             self.finishUpdateCalculations();
             std::lock_guard<std::mutex> lock(self.mutex_);
             self.setStream(at::cuda::getCurrentCUDAStream());
@@ -412,7 +421,7 @@ void declare_rpu_tiles_cuda(py::module &m) {
            )pbdoc");
 
   py::class_<ClassPulsed, RPU::RPUCudaSimple<T>>(
-      m, "CudaAnalogTile",
+      m, ("CudaAnalogTile" + type_name_add).c_str(),
       R"pbdoc(
     Analog tile (CUDA).
 
@@ -429,4 +438,16 @@ void declare_rpu_tiles_cuda(py::module &m) {
       .def("get_parameters", &ClassPulsed::getMetaPar);
 }
 
+void declare_rpu_tiles_cuda(py::module &m) {
+  /*
+   * Helper bindings.
+   */
+  py::class_<cudaStream_t>(m, "cudaStream_t");
+
+  declare_rpu_tiles_cuda_typed<float>(m, "");
+#ifdef RPU_USE_DOUBLE
+  declare_rpu_tiles_cuda_typed<double>(m, "Double");
+#endif
+}
+
 #endif
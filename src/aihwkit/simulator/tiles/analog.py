@@ -13,7 +13,7 @@
 """High level analog tiles (analog)."""
 
 from copy import deepcopy
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Dict, Optional, Union, TYPE_CHECKING
 
 from torch import device as torch_device
 from torch.cuda import current_device
@@ -242,9 +242,14 @@ class AnalogTile(BaseTile):
         if self.is_cuda and device != self.device:
             raise CudaError('Cannot switch CUDA devices of existing Cuda tiles')
 
-        if isinstance(self.tile, tiles.AnalogTile):
+        # Import `aihwkit.simulator.configs` items dynamically to avoid import cycles.
+        # pylint: disable=import-outside-toplevel
+        from aihwkit.simulator.configs.helpers import get_bindings_class
+
+        data_type = getattr(self.rpu_config, 'dtype', None)
+        if isinstance(self.tile, get_bindings_class(tiles.AnalogTile, data_type)):
             with cuda_device(device):
-                self.tile = tiles.CudaAnalogTile(self.tile)
+                self.tile = get_bindings_class(tiles.CudaAnalogTile, data_type)(self.tile)
                 self.is_cuda = True
                 self.device = device
                 self.analog_ctx.cuda(device)
@@ -252,6 +257,48 @@ class AnalogTile(BaseTile):
                     self.out_scaling_alpha.data = self.out_scaling_alpha.data.cuda(device)
         return self
 
+    def get_bm_iterations(self) -> int:
+        """Return the number of bound management iterations of the last forward pass.
+
+        Samples that fail the bound test are re-computed (only those)
+        with a reduced input scale until they pass (see
+        :class:`~aihwkit.simulator.configs.utils.BoundManagementType`).
+        This can be used to tune the ``out_bound``.
+
+        Returns:
+            The number of iterations (``1`` if no sample was re-computed).
+
+        Raises:
+            CudaError: if the tile is a CUDA tile.
+        """
+        if self.is_cuda:
+            raise CudaError('The number of bound management iterations is only '
+                            'available for CPU tiles.')
+
+        return self.tile.get_bm_iterations()
+
+    def get_transfer_timings(self) -> Dict[str, float]:
+        """Return the accumulated timings of a transfer compound device.
+
+        Can be used to compare the time spent in the transfers between
+        the devices of e.g. a
+        :class:`~aihwkit.simulator.configs.devices.TransferCompound`
+        with the time spent in the gradient updates.
+
+        Returns:
+            Dictionary with the wall-clock times (in sec) of the gradient
+            updates (``update_time``) and of the transfers
+            (``transfer_time``) since the tile was created, and the number
+            of transfers (``n_transfers``).
+
+        Raises:
+            CudaError: if the tile is a CUDA tile.
+        """
+        if self.is_cuda:
+            raise CudaError('Transfer timings are only available for CPU tiles.')
+
+        return self.tile.get_transfer_timings()
+
     def _create_simulator_tile(
             self,
             x_size: int,
@@ -269,7 +316,7 @@ class AnalogTile(BaseTile):
             a simulator tile based on the specified configuration.
         """
         meta_parameter = rpu_config.as_bindings()
-        device_parameter = rpu_config.device.as_bindings()
+        device_parameter = rpu_config.device.as_bindings(rpu_config.dtype)
 
         return meta_parameter.create_array(x_size, d_size, device_parameter)
 
@@ -13,12 +13,12 @@
 """High level analog tiles (base)."""
 
 from collections import OrderedDict
-from typing import Dict, Generic, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 from copy import deepcopy
 from numpy import ascontiguousarray
 
 from torch import (
-    Tensor, stack, zeros, as_tensor, cat, unsqueeze, squeeze, ones_like
+    Tensor, stack, zeros, as_tensor, cat, unsqueeze, squeeze, ones_like, float32
 )
 from torch import device as torch_device
 from torch import max as torch_max
@@ -28,13 +28,26 @@ from torch.autograd import no_grad
 from aihwkit.exceptions import TileError
 from aihwkit.simulator.rpu_base import tiles
 from aihwkit.optim.context import AnalogContext
+from aihwkit.simulator.tiles.weights import TileWeightsMixin
 
 RPUConfigGeneric = TypeVar('RPUConfigGeneric')
 
 
-class BaseTile(Generic[RPUConfigGeneric]):
+class BaseTile(TileWeightsMixin, Generic[RPUConfigGeneric]):
     """Base class for tiles.
 
+    Note:
+        The simulator releases the GIL during the tile computations, so
+        that different tiles can be used concurrently from Python threads.
+        Calls to the same tile are serialized, however, and the Python-side
+        state of a tile (e.g. the ``analog_ctx`` and the weight scales)
+        is not protected and should only be modified by one thread.
+
+    Note:
+        The data type of the tile is given by the ``dtype`` field of the
+        ``rpu_config``. The inputs of the forward, backward and update
+        passes are expected to be of this type.
+
     Args:
         out_size: output size
         in_size: input size
@@ -62,10 +75,13 @@ class BaseTile(Generic[RPUConfigGeneric]):
         self.out_trans = out_trans
         self.shared_weights = None  # type: Parameter
         self.out_scaling_alpha = None  # type: Parameter
+        self.seed = None  # type: Optional[Tuple[int, int]]
 
         # Only used for indexed.
         self.image_sizes = []  # type: List[int]
 
+        self._set_dtype()
+
         x_size = in_size + 1 if self.bias else in_size
         d_size = out_size
 
@@ -79,6 +95,15 @@ class BaseTile(Generic[RPUConfigGeneric]):
         # create analog context
         self.analog_ctx = AnalogContext(self)
 
+        # cache of the bindings of the RPU config parameters
+        self._bindings_cache = {}  # type: Dict[str, Tuple[Any, Any]]
+        self._bindings_cache_misses = 0
+
+    def _set_dtype(self) -> None:
+        """Set the torch data type of the tile tensors."""
+        data_type = getattr(self.rpu_config, 'dtype', None)
+        self.dtype = float32 if data_type is None else data_type.as_torch()
+
     @no_grad()
     def get_analog_ctx(self) -> AnalogContext:
         """Return the analog context of the tile to be used in ``AnalogFunction``."""
@@ -142,6 +167,7 @@ class BaseTile(Generic[RPUConfigGeneric]):
         current_dict['analog_lr'] = self.tile.get_learning_rate()
         current_dict['shared_weights'] = self.shared_weights
         current_dict.pop('tile', None)
+        current_dict.pop('_bindings_cache', None)
 
         # don't save device. Will be determined by loading object
         current_dict.pop('stream', None)
@@ -183,6 +209,9 @@ class BaseTile(Generic[RPUConfigGeneric]):
         shared_weights_if = shared_weights is not None
 
         self.__dict__.update(current_dict)
+        self._set_dtype()
+        self._bindings_cache = {}
+        self._bindings_cache_misses = current_dict.get('_bindings_cache_misses', 0)
 
         self.device = torch_device('cpu')
         self.is_cuda = False
@@ -207,11 +236,17 @@ class BaseTile(Generic[RPUConfigGeneric]):
             # Check whether names match
             raise TileError('Mismatch with loaded analog state: '
                             'Hidden parameter structure is unexpected.')
-        self.tile.set_hidden_parameters(Tensor(hidden_parameters))
+        self.tile.set_hidden_parameters(as_tensor(hidden_parameters).to(self.dtype))
         self.tile.set_weights(ascontiguousarray(weights))
 
         self.tile.set_learning_rate(analog_lr)
 
+        # restart the random number generator if a seed was given
+        if getattr(self, 'seed', None) is not None:
+            self.tile.set_random_seed(*self.seed)
+        else:
+            self.seed = None
+
         # re-generate shared weights (CPU)
         if shared_weights_if:
             if not hasattr(self, 'shared_weights'):
@@ -220,7 +255,8 @@ class BaseTile(Generic[RPUConfigGeneric]):
 
             with no_grad():
                 # always new will be populated with set weights.
-                self.shared_weights.data = zeros(d_size, x_size, requires_grad=True)
+                self.shared_weights.data = zeros(d_size, x_size, dtype=self.dtype,
+                                                 requires_grad=True)
             self.ensure_shared_weights()
         else:
             self.shared_weights = None
@@ -262,102 +298,6 @@ class BaseTile(Generic[RPUConfigGeneric]):
         """
         raise NotImplementedError
 
-    def set_weights(
-            self,
-            weights: Tensor,
-            biases: Optional[Tensor] = None,
-            realistic: bool = False,
-            n_loops: int = 10
-    ) -> None:
-        """Set the tile weights (and biases).
-
-        Sets the internal tile weights to the specified values, and also the
-        internal tile biases if the tile was set to use bias (via
-        ``self.bias``).
-
-        Note:
-            By default this is **not** hardware realistic. You can set the
-            ``realistic`` parameter to ``True`` for a realistic transfer.
-
-        Args:
-            weights: ``[out_size, in_size]`` weight matrix.
-            biases: ``[out_size]`` bias vector. This parameter is required if
-                ``self.bias`` is ``True``, and ignored otherwise.
-            realistic: whether to use the forward and update pass to
-                program the weights iteratively, using
-                :meth:`set_weights_realistic`.
-            n_loops: number of times the columns of the weights are set in a
-                closed-loop manner.
-                A value of ``1`` means that all columns in principle receive
-                enough pulses to change from ``w_min`` to ``w_max``.
-
-        Returns:
-            None.
-
-        Raises:
-            ValueError: if the tile has bias but ``bias`` has not been
-                specified.
-        """
-        # Prepare the array expected by the pybind function, appending the
-        # biases row if needed.
-        weights_torch = weights.clone().detach().cpu()
-
-        if self.bias:
-            # Create a ``[out_size, in_size (+ 1)]`` matrix.
-            if biases is None:
-                raise ValueError('Analog tile has a bias, but no bias given')
-
-            biases_torch = unsqueeze(biases.clone().detach().cpu(), 1)
-            combined_weights = cat((weights_torch, biases_torch), dim=1)
-        else:
-            # Use only the ``[out_size, in_size]`` matrix.
-            combined_weights = weights_torch
-
-        numpy_weights = ascontiguousarray(combined_weights.numpy())
-
-        if realistic:
-            return self.tile.set_weights_realistic(numpy_weights, n_loops)
-
-        return self.tile.set_weights(numpy_weights)
-
-    def get_weights(self, realistic: bool = False) -> Tuple[Tensor, Optional[Tensor]]:
-        """Get the tile weights (and biases).
-
-        Gets the tile weights and extracts the mathematical weight
-        matrix and biases (if present, by determined by the ``self.bias``
-        parameter).
-
-        Note:
-            By default this is **not** hardware realistic. Use set
-            ``realistic`` to True for a realistic transfer.
-
-        Args:
-            realistic: Whether to use the forward pass to read out the tile
-                weights iteratively, using :meth:`get_weights_realistic`.
-
-        Returns:
-            a tuple where the first item is the ``[out_size, in_size]`` weight
-            matrix; and the second item is either the ``[out_size]`` bias vector
-            or ``None`` if the tile is set not to use bias.
-        """
-        # Retrieve the internal weights (and potentially biases) matrix.
-        if realistic:
-            combined_weights = self.tile.get_weights_realistic()
-        else:
-            combined_weights = self.tile.get_weights()
-
-        # Split the internal weights (and potentially biases) matrix.
-        if self.bias:
-            # combined_weights is [out_size, in_size (+ 1)].
-            weights = Tensor(combined_weights[:, :-1])
-            biases = Tensor(combined_weights[:, -1])
-        else:
-            # combined_weights is [out_size, in_size].
-            weights = Tensor(combined_weights)
-            biases = None
-
-        return weights, biases if self.bias else None
-
     def set_weights_scaled(
             self,
             weights: Tensor,
@@ -456,7 +396,7 @@ class BaseTile(Generic[RPUConfigGeneric]):
         # update the mapping field
         self.rpu_config.mapping.weight_scaling_omega = omega  # type: ignore
 
-        numpy_weights = ascontiguousarray(combined_weights.numpy())
+        numpy_weights = ascontiguousarray(combined_weights.to(self.dtype).numpy())
         if realistic:
             return self.tile.set_weights_realistic(numpy_weights, n_loops)
         return self.tile.set_weights(numpy_weights)
@@ -556,6 +496,71 @@ class BaseTile(Generic[RPUConfigGeneric]):
         """
         return self.tile.get_learning_rate()
 
+    def set_seed(self, seed: int, stream: int = 0) -> None:
+        """Set the seed of the random number generator of the tile.
+
+        The CPU simulator uses a counter based random number generator,
+        so that the noise of the tile is reproducible for a given seed,
+        stream and number of threads.
+
+        Note:
+            The CUDA tiles use their own random states, which are not
+            affected by the seed.
+
+        Args:
+            seed: the seed. If ``0``, a random seed is used.
+            stream: the stream of the generator. Tiles with the same
+                seed but different streams draw independent random numbers.
+        """
+        self.seed = (seed, stream)
+        self.tile.set_random_seed(seed, stream)
+
+    def get_seed(self) -> int:
+        """Return the seed of the random number generator of the tile.
+
+        Returns:
+            int: the seed (``0`` if a random seed is used).
+        """
+        return self.tile.get_random_seed()
+
+    def get_parameter_bindings(self, name: str) -> Any:
+        """Return the bindings of a parameter of the RPU config.
+
+        The bindings are cached by the version of the parameter and
+        only re-generated if any of its (nested) fields has been
+        assigned, so that the bindings can be used in every forward
+        pass or update step.
+
+        Args:
+            name: name of the parameter field of the RPU config (such
+                as ``modifier`` or ``clip``).
+
+        Returns:
+            The bindings object of the parameter.
+        """
+        # Import `aihwkit.simulator.configs` items dynamically to avoid import cycles.
+        # pylint: disable=import-outside-toplevel
+        from aihwkit.simulator.configs.helpers import parameters_to_bindings
+
+        params = getattr(self.rpu_config, name)
+        key = (params, params.get_version())
+        cached = self._bindings_cache.get(name)
+        if cached is not None and cached[0][0] is params and cached[0][1] == key[1]:
+            return cached[1]
+
+        self._bindings_cache_misses += 1
+        bindings = parameters_to_bindings(params)
+        self._bindings_cache[name] = (key, bindings)
+        return bindings
+
+    def get_bindings_cache_misses(self) -> int:
+        """Return the number of times the cached parameter bindings were generated.
+
+        Returns:
+            int: the number of cache misses of :meth:`get_parameter_bindings`.
+        """
+        return self._bindings_cache_misses
+
     @no_grad()
     def decay_weights(self, alpha: float = 1.0) -> None:
         """Decays the weights once according to the decay parameters of the tile.
@@ -682,9 +687,11 @@ class BaseTile(Generic[RPUConfigGeneric]):
         names = self.tile.get_hidden_parameter_names()
         hidden_parameters = self.tile.get_hidden_parameters().detach_()
 
+        # The hidden parameters are a fresh copy, so the slices can be
+        # returned directly.
         ordered_parameters = OrderedDict()
         for idx, name in enumerate(names):
-            ordered_parameters[name] = hidden_parameters[idx].clone()
+            ordered_parameters[name] = hidden_parameters[idx]
 
         return ordered_parameters
 
@@ -719,6 +726,7 @@ class BaseTile(Generic[RPUConfigGeneric]):
             return
 
         hidden_parameters = stack(list(ordered_parameters.values()), dim=0)
+        hidden_parameters = hidden_parameters.to(self.dtype)
         names = self.tile.get_hidden_parameter_names()
         if names != list(ordered_parameters.keys()):
             raise TileError('Mismatch with loaded analog state:'
@@ -772,13 +780,21 @@ class BaseTile(Generic[RPUConfigGeneric]):
         """
         return self.tile.has_matrix_indices()
 
-    def set_indexed(self, indices: Tensor, image_sizes: List) -> None:
+    def set_indexed(
+            self,
+            indices: Tensor,
+            image_sizes: List,
+            keep_plans: bool = False
+    ) -> None:
         """Set the index matrix for convolutions and switches to
         indexed forward/backward/update versions.
 
         Args:
             indices : torch.tensor with int indices
             image_sizes: [C_in, H_in, W_in, H_out, W_out] sizes
+            keep_plans: whether to re-use the gather plans that the tile
+                built for the same ``indices`` tensor before. Only valid
+                if the tensor was kept (unchanged) since.
 
         Raises:
             ValueError: if ``image_sizes`` does not have valid dimensions.
@@ -792,7 +808,7 @@ class BaseTile(Generic[RPUConfigGeneric]):
             raise TileError('Transposed indexed versions not supported (assumes NC(D)HW)')
 
         self.image_sizes = image_sizes
-        self.tile.set_matrix_indices(indices)
+        self.tile.set_matrix_indices(indices, keep_plans)
 
     @no_grad()
     def forward_indexed(self, x_input: Tensor, is_test: bool = False) -> Tensor:
@@ -884,8 +900,11 @@ class BaseTile(Generic[RPUConfigGeneric]):
 
     @no_grad()
     def post_update_step(self) -> None:
-        """Operators that need to be called once per mini-batch."""
-        if self.rpu_config.device.requires_diffusion():  # type: ignore
-            self.diffuse_weights()
-        if self.rpu_config.device.requires_decay():  # type: ignore
-            self.decay_weights()
+        """Operators that need to be called once per mini-batch.
+
+        Diffusion and decay are applied in one call to the simulator tile.
+        """
+        diffuse = self.rpu_config.device.requires_diffusion()  # type: ignore
+        decay = self.rpu_config.device.requires_decay()  # type: ignore
+        if diffuse or decay:
+            self.tile.post_update_step(diffuse, decay)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming checkpoints of the analog tile states."""
+
+from os import path as os_path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from numpy import ascontiguousarray, empty, memmap, ndarray
+from torch import Tensor, from_numpy, zeros
+from torch.nn import Parameter
+
+if TYPE_CHECKING:
+    from aihwkit.simulator.tiles import BaseTile
+
+# Alignment (in bytes) of the arrays in the tile files.
+_ALIGNMENT = 64
+
+# Array entry: offset, dtype, shape, kind.
+ArrayEntry = Tuple[int, str, Tuple[int, ...], str]
+
+
+class AnalogTileCheckpoint:
+    """Header of an analog tile state that is saved in a file of raw arrays.
+
+    The header holds the (small) tile state without the arrays, and the
+    offset, data type and shape of each array in the tile file. The
+    arrays are memory-mapped when the state is loaded, so that the tile
+    is populated directly from the file.
+
+    Args:
+        file_name: name of the tile file (relative to the checkpoint).
+        state: tile state without the arrays.
+        arrays: array entries of the tile file.
+    """
+
+    def __init__(
+            self,
+            file_name: str,
+            state: Dict,
+            arrays: Dict[str, ArrayEntry]
+    ):
+        self.file_name = file_name
+        self.state = state
+        self.arrays = arrays
+        self.path = None  # type: Optional[str]
+        self.is_loaded = False
+
+    def __getstate__(self) -> Dict:
+        """Get the state for pickling (without the load state)."""
+        current_dict = self.__dict__.copy()
+        current_dict['path'] = None
+        current_dict['is_loaded'] = False
+
+        return current_dict
+
+    @classmethod
+    def save(
+            cls,
+            analog_tile: 'BaseTile',
+            directory: str,
+            file_name: str
+    ) -> 'AnalogTileCheckpoint':
+        """Write the arrays of a tile state and return the header.
+
+        The arrays are written one at a time and released after writing,
+        so that only the state of this tile is materialized at once.
+
+        Args:
+            analog_tile: tile to save.
+            directory: directory of the checkpoint.
+            file_name: name of the tile file.
+
+        Returns:
+            The header of the tile state.
+        """
+        state = analog_tile.__getstate__()
+
+        # The shared weights are re-populated from the tile weights, and
+        # the analog context would pickle the tile again.
+        if state.get('shared_weights') is not None:
+            state['shared_weights'] = zeros(0, dtype=state['shared_weights'].dtype)
+        analog_ctx = state['analog_ctx']
+        state['analog_ctx'] = Parameter(analog_ctx.data.detach().cpu(),
+                                        requires_grad=analog_ctx.requires_grad)
+
+        arrays = {}  # type: Dict[str, ArrayEntry]
+        offset = 0
+        with open(os_path.join(directory, file_name), 'wb') as file:
+            for key in list(state.keys()):
+                for array_key, array, kind in cls._get_arrays(key, state[key]):
+                    padding = -offset % _ALIGNMENT
+                    file.write(bytes(padding))
+                    offset += padding
+
+                    array = ascontiguousarray(array)
+                    file.write(memoryview(array))
+                    arrays[array_key] = (offset, array.dtype.str, array.shape, kind)
+                    offset += array.nbytes
+                    state.pop(key, None)
+
+        return cls(file_name, state, arrays)
+
+    @staticmethod
+    def _get_arrays(key: str, value: Any) -> List[Tuple[str, ndarray, str]]:
+        """Return the arrays to write of a state entry."""
+        if isinstance(value, ndarray):
+            return [(key, value, 'numpy')]
+        if isinstance(value, Tensor) and not isinstance(value, Parameter):
+            if value.numel() == 0:
+                return []
+            return [(key, value.detach().cpu().numpy(), 'tensor')]
+        if isinstance(value, list) and value and all(isinstance(item, Tensor) for item in value):
+            return [('{}.{}'.format(key, idx), item.detach().cpu().numpy(), 'tensor_list')
+                    for idx, item in enumerate(value)]
+        return []
+
+    def load(self) -> Dict:
+        """Return the tile state with the arrays memory-mapped from the tile file.
+
+        The arrays are mapped copy-on-write, so that the file is not
+        modified by the tile.
+
+        Returns:
+            The tile state for ``BaseTile.__setstate__``.
+
+        Raises:
+            ValueError: if the path of the tile file is not set.
+        """
+        if self.path is None:
+            raise ValueError('The path of the tile file is not set')
+
+        state = self.state.copy()
+        for array_key, (offset, dtype, shape, kind) in self.arrays.items():
+            if 0 in shape:
+                # Empty arrays cannot be memory-mapped.
+                array = empty(shape, dtype=dtype)
+            else:
+                array = memmap(self.path, dtype=dtype, mode='c', offset=offset, shape=shape)
+
+            if kind == 'numpy':
+                state[array_key] = array
+            elif kind == 'tensor':
+                state[array_key] = from_numpy(array)
+            else:
+                key, idx = array_key.rsplit('.', 1)
+                state.setdefault(key, [])
+                state[key].insert(int(idx), from_numpy(array))
+
+        return state
@@ -159,9 +159,14 @@ class FloatingPointTile(BaseTile):
         if self.is_cuda and device != self.device:
             raise CudaError('Cannot switch CUDA devices of existing Cuda tiles')
 
-        if isinstance(self.tile, tiles.FloatingPointTile):
+        # Import `aihwkit.simulator.configs` items dynamically to avoid import cycles.
+        # pylint: disable=import-outside-toplevel
+        from aihwkit.simulator.configs.helpers import get_bindings_class
+
+        data_type = getattr(self.rpu_config, 'dtype', None)
+        if isinstance(self.tile, get_bindings_class(tiles.FloatingPointTile, data_type)):
             with cuda_device(device):
-                self.tile = tiles.CudaFloatingPointTile(self.tile)
+                self.tile = get_bindings_class(tiles.CudaFloatingPointTile, data_type)(self.tile)
                 self.is_cuda = True
                 self.device = device
                 self.analog_ctx.cuda(device)
@@ -184,7 +189,7 @@ class FloatingPointTile(BaseTile):
         Returns:
             a simulator tile based on the specified configuration.
         """
-        meta_parameter = rpu_config.device.as_bindings()
+        meta_parameter = rpu_config.device.as_bindings(rpu_config.dtype)
 
         return meta_parameter.create_array(x_size, d_size)
 
@@ -13,13 +13,13 @@
 """High level analog tiles (inference)."""
 
 from copy import deepcopy
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union, TYPE_CHECKING
 
 from torch import device as torch_device
-from torch import ones, zeros, Tensor
+from torch import as_tensor, cat, ones, stack, zeros, Tensor
 from torch.autograd import no_grad
 
-from aihwkit.exceptions import CudaError
+from aihwkit.exceptions import CudaError, TileError
 from aihwkit.simulator.rpu_base import cuda
 from aihwkit.simulator.tiles.analog import AnalogTile
 
@@ -76,10 +76,15 @@ class InferenceTile(AnalogTile):
         self.programmed_weights = None  # type: Optional[Tensor]
         self.nu_drift_list = None  # type: Optional[List[Tensor]]
 
+        # Ensemble of weight realizations.
+        self.ensemble_weights = None  # type: Optional[Tensor]
+        self.ensemble_alpha = None  # type: Optional[Tensor]
+
         super().__init__(out_size, in_size, rpu_config, bias, in_trans, out_trans)
 
         if shared_weights:
             self.shared_weights = zeros(out_size, in_size + int(bias),
+                                        dtype=self.dtype,
                                         requires_grad=True)  # type: Tensor
             self.ensure_shared_weights()
 
@@ -91,7 +96,8 @@ class InferenceTile(AnalogTile):
 
         if self.drift_readout_tensor is None:
             self.drift_readout_tensor = self.drift_compensation.get_readout_tensor(
-                self.tile.get_x_size()).detach().to(self.device)
+                self.tile.get_x_size()).detach().to(device=self.device,
+                                                    dtype=self.dtype)
             if self.in_trans:
                 self.drift_readout_tensor = self.drift_readout_tensor.tranpose(0, 1).clone()
 
@@ -112,12 +118,12 @@ class InferenceTile(AnalogTile):
             from_reference: Whether to use weights from reference
         """
         if not from_reference or self.reference_combined_weights is None:
-            self.reference_combined_weights = Tensor(self.tile.get_weights())
+            self.reference_combined_weights = as_tensor(self.tile.get_weights())
 
         self.programmed_weights, self.nu_drift_list = self.noise_model.apply_programming_noise(
             self.reference_combined_weights)
 
-        self.tile.set_weights(self.programmed_weights.numpy())
+        self.tile.set_weights(self.programmed_weights.contiguous())
 
         if self.drift_compensation is not None:
             forward_output = self._forward_drift_readout_tensor()
@@ -148,13 +154,199 @@ class InferenceTile(AnalogTile):
 
         drifted_weights = self.noise_model.apply_drift_noise(
             self.programmed_weights, self.nu_drift_list, t_inference)
-        self.tile.set_weights(drifted_weights.detach().cpu().numpy())
+        self._set_drifted_weights(drifted_weights)
+
+    @no_grad()
+    def drift_weights_sweep(
+            self,
+            t_inference_list: Sequence[float]
+    ) -> Iterator[float]:
+        """Drifts the programmed weights to several inference times in turn.
+
+        The drifted weights of all time points are generated at once
+        from the programmed weights and drift coefficients (which are
+        established with :meth:`program_weights` if needed). The tile
+        weights (and the drift compensation) are then set to each time
+        point in turn, so that the caller can evaluate the tile once
+        per time point::
+
+            for t_inference in tile.drift_weights_sweep([1.0, 3600.0, 86400.0]):
+                ...  # evaluate at ``t_inference``
+
+        Note:
+            The drifted weights of all time points are kept in memory
+            during the sweep.
+
+        Args:
+            t_inference_list: Times (in sec) of assumed inference. See
+                :meth:`drift_weights`.
+
+        Yields:
+            the inference time the tile weights are currently drifted to.
+        """
+        if self.programmed_weights is None:
+            self.program_weights()
+
+        drifted_weights = self.noise_model.apply_drift_noise_sweep(
+            self.programmed_weights, self.nu_drift_list, t_inference_list)
+
+        for t_inference, weights in zip(t_inference_list, drifted_weights):
+            self._set_drifted_weights(weights)
+            yield t_inference
+
+    @no_grad()
+    def _set_drifted_weights(self, drifted_weights: Tensor) -> None:
+        """Set the drifted weights and apply the drift compensation."""
+        self.tile.set_weights(
+            drifted_weights.detach().to(device='cpu', dtype=self.dtype).contiguous())
 
         if self.drift_compensation is not None:
             forward_output = self._forward_drift_readout_tensor()
             self.alpha = self.drift_compensation.apply(forward_output,
                                                        self.drift_baseline).to(self.device)
 
+    def __getstate__(self) -> Dict:
+        """Get the state for pickling.
+
+        The ensemble of weight realizations is not saved.
+        """
+        current_dict = super().__getstate__()
+        current_dict.pop('ensemble_weights', None)
+        current_dict.pop('ensemble_alpha', None)
+
+        return current_dict
+
+    def __setstate__(self, state: Dict) -> None:
+        """Set the state after unpickling.
+
+        The ensemble of weight realizations is reset.
+        """
+        super().__setstate__(state)
+        self.ensemble_weights = None
+        self.ensemble_alpha = None
+
+    @no_grad()
+    def program_weights_ensemble(
+            self,
+            n_realizations: int,
+            t_inference: float = 0.0
+    ) -> None:
+        """Programs and drifts an ensemble of weight realizations.
+
+        Generates ``n_realizations`` independent programming (and drift)
+        noise realizations of the reference weights at once, as a stacked
+        tensor, which is kept on the device of the tile. While the
+        ensemble is active, the evaluation forward pass expects the
+        mini-batch repeated ``n_realizations`` times (along the batch
+        dimension) and evaluates the ``k``-th repetition with the
+        ``k``-th realization, see
+        :meth:`~aihwkit.nn.AnalogSequential.forward_ensemble`.
+
+        Note:
+            The noise model needs to apply the noise element-wise, as
+            the realizations are generated as one stacked tensor.
+
+        Note:
+            The realizations are evaluated one after another with the
+            forward pass (and IO) of the tile. CPU tiles use each
+            realization directly in place of the tile weights, while
+            CUDA tiles copy it into their shared weights, which are
+            restored after the forward pass.
+
+        Args:
+            n_realizations: number of weight realizations.
+            t_inference: Time (in sec) of assumed inference. See
+                :meth:`drift_weights`.
+
+        Raises:
+            TileError: if ``n_realizations`` is not positive.
+        """
+        if n_realizations < 1:
+            raise TileError('The number of realizations needs to be positive')
+
+        self.clear_weights_ensemble()
+        current_weights = as_tensor(self.tile.get_weights())
+        if self.reference_combined_weights is None:
+            self.reference_combined_weights = current_weights
+
+        reference_weights = self.reference_combined_weights.unsqueeze(0).expand(
+            n_realizations, *self.reference_combined_weights.shape)
+        programmed_weights, nu_drift_list = self.noise_model.apply_programming_noise(
+            reference_weights)
+        drifted_weights = self.noise_model.apply_drift_noise(
+            programmed_weights, nu_drift_list, t_inference)
+
+        alpha = ones((n_realizations, 1))
+        if self.drift_compensation is not None:
+            alpha_list = []
+            for programmed, drifted in zip(programmed_weights, drifted_weights):
+                self.tile.set_weights(programmed.contiguous())
+                drift_baseline = self.drift_compensation.init_baseline(
+                    self._forward_drift_readout_tensor())
+                self.tile.set_weights(drifted.contiguous())
+                alpha_list.append(self.drift_compensation.apply(
+                    self._forward_drift_readout_tensor(), drift_baseline).to(self.device))
+            alpha = stack(alpha_list)
+            self.tile.set_weights(current_weights)
+
+        self.ensemble_weights = drifted_weights.to(device=self.device,
+                                                   dtype=self.dtype).contiguous()
+        self.ensemble_alpha = alpha.to(self.device)
+
+    def clear_weights_ensemble(self) -> None:
+        """Removes the ensemble of weight realizations."""
+        self.ensemble_weights = None
+        self.ensemble_alpha = None
+
+    def get_ensemble_size(self) -> int:
+        """Return the number of weight realizations of the ensemble.
+
+        Returns:
+            The number of realizations, or ``0`` if no ensemble is active.
+        """
+        if self.ensemble_weights is None:
+            return 0
+        return self.ensemble_weights.size(0)
+
+    def _set_ensemble_weights(self, weights: Tensor) -> None:
+        """Set the weights of one realization for the forward pass."""
+        if self.is_cuda:
+            # CUDA tiles use the (transposed) shared weights.
+            self.shared_weights.data.copy_(weights.T)
+        else:
+            self.tile.set_test_weights(weights)
+
+    @no_grad()
+    def _forward_ensemble(
+            self,
+            forward_fn: Callable[[Tensor, bool], Tensor],
+            x_input: Tensor,
+            apply_alpha: bool
+    ) -> Tensor:
+        """Forward pass of the repeated mini-batch with the ensemble weights."""
+        n_realizations = self.get_ensemble_size()
+        batch_dim = -1 if self.in_trans else 0
+        if x_input.size(batch_dim) % n_realizations:
+            raise TileError('The batch size needs to be a multiple of the number '
+                            'of realizations of the ensemble')
+
+        reference_weights = self.shared_weights.data.clone() if self.is_cuda else None
+        outputs = []
+        try:
+            for weights, alpha, x_chunk in zip(self.ensemble_weights, self.ensemble_alpha,
+                                               x_input.chunk(n_realizations, dim=batch_dim)):
+                self._set_ensemble_weights(weights)
+                output = forward_fn(x_chunk, True)
+                outputs.append(output * alpha.to(output.dtype) if apply_alpha else output)
+        finally:
+            # The tile weights are not changed by the ensemble.
+            if reference_weights is not None:
+                self.shared_weights.data.copy_(reference_weights)
+            else:
+                self.tile.reset_test_weights()
+
+        return cat(outputs, dim=-1 if self.out_trans else 0)
+
     def forward(self, x_input: Tensor, is_test: bool = False) -> Tensor:
         """Forward pass with drift compensation.
 
@@ -164,34 +356,52 @@ class InferenceTile(AnalogTile):
         """
         # Import `aihwkit.simulator.configs` items dynamically to avoid import cycles.
         # pylint: disable=import-outside-toplevel
-        from aihwkit.simulator.configs.helpers import parameters_to_bindings
         from aihwkit.simulator.configs.utils import WeightModifierType
 
         if not is_test and (self.rpu_config.modifier.type != WeightModifierType.COPY or
                             self.rpu_config.modifier.pdrop > 0.0):
-            weight_modify_params = parameters_to_bindings(self.rpu_config.modifier)
+            weight_modify_params = self.get_parameter_bindings('modifier')
             self.tile.modify_weights(weight_modify_params)
 
+        if is_test and self.ensemble_weights is not None:
+            return self._forward_ensemble(super().forward, x_input,
+                                          self.drift_compensation is not None)
+
         if not is_test or self.drift_compensation is None:
             return super().forward(x_input, is_test)
 
         # only do drift compensation in eval mode
         return super().forward(x_input, True)*self.alpha
 
+    def forward_indexed(self, x_input: Tensor, is_test: bool = False) -> Tensor:
+        """Forward pass for convolutions, using the ensemble weights if active."""
+        if is_test and self.ensemble_weights is not None:
+            return self._forward_ensemble(super().forward_indexed, x_input, False)
+
+        return super().forward_indexed(x_input, is_test)
+
     @no_grad()
     def post_update_step(self) -> None:
-        """Operators that need to be called once per mini-batch."""
+        """Operators that need to be called once per mini-batch.
+
+        Diffusion, decay and clipping are applied in one call to the
+        simulator tile.
+        """
         # Import `aihwkit.simulator.configs` items dynamically to avoid import cycles.
         # pylint: disable=import-outside-toplevel
-        from aihwkit.simulator.configs.helpers import parameters_to_bindings
         from aihwkit.simulator.configs.utils import WeightClipType
 
-        super().post_update_step()
+        diffuse = self.rpu_config.device.requires_diffusion()
+        decay = self.rpu_config.device.requires_decay()
+        clip = self.rpu_config.clip.type != WeightClipType.NONE
+        if not (diffuse or decay or clip):
+            return
 
-        # TODO: make this a little nicer. Now each time bindings are generated.
-        if self.rpu_config.clip.type != WeightClipType.NONE:
-            weight_clip_params = parameters_to_bindings(self.rpu_config.clip)
-            self.tile.clip_weights(weight_clip_params)
+        if clip:
+            weight_clip_params = self.get_parameter_bindings('clip')
+            self.tile.post_update_step(diffuse, decay, weight_clip_params)
+        else:
+            self.tile.post_update_step(diffuse, decay)
 
     def cuda(
             self,
@@ -211,8 +421,12 @@ class InferenceTile(AnalogTile):
         super().cuda(device)
 
         self.alpha = self.alpha.cuda(device)
+        if self.ensemble_weights is not None:
+            self.ensemble_weights = self.ensemble_weights.cuda(device)
+            self.ensemble_alpha = self.ensemble_alpha.cuda(device)
         self.shared_weights.data = zeros(self.tile.get_x_size(),
                                          self.tile.get_d_size(),
+                                         dtype=self.dtype,
                                          requires_grad=True).cuda(device)
         self.ensure_shared_weights()
 
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Weights of the high level analog tiles."""
+
+from typing import Optional, Tuple, Union
+
+from torch import Tensor, as_tensor, cat, unsqueeze
+from torch import dtype as torch_dtype
+from torch.nn import Parameter
+from torch.autograd import no_grad
+
+from aihwkit.exceptions import TileError
+from aihwkit.simulator.rpu_base import tiles
+
+
+class TileWeightsMixin:
+    """Mixin for getting and setting the weights of the tiles.
+
+    The weights are set from tensors and read as copies or as views of
+    the simulator tile weights. It is designed to be used as a mixin of
+    the :class:`~aihwkit.simulator.tiles.BaseTile`.
+    """
+
+    tile: Union[tiles.FloatingPointTile, tiles.AnalogTile]
+    bias: bool
+    dtype: torch_dtype
+    shared_weights: Parameter
+    is_cuda: bool
+
+    def set_weights(
+            self,
+            weights: Tensor,
+            biases: Optional[Tensor] = None,
+            realistic: bool = False,
+            n_loops: int = 10
+    ) -> None:
+        """Set the tile weights (and biases).
+
+        Sets the internal tile weights to the specified values, and also the
+        internal tile biases if the tile was set to use bias (via
+        ``self.bias``).
+
+        Note:
+            By default this is **not** hardware realistic. You can set the
+            ``realistic`` parameter to ``True`` for a realistic transfer.
+
+        Args:
+            weights: ``[out_size, in_size]`` weight matrix.
+            biases: ``[out_size]`` bias vector. This parameter is required if
+                ``self.bias`` is ``True``, and ignored otherwise.
+            realistic: whether to use the forward and update pass to
+                program the weights iteratively, using
+                :meth:`set_weights_realistic`.
+            n_loops: number of times the columns of the weights are set in a
+                closed-loop manner.
+                A value of ``1`` means that all columns in principle receive
+                enough pulses to change from ``w_min`` to ``w_max``.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: if the tile has bias but ``bias`` has not been
+                specified.
+        """
+        # Prepare the tensor expected by the pybind function, appending the
+        # biases row if needed. The tile copies the weights, so no copy
+        # is made here if the weights are already contiguous CPU tensors.
+        weights_torch = weights.detach().to(device='cpu', dtype=self.dtype)
+
+        if self.bias:
+            # Create a ``[out_size, in_size (+ 1)]`` matrix.
+            if biases is None:
+                raise ValueError('Analog tile has a bias, but no bias given')
+
+            biases_torch = unsqueeze(biases.detach().to(device='cpu',
+                                                        dtype=self.dtype), 1)
+            combined_weights = cat((weights_torch, biases_torch), dim=1)
+        else:
+            # Use only the ``[out_size, in_size]`` matrix.
+            combined_weights = weights_torch.contiguous()
+
+        if realistic:
+            return self.tile.set_weights_realistic(combined_weights.numpy(), n_loops)
+
+        return self.tile.set_weights(combined_weights)
+
+    def get_weights(self, realistic: bool = False) -> Tuple[Tensor, Optional[Tensor]]:
+        """Get the tile weights (and biases).
+
+        Gets the tile weights and extracts the mathematical weight
+        matrix and biases (if present, by determined by the ``self.bias``
+        parameter).
+
+        Note:
+            By default this is **not** hardware realistic. Use set
+            ``realistic`` to True for a realistic transfer.
+
+        Args:
+            realistic: Whether to use the forward pass to read out the tile
+                weights iteratively, using :meth:`get_weights_realistic`.
+
+        Returns:
+            a tuple where the first item is the ``[out_size, in_size]`` weight
+            matrix; and the second item is either the ``[out_size]`` bias vector
+            or ``None`` if the tile is set not to use bias.
+        """
+        # Retrieve the internal weights (and potentially biases) matrix.
+        if realistic:
+            combined_weights = self.tile.get_weights_realistic()
+        else:
+            combined_weights = self.tile.get_weights()
+        combined_weights = as_tensor(combined_weights)
+
+        # Split the internal weights (and potentially biases) matrix.
+        if self.bias:
+            # combined_weights is [out_size, in_size (+ 1)].
+            weights = combined_weights[:, :-1].to(self.dtype, copy=True)
+            biases = combined_weights[:, -1].to(self.dtype, copy=True)
+        else:
+            # combined_weights is [out_size, in_size].
+            weights = combined_weights.to(self.dtype, copy=True)
+            biases = None
+
+        return weights, biases if self.bias else None
+
+    @no_grad()
+    def get_weights_view(self) -> Tuple[Tensor, Optional[Tensor]]:
+        """Get views of the tile weights (and biases) without copying.
+
+        The returned tensors share the memory with the tile weights, so
+        that they always reflect the current tile weights. If the tile
+        uses shared weights, the views are taken of the shared weights.
+
+        Caution:
+            The views should be treated as read-only. Writing to them
+            bypasses the device model of the tile (e.g. bounds or
+            hidden weights of compound devices). Use :meth:`set_weights`
+            to set the weights, which copies the given tensors directly
+            into the tile weights.
+
+        Returns:
+            a tuple where the first item is the ``[out_size, in_size]`` weight
+            matrix view; and the second item is either the ``[out_size]``
+            bias vector view or ``None`` if the tile is set not to use bias.
+
+        Raises:
+            TileError: if the tile is a CUDA tile without shared weights.
+        """
+        if self.shared_weights is not None:
+            combined_weights = self.shared_weights.data
+            if self.is_cuda:
+                # CUDA shared weights are stored transposed.
+                combined_weights = combined_weights.T
+        elif self.is_cuda:
+            raise TileError('Weight views of CUDA tiles need shared weights')
+        else:
+            combined_weights = self.tile.get_weights_view()
+
+        if self.bias:
+            return combined_weights[:, :-1], combined_weights[:, -1]
+
+        return combined_weights, None
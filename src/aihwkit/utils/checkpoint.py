@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming, memory-mapped checkpoints of analog models.
+
+A checkpoint is a directory with one file of raw arrays per analog tile
+(``tile_<n>.bin``) and a small pickled header (``checkpoint.pkl``) that
+holds the state dict of the model, where the analog tile states are
+replaced by :class:`~aihwkit.simulator.tiles.checkpoint.AnalogTileCheckpoint`
+headers. The tile states are written one tile at a time, and the tiles
+are populated directly from the memory-mapped tile files when loading.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import count
+from fnmatch import fnmatch
+from os import listdir, makedirs, remove, path as os_path
+from pickle import dump, load
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from torch.nn import Module
+
+from aihwkit.nn.modules.base import AnalogModuleBase
+from aihwkit.simulator.tiles import BaseTile
+from aihwkit.simulator.tiles.checkpoint import AnalogTileCheckpoint
+
+CHECKPOINT_FILE = 'checkpoint.pkl'
+TILE_FILE_PATTERN = 'tile_*.bin'
+CHECKPOINT_VERSION = 1
+
+
+def save_analog_checkpoint(model: Module, path: str) -> None:
+    """Save the state of a model as a streaming checkpoint.
+
+    If the directory holds a checkpoint already, it is overwritten, and
+    the tile files that are not part of the new checkpoint are removed.
+
+    Args:
+        model: the model to save.
+        path: the directory of the checkpoint. It is created if needed.
+    """
+    makedirs(path, exist_ok=True)
+    tile_counter = count()
+    file_names = set()  # type: Set[str]
+
+    def write_tile(analog_tile: BaseTile) -> AnalogTileCheckpoint:
+        file_name = 'tile_{}.bin'.format(next(tile_counter))
+        file_names.add(file_name)
+        return AnalogTileCheckpoint.save(analog_tile, path, file_name)
+
+    analog_modules = [module for module in model.modules()
+                      if isinstance(module, AnalogModuleBase)]
+    # pylint: disable=protected-access
+    for module in analog_modules:
+        module._set_analog_checkpoint_writer(write_tile)
+    try:
+        state_dict = model.state_dict()
+    finally:
+        for module in analog_modules:
+            module._set_analog_checkpoint_writer(None)
+
+    with open(os_path.join(path, CHECKPOINT_FILE), 'wb') as file:
+        dump({'version': CHECKPOINT_VERSION, 'state_dict': state_dict}, file)
+
+    # Remove the stale tile files of a previous checkpoint.
+    for file_name in listdir(path):
+        if fnmatch(file_name, TILE_FILE_PATTERN) and file_name not in file_names:
+            remove(os_path.join(path, file_name))
+
+
+def _get_tile_loaders(
+        model: Module,
+        state_dict: Dict[str, Any],
+        load_rpu_config: bool
+) -> List[Callable]:
+    """Return the jobs that load the analog tiles from their tile files.
+
+    Args:
+        model: the model to load the checkpoint into.
+        state_dict: the state dict of the checkpoint.
+        load_rpu_config: Whether to load the saved RPU config.
+
+    Returns:
+        One job per analog tile that has a tile file in the checkpoint.
+    """
+    jobs = []  # type: List[Callable]
+    # pylint: disable=protected-access
+    for module_name, module in model.named_modules():
+        if not isinstance(module, AnalogModuleBase):
+            continue
+        module._set_load_rpu_config_state(load_rpu_config)
+        prefix = module_name + '.' if module_name else ''
+        for name, analog_tile in module.named_analog_tiles():
+            analog_state = state_dict.get(prefix + module.ANALOG_STATE_PREFIX + name)
+            if isinstance(analog_state, AnalogTileCheckpoint):
+                jobs.append(partial(module.load_analog_tile_state, analog_tile, analog_state))
+
+    return jobs
+
+
+def load_analog_checkpoint(
+        model: Module,
+        path: str,
+        strict: bool = True,
+        load_rpu_config: bool = True,
+        n_workers: Optional[int] = None
+) -> NamedTuple:
+    """Load a streaming checkpoint into a model.
+
+    The analog tiles are populated directly from the memory-mapped tile
+    files. If ``n_workers`` is not ``1``, the tiles are loaded in parallel
+    threads before the rest of the state dict, otherwise they are loaded
+    lazily in ``AnalogModuleBase._load_from_state_dict``.
+
+    Args:
+        model: the model to load the checkpoint into.
+        path: the directory of the checkpoint.
+        strict: see torch's ``load_state_dict``
+        load_rpu_config: Whether to load the saved RPU config or use the
+            current RPU config of the model, see
+            :meth:`~aihwkit.nn.modules.base.AnalogModuleBase.load_state_dict`.
+        n_workers: number of threads to load the tiles. If ``None``,
+            the default of ``ThreadPoolExecutor`` is used.
+
+    Returns:
+        see torch's ``load_state_dict``
+    """
+    with open(os_path.join(path, CHECKPOINT_FILE), 'rb') as file:
+        checkpoint = load(file)
+    state_dict = checkpoint['state_dict']
+
+    for analog_state in state_dict.values():
+        if isinstance(analog_state, AnalogTileCheckpoint):
+            analog_state.path = os_path.join(path, analog_state.file_name)
+
+    jobs = _get_tile_loaders(model, state_dict, load_rpu_config)
+    if n_workers != 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(n_workers) as executor:
+            for future in [executor.submit(job) for job in jobs]:
+                future.result()
+
+    # Use torch's load_state_dict, as the RPU config flag is already set.
+    return Module.load_state_dict(model, state_dict, strict)
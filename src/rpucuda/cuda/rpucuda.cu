@@ -642,6 +642,20 @@ template <typename T> void RPUCudaSimple<T>::clipWeights(const WeightClipParamet
   wclipper_cuda_->apply(dev_weights_->getData(), wclpar);
 }
 
+template <typename T>
+void RPUCudaSimple<T>::postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar) {
+  // separate kernels (CPU weights are not synchronized)
+  if (diffuse) {
+    this->diffuseWeights();
+  }
+  if (decay) {
+    this->decayWeights(false);
+  }
+  if (wclpar.type != WeightClipType::None) {
+    this->clipWeights(wclpar);
+  }
+}
+
 /*********************************************************************************/
 template <typename T> void RPUCudaSimple<T>::diffuseWeights() {
 
@@ -186,6 +186,8 @@ public:
   void clipWeights(T clip) override;
   void clipWeights(const WeightClipParameter &wclpar) override;
 
+  void postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar) override;
+
   T **getWeights() override; // host weights. implicit copy from CUDA
 
   void getWeights(T *weightsptr) const override;
@@ -39,15 +39,24 @@ template <typename T> void RealWorldRNG<T>::setSeed(unsigned int seed) {
 /********************************************************/
 /* RNG                                                  */
 
-template <typename T> RNG<T>::RNG(unsigned int rseed) : gauss_list_size_(FIXED_LIST_SIZE) {
-  this->setSeed(rseed);
+template <typename T>
+RNG<T>::RNG(unsigned int rseed, unsigned int stream) : gauss_list_size_(FIXED_LIST_SIZE) {
+  this->setSeed(rseed, stream);
 }
 
-template <typename T> RNG<T>::~RNG() {
-  if (gauss_numbers_list_ != nullptr) {
-    delete[] gauss_numbers_list_;
-    gauss_numbers_list_ = nullptr;
-  }
+// thread substream (shares key and gauss list with the parent)
+template <typename T>
+RNG<T>::RNG(const RNG<T> &parent, unsigned int substream)
+    : gauss_list_size_(parent.gauss_list_size_), seed_(parent.seed_), key_(parent.key_),
+      stream_(parent.stream_),
+      // substreams of substreams (nested parallel loops) need to differ from the parent's
+      substream_((parent.substream_ << RPU_RNG_SUBSTREAM_BITS) + substream),
+      gauss_list_(parent.gauss_list_), gauss_numbers_list_(parent.gauss_numbers_list_) {}
+
+template <typename T>
+RNG<T>::RNG(const RNG<T> &parent, unsigned int substream, uint64_t counter)
+    : RNG<T>(parent, substream) {
+  counter_ = counter;
 }
 
 /*********************************************************************************/
@@ -55,7 +64,7 @@ template <typename T> RNG<T>::~RNG() {
 template <typename T> RNG<T>::RNG(const RNG<T> &other) {
   // do never copy random numbers. Just re-generate
   gauss_list_size_ = other.gauss_list_size_;
-  this->setSeed(other.seed_);
+  this->setSeed(other.seed_, other.stream_);
 }
 
 // copy assignment
@@ -70,29 +79,87 @@ template <typename T> RNG<T>::RNG(RNG<T> &&other) { *this = std::move(other); }
 // move assignment
 template <typename T> RNG<T> &RNG<T>::operator=(RNG<T> &&other) {
 
+  gauss_list_ = std::move(other.gauss_list_);
   gauss_numbers_list_ = other.gauss_numbers_list_;
   other.gauss_numbers_list_ = nullptr;
   gauss_list_size_ = other.gauss_list_size_;
   seed_ = other.seed_;
+  key_ = other.key_;
+  stream_ = other.stream_;
+  substream_ = other.substream_;
+  counter_ = other.counter_;
+  std::copy(other.block_, other.block_ + 4, block_);
+  block_idx_ = other.block_idx_;
+  thread_rngs_ = std::move(other.thread_rngs_);
   return *this;
 }
 
 template <typename T> void RNG<T>::randomizeSeed() {
-  unsigned int seed = std::chrono::high_resolution_clock::now().time_since_epoch().count();
-  srand(seed);
-  fast_srand((randomint_t)(rand() % RPU_MAX_RAND_RANGE));
-  generateNewList();
+  std::random_device rd;
+  uint64_t t = (uint64_t)std::chrono::high_resolution_clock::now().time_since_epoch().count();
+  key_ = (((uint64_t)rd() << 32) | (uint64_t)rd()) ^ t;
   seed_ = 0;
 }
 
-template <typename T> void RNG<T>::setSeed(unsigned int seed) {
+template <typename T> void RNG<T>::setSeed(unsigned int seed) { setSeed(seed, stream_); }
+
+template <typename T> void RNG<T>::setSeed(unsigned int seed, unsigned int stream) {
   seed_ = seed;
+  stream_ = stream;
+  substream_ = 0;
+  counter_ = 0;
+  block_idx_ = 4;
   if (seed == 0) {
     randomizeSeed();
   } else {
-    srand((randomint_t)seed);
-    fast_srand((randomint_t)seed);
-    generateNewList();
+    key_ = (uint64_t)seed;
+  }
+  thread_rngs_.clear();
+  generateNewList();
+}
+
+template <typename T> void RNG<T>::prepareThreadRNGs(int n_threads) {
+  // thread 0 is this RNG
+  int n_streams = n_threads - 1;
+  while ((int)thread_rngs_.size() < n_streams) {
+    unsigned int substream = (unsigned int)thread_rngs_.size() + 1;
+    thread_rngs_.push_back(std::unique_ptr<RNG<T>>(new RNG<T>(*this, substream)));
+  }
+}
+
+template <typename T> void RNG<T>::fillUniform(T *values, int size) {
+  int i = 0;
+  while (i < size && block_idx_ < 4) {
+    values[i++] = sampleUniform();
+  }
+  uint32_t block[4];
+  for (; i + 4 <= size; i += 4) {
+    philox::generate(block, counter_++, stream_, substream_, key_);
+    PRAGMA_SIMD
+    for (int k = 0; k < 4; k++) {
+      values[i + k] = (block[k] >> RPU_RAND_SHIFT) / ((T)RPU_MAX_RAND_RANGE);
+    }
+  }
+  while (i < size) {
+    values[i++] = sampleUniform();
+  }
+}
+
+template <typename T> void RNG<T>::fillGauss(T *values, int size) {
+  int i = 0;
+  while (i < size && block_idx_ < 4) {
+    values[i++] = sampleGauss();
+  }
+  uint32_t block[4];
+  for (; i + 4 <= size; i += 4) {
+    philox::generate(block, counter_++, stream_, substream_, key_);
+    PRAGMA_SIMD
+    for (int k = 0; k < 4; k++) {
+      values[i + k] = gaussFromRandom((randomint_t)(block[k] >> RPU_RAND_SHIFT));
+    }
+  }
+  while (i < size) {
+    values[i++] = sampleGauss();
   }
 }
 
@@ -103,26 +170,26 @@ template <typename T> void RNG<T>::generateNewList(int list_size) {
     RPU_FATAL("Fast mode needs constant list size (" << FIXED_LIST_SIZE << ") got: " << list_size);
   }
 #endif
-  unsigned long long seed = seed_;
-  if (seed == 0) {
-    seed = (unsigned long long)std::chrono::high_resolution_clock::now().time_since_epoch().count();
-  }
-  std::default_random_engine generator{(unsigned int)seed};
-  std::normal_distribution<T> random_dist{};
-  auto nrnd = std::bind(random_dist, generator);
-
-  T *numbers = new T[list_size];
-
-  for (int i = 0; i < list_size; ++i) {
-    numbers[i] = nrnd();
-  }
-
-  if (gauss_numbers_list_ != nullptr) {
-    delete[] gauss_numbers_list_;
+  // Box-Muller from a separate Philox substream, so that the list
+  // only depends on the seed (and is platform independent)
+  auto numbers = std::make_shared<std::vector<T>>(list_size);
+  uint32_t block[4];
+  const double two_pi = 6.283185307179586;
+  for (int i = 0; i < list_size; i += 2) {
+    philox::generate(block, (uint64_t)i, 0xFFFFFFFF, 0xFFFFFFFF, key_);
+    double u1 = ((double)block[0] + 1.0) / 4294967296.0; // in (0, 1]
+    double u2 = (double)block[1] / 4294967296.0;
+    double r = sqrt(-2.0 * log(u1));
+    (*numbers)[i] = (T)(r * cos(two_pi * u2));
+    if (i + 1 < list_size) {
+      (*numbers)[i + 1] = (T)(r * sin(two_pi * u2));
+    }
   }
 
   gauss_list_size_ = list_size;
-  gauss_numbers_list_ = numbers;
+  gauss_list_ = numbers;
+  gauss_numbers_list_ = gauss_list_->data();
+  thread_rngs_.clear();
 }
 
 #ifdef RPU_USE_DOUBLE
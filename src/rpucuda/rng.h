@@ -19,34 +19,27 @@
 #include <iostream>
 #include <memory>
 #include <random>
+#include <stdint.h>
 #include <time.h>
+#include <vector>
 
 #ifdef RPU_USE_FASTRAND
 #define RPU_MAX_RAND_RANGE 0x7FFF
-#define RANDFUN fastrand
-#include <stdint.h>
-typedef int_fast16_t randomint_t;
+#define RPU_RAND_SHIFT 17
 #else
-#define RANDFUN rand
-#define RPU_MAX_RAND_RANGE RAND_MAX
-typedef int randomint_t;
+#define RPU_MAX_RAND_RANGE 0x7FFFFFFF
+#define RPU_RAND_SHIFT 1
 #endif
+typedef int randomint_t;
 
 // NEED TO BE 0x7FFF for FASTRAND!!!
 #define FIXED_LIST_SIZE 32768
 #define FIXED_LIST_SIZE_MSK 0x7FFF
+// bits reserved for the substreams of each level of (nested) parallel
+// loops. Substreams might be used per row, thus up to 65535 substreams
+#define RPU_RNG_SUBSTREAM_BITS 16
 namespace RPU {
 
-static randomint_t g_seed;
-
-// Used to seed the generator.
-inline void fast_srand(randomint_t seed) { g_seed = seed; }
-// fastrand routine returns one integer, similar output value range as C lib.
-inline randomint_t fastrand() {
-  g_seed = (214013 * g_seed + 2531011);
-  return (g_seed >> 16) & 0x7FFF;
-}
-
 /* this is used for construction (populate device) */
 template <typename T> class RealWorldRNG {
 public:
@@ -66,16 +59,63 @@ private:
   std::normal_distribution<T> ndist_{(T)0.0, (T)1.0};
 };
 
+/* Philox4x32-10 counter-based random number generator (Salmon et
+   al. 2011, "Parallel random numbers: as easy as 1, 2, 3"). Each
+   counter value is mapped to 4 independent 32 bit random numbers, so
+   that streams can be split without any shared state. */
+namespace philox {
+
+#define RPU_PHILOX_M0 0xD2511F53
+#define RPU_PHILOX_M1 0xCD9E8D57
+#define RPU_PHILOX_W0 0x9E3779B9
+#define RPU_PHILOX_W1 0xBB67AE85
+
+FORCE_INLINE void philoxRound(uint32_t *ctr, const uint32_t *key) {
+  uint64_t prod0 = (uint64_t)RPU_PHILOX_M0 * ctr[0];
+  uint64_t prod1 = (uint64_t)RPU_PHILOX_M1 * ctr[2];
+  uint32_t hi0 = (uint32_t)(prod0 >> 32);
+  uint32_t hi1 = (uint32_t)(prod1 >> 32);
+  uint32_t lo0 = (uint32_t)prod0;
+  uint32_t lo1 = (uint32_t)prod1;
+  ctr[0] = hi1 ^ ctr[1] ^ key[0];
+  ctr[1] = lo1;
+  ctr[2] = hi0 ^ ctr[3] ^ key[1];
+  ctr[3] = lo0;
+}
+
+FORCE_INLINE void
+generate(uint32_t *out, uint64_t counter, uint32_t stream, uint32_t substream, uint64_t key) {
+  uint32_t k[2] = {(uint32_t)key, (uint32_t)(key >> 32)};
+  out[0] = (uint32_t)counter;
+  out[1] = (uint32_t)(counter >> 32);
+  out[2] = stream;
+  out[3] = substream;
+  for (int r = 0; r < 10; r++) {
+    if (r > 0) {
+      k[0] += RPU_PHILOX_W0;
+      k[1] += RPU_PHILOX_W1;
+    }
+    philoxRound(out, k);
+  }
+}
+
+} // namespace philox
+
 /* Faster approximative RNG for CPU. This is used for everything
  else on the CPU. Note that GPU ALWAYS uses "real world
  random numbers !
+
+ Counter based (Philox) with the seed as key. Tiles can use different
+ streams with the same seed, and each (OpenMP) thread uses its own
+ substream. Thus results are reproducible for a given seed and number
+ of threads. Gaussian numbers are drawn from a (seeded) list.
 */
 template <typename T> class RNG {
 
 public:
-  explicit RNG(unsigned int seed);
+  explicit RNG(unsigned int seed, unsigned int stream = 0);
   RNG() : RNG<T>(0){};
-  ~RNG();
+  ~RNG() = default;
 
   RNG(const RNG<T> &);
   RNG<T> &operator=(const RNG<T> &);
@@ -86,7 +126,15 @@ public:
     using std::swap;
     swap(a.gauss_list_size_, b.gauss_list_size_);
     swap(a.seed_, b.seed_);
+    swap(a.key_, b.key_);
+    swap(a.stream_, b.stream_);
+    swap(a.substream_, b.substream_);
+    swap(a.counter_, b.counter_);
+    swap(a.block_, b.block_);
+    swap(a.block_idx_, b.block_idx_);
+    swap(a.gauss_list_, b.gauss_list_);
     swap(a.gauss_numbers_list_, b.gauss_numbers_list_);
+    swap(a.thread_rngs_, b.thread_rngs_);
   }
 
   void generateNewList();
@@ -94,39 +142,75 @@ public:
 
   void randomizeSeed();
   void setSeed(unsigned int seed);
+  void setSeed(unsigned int seed, unsigned int stream);
+  unsigned int getSeed() const { return seed_; };
+  unsigned int getStream() const { return stream_; };
+
+  /* Independent substreams for (OpenMP) parallel loops. Needs to be
+     called outside of the parallel region. Thread 0 uses the RNG
+     itself. The substreams of a substream (for nested loops) differ
+     from all substreams of the parent. */
+  void prepareThreadRNGs(int n_threads);
+  FORCE_INLINE RNG<T> *getThreadRNG(int thread_idx) {
+    return thread_idx == 0 ? this : thread_rngs_[thread_idx - 1].get();
+  }
 
-  FORCE_INLINE randomint_t sample() { return RANDFUN(); }
+  FORCE_INLINE randomint_t sample() {
+    if (block_idx_ >= 4) {
+      nextBlock();
+    }
+    return (randomint_t)(block_[block_idx_++] >> RPU_RAND_SHIFT);
+  }
 
-  FORCE_INLINE T sampleUniform() { return RANDFUN() / ((T)RPU_MAX_RAND_RANGE); }
+  FORCE_INLINE T sampleUniform() { return sample() / ((T)RPU_MAX_RAND_RANGE); }
 
   FORCE_INLINE T sampleUniform(T min_max) {
-    return ((RANDFUN() / ((T)RPU_MAX_RAND_RANGE)) - (T)0.5) * 2 * min_max;
+    return ((sample() / ((T)RPU_MAX_RAND_RANGE)) - (T)0.5) * 2 * min_max;
   }
 
   FORCE_INLINE T sampleUniform(T min_value, T max_value) {
-    return ((RANDFUN() / ((T)RPU_MAX_RAND_RANGE)) * (max_value - min_value)) + min_value;
+    return ((sample() / ((T)RPU_MAX_RAND_RANGE)) * (max_value - min_value)) + min_value;
   }
 
-  FORCE_INLINE T sampleGauss() {
-#ifdef RPU_USE_FASTRAND
-#ifdef RPU_USE_FASTMOD
-    return gauss_numbers_list_[RANDFUN()]; // assume 0x7FFF for list size
-#else
-    return gauss_numbers_list_[RANDFUN() % gauss_list_size_];
-#endif
-#else
+  FORCE_INLINE T sampleGauss() { return gaussFromRandom(sample()); }
+
+  /* Bulk versions. Same numbers as sampling one by one. */
+  void fillUniform(T *values, int size);
+  void fillGauss(T *values, int size);
+
+  /* Substream of the parent starting at the given counter. Used to
+     (re-)generate identical numbers, e.g. per matrix row, independent
+     of the thread. */
+  RNG(const RNG<T> &parent, unsigned int substream, uint64_t counter);
+
+private:
+  RNG(const RNG<T> &parent, unsigned int substream);
+
+  FORCE_INLINE void nextBlock() {
+    philox::generate(block_, counter_++, stream_, substream_, key_);
+    block_idx_ = 0;
+  }
+
+  FORCE_INLINE T gaussFromRandom(randomint_t r) const {
 #ifdef RPU_USE_FASTMOD
-    return gauss_numbers_list_[RANDFUN() & FIXED_LIST_SIZE_MSK];
+    return gauss_numbers_list_[r & FIXED_LIST_SIZE_MSK];
 #else
-    return gauss_numbers_list_[RANDFUN() % gauss_list_size_];
-#endif
+    return gauss_numbers_list_[r % gauss_list_size_];
 #endif
   }
 
-private:
   int gauss_list_size_;
-  unsigned int seed_;
+  unsigned int seed_ = 0;
+  uint64_t key_ = 0;
+  uint32_t stream_ = 0;
+  uint32_t substream_ = 0;
+  uint64_t counter_ = 0;
+  uint32_t block_[4] = {0, 0, 0, 0};
+  int block_idx_ = 4;
+  // list is shared with the thread RNGs (read only)
+  std::shared_ptr<std::vector<T>> gauss_list_ = nullptr;
   T *gauss_numbers_list_ = nullptr;
+  std::vector<std::unique_ptr<RNG<T>>> thread_rngs_;
 };
 
 } // namespace RPU
@@ -0,0 +1,113 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "rng.h"
+#include "gtest/gtest.h"
+#include <vector>
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+TEST(RNGTest, SameSeedIsReproducible) {
+  RNG<num_t> rng1(1234);
+  RNG<num_t> rng2(1234);
+
+  for (int i = 0; i < 1000; i++) {
+    ASSERT_EQ(rng1.sample(), rng2.sample());
+    ASSERT_EQ(rng1.sampleGauss(), rng2.sampleGauss());
+  }
+}
+
+TEST(RNGTest, StreamsAreDifferent) {
+  RNG<num_t> rng1(1234, 0);
+  RNG<num_t> rng2(1234, 1);
+
+  int n_equal = 0;
+  for (int i = 0; i < 1000; i++) {
+    n_equal += rng1.sample() == rng2.sample();
+  }
+  ASSERT_LT(n_equal, 5);
+}
+
+TEST(RNGTest, FillIsSameAsSample) {
+  RNG<num_t> rng1(42);
+  RNG<num_t> rng2(42);
+  int size = 103;
+  std::vector<num_t> values(size);
+
+  // start within a block
+  rng1.sample();
+  rng2.sample();
+
+  rng1.fillGauss(values.data(), size);
+  for (int i = 0; i < size; i++) {
+    ASSERT_EQ(values[i], rng2.sampleGauss());
+  }
+  rng1.fillUniform(values.data(), size);
+  for (int i = 0; i < size; i++) {
+    ASSERT_EQ(values[i], rng2.sampleUniform());
+  }
+}
+
+TEST(RNGTest, ThreadRNGsAreReproducible) {
+  RNG<num_t> rng1(42);
+  RNG<num_t> rng2(42);
+  rng1.prepareThreadRNGs(3);
+  rng2.prepareThreadRNGs(3);
+
+  ASSERT_EQ(rng1.getThreadRNG(0), &rng1);
+  for (int i = 0; i < 100; i++) {
+    ASSERT_EQ(rng1.getThreadRNG(2)->sample(), rng2.getThreadRNG(2)->sample());
+  }
+  ASSERT_NE(rng1.getThreadRNG(1)->sample(), rng1.getThreadRNG(2)->sample());
+}
+
+TEST(RNGTest, Statistics) {
+  RNG<num_t> rng(7);
+  int size = 100000;
+  std::vector<num_t> values(size);
+
+  rng.fillGauss(values.data(), size);
+  double mean = 0.0;
+  double var = 0.0;
+  for (int i = 0; i < size; i++) {
+    mean += values[i];
+    var += values[i] * values[i];
+  }
+  mean /= size;
+  var = var / size - mean * mean;
+  ASSERT_NEAR(mean, 0.0, 0.02);
+  ASSERT_NEAR(var, 1.0, 0.02);
+
+  rng.fillUniform(values.data(), size);
+  mean = 0.0;
+  for (int i = 0; i < size; i++) {
+    ASSERT_GE(values[i], 0.0);
+    ASSERT_LE(values[i], 1.0);
+    mean += values[i];
+  }
+  ASSERT_NEAR(mean / size, 0.5, 0.01);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
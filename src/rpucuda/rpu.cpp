@@ -203,6 +203,7 @@ template <typename T> void RPUSimple<T>::initialize(int x_sz, int d_sz) {
   weights_ = Array_2D_Get<T>(d_sz, x_sz);
   fb_weights_ = nullptr;
   delta_weights_extern_.resize(d_sz, nullptr); // this is a pointer array of row pointers
+  test_weights_extern_.resize(d_sz, nullptr);
 
   for (int i = 0; i < d_sz; ++i) {
     for (int j = 0; j < x_sz; ++j) {
@@ -301,6 +302,7 @@ template <typename T> RPUSimple<T>::RPUSimple(const RPUSimple<T> &other) : RPUAb
 
   // cannot copy external weight pointer... user needs to call it again
   delta_weights_extern_[0] = nullptr;
+  test_weights_extern_[0] = nullptr;
 
   if (other.fb_weights_) {
     fb_weights_ = Array_2D_Get<T>(this->d_size_, this->x_size_);
@@ -320,6 +322,7 @@ template <typename T> RPUSimple<T>::RPUSimple(const RPUSimple<T> &other) : RPUAb
 
   matrix_indices_ = other.matrix_indices_;
   matrix_indices_set_ = other.matrix_indices_set_;
+  index_plans_ = other.index_plans_;
 
   // note: RNG / temp_values are not copied.
   last_update_m_batch_ = other.last_update_m_batch_;
@@ -368,6 +371,7 @@ template <typename T> RPUSimple<T> &RPUSimple<T>::operator=(RPUSimple<T> &&other
   other.fb_weights_ = nullptr;
 
   delta_weights_extern_ = std::move(other.delta_weights_extern_);
+  test_weights_extern_ = std::move(other.test_weights_extern_);
 
   fb_weight_modifier_ = std::move(other.fb_weight_modifier_);
 
@@ -389,6 +393,9 @@ template <typename T> RPUSimple<T> &RPUSimple<T>::operator=(RPUSimple<T> &&other
   matrix_indices_set_ = other.matrix_indices_set_;
   other.matrix_indices_set_ = false;
 
+  index_plans_ = std::move(other.index_plans_);
+  other.index_plans_.clear();
+
   wdrifter_ = std::move(other.wdrifter_);
 
   last_update_m_batch_ = other.last_update_m_batch_;
@@ -472,7 +479,11 @@ template <typename T>
 void RPUSimple<T>::forwardMatrix(
     const T *X_input, T *D_output, int m_batch, bool x_trans, bool d_trans, bool is_test) {
 
-  if (d_trans) {
+  if (auto *wmodifier = getLazyFBWeightModifier(is_test)) {
+    wmodifier->gemmForward(
+        getFBWeights(is_test)[0], this->fwd_alpha_, X_input, m_batch, x_trans, (T)0.0, D_output,
+        d_trans);
+  } else if (d_trans) {
     RPU::math::gemm<T>(
         CblasRowMajor, CblasNoTrans,
         x_trans ? CblasNoTrans : CblasTrans, // inverse meaning...
@@ -496,7 +507,10 @@ template <typename T>
 void RPUSimple<T>::backwardMatrix(
     const T *D_input, T *X_output, int m_batch, bool d_trans, bool x_trans) {
 
-  if (x_trans) {
+  if (auto *wmodifier = getLazyFBWeightModifier(false)) {
+    wmodifier->gemmBackward(
+        weights_[0], this->bwd_alpha_, D_input, m_batch, d_trans, (T)0.0, X_output, x_trans);
+  } else if (x_trans) {
     RPU::math::gemm<T>(
         CblasRowMajor, CblasTrans, d_trans ? CblasNoTrans : CblasTrans, this->x_size_, m_batch,
         this->d_size_, this->bwd_alpha_, getFBWeights(false)[0], this->x_size_, D_input,
@@ -590,6 +604,11 @@ void RPUSimple<T>::copyFromMatrixBiasBuffer(T *X_input_without_bias, int m_batch
 template <typename T>
 void RPUSimple<T>::forwardVector(
     const T *x_input, T *d_output, int x_inc, int d_inc, bool is_test) {
+  if (auto *wmodifier = getLazyFBWeightModifier(is_test)) {
+    wmodifier->gemvForward(
+        getFBWeights(is_test)[0], this->fwd_alpha_, x_input, x_inc, (T)0.0, d_output, d_inc);
+    return;
+  }
   RPU::math::gemv<T>(
       CblasRowMajor, CblasNoTrans, this->d_size_, this->x_size_, this->fwd_alpha_,
       getFBWeights(is_test)[0], this->x_size_, x_input, x_inc, (T)0.0, d_output, d_inc);
@@ -597,6 +616,10 @@ void RPUSimple<T>::forwardVector(
 
 template <typename T>
 void RPUSimple<T>::backwardVector(const T *d_input, T *x_output, int d_inc, int x_inc) {
+  if (auto *wmodifier = getLazyFBWeightModifier(false)) {
+    wmodifier->gemvBackward(weights_[0], this->bwd_alpha_, d_input, d_inc, (T)0.0, x_output, x_inc);
+    return;
+  }
   RPU::math::gemv<T>(
       CblasRowMajor, CblasTrans, this->d_size_, this->x_size_, this->bwd_alpha_,
       getFBWeights(false)[0], this->x_size_, d_input, d_inc, (T)0.0, x_output, x_inc);
@@ -744,6 +767,137 @@ void RPUSimple<T>::updateTensor(
 /*********************************************************************************/
 /* Indexed forward/backward/update */
 
+void IndexGatherPlan::build(const int *indices_, int size_, int m_batch_, bool trans_) {
+  indices = indices_;
+  size = size_;
+  m_batch = m_batch_;
+  trans = trans_;
+  runs.clear();
+
+  // in the transposed case the rows of the different images are
+  // interleaved, thus runs cannot extend over a row (of m_batch)
+  int n = size * m_batch;
+  int row_length = trans ? m_batch : n;
+
+  for (int k = 0; k < n; k++) {
+    int j_shifted = indices[k];
+    if (!runs.empty() && (k % row_length)) {
+      Run &run = runs.back();
+      if (run.j_start <= 1 ? j_shifted == run.j_start : j_shifted == run.j_start + run.length) {
+        run.length++;
+        continue;
+      }
+    }
+    runs.push_back({k, j_shifted, 1});
+  }
+}
+
+template <typename T>
+const IndexGatherPlan &
+RPUSimple<T>::getIndexGatherPlan(const int *indices, int size, int m_batch, bool trans) {
+  // note: assumes that the content of the indices only changes with setMatrixIndices
+  for (auto it = index_plans_.begin(); it != index_plans_.end(); ++it) {
+    if (it->matches(indices, size, m_batch, trans)) {
+      std::rotate(it, it + 1, index_plans_.end());
+      return index_plans_.back();
+    }
+  }
+  if (index_plans_.size() >= RPU_MAX_INDEX_PLANS) {
+    index_plans_.erase(index_plans_.begin());
+  }
+  index_plans_.emplace_back();
+  index_plans_.back().build(indices, size, m_batch, trans);
+  return index_plans_.back();
+}
+
+template <typename T>
+void RPUSimple<T>::copyIndexedInputPlan(
+    T *out_tensor,
+    const T *src_tensor,
+    const int input_matrix_size,
+    const int *indices_shifted,
+    const int size,
+    const int m_batch,
+    const int dim3,
+    const bool trans) {
+
+  const IndexGatherPlan &plan = getIndexGatherPlan(indices_shifted, size, m_batch, trans);
+  const IndexGatherPlan::Run *runs = plan.runs.data();
+  int n_runs = (int)plan.runs.size();
+  int sz_all = size * m_batch * dim3;
+
+  // offset of the images and additional offset per row (for trans)
+  int image_offset = trans ? m_batch : m_batch * size;
+  int row_offset = trans ? (dim3 - 1) * m_batch : 0;
+
+#pragma omp parallel for collapse(2) num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
+  for (int i_dim3 = 0; i_dim3 < dim3; i_dim3++) {
+    for (int i_run = 0; i_run < n_runs; i_run++) {
+      const IndexGatherPlan::Run &run = runs[i_run];
+      T *out = out_tensor + i_dim3 * image_offset + run.start;
+      if (trans) {
+        out += run.start / m_batch * row_offset;
+      }
+      if (run.j_start <= 1) {
+        T value = (T)run.j_start; // padding or bias
+        PRAGMA_SIMD
+        for (int i = 0; i < run.length; i++) {
+          out[i] = value;
+        }
+      } else {
+        const T *src = src_tensor + i_dim3 * input_matrix_size + run.j_start - 2;
+        PRAGMA_SIMD
+        for (int i = 0; i < run.length; i++) {
+          out[i] = src[i];
+        }
+      }
+    }
+  }
+}
+
+template <typename T>
+void RPUSimple<T>::copyIndexedOutputPlan(
+    T *out_tensor,
+    const T *src_tensor,
+    const int output_matrix_size,
+    const int *indices_shifted,
+    const int size,
+    const int m_batch,
+    const int dim3,
+    const bool trans) {
+
+  const IndexGatherPlan &plan = getIndexGatherPlan(indices_shifted, size, m_batch, trans);
+  const IndexGatherPlan::Run *runs = plan.runs.data();
+  int n_runs = (int)plan.runs.size();
+  int sz_all = size * m_batch * dim3;
+
+  int image_offset = trans ? m_batch : m_batch * size;
+  int row_offset = trans ? (dim3 - 1) * m_batch : 0;
+
+  // images write to separate outputs, whereas the runs of one image
+  // might overlap (and are thus summed sequentially)
+#pragma omp parallel for num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
+  for (int i_dim3 = 0; i_dim3 < dim3; i_dim3++) {
+    T *out_image = out_tensor + i_dim3 * output_matrix_size;
+
+    for (int i_run = 0; i_run < n_runs; i_run++) {
+      const IndexGatherPlan::Run &run = runs[i_run];
+      if (run.j_start <= 1) {
+        continue;
+      }
+      const T *src = src_tensor + i_dim3 * image_offset + run.start;
+      if (trans) {
+        src += run.start / m_batch * row_offset;
+      }
+      T *out = out_image + run.j_start - 2;
+      PRAGMA_SIMD
+      for (int i = 0; i < run.length; i++) {
+        out[i] += src[i];
+      }
+    }
+  }
+}
+
 template <typename T>
 void RPUSimple<T>::copyIndexedInput(
     T *out_tensor,
@@ -770,73 +924,49 @@ void RPUSimple<T>::copyIndexedInput(
   // all other RPUs just use the RPU/RPUCudaSimple::copyIndexed
   // and forwardIndex without the need to implement anything new.
 
-  int m = m_batch;
   int input_matrix_size = total_input_size / dim3;
-  int M = m_batch * size;
-  int sz_all = size * m_batch * dim3;
 
-  bool batch_slice = m_batch_slice > 0;
+  if (m_batch_slice <= 0) {
+    // blocked copy using the (cached) gather plan
+    this->copyIndexedInputPlan(
+        out_tensor, src_tensor, input_matrix_size, indices_shifted, size, m_batch, dim3, trans);
+    return;
+  }
+
+  int sz_all = size * m_batch_slice * dim3;
 
   if (trans) {
     // here we additioanlly permute 132
-    if (batch_slice) {
-      sz_all = size * m_batch_slice * dim3;
-      M = m_batch_slice * dim3;
-
-      for (int idx = 0; idx < sz_all; idx++) {
-
-        int i_dim3 = (idx % M) / m_batch_slice;
-        int i_batch_slice = idx % m_batch_slice;
-        int i_xd = idx / M;
-        int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
-        int ind_idx = batch_idx + m_batch * i_xd;
-
-        int j_shifted = indices_shifted[ind_idx];
-        out_tensor[idx] = (j_shifted <= 1)
-                              ? (T)j_shifted
-                              : src_tensor[(j_shifted - 2) + i_dim3 * input_matrix_size];
-      }
-    } else {
+    int M = m_batch_slice * dim3;
 
-      int L = m_batch * dim3;
+#pragma omp parallel for num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
+    for (int idx = 0; idx < sz_all; idx++) {
 
-      for (int idx = 0; idx < sz_all; idx++) {
+      int i_dim3 = (idx % M) / m_batch_slice;
+      int i_batch_slice = idx % m_batch_slice;
+      int i_xd = idx / M;
+      int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
+      int ind_idx = batch_idx + m_batch * i_xd;
 
-        int i = (idx % L) / m * M + (idx % m) + idx / L * m;
-        int j_shifted = indices_shifted[i % M];
-        out_tensor[idx] = (j_shifted <= 1)
-                              ? (T)j_shifted
-                              : src_tensor[(j_shifted - 2) + i / M * input_matrix_size];
-      }
+      int j_shifted = indices_shifted[ind_idx];
+      out_tensor[idx] = (j_shifted <= 1) ? (T)j_shifted
+                                         : src_tensor[(j_shifted - 2) + i_dim3 * input_matrix_size];
     }
   } else { // no trans
-    if (batch_slice) {
-
-      sz_all = size * m_batch_slice * dim3;
-      M = m_batch_slice * size;
-
-      for (int idx = 0; idx < sz_all; idx++) {
-
-        int i_dim3 = idx / M;
-        int i_batch_slice = (idx % M) / size;
-        int i_xd = idx % size;
-        int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
-        int ind_idx = batch_idx * size + i_xd;
+    int M = m_batch_slice * size;
 
-        int j_shifted = indices_shifted[ind_idx];
-        out_tensor[idx] = (j_shifted <= 1)
-                              ? (T)j_shifted
-                              : src_tensor[(j_shifted - 2) + i_dim3 * input_matrix_size];
-      }
-    } else {
+#pragma omp parallel for num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
+    for (int idx = 0; idx < sz_all; idx++) {
 
-      for (int idx = 0; idx < sz_all; idx++) {
+      int i_dim3 = idx / M;
+      int i_batch_slice = (idx % M) / size;
+      int i_xd = idx % size;
+      int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
+      int ind_idx = batch_idx * size + i_xd;
 
-        int j_shifted = indices_shifted[idx % M];
-        out_tensor[idx] = (j_shifted <= 1)
-                              ? (T)j_shifted
-                              : src_tensor[(j_shifted - 2) + idx / M * input_matrix_size];
-      }
+      int j_shifted = indices_shifted[ind_idx];
+      out_tensor[idx] = (j_shifted <= 1) ? (T)j_shifted
+                                         : src_tensor[(j_shifted - 2) + i_dim3 * input_matrix_size];
     }
   }
 }
@@ -853,69 +983,50 @@ void RPUSimple<T>::copyIndexedOutput(
     const bool trans,
     const int m_batch_slice,
     const int *batch_indices) {
-  bool batch_slice = m_batch_slice > 0;
 
   // output iterator
-  int m = m_batch;
   int output_matrix_size = total_output_size / dim3;
-  int M = m_batch * size;
-  int sz_all = size * m_batch * dim3;
-
-  if (trans) {
-    // here we additionally permute 132
-
-    if (batch_slice) {
-      sz_all = size * m_batch_slice * dim3;
-      M = m_batch_slice * dim3;
 
-      for (int idx = 0; idx < sz_all; idx++) {
+  if (m_batch_slice <= 0) {
+    // blocked scatter-add using the (cached) gather plan
+    this->copyIndexedOutputPlan(
+        out_tensor, src_tensor, output_matrix_size, indices_shifted, size, m_batch, dim3, trans);
+    return;
+  }
 
-        int i_dim3 = (idx % M) / m_batch_slice;
-        int i_batch_slice = idx % m_batch_slice;
-        int i_xd = idx / M;
-        int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
-        int ind_idx = batch_idx + m_batch * i_xd;
+  int sz_all = size * m_batch_slice * dim3;
 
-        int j_shifted = indices_shifted[ind_idx];
-        if (j_shifted > 1)
-          out_tensor[(j_shifted - 2) + i_dim3 * output_matrix_size] += src_tensor[idx];
-      }
+  if (trans) {
+    // here we additionally permute 132
+    int M = m_batch_slice * dim3;
 
-    } else {
+    for (int idx = 0; idx < sz_all; idx++) {
 
-      int L = m_batch * dim3;
+      int i_dim3 = (idx % M) / m_batch_slice;
+      int i_batch_slice = idx % m_batch_slice;
+      int i_xd = idx / M;
+      int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
+      int ind_idx = batch_idx + m_batch * i_xd;
 
-      for (int idx = 0; idx < sz_all; idx++) {
-        int i = (idx % L) / m * M + (idx % m) + idx / L * m;
-        int j_shifted = indices_shifted[i % M];
-        if (j_shifted > 1)
-          out_tensor[(j_shifted - 2) + i / M * output_matrix_size] += src_tensor[idx];
-      }
+      int j_shifted = indices_shifted[ind_idx];
+      if (j_shifted > 1)
+        out_tensor[(j_shifted - 2) + i_dim3 * output_matrix_size] += src_tensor[idx];
     }
-  } else { // no trans
-    if (batch_slice) {
-      sz_all = size * m_batch_slice * dim3;
-      M = m_batch_slice * size;
 
-      for (int idx = 0; idx < sz_all; idx++) {
+  } else { // no trans
+    int M = m_batch_slice * size;
 
-        int i_dim3 = idx / M;
-        int i_batch_slice = (idx % M) / size;
-        int i_xd = idx % size;
-        int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
-        int ind_idx = batch_idx * size + i_xd;
+    for (int idx = 0; idx < sz_all; idx++) {
 
-        int j_shifted = indices_shifted[ind_idx];
-        if (j_shifted > 1)
-          out_tensor[(j_shifted - 2) + i_dim3 * output_matrix_size] += src_tensor[idx];
-      }
+      int i_dim3 = idx / M;
+      int i_batch_slice = (idx % M) / size;
+      int i_xd = idx % size;
+      int batch_idx = batch_indices[i_batch_slice + m_batch * i_dim3];
+      int ind_idx = batch_idx * size + i_xd;
 
-    } else {
-      for (int idx = 0; idx < sz_all; idx++) {
-        int j_shifted = indices_shifted[idx % M];
-        if (j_shifted > 1)
-          out_tensor[(j_shifted - 2) + idx / M * output_matrix_size] += src_tensor[idx];
-      }
+      int j_shifted = indices_shifted[ind_idx];
+      if (j_shifted > 1)
+        out_tensor[(j_shifted - 2) + i_dim3 * output_matrix_size] += src_tensor[idx];
     }
   }
 }
@@ -937,6 +1048,7 @@ void RPUSimple<T>::copySliceInput(
 
     int M = m_batch_slice * dim3;
 
+#pragma omp parallel for num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
     for (int idx = 0; idx < sz_all; idx++) {
 
       int i_dim3 = (idx % M) / m_batch_slice;
@@ -951,6 +1063,7 @@ void RPUSimple<T>::copySliceInput(
 
     int M = m_batch_slice * size;
 
+#pragma omp parallel for num_threads(getNumThreads()) if (sz_all > RPU_OMP_MIN_SIZE)
     for (int idx = 0; idx < sz_all; idx++) {
 
       int i_dim3 = idx / M;
@@ -1370,12 +1483,30 @@ template <typename T> void RPUSimple<T>::setDeltaWeights(T *dw_extern) {
   }
 }
 
+template <typename T> void RPUSimple<T>::setTestWeights(T *weights_extern) {
+  test_weights_extern_[0] = weights_extern;
+  if (weights_extern) {
+    for (int i = 0; i < this->d_size_; i++) {
+      test_weights_extern_[i] = weights_extern + this->x_size_ * i;
+    }
+  }
+}
+
 template <typename T> T **RPUSimple<T>::getFBWeights(bool is_test) const {
+  if (is_test && test_weights_extern_[0]) {
+    return const_cast<T **>(test_weights_extern_.data());
+  }
   bool use_fb =
       fb_weights_ && (!is_test || (fb_weight_modifier_ && fb_weight_modifier_->enableDuringTest()));
   return use_fb ? fb_weights_ : weights_;
 }
 
+template <typename T> WeightModifier<T> *RPUSimple<T>::getLazyFBWeightModifier(bool is_test) const {
+  bool use_lazy = fb_weight_modifier_ && fb_weight_modifier_->isLazy() &&
+                  (!is_test || fb_weight_modifier_->enableDuringTest());
+  return use_lazy ? fb_weight_modifier_.get() : nullptr;
+}
+
 template <typename T> T **RPUSimple<T>::getUpWeights() {
   // This is called from the Update routines to check which weight
   // is used for calculation. If dw is defined, then it will use the
@@ -1403,10 +1534,10 @@ template <typename T> T RPUSimple<T>::getUpBeta() const {
 /********************************************************************************/
 /* Utilities */
 
-template <typename T> void RPUSimple<T>::setRandomSeed(unsigned int seed) {
+template <typename T> void RPUSimple<T>::setRandomSeed(unsigned int seed, unsigned int stream) {
   DEBUG_OUT("Simple: Set seed.");
-  rng_->setSeed((randomint_t)seed);
-  rw_rng_->setSeed((randomint_t)seed);
+  rng_->setSeed(seed, stream);
+  rw_rng_->setSeed(seed);
 }
 
 template <typename T> void RPUSimple<T>::printWeights(int x_count, int d_count) {
@@ -1515,17 +1646,61 @@ template <typename T> void RPUSimple<T>::diffuseWeights() {
   }
 }
 
+template <typename T>
+void RPUSimple<T>::postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar) {
+
+  T diffusion = diffuse ? getPar().diffusion : (T)0.0;
+  T lifetime = getPar().lifetime;
+  T decay_scale = (decay && lifetime > 1.0) ? ((T)1.0 - (T)1.0 / lifetime) : (T)1.0;
+  bool fixed_clip = wclpar.type == WeightClipType::FixedValue && wclpar.fixed_value > 0;
+  T clip = wclpar.fixed_value;
+
+  if (diffusion > 0.0 || decay_scale < 1.0 || fixed_clip) {
+    int size = this->d_size_ * this->x_size_;
+    T *w = this->getWeightsPtr()[0];
+    PRAGMA_SIMD
+    for (int i = 0; i < size; ++i) {
+      T w_i = w[i];
+      if (diffusion > 0.0) {
+        w_i += diffusion * rng_->sampleGauss();
+      }
+      w_i *= decay_scale;
+      if (fixed_clip) {
+        w_i = MIN(MAX(w_i, -clip), clip);
+      }
+      w[i] = w_i;
+    }
+  }
+
+  if (wclpar.type != WeightClipType::None && wclpar.type != WeightClipType::FixedValue) {
+    clipWeights(wclpar);
+  }
+}
+
 /*********************************************************************************/
 
 template <typename T> void RPUSimple<T>::modifyFBWeights(const WeightModifierParameter &wmpar) {
 
+  if (fb_weight_modifier_ == nullptr) {
+    fb_weight_modifier_ = make_unique<WeightModifier<T>>(this->x_size_, this->d_size_);
+  }
+
+  if (wmpar.lazy_block_size > 0 && supportsLazyFBWeights()) {
+    // modified in forward and backward (per block), no full copy
+    if (fb_weights_ != nullptr) {
+      Array_2D_Free<T>(fb_weights_);
+      fb_weights_ = nullptr;
+    }
+    fb_weight_modifier_->prepare(this->getWeightsPtr()[0], wmpar, *rng_);
+    return;
+  }
+
   if (fb_weights_ == nullptr) {
     fb_weights_ = Array_2D_Get<T>(this->d_size_, this->x_size_);
-    fb_weight_modifier_ = make_unique<WeightModifier<T>>(this->x_size_, this->d_size_);
   }
 
   // modify FB weights
-  fb_weight_modifier_->apply(fb_weights_[0], this->getWeightsPtr()[0], wmpar);
+  fb_weight_modifier_->apply(fb_weights_[0], this->getWeightsPtr()[0], wmpar, *rng_);
 }
 
 /*********************************************************************************/
@@ -16,12 +16,14 @@
 #include "weight_clipper.h"
 #include "weight_drifter.h"
 #include "weight_modifier.h"
+#include <algorithm>
 #include <cfenv>
 #include <iostream>
 #include <memory>
 #include <mutex>
 #include <random>
 #include <sstream>
+#include <vector>
 
 //#pragma STDC FENV_ACCESS ON
 
@@ -144,6 +146,32 @@ protected:
   T learning_rate_ = (T)0.0;
 };
 
+// maximal number of cached gather plans (per tile)
+#define RPU_MAX_INDEX_PLANS 8
+
+/* Gather plan of the (shifted) matrix indices of the indexed
+   interface. The indices of one image are split into runs of
+   consecutive source elements (or of a constant padding / bias value),
+   which can be copied blockwise for all images of the batch. */
+struct IndexGatherPlan {
+  struct Run {
+    int start;   // position of the first element within the indices
+    int j_start; // shifted index of the first element (<=1 for constants)
+    int length;
+  };
+
+  const int *indices = nullptr;
+  int size = 0;
+  int m_batch = 0;
+  bool trans = false;
+  std::vector<Run> runs;
+
+  bool matches(const int *indices_, int size_, int m_batch_, bool trans_) const {
+    return indices == indices_ && size == size_ && m_batch == m_batch_ && trans == trans_;
+  };
+  void build(const int *indices_, int size_, int m_batch_, bool trans_);
+};
+
 template <typename T> struct SimpleMetaParameter {
 
   SimpleMetaParameter() { drift.setSimpleDrift(); }
@@ -209,12 +237,14 @@ public:
 
     swap(a.matrix_indices_, b.matrix_indices_);
     swap(a.matrix_indices_set_, b.matrix_indices_set_);
+    swap(a.index_plans_, b.index_plans_);
 
     swap(a.wdrifter_, b.wdrifter_);
     swap(a.wclipper_, b.wclipper_);
 
     swap(a.fb_weights_, b.fb_weights_);
     swap(a.delta_weights_extern_, b.delta_weights_extern_);
+    swap(a.test_weights_extern_, b.test_weights_extern_);
 
     swap(a.fb_weight_modifier_, b.fb_weight_modifier_);
     swap(a.last_update_m_batch_, b.last_update_m_batch_);
@@ -243,8 +273,10 @@ public:
   void printToStream(std::stringstream &ss) const override;
 
   /* This is to set the random seed. This is currently, however, NOT
-     causing all seeds to be set. Some seeds remain random!*/
-  virtual void setRandomSeed(unsigned int seed);
+     causing all seeds to be set. Some seeds remain random! Tiles with
+     the same seed but different streams draw independent numbers.*/
+  virtual void setRandomSeed(unsigned int seed, unsigned int stream = 0);
+  virtual unsigned int getRandomSeed() const { return rng_->getSeed(); };
   virtual void setWeightsUniformRandom(T min_value, T max_value);
 
   /* This scales the weights by applying an (digital) output scale
@@ -325,6 +357,12 @@ public:
   /* conductance drift */
   virtual void driftWeights(T time_since_last_call);
 
+  /* Operators applied once per mini-batch after the update:
+     diffusion, decay and clipping (in this order) in one sweep over
+     the weights. Clipping types that need statistics of the
+     weights are applied after the sweep */
+  virtual void postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar);
+
   /* Modify forward/backward weights (while keeping the update
      weights to a reference). This essentially copies the weight
      matrix and modifies this based on the given parameters
@@ -333,7 +371,9 @@ public:
      on the reference weights. Each call a new copied matrix will by
      generated based on the reference weights. Usually, during
      testing, the referenece weiight matrix is used instead (can be
-     selected by settiing wmpar appropriately).  */
+     selected by settiing wmpar appropriately). With
+     wmpar.lazy_block_size the modified matrix is not stored but
+     generated per block of rows in each forward and backward. */
   virtual void modifyFBWeights(const WeightModifierParameter &wmpar);
 
   /* Delayed update support. If use_delayed_update is turned on when
@@ -369,6 +409,13 @@ public:
   virtual void setDeltaWeights(T *dw_extern);
   virtual T *getDeltaWeights() const { return delta_weights_extern_[0]; };
 
+  /* external weights that are used instead of the weights in the
+     forward pass during testing (e.g. one weight realization of an
+     ensemble), without copying them. The memory is externally
+     governed. nullptr resets to the weights. */
+  void setTestWeights(T *weights_extern);
+  inline T *getTestWeights() const { return test_weights_extern_[0]; };
+
   /* public interfaces for forward/backward/update. Format is
      expected in x-major order. However, the batch dimension comes
      first iif x_trans or d_trans is set to true */
@@ -405,10 +452,22 @@ public:
   void
   updateTensor(const T *X_input, const T *D_input, bool bias, int m_batch, int dim3, bool trans);
 
-  /* Indexed interfaces can be used to implement fast convolutions on GPU*/
-  FORCE_INLINE void setMatrixIndices(int *indices) {
+  /* Indexed interfaces can be used to implement fast convolutions on GPU.
+
+     The gather plans are cached per indices pointer (and sizes). With
+     keep_plans the cached plans of the given indices are re-used,
+     which requires that their content did not change since. Otherwise
+     they are (re-)built on the next indexed call. */
+  FORCE_INLINE void setMatrixIndices(int *indices, bool keep_plans = false) {
     this->matrix_indices_set_ = true;
     this->matrix_indices_ = indices;
+    if (!keep_plans) {
+      index_plans_.erase(
+          std::remove_if(
+              index_plans_.begin(), index_plans_.end(),
+              [indices](const IndexGatherPlan &plan) { return plan.indices == indices; }),
+          index_plans_.end());
+    }
   };
 
   FORCE_INLINE int *getMatrixIndices() {
@@ -477,6 +536,14 @@ protected:
      case the user needs to explicitely use enable_during_test */
   T **getFBWeights(bool is_test) const;
 
+  /* Returns the weight modifier if the FB weights are modified
+     lazily (see modifyFBWeights), nullptr otherwise. In this case,
+     getFBWeights returns the reference weights to be modified. */
+  WeightModifier<T> *getLazyFBWeightModifier(bool is_test) const;
+
+  /* Whether forward and backward can use lazily modified weights */
+  virtual bool supportsLazyFBWeights() const { return true; };
+
   /* This is called from the Update routines to check which weight
      is used for calculation. If dw is defined, then it will use the
      DW mode, meaning that it will write into delta_weights the DW
@@ -604,6 +671,30 @@ protected:
 
   virtual void setZero(T *v, const int size);
 
+  /* returns the (cached) gather plan of the given indices */
+  const IndexGatherPlan &getIndexGatherPlan(const int *indices, int size, int m_batch, bool trans);
+
+  /* blocked gather (im2col) / scatter-add (col2im) for all images
+     using the gather plan (without batch slices) */
+  void copyIndexedInputPlan(
+      T *out_tensor,
+      const T *src_tensor,
+      const int input_matrix_size,
+      const int *indices,
+      const int size,
+      const int m_batch,
+      const int dim3,
+      const bool trans);
+  void copyIndexedOutputPlan(
+      T *out_tensor,
+      const T *src_tensor,
+      const int output_matrix_size,
+      const int *indices,
+      const int size,
+      const int m_batch,
+      const int dim3,
+      const bool trans);
+
 private:
   void alpha_warning() {
     DEBUG_CALL(
@@ -631,6 +722,7 @@ protected:
 
 private:
   std::vector<T *> delta_weights_extern_;
+  std::vector<T *> test_weights_extern_;
 
   void initialize(int x_sz, int d_sz);
 
@@ -648,6 +740,7 @@ private:
 
   int *matrix_indices_ = nullptr;
   bool matrix_indices_set_ = false;
+  std::vector<IndexGatherPlan> index_plans_; // most recently used last
 
   T fwd_alpha_ = 1.0;
   T bwd_alpha_ = 1.0;
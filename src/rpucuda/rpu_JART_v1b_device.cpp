@@ -11,6 +11,9 @@
  */
 
 #include "rpu_JART_v1b_device.h"
+#include <array>
+#include <limits>
+#include <map>
 #include <stdio.h>
 
 namespace RPU {
@@ -276,6 +279,8 @@ void JARTv1bRPUDevice<T>::populate(
       }
     }
   }
+
+  buildLookupTables();
 }
 
 template <typename T> void JARTv1bRPUDevice<T>::printDP(int x_count, int d_count) const {
@@ -620,6 +625,214 @@ inline void update_once(
   } 
 }
 
+/* Lookup table update */
+
+// maximal number of grid points of a pulse table
+#define JART_LUT_MAX_SIZE 65536
+
+template <typename T>
+inline void apply_pulse(
+    const JARTv1bRPUDeviceMetaParameter<T> &par,
+    const int &sign,
+    double &Ndisc,
+    T Ndiscmax,
+    T Ndiscmin,
+    T ldisc,
+    T A) {
+  int pulse_counter = int (par.pulse_length/par.base_time_step);
+  T bound = (T)0.0; // not used by the steps
+  if (sign < 0) {
+    for (int i = 0; i < pulse_counter; i++) {
+      step_SET(par.pulse_voltage_SET, par.base_time_step, Ndisc, par.alpha_SET, par.beta_SET, par.c_SET, par.d_SET, par.f_SET,
+               par.T0, Ndiscmax, par.Nplug, par.a_ny0, par.dWa, par.Rth_negative_coefficient,
+               par.RseriesTiOx, par.R0, par.V_series_coefficient, par.V_disk_coefficient, par.gamma_coefficient, par.lcell, ldisc, A, bound);
+    }
+  } else {
+    for (int i = 0; i < pulse_counter; i++) {
+      step_RESET(par.pulse_voltage_RESET, par.base_time_step, Ndisc, par.g_RESET, par.h_RESET, par.j_0, par.k0, par.T0,
+                 par.Ndiscmin, Ndiscmin, par.Nplug, par.a_ny0, par.dWa, par.Rth_positive_coefficient,
+                 par.RseriesTiOx, par.R0, par.V_series_coefficient, par.V_disk_coefficient, par.gamma_coefficient, par.lcell, ldisc, A, bound);
+    }
+  }
+}
+
+template <typename T>
+void build_pulse_table(
+    JARTv1bPulseTable<T> &table,
+    const JARTv1bRPUDeviceMetaParameter<T> &par,
+    const int &sign,
+    const T &Ndisc_low,
+    const T &Ndisc_high,
+    const T &Ndiscmax,
+    const T &Ndiscmin,
+    const T &ldisc,
+    const T &A) {
+
+  table = JARTv1bPulseTable<T>();
+  if (!(Ndisc_low > (T)0.0) || !(Ndisc_high > Ndisc_low)) {
+    return; // always use the exact pulse
+  }
+  double log_low = log((double)Ndisc_low);
+  double log_high = log((double)Ndisc_high);
+
+  auto pulse_change = [&](double log_Ndisc) {
+    double Ndisc = exp(log_Ndisc);
+    double Ndisc_new = Ndisc;
+    apply_pulse(par, sign, Ndisc_new, Ndiscmax, Ndiscmin, ldisc, A);
+    return Ndisc_new - Ndisc;
+  };
+
+  int n = MAX(par.lut_size, 2);
+  std::vector<double> values(n);
+  for (int i = 0; i < n; i++) {
+    values[i] = pulse_change(log_low + (log_high - log_low) * i / (n - 1));
+  }
+
+  // Refine the grid until the interpolation error at the midpoints is
+  // within the tolerance. The midpoints are the new grid points.
+  while (true) {
+    std::vector<double> refined(2 * n - 1);
+    double max_error = 0.0;
+    double max_change = 0.0;
+    for (int i = 0; i < n - 1; i++) {
+      double mid = pulse_change(log_low + (log_high - log_low) * (i + 0.5) / (n - 1));
+      max_error = MAX(max_error, fabs(mid - 0.5 * (values[i] + values[i + 1])));
+      max_change = MAX(max_change, fabs(values[i]));
+      refined[2 * i] = values[i];
+      refined[2 * i + 1] = mid;
+    }
+    refined[2 * n - 2] = values[n - 1];
+    values.swap(refined);
+    n = 2 * n - 1;
+    if (!(max_error > par.lut_tolerance * max_change) || 2 * n - 1 > JART_LUT_MAX_SIZE) {
+      break;
+    }
+  }
+
+  table.log_Ndisc_min = (T)log_low;
+  table.log_Ndisc_max = (T)log_high;
+  table.inv_log_step = (T)((n - 1) / (log_high - log_low));
+  table.dNdisc.assign(values.begin(), values.end());
+}
+
+template <typename T> void JARTv1bRPUDevice<T>::buildLookupTables() {
+
+  const auto &par = getPar();
+  lut_SET_.clear();
+  lut_RESET_.clear();
+  lut_index_SET_.clear();
+  lut_index_RESET_.clear();
+
+  if (!par.lut_update) {
+    return;
+  }
+
+  if (par.Ndiscmax_std > (T)0.0 || par.Ndiscmin_std > (T)0.0 || par.ldisc_std > (T)0.0 ||
+      par.ldisc_std_slope > (T)0.0 || par.rdisc_std > (T)0.0 || par.rdisc_std_slope > (T)0.0) {
+    RPU_FATAL("Lookup table update does not support cycle-to-cycle variations.");
+  }
+  if (par.lut_dtod_resolution <= (T)0.0) {
+    RPU_FATAL("lut_dtod_resolution needs to be positive.");
+  }
+
+  // Bucket the devices by their (logarithmically quantized) device
+  // parameters. A SET pulse does not depend on Ndiscmin and a RESET
+  // pulse does not depend on Ndiscmax.
+  T log_resolution = log1p(par.lut_dtod_resolution);
+  auto quantize = [log_resolution](T value) {
+    return value > (T)0.0 ? (long)std::lround(log(value) / log_resolution)
+                          : std::numeric_limits<long>::min();
+  };
+
+  T **Ndiscmax = device_specific_Ndiscmax;
+  T **Ndiscmin = device_specific_Ndiscmin;
+  T **ldisc = device_specific_ldisc;
+  T **A = device_specific_A;
+
+  for (int sign = -1; sign <= 1; sign += 2) {
+    T **Ndisc_limit = sign < 0 ? Ndiscmax : Ndiscmin;
+    auto &tables = sign < 0 ? lut_SET_ : lut_RESET_;
+    auto &index = sign < 0 ? lut_index_SET_ : lut_index_RESET_;
+
+    std::map<std::array<long, 3>, int> buckets;
+    std::vector<int> representative;
+    std::vector<T> Ndisc_low;
+    std::vector<T> Ndisc_high;
+
+    index.resize(this->size_);
+    for (int idx = 0; idx < this->size_; idx++) {
+      std::array<long, 3> key = {
+          quantize(Ndisc_limit[0][idx]), quantize(ldisc[0][idx]), quantize(A[0][idx])};
+      T low = MAX(device_specific_Ndisc_min_bound[0][idx], Ndiscmin[0][idx]);
+      T high = MIN(device_specific_Ndisc_max_bound[0][idx], Ndiscmax[0][idx]);
+
+      auto it = buckets.find(key);
+      if (it == buckets.end()) {
+        int b = (int)representative.size();
+        buckets[key] = b;
+        representative.push_back(idx);
+        Ndisc_low.push_back(low);
+        Ndisc_high.push_back(high);
+        index[idx] = b;
+      } else {
+        int b = it->second;
+        Ndisc_low[b] = MIN(Ndisc_low[b], low);
+        Ndisc_high[b] = MAX(Ndisc_high[b], high);
+        index[idx] = b;
+      }
+    }
+
+    int n_buckets = (int)representative.size();
+    tables.resize(n_buckets);
+
+#pragma omp parallel for num_threads(getNumThreads()) if (n_buckets > 1)
+    for (int b = 0; b < n_buckets; b++) {
+      int idx = representative[b];
+      build_pulse_table(
+          tables[b], par, sign, Ndisc_low[b], Ndisc_high[b], Ndiscmax[0][idx], Ndiscmin[0][idx],
+          ldisc[0][idx], A[0][idx]);
+    }
+  }
+}
+
+template <typename T>
+inline void JARTv1bRPUDevice<T>::updateOnceLookup(
+    const JARTv1bRPUDeviceMetaParameter<T> &par, T &w, T &Ndisc, int idx, int sign) {
+
+  // same as update_once (without cycle-to-cycle noise) but with the tabulated pulses
+  T Ndiscmax = device_specific_Ndiscmax[0][idx];
+  T Ndiscmin = device_specific_Ndiscmin[0][idx];
+  T max_bound = MIN(device_specific_Ndisc_max_bound[0][idx], Ndiscmax);
+  T min_bound = MAX(device_specific_Ndisc_min_bound[0][idx], Ndiscmin);
+  double Ndisc_double = Ndisc;
+  double dNdisc;
+
+  if (sign < 0) {
+    if (!(Ndisc_double < max_bound)) {
+      return;
+    }
+    if (lut_SET_[lut_index_SET_[idx]].lookup(Ndisc_double, dNdisc)) {
+      Ndisc_double += dNdisc;
+    } else {
+      apply_pulse(par, sign, Ndisc_double, Ndiscmax, Ndiscmin, device_specific_ldisc[0][idx], device_specific_A[0][idx]);
+    }
+    Ndisc_double = MIN(Ndisc_double, max_bound);
+  } else {
+    if (!(Ndisc_double > min_bound)) {
+      return;
+    }
+    if (lut_RESET_[lut_index_RESET_[idx]].lookup(Ndisc_double, dNdisc)) {
+      Ndisc_double += dNdisc;
+    } else {
+      apply_pulse(par, sign, Ndisc_double, Ndiscmax, Ndiscmin, device_specific_ldisc[0][idx], device_specific_A[0][idx]);
+    }
+    Ndisc_double = MAX(Ndisc_double, min_bound);
+  }
+  w = map_Ndisc_to_weight(par.read_voltage, Ndisc_double, par.current_min, par.w_min, par.current_to_weight_ratio,
+                          par.g_read, par.h_read, par.j_0, par.k0, par.Ndiscmin);
+  Ndisc = Ndisc_double;
+}
+
 template <typename T>
 void JARTv1bRPUDevice<T>::doSparseUpdate(
     T **weights, int i, const int *x_signed_indices, int x_count, int d_sign, RNG<T> *rng) {
@@ -628,6 +841,13 @@ void JARTv1bRPUDevice<T>::doSparseUpdate(
 
   T *w = weights[i];
   T *Ndisc = this->w_persistent_[i];
+
+  if (par.lut_update) {
+    int idx_offset = i * this->x_size_;
+    PULSED_UPDATE_W_LOOP(updateOnceLookup(par, w[j], Ndisc[j], idx_offset + j, sign););
+    return;
+  }
+
   T *Ndiscmax = device_specific_Ndiscmax[i];
   T *Ndiscmin = device_specific_Ndiscmin[i];
   T *ldisc = device_specific_ldisc[i];
@@ -674,6 +894,12 @@ void JARTv1bRPUDevice<T>::doDenseUpdate(T **weights, int *coincidences, RNG<T> *
 
   T *w = weights[0];
   T *Ndisc = this->w_persistent_[0];
+
+  if (par.lut_update) {
+    PULSED_UPDATE_W_LOOP_DENSE(updateOnceLookup(par, w[j], Ndisc[j], j, sign););
+    return;
+  }
+
   T *Ndiscmax = device_specific_Ndiscmax[0];
   T *Ndiscmin = device_specific_Ndiscmin[0];
   T *ldisc = device_specific_ldisc[0];
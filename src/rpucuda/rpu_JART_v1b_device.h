@@ -22,11 +22,38 @@
 #define PHYSICAL_PARAMETER_kb_over_e 8.61860174781523e-05
 #define PHYSICAL_PARAMETER_zvo 2									// oxygen vacancy charge number
 #define PHYSICAL_PARAMETER_eps_0 8.854e-12				      				// vacuum permittivity [As/Vm]
+#include <vector>
 
 namespace RPU {
 
 template <typename T> class JARTv1bRPUDevice;
 
+/* Tabulated change of Ndisc by a single SET or RESET pulse for one set
+   of device parameters. The grid is logarithmic in Ndisc and the
+   values are linearly interpolated. */
+template <typename T> struct JARTv1bPulseTable {
+  T log_Ndisc_min = (T)0.0;
+  T log_Ndisc_max = (T)0.0;
+  T inv_log_step = (T)0.0;
+  std::vector<T> dNdisc;
+
+  // returns false if Ndisc is outside of the tabulated range
+  inline bool lookup(const double &Ndisc, double &dNdisc_out) const {
+    if (dNdisc.size() < 2 || !(Ndisc > 0.0)) {
+      return false;
+    }
+    T x = (T)log(Ndisc);
+    if (x < log_Ndisc_min || x > log_Ndisc_max) {
+      return false;
+    }
+    T t = (x - log_Ndisc_min) * inv_log_step;
+    int i = MIN((int)t, (int)dNdisc.size() - 2);
+    T frac = t - (T)i;
+    dNdisc_out = dNdisc[i] + frac * (dNdisc[i + 1] - dNdisc[i]);
+    return true;
+  }
+};
+
 BUILD_PULSED_DEVICE_META_PARAMETER(
     JARTv1b,
     /*implements*/
@@ -128,6 +155,10 @@ BUILD_PULSED_DEVICE_META_PARAMETER(
     T w_max_dtod_lower_bound = (T) 0.0;							// 
     T w_min_dtod_upper_bound = (T) 0.0;							// 
     T w_min_dtod_lower_bound = (T) 0.0;							// 
+    bool lut_update = false;							// use tabulated pulse updates
+    int lut_size = 64;							// initial number of grid points of the tables
+    T lut_tolerance = (T) 1e-3;							// interpolation tolerance (relative to the largest pulse change)
+    T lut_dtod_resolution = (T) 0.01;							// relative bucket width of the dtod parameters
 
     
     T current_min =  (T) (-g0*(exp(-g1*read_voltage)-1))/(pow((1+(h0+h1*read_voltage+h2*exp(-h3*read_voltage))*pow((Ndisc_min_bound/Ndiscmin),(-j_0))),(1/k0)));
@@ -256,6 +287,11 @@ BUILD_PULSED_DEVICE_META_PARAMETER(
     ss << "\t w_max_dtod_lower_bound:\t\t" << w_max_dtod_lower_bound << std::endl;
     ss << "\t w_min_dtod_upper_bound:\t\t" << w_min_dtod_upper_bound << std::endl;
     ss << "\t w_min_dtod_lower_bound:\t\t" << w_min_dtod_lower_bound << std::endl;
+    if (lut_update) {
+      ss << "\t lut_size:\t\t" << lut_size << std::endl;
+      ss << "\t lut_tolerance:\t\t" << lut_tolerance << std::endl;
+      ss << "\t lut_dtod_resolution:\t\t" << lut_dtod_resolution << std::endl;
+    }
     ,
     /* calc weight granularity body */
     return this->dw_min;
@@ -338,7 +374,12 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
           device_specific_ldisc_ctoc_lower_bound[i][j] = other.device_specific_ldisc_ctoc_lower_bound[i][j];
           device_specific_A_ctoc_lower_bound[i][j] = other.device_specific_A_ctoc_lower_bound[i][j];
         }
-      },
+      }
+      lut_SET_ = other.lut_SET_;
+      lut_RESET_ = other.lut_RESET_;
+      lut_index_SET_ = other.lut_index_SET_;
+      lut_index_RESET_ = other.lut_index_RESET_;
+      ,
       /* move assignment */
       device_specific_Ndisc_max_bound = other.device_specific_Ndisc_max_bound;
       device_specific_Ndisc_min_bound = other.device_specific_Ndisc_min_bound;
@@ -369,6 +410,11 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
       other.device_specific_Ndiscmin_ctoc_lower_bound = nullptr;
       other.device_specific_ldisc_ctoc_lower_bound = nullptr;
       other.device_specific_A_ctoc_lower_bound = nullptr;
+
+      lut_SET_ = std::move(other.lut_SET_);
+      lut_RESET_ = std::move(other.lut_RESET_);
+      lut_index_SET_ = std::move(other.lut_index_SET_);
+      lut_index_RESET_ = std::move(other.lut_index_RESET_);
       ,
       /* swap*/
       swap(a.device_specific_Ndisc_max_bound, b.device_specific_Ndisc_max_bound);
@@ -385,6 +431,10 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
       swap(a.device_specific_Ndiscmin_ctoc_lower_bound, b.device_specific_Ndiscmin_ctoc_lower_bound);
       swap(a.device_specific_ldisc_ctoc_lower_bound, b.device_specific_ldisc_ctoc_lower_bound);
       swap(a.device_specific_A_ctoc_lower_bound, b.device_specific_A_ctoc_lower_bound);
+      swap(a.lut_SET_, b.lut_SET_);
+      swap(a.lut_RESET_, b.lut_RESET_);
+      swap(a.lut_index_SET_, b.lut_index_SET_);
+      swap(a.lut_index_RESET_, b.lut_index_RESET_);
       ,
       /* dp names*/
       names.push_back(std::string("device_specific_Ndisc_max_bound"));
@@ -442,6 +492,7 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
         device_specific_ldisc_ctoc_lower_bound[0][i] = data_ptrs[n_prev + 12][i];
         device_specific_A_ctoc_lower_bound[0][i] = data_ptrs[n_prev + 13][i];
       }
+      buildLookupTables();
 
 
       ,
@@ -455,6 +506,7 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
         }
       }
       // Todo: if device specific Ndisc bounds: Remap wmax&wmin to Ndisc max_bound&min_bound 
+      buildLookupTables();
 
   );
 
@@ -478,6 +530,10 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
   void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) override{RPU_NOT_IMPLEMENTED;};
   void diffuseWeights(T **weights, RNG<T> &rng) override{RPU_NOT_IMPLEMENTED;};
   void clipWeights(T **weights, T add_clip) override;
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override {
+    AbstractRPUDevice<T>::postUpdateWeights(weights, diffuse, decay, clip, clip_value, rng);
+  };
   bool onSetWeights(T **weights) override;
   // RRAM does not have the function to reset to a 0 weight value
   void resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) override{RPU_NOT_IMPLEMENTED;};
@@ -488,9 +544,20 @@ template <typename T> class JARTv1bRPUDevice : public PulsedRPUDevice<T> {
       T **weights, int i, const int *x_signed_indices, int x_count, int d_sign, RNG<T> *rng)
       override;
   void doDenseUpdate(T **weights, int *coincidences, RNG<T> *rng) override;
-  
+
+  // number of (SET and RESET) lookup tables (0 if not used)
+  inline int getLookupTableCount() const { return (int)(lut_SET_.size() + lut_RESET_.size()); };
 
 private:
+  void buildLookupTables();
+  inline void updateOnceLookup(
+      const JARTv1bRPUDeviceMetaParameter<T> &par, T &w, T &Ndisc, int idx, int sign);
+
+  std::vector<JARTv1bPulseTable<T>> lut_SET_;
+  std::vector<JARTv1bPulseTable<T>> lut_RESET_;
+  std::vector<int> lut_index_SET_;
+  std::vector<int> lut_index_RESET_;
+
   T **device_specific_Ndisc_max_bound = nullptr;
   T **device_specific_Ndisc_min_bound = nullptr;
   T **device_specific_Ndiscmax = nullptr;
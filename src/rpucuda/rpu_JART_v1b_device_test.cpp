@@ -0,0 +1,163 @@
+/**
+ * (C) Copyright 2022 Forschungszentrum Jülich GmbH, Zhenming Yu. All Rights reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "rng.h"
+#include "rpu_JART_v1b_device.h"
+#include "utility_functions.h"
+#include "gtest/gtest.h"
+#include <chrono>
+#include <memory>
+#include <random>
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+class RPUJARTv1bLookupTestFixture : public ::testing::TestWithParam<bool> {
+public:
+  void SetUp() {
+    x_size = 12;
+    d_size = 10;
+    with_dtod = GetParam();
+
+    dp.w_max_dtod = 0.0;
+    dp.w_min_dtod = 0.0;
+    if (with_dtod) {
+      dp.Ndiscmax_dtod = 0.1;
+      dp.ldisc_dtod = 0.1;
+      dp.Ndiscmax_dtod_upper_bound = 40.0;
+      dp.Ndiscmax_dtod_lower_bound = 1.0;
+      dp.ldisc_dtod_upper_bound = 1e-9;
+      dp.ldisc_dtod_lower_bound = 0.1e-9;
+    }
+    dp_lut = dp;
+    dp_lut.lut_update = true;
+
+    // the device parameters are bucketed with a resolution of 1%
+    tolerance = with_dtod ? 1e-2 : 1e-3;
+
+    RealWorldRNG<num_t> rw_rng(1234);
+    RealWorldRNG<num_t> rw_rng_lut(1234);
+    device = std::unique_ptr<JARTv1bRPUDevice<num_t>>(
+        dp.createDevice(x_size, d_size, &rw_rng));
+    device_lut = std::unique_ptr<JARTv1bRPUDevice<num_t>>(
+        dp_lut.createDevice(x_size, d_size, &rw_rng_lut));
+
+    weights = Array_2D_Get<num_t>(d_size, x_size);
+    weights_lut = Array_2D_Get<num_t>(d_size, x_size);
+    RealWorldRNG<num_t> w_rng(12);
+    for (int i = 0; i < x_size * d_size; i++) {
+      weights[0][i] = 0.4 * (2 * w_rng.sampleUniform() - 1);
+      weights_lut[0][i] = weights[0][i];
+    }
+    device->onSetWeights(weights);
+    device_lut->onSetWeights(weights_lut);
+
+    coincidences.resize(x_size * d_size);
+    for (int i = 0; i < x_size * d_size; i++) {
+      coincidences[i] = (int)(5 * (2 * w_rng.sampleUniform() - 1));
+    }
+  }
+
+  void TearDown() {
+    Array_2D_Free<num_t>(weights);
+    Array_2D_Free<num_t>(weights_lut);
+  }
+
+  int x_size, d_size;
+  bool with_dtod;
+  num_t tolerance;
+  JARTv1bRPUDeviceMetaParameter<num_t> dp, dp_lut;
+  std::unique_ptr<JARTv1bRPUDevice<num_t>> device, device_lut;
+  num_t **weights, **weights_lut;
+  std::vector<int> coincidences;
+  RNG<num_t> rng{0};
+};
+
+INSTANTIATE_TEST_CASE_P(DeviceToDevice, RPUJARTv1bLookupTestFixture, ::testing::Bool());
+
+TEST_P(RPUJARTv1bLookupTestFixture, Buckets) {
+  ASSERT_EQ(device->getLookupTableCount(), 0);
+  if (with_dtod) {
+    ASSERT_GT(device_lut->getLookupTableCount(), 2);
+    ASSERT_LE(device_lut->getLookupTableCount(), 2 * x_size * d_size);
+  } else {
+    ASSERT_EQ(device_lut->getLookupTableCount(), 2);
+  }
+
+  // copies keep the tables
+  JARTv1bRPUDevice<num_t> device_copy(*device_lut);
+  ASSERT_EQ(device_copy.getLookupTableCount(), device_lut->getLookupTableCount());
+}
+
+TEST_P(RPUJARTv1bLookupTestFixture, SparseUpdate) {
+  std::vector<int> x_indices(x_size);
+  for (int loop = 0; loop < 20; loop++) {
+    for (int j = 0; j < x_size; j++) {
+      // 1-based signed indices
+      x_indices[j] = (j + loop) % 3 ? j + 1 : -(j + 1);
+    }
+    int d_sign = loop % 4 < 2 ? 1 : -1;
+    for (int i = 0; i < d_size; i++) {
+      device->doSparseUpdate(weights, i, x_indices.data(), x_size, d_sign, &rng);
+      device_lut->doSparseUpdate(weights_lut, i, x_indices.data(), x_size, d_sign, &rng);
+    }
+  }
+
+  for (int i = 0; i < x_size * d_size; i++) {
+    ASSERT_NEAR(weights[0][i], weights_lut[0][i], tolerance);
+  }
+}
+
+TEST_P(RPUJARTv1bLookupTestFixture, DenseUpdateBenchmark) {
+  int nloop = 10;
+  double dur = 0, dur_lut = 0;
+
+  for (int loop = 0; loop < nloop; loop++) {
+    auto start_time = std::chrono::high_resolution_clock::now();
+    device->doDenseUpdate(weights, coincidences.data(), &rng);
+    auto end_time = std::chrono::high_resolution_clock::now();
+    dur += std::chrono::duration_cast<std::chrono::microseconds>(end_time - start_time).count();
+
+    start_time = std::chrono::high_resolution_clock::now();
+    device_lut->doDenseUpdate(weights_lut, coincidences.data(), &rng);
+    end_time = std::chrono::high_resolution_clock::now();
+    dur_lut += std::chrono::duration_cast<std::chrono::microseconds>(end_time - start_time).count();
+  }
+
+  std::cout << "Exact updates done in: " << dur / 1000. / nloop << " msec." << std::endl;
+  std::cout << "Lookup table updates done in: " << dur_lut / 1000. / nloop << " msec."
+            << std::endl;
+
+  for (int i = 0; i < x_size * d_size; i++) {
+    ASSERT_NEAR(weights[0][i], weights_lut[0][i], tolerance);
+  }
+}
+
+TEST_P(RPUJARTv1bLookupTestFixture, CycleToCycleNotSupported) {
+  dp_lut.Ndiscmax_std = 0.1;
+  RealWorldRNG<num_t> rw_rng(1);
+  EXPECT_THROW(dp_lut.createDevice(x_size, d_size, &rw_rng), std::runtime_error);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
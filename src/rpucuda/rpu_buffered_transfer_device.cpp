@@ -137,7 +137,7 @@ void BufferedTransferRPUDevice<T>::readAndUpdate(
     const int n_vec,
     const T reset_prob_in,
     const int i_slice_start) {
-  if (lr == (T)0.0) {
+  if (lr == (T)0.0 || n_vec <= 0) {
     return;
   }
 
@@ -146,17 +146,17 @@ void BufferedTransferRPUDevice<T>::readAndUpdate(
     return;
   }
 
-  this->transfer_tmp_.resize(this->d_size_);
   const auto &par = getPar();
   int in_size = par.getInSize();
   int out_size = par.getOutSize();
 
+  this->transfer_tmp_.resize(n_vec * out_size);
+
   T weight_granularity = this->rpu_device_vec_[to_device_idx]->getWeightGranularity();
   T buffer_granularity = par.thres_scale * weight_granularity;
   T sub_momentum = (T)1.0 - MAX(MIN(par.momentum, (T)1.0), (T)0.0);
   T step = par.step;
   T lr_abs = fabs(lr);
-  T *v_out = this->transfer_tmp_.data();
 
   int max_steps = this->transfer_pwu_->getUpPar().desired_BL;
 
@@ -164,13 +164,14 @@ void BufferedTransferRPUDevice<T>::readAndUpdate(
   bool use_cols = par.transfer_columns;
   int w_inc = use_cols ? in_size : 1;
 
-  // forward / update
+  // first read all vectors at once
+  this->readMatrix(from_device_idx, vec, this->transfer_tmp_.data(), n_vec, 1.0);
+
+  // update
   for (int i = 0; i < n_vec; i++) {
 
     const T *v_in = vec + i * in_size;
-
-    // first read into d (will overwrite d)
-    this->readVector(from_device_idx, v_in, v_out, 1.0);
+    T *v_out = this->transfer_tmp_.data() + i * out_size;
 
     // add into to FP buffer
     T *fp_w = transfer_buffer_vec_[from_device_idx].data();
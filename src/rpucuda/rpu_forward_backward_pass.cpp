@@ -15,6 +15,103 @@
 
 namespace RPU {
 
+/* weight products (possibly with lazily modified weights) */
+template <typename T>
+void ForwardBackwardPass<T>::gemvForward(
+    T **weights,
+    const T alpha,
+    const T *x_input,
+    const int x_inc,
+    const T beta,
+    T *d_output,
+    const int d_inc) {
+
+  if (lazy_weight_modifier_) {
+    lazy_weight_modifier_->gemvForward(weights[0], alpha, x_input, x_inc, beta, d_output, d_inc);
+    return;
+  }
+  RPU::math::gemv<T>(
+      CblasRowMajor, CblasNoTrans, this->d_size_, this->x_size_, alpha, weights[0], this->x_size_,
+      x_input, x_inc, beta, d_output, d_inc);
+}
+
+template <typename T>
+void ForwardBackwardPass<T>::gemvBackward(
+    T **weights,
+    const T alpha,
+    const T *d_input,
+    const int d_inc,
+    const T beta,
+    T *x_output,
+    const int x_inc) {
+
+  if (lazy_weight_modifier_) {
+    lazy_weight_modifier_->gemvBackward(weights[0], alpha, d_input, d_inc, beta, x_output, x_inc);
+    return;
+  }
+  RPU::math::gemv<T>(
+      CblasRowMajor, CblasTrans, this->d_size_, this->x_size_, alpha, weights[0], this->x_size_,
+      d_input, d_inc, beta, x_output, x_inc);
+}
+
+template <typename T>
+void ForwardBackwardPass<T>::gemmForward(
+    T **weights,
+    const T alpha,
+    const T *X_input,
+    const int m_batch,
+    const bool x_trans,
+    const T beta,
+    T *D_output,
+    const bool d_trans) {
+
+  if (lazy_weight_modifier_) {
+    lazy_weight_modifier_->gemmForward(
+        weights[0], alpha, X_input, m_batch, x_trans, beta, D_output, d_trans);
+    return;
+  }
+  if (d_trans) {
+    RPU::math::gemm<T>(
+        CblasRowMajor, CblasNoTrans, x_trans ? CblasNoTrans : CblasTrans, this->d_size_, m_batch,
+        this->x_size_, alpha, weights[0], this->x_size_, X_input, x_trans ? m_batch : this->x_size_,
+        beta, D_output, m_batch);
+  } else {
+    RPU::math::gemm<T>(
+        CblasRowMajor, x_trans ? CblasTrans : CblasNoTrans, CblasTrans, m_batch, this->d_size_,
+        this->x_size_, alpha, X_input, x_trans ? m_batch : this->x_size_, weights[0], this->x_size_,
+        beta, D_output, this->d_size_);
+  }
+}
+
+template <typename T>
+void ForwardBackwardPass<T>::gemmBackward(
+    T **weights,
+    const T alpha,
+    const T *D_input,
+    const int m_batch,
+    const bool d_trans,
+    const T beta,
+    T *X_output,
+    const bool x_trans) {
+
+  if (lazy_weight_modifier_) {
+    lazy_weight_modifier_->gemmBackward(
+        weights[0], alpha, D_input, m_batch, d_trans, beta, X_output, x_trans);
+    return;
+  }
+  if (x_trans) {
+    RPU::math::gemm<T>(
+        CblasRowMajor, CblasTrans, d_trans ? CblasNoTrans : CblasTrans, this->x_size_, m_batch,
+        this->d_size_, alpha, weights[0], this->x_size_, D_input, d_trans ? m_batch : this->d_size_,
+        beta, X_output, m_batch);
+  } else {
+    RPU::math::gemm<T>(
+        CblasRowMajor, d_trans ? CblasTrans : CblasNoTrans, CblasNoTrans, m_batch, this->x_size_,
+        this->d_size_, alpha, D_input, d_trans ? m_batch : this->d_size_, weights[0], this->x_size_,
+        beta, X_output, this->x_size_);
+  }
+}
+
 /*FP forward / backward pass */
 template <typename T>
 void ForwardBackwardPass<T>::forwardVector(
@@ -26,18 +123,41 @@ void ForwardBackwardPass<T>::forwardVector(
     const T alpha,
     const bool is_test) {
 
-  RPU::math::gemv<T>(
-      CblasRowMajor, CblasNoTrans, this->d_size_, this->x_size_, alpha, weights[0], this->x_size_,
-      x_input, x_inc, (T)0.0, d_output, d_inc);
+  gemvForward(weights, alpha, x_input, x_inc, (T)0.0, d_output, d_inc);
 }
 
 template <typename T>
 void ForwardBackwardPass<T>::backwardVector(
     T **weights, const T *d_input, const int d_inc, T *x_output, const int x_inc, const T alpha) {
 
-  RPU::math::gemv<T>(
-      CblasRowMajor, CblasTrans, this->d_size_, this->x_size_, alpha, weights[0], this->x_size_,
-      d_input, d_inc, (T)0.0, x_output, x_inc);
+  gemvBackward(weights, alpha, d_input, d_inc, (T)0.0, x_output, x_inc);
+}
+
+template <typename T>
+void ForwardBackwardPass<T>::forwardMatrix(
+    T **weights,
+    const T *X_input,
+    const int m_batch,
+    const bool x_trans,
+    T *D_output,
+    const bool d_trans,
+    const T alpha,
+    const bool is_test) {
+
+  gemmForward(weights, alpha, X_input, m_batch, x_trans, (T)0.0, D_output, d_trans);
+}
+
+template <typename T>
+void ForwardBackwardPass<T>::backwardMatrix(
+    T **weights,
+    const T *D_input,
+    const int m_batch,
+    const bool d_trans,
+    T *X_output,
+    const bool x_trans,
+    const T alpha) {
+
+  gemmBackward(weights, alpha, D_input, m_batch, d_trans, (T)0.0, X_output, x_trans);
 }
 
 template class ForwardBackwardPass<float>;
@@ -139,6 +259,16 @@ void ForwardBackwardPassIOManaged<T>::setIOPar(
   checked_implemented_ = false; // need to check in forward because CUDA also shares this with CPU
 }
 
+template <typename T> bool ForwardBackwardPassIOManaged<T>::supportsLazyWeights() const {
+  for (auto io : {&f_io_, &b_io_}) {
+    if (io->ir_drop != (T)0.0 ||
+        (io->w_noise_type == OutputWeightNoiseType::PCMRead && io->w_noise > (T)0.0)) {
+      return false;
+    }
+  }
+  return true;
+}
+
 template <typename T> void ForwardBackwardPassIOManaged<T>::ensureImplemented() {}
 
 template <typename T>
@@ -262,6 +392,154 @@ void ForwardBackwardPassIOManaged<T>::applyIrDrop(
   }
 }
 
+template <typename T> void ForwardBackwardPassIOManaged<T>::computeAbsWeights(T **weights) {
+  int size = this->x_size_ * this->d_size_;
+  tmp_abs_weights_.resize(size);
+  T *abs_weights = tmp_abs_weights_.data();
+  const T *w = weights[0];
+
+#pragma omp parallel for num_threads(getNumThreads()) if (size > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < size; ++k) {
+    abs_weights[k] = (T)fabs(w[k]);
+  }
+}
+
+/* Batched versions of the weight noise and IR drop. Input and output
+   values are batch-major. The sums over |w_ij| are computed with one
+   GEMM for the whole batch using the absolute weights (computeAbsWeights
+   needs to be called before). */
+template <typename T>
+void ForwardBackwardPassIOManaged<T>::applyOutputWeightNoiseMatrix(
+    T *out_values,
+    const int out_size,
+    const T *in_values,
+    const int in_size,
+    const int m_batch,
+    IOMetaParameter<T> &io,
+    bool transposed,
+    int n_threads) {
+
+  if (io.w_noise_type == OutputWeightNoiseType::None || io.w_noise <= (T)0.0) {
+    return;
+  }
+
+  switch (io.w_noise_type) {
+  case OutputWeightNoiseType::AdditiveConstant: {
+#pragma omp parallel for num_threads(n_threads) schedule(static)
+    for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+      RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+      T x_norm = RPU::math::nrm2<T>(in_size, in_values + i_batch * in_size, 1);
+      T w_std = io.w_noise * x_norm;
+      T *out_value = out_values + i_batch * out_size;
+      PRAGMA_SIMD
+      for (int i = 0; i < out_size; ++i) {
+        out_value[i] += w_std * rng->sampleGauss();
+      }
+    }
+    break;
+  }
+  case OutputWeightNoiseType::PCMRead: {
+    int in_total = m_batch * in_size;
+    tmp_in_batch_values_.resize(in_total);
+    tmp_out_batch_values_.resize(m_batch * out_size);
+    T *in_sq = tmp_in_batch_values_.data();
+    T *accum = tmp_out_batch_values_.data();
+
+#pragma omp parallel for num_threads(n_threads) if (in_total > RPU_OMP_MIN_SIZE)
+    for (int k = 0; k < in_total; ++k) {
+      in_sq[k] = in_values[k] * in_values[k];
+    }
+
+    // accum_i = sum_j |w_ij| * x_j^2 for all samples
+    RPU::math::gemm<T>(
+        CblasRowMajor, CblasNoTrans, transposed ? CblasNoTrans : CblasTrans, m_batch, out_size,
+        in_size, (T)1.0, in_sq, in_size, tmp_abs_weights_.data(), this->x_size_, (T)0.0, accum,
+        out_size);
+
+#pragma omp parallel for num_threads(n_threads) schedule(static)
+    for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+      RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+      T *out_value = out_values + i_batch * out_size;
+      T *accum_value = accum + i_batch * out_size;
+      PRAGMA_SIMD
+      for (int i = 0; i < out_size; ++i) {
+        out_value[i] += io.w_noise * (T)sqrt(accum_value[i]) * rng->sampleGauss();
+      }
+    }
+    break;
+  }
+  default:
+    RPU_FATAL("Output noise type not implemented")
+  }
+}
+
+template <typename T>
+void ForwardBackwardPassIOManaged<T>::applyIrDropMatrix(
+    T **weights,
+    T *out_values,
+    const int out_size,
+    const T *in_values,
+    const int in_size,
+    const int m_batch,
+    IOMetaParameter<T> &io,
+    bool transposed,
+    int n_threads) {
+
+  if (io.ir_drop <= 0.0) {
+    return;
+  }
+  int in_total = m_batch * in_size;
+  int out_total = m_batch * out_size;
+  tmp_in_batch_values_.resize(in_total);
+  tmp_out_batch_values_.resize(out_total);
+  tmp_c_batch_values_.resize(out_total);
+  T *in_tmp = tmp_in_batch_values_.data();
+  T *out_tmp = tmp_out_batch_values_.data();
+  T *c_values = tmp_c_batch_values_.data();
+  CBLAS_TRANSPOSE w_trans = transposed ? CblasNoTrans : CblasTrans;
+
+#pragma omp parallel for num_threads(n_threads) if (in_total > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < in_total; ++k) {
+    in_tmp[k] = (T)fabs(in_values[k]);
+  }
+
+  // a_i = sum_j(|w_ij|*|x_j|)*n/Gw*gmax for all samples
+  T a_scale = in_size / io.ir_drop_Gw_div_gmax;
+  RPU::math::gemm<T>(
+      CblasRowMajor, CblasNoTrans, w_trans, m_batch, out_size, in_size, a_scale, in_tmp, in_size,
+      tmp_abs_weights_.data(), this->x_size_, (T)0.0, c_values, out_size);
+
+  // c_i = a_i*(a_i*(0.05*a_i - 0.2) + 0.5);
+#pragma omp parallel for num_threads(n_threads) if (out_total > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < out_total; ++k) {
+    T a = c_values[k];
+    c_values[k] = a * (a * ((T)0.05 * a - (T)0.2) + (T)0.5);
+  }
+
+  // compute x_j*(1-(1-j/n)^2)
+#pragma omp parallel for num_threads(n_threads) if (in_total > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < in_total; ++k) {
+    T p = ((T)1 - (T)(k % in_size) / in_size);
+    in_tmp[k] = in_values[k] * (1 - p * p);
+  }
+
+  RPU::math::gemm<T>(
+      CblasRowMajor, CblasNoTrans, w_trans, m_batch, out_size, in_size, io.ir_drop, in_tmp, in_size,
+      weights[0], this->x_size_, (T)0.0, out_tmp, out_size);
+
+  // y_i = y_i_ideal - ir_drop*c_i*sum_j(w_ij * x'_j)
+#pragma omp parallel for num_threads(n_threads) schedule(static)
+  for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+    T *out_value = out_values + i_batch * out_size;
+    T *c_value = c_values + i_batch * out_size;
+    T *out_tmp_value = out_tmp + i_batch * out_size;
+    PRAGMA_SIMD
+    for (int i = 0; i < out_size; ++i) {
+      out_value[i] -= c_value[i] * out_tmp_value[i];
+    }
+  }
+}
+
 template <typename T>
 void ForwardBackwardPassIOManaged<T>::forwardVector(
     T **weights,
@@ -300,6 +578,7 @@ void ForwardBackwardPassIOManaged<T>::forwardVector(
         d_output[i_d] = (T)0.0;
         i_d += d_inc;
       }
+      bm_iterations_ = 0;
       return;
     }
   }
@@ -393,9 +672,7 @@ void ForwardBackwardPassIOManaged<T>::forwardVector(
       }
     }
 
-    RPU::math::gemv<T>(
-        CblasRowMajor, CblasNoTrans, this->d_size_, this->x_size_, 1.0, weights[0], this->x_size_,
-        x_value, 1, f_io_.out_noise, d_output, d_inc);
+    this->gemvForward(weights, (T)1.0, x_value, 1, f_io_.out_noise, d_output, d_inc);
 
     if (f_io_.w_noise_type != OutputWeightNoiseType::None) {
       applyOutputWeightNoise(
@@ -435,7 +712,7 @@ void ForwardBackwardPassIOManaged<T>::forwardVector(
         bound_test_passed = false;
       } else if (value < -f_io_.out_bound) {
         value = -f_io_.out_bound;
-        bound_test_passed = !f_io_.bm_test_negative_bound;
+        bound_test_passed = bound_test_passed && !f_io_.bm_test_negative_bound;
       }
 
       d_output[i_d] = value;
@@ -452,6 +729,8 @@ void ForwardBackwardPassIOManaged<T>::forwardVector(
     }
   }
 
+  bm_iterations_ = bm_round;
+
   if (scaling || out_scale != 1.0) {
     RPU::math::scal<T>(this->d_size_, out_scale / scale, d_output, d_inc);
   }
@@ -527,9 +806,7 @@ void ForwardBackwardPassIOManaged<T>::backwardVector(
     }
   }
 
-  RPU::math::gemv<T>(
-      CblasRowMajor, CblasTrans, this->d_size_, this->x_size_, 1.0, weights[0], this->x_size_,
-      d_value, 1, b_io_.out_noise, x_output, x_inc);
+  this->gemvBackward(weights, (T)1.0, d_value, 1, b_io_.out_noise, x_output, x_inc);
 
   if (b_io_.w_noise_type != OutputWeightNoiseType::None) {
     applyOutputWeightNoise(
@@ -561,6 +838,379 @@ void ForwardBackwardPassIOManaged<T>::backwardVector(
 };
 #undef CHECK_INPUT_BOUNDS
 
+/*********************************************************************/
+/* Matrix (batch) versions of the noisy forward / backward pass. Same
+   per-sample semantics as the vector versions, but the MAC is done
+   with one GEMM over the whole batch. The per-sample loops run in
+   parallel (OpenMP) with one RNG stream per thread. */
+
+template <typename T>
+void ForwardBackwardPassIOManaged<T>::forwardMatrix(
+    T **weights,
+    const T *X_input,
+    const int m_batch,
+    const bool x_trans,
+    T *D_output,
+    const bool d_trans,
+    const T alpha,
+    const bool is_test) {
+
+  if (f_io_.is_perfect) {
+    // short-cut for FP
+    ForwardBackwardPass<T>::forwardMatrix(
+        weights, X_input, m_batch, x_trans, D_output, d_trans, f_io_.out_scale * alpha, is_test);
+    return;
+  }
+  if (!checked_implemented_) {
+    ensureImplemented();
+    checked_implemented_ = true;
+  }
+
+  const int x_size = this->x_size_;
+  const int d_size = this->d_size_;
+  const int x_offset = x_trans ? 1 : x_size;
+  const int d_offset = d_trans ? 1 : d_size;
+  const int x_inc = x_trans ? m_batch : 1;
+  const int d_inc = d_trans ? m_batch : 1;
+
+  // batch-major buffers [n_pending, x_size] and [n_pending, d_size]
+  // of the samples that still need to be computed
+  tmp_X_values_.resize(m_batch * x_size);
+  tmp_D_values_.resize(m_batch * d_size);
+  tmp_nm_scale_values_.resize(m_batch);
+  tmp_bm_reduction_values_.resize(m_batch);
+  tmp_bm_passed_.resize(m_batch);
+  tmp_bm_pending_.resize(m_batch);
+
+  T *x_values = tmp_X_values_.data();
+  T *d_values = tmp_D_values_.data();
+  T *nm_scale_values = tmp_nm_scale_values_.data();
+  T *reductions = tmp_bm_reduction_values_.data();
+  int *passed = tmp_bm_passed_.data();
+  int *pending = tmp_bm_pending_.data();
+
+  bool nm = f_io_.noise_management != NoiseManagementType::None;
+  bool sm = f_io_.bound_management == BoundManagementType::Shift;
+  bool bm = f_io_.bound_management != BoundManagementType::None && !sm;
+  bool worst_case = f_io_.bound_management == BoundManagementType::IterativeWorstCase &&
+                    f_io_.noise_management != NoiseManagementType::AbsMaxNPSum;
+
+  T out_scale = (T)1.0;
+  if (!sm) { // NOT scaled for ShiftManagement (ONLY during forward...)
+    out_scale = f_io_.out_scale * alpha;
+  }
+
+  int n_threads = m_batch > 1 ? MIN(getNumThreads(), m_batch) : 1;
+  rng_->prepareThreadRNGs(n_threads);
+  // running averages need the samples in order
+  bool nm_in_order = f_io_.noise_management == NoiseManagementType::AverageAbsMax ||
+                     f_io_.noise_management == NoiseManagementType::AverageAbsMaxSingleValue;
+  if ((f_io_.w_noise_type == OutputWeightNoiseType::PCMRead && f_io_.w_noise > (T)0.0) ||
+      f_io_.ir_drop > (T)0.0) {
+    computeAbsWeights(weights);
+  }
+
+  // noise management
+#pragma omp parallel for num_threads(n_threads) if (!nm_in_order)
+  for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+    nm_scale_values[i_batch] = computeNoiseManagement(
+        X_input + i_batch * x_offset, x_size, x_inc, f_io_.noise_management, aux_nm_value_, f_io_);
+    reductions[i_batch] = (T)0.5;
+
+    if (nm && nm_scale_values[i_batch] <= (T)0.0 && f_io_.inp_noise <= (T)0.0) {
+      // short cut. output will be zero anyway
+      T *d_output = D_output + i_batch * d_offset;
+      int i_d = 0;
+      PRAGMA_SIMD
+      for (int i = 0; i < d_size; ++i) {
+        d_output[i_d] = (T)0.0;
+        i_d += d_inc;
+      }
+      passed[i_batch] = 1;
+    } else {
+      passed[i_batch] = 0;
+    }
+  }
+  int n_pending = 0;
+  for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+    if (!passed[i_batch]) {
+      pending[n_pending++] = i_batch;
+    }
+  }
+
+  T inp_noise = f_io_.inp_noise;
+  int bm_round = 0;
+  while (n_pending > 0) {
+
+    int n_round_threads = MIN(n_threads, n_pending);
+
+    // input DAC per pending sample
+#pragma omp parallel for num_threads(n_round_threads) schedule(static)
+    for (int k = 0; k < n_pending; k++) {
+      int i_batch = pending[k];
+      T *x_value = x_values + k * x_size;
+      const T *x_input = X_input + i_batch * x_offset;
+      reductions[i_batch] *= (T)2.0;
+
+      if (bm_round == 1 && worst_case) {
+        nm_scale_values[i_batch] = computeNoiseManagement(
+            x_input, x_size, x_inc, NoiseManagementType::AbsMaxNPSum, aux_nm_value_, f_io_);
+        reductions[i_batch] = (T)1.0; // reset to 1.0
+      }
+
+      T scale = (T)1.0;
+      if (nm && nm_scale_values[i_batch] > (T)0.0) {
+        scale /= nm_scale_values[i_batch];
+      }
+      if (bm) {
+        scale /= reductions[i_batch];
+      }
+
+      RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+      int j_x = 0;
+      PRAGMA_SIMD
+      for (int j = 0; j < x_size; ++j) {
+
+        T value = x_input[j_x] * scale;
+        j_x += x_inc;
+
+        value = getDiscretizedValue(value, f_io_.inp_res, f_io_.inp_sto_round, *rng);
+
+        if (inp_noise > 0) {
+          value += inp_noise * rng->sampleGauss();
+        }
+
+        value = (value > f_io_.inp_bound) ? f_io_.inp_bound : value;
+        value = (value < -f_io_.inp_bound) ? -f_io_.inp_bound : value;
+
+        x_value[j] = value;
+      }
+    }
+
+    if (f_io_.out_noise > 0) {
+#pragma omp parallel for num_threads(n_round_threads) schedule(static)
+      for (int k = 0; k < n_pending; k++) {
+        rng_->getThreadRNG(getThreadNum())->fillGauss(d_values + k * d_size, d_size);
+      }
+    }
+
+    // the analog MAC for the pending samples only
+    this->gemmForward(
+        weights, (T)1.0, x_values, n_pending, false, f_io_.out_noise, d_values, false);
+
+    applyOutputWeightNoiseMatrix(
+        d_values, d_size, x_values, x_size, n_pending, f_io_, false, n_round_threads);
+    applyIrDropMatrix(
+        weights, d_values, d_size, x_values, x_size, n_pending, f_io_, false, n_round_threads);
+
+    // output ADC and bound test per pending sample
+#pragma omp parallel for num_threads(n_round_threads) schedule(static)
+    for (int k = 0; k < n_pending; k++) {
+      int i_batch = pending[k];
+      RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+      T *d_value = d_values + k * d_size;
+
+      if (sm) {
+        int max_index = RPU::math::iamax<T>(d_size, d_value, 1);
+        T shift_value = f_io_.out_bound - (T)fabs(d_value[max_index]);
+        PRAGMA_SIMD
+        for (int i = 0; i < d_size; ++i) {
+          d_value[i] += shift_value; // will be clipped below
+        }
+      }
+
+      bool bound_test_passed = true;
+      PRAGMA_SIMD
+      for (int i = 0; i < d_size; ++i) {
+
+        T value = d_value[i];
+
+        value = getDiscretizedValue(value, f_io_.out_res, f_io_.out_sto_round, *rng);
+
+        if (value > f_io_.out_bound) {
+          value = f_io_.out_bound;
+          bound_test_passed = false;
+        } else if (value < -f_io_.out_bound) {
+          value = -f_io_.out_bound;
+          bound_test_passed = bound_test_passed && !f_io_.bm_test_negative_bound;
+        }
+
+        d_value[i] = value;
+      }
+
+      T reduction = reductions[i_batch];
+      if (bm) {
+        bound_test_passed =
+            bound_test_passed ||
+            ((reduction > f_io_.max_bm_factor) ||
+             ((f_io_.inp_res > 0) && (reduction > f_io_.max_bm_res / f_io_.inp_res)));
+      } else {
+        bound_test_passed = true;
+      }
+
+      if (bound_test_passed) {
+        // write out and undo the input scales
+        T scale = (T)1.0;
+        if (nm && nm_scale_values[i_batch] > (T)0.0) {
+          scale *= nm_scale_values[i_batch];
+        }
+        if (bm) {
+          scale *= reduction;
+        }
+        scale *= out_scale;
+
+        T *d_output = D_output + i_batch * d_offset;
+        int i_d = 0;
+        PRAGMA_SIMD
+        for (int i = 0; i < d_size; ++i) {
+          d_output[i_d] = d_value[i] * scale;
+          i_d += d_inc;
+        }
+        passed[i_batch] = 1;
+      }
+    }
+
+    // compact the samples that need to be re-run (in order)
+    int n_failed = 0;
+    for (int k = 0; k < n_pending; k++) {
+      if (!passed[pending[k]]) {
+        pending[n_failed++] = pending[k];
+      }
+    }
+    n_pending = n_failed;
+    bm_round++;
+  }
+  bm_iterations_ = bm_round;
+}
+
+template <typename T>
+void ForwardBackwardPassIOManaged<T>::backwardMatrix(
+    T **weights,
+    const T *D_input,
+    const int m_batch,
+    const bool d_trans,
+    T *X_output,
+    const bool x_trans,
+    const T alpha) {
+
+  if (b_io_.is_perfect) {
+    // short-cut for FP
+    ForwardBackwardPass<T>::backwardMatrix(
+        weights, D_input, m_batch, d_trans, X_output, x_trans, b_io_.out_scale * alpha);
+    return;
+  }
+
+  const int x_size = this->x_size_;
+  const int d_size = this->d_size_;
+  const int x_offset = x_trans ? 1 : x_size;
+  const int d_offset = d_trans ? 1 : d_size;
+  const int x_inc = x_trans ? m_batch : 1;
+  const int d_inc = d_trans ? m_batch : 1;
+
+  tmp_X_values_.resize(m_batch * x_size);
+  tmp_D_values_.resize(m_batch * d_size);
+  tmp_nm_scale_values_.resize(m_batch);
+
+  T *x_values = tmp_X_values_.data();
+  T *d_values = tmp_D_values_.data();
+  T *nm_scale_values = tmp_nm_scale_values_.data();
+
+  bool nm = b_io_.noise_management != NoiseManagementType::None;
+  T out_scale = b_io_.out_scale * alpha;
+
+  int n_threads = m_batch > 1 ? MIN(getNumThreads(), m_batch) : 1;
+  rng_->prepareThreadRNGs(n_threads);
+  bool nm_in_order = b_io_.noise_management == NoiseManagementType::AverageAbsMax ||
+                     b_io_.noise_management == NoiseManagementType::AverageAbsMaxSingleValue;
+  if ((b_io_.w_noise_type == OutputWeightNoiseType::PCMRead && b_io_.w_noise > (T)0.0) ||
+      b_io_.ir_drop > (T)0.0) {
+    computeAbsWeights(weights);
+  }
+
+  // input DAC per sample
+#pragma omp parallel for num_threads(n_threads) schedule(static) if (!nm_in_order)
+  for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+    const T *d_input = D_input + i_batch * d_offset;
+    T *d_value = d_values + i_batch * d_size;
+
+    nm_scale_values[i_batch] = computeNoiseManagement(
+        d_input, d_size, d_inc, b_io_.noise_management, aux_nm_value_, b_io_);
+    T nm_scale_value = nm_scale_values[i_batch];
+    T scale = (nm && nm_scale_value > (T)0.0) ? (T)1.0 / nm_scale_value : (T)1.0;
+
+    if (nm && nm_scale_value <= (T)0.0) {
+      // max is zero. output will be set to zero below
+      PRAGMA_SIMD
+      for (int i = 0; i < d_size; ++i) {
+        d_value[i] = (T)0.0;
+      }
+      continue;
+    }
+
+    RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+    int i_d = 0;
+    PRAGMA_SIMD
+    for (int i = 0; i < d_size; ++i) {
+      T value = d_input[i_d] * scale;
+      i_d += d_inc;
+
+      value = getDiscretizedValue(value, b_io_.inp_res, b_io_.inp_sto_round, *rng);
+      value = (value > b_io_.inp_bound) ? b_io_.inp_bound : value;
+      value = (value < -b_io_.inp_bound) ? -b_io_.inp_bound : value;
+
+      d_value[i] = value;
+    }
+  }
+
+  if (b_io_.out_noise > 0) {
+#pragma omp parallel for num_threads(n_threads) schedule(static)
+    for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+      rng_->getThreadRNG(getThreadNum())->fillGauss(x_values + i_batch * x_size, x_size);
+    }
+  }
+
+  // the analog MAC for the whole batch
+  this->gemmBackward(weights, (T)1.0, d_values, m_batch, false, b_io_.out_noise, x_values, false);
+
+  applyOutputWeightNoiseMatrix(x_values, x_size, d_values, d_size, m_batch, b_io_, true, n_threads);
+  applyIrDropMatrix(weights, x_values, x_size, d_values, d_size, m_batch, b_io_, true, n_threads);
+
+  // output ADC per sample
+#pragma omp parallel for num_threads(n_threads) schedule(static)
+  for (int i_batch = 0; i_batch < m_batch; i_batch++) {
+    T *x_output = X_output + i_batch * x_offset;
+    T *x_value = x_values + i_batch * x_size;
+    T nm_scale_value = nm_scale_values[i_batch];
+
+    if (nm && nm_scale_value <= (T)0.0) {
+      int j_x = 0;
+      PRAGMA_SIMD
+      for (int j = 0; j < x_size; j++) {
+        x_output[j_x] = (T)0.0;
+        j_x += x_inc;
+      }
+      continue;
+    }
+
+    RNG<T> *rng = rng_->getThreadRNG(getThreadNum());
+    T scale = out_scale * ((nm && nm_scale_value > (T)0.0) ? nm_scale_value : (T)1.0);
+    int j_x = 0;
+    PRAGMA_SIMD
+    for (int j = 0; j < x_size; j++) {
+
+      T value = x_value[j];
+
+      value = getDiscretizedValue(value, b_io_.out_res, b_io_.out_sto_round, *rng);
+
+      value = (value > b_io_.out_bound) ? b_io_.out_bound : value;
+      value = (value < -b_io_.out_bound) ? -b_io_.out_bound : value;
+
+      x_output[j_x] = value * scale;
+      j_x += x_inc;
+    }
+  }
+}
+
 template class ForwardBackwardPassIOManaged<float>;
 #ifdef RPU_USE_DOUBLE
 template class ForwardBackwardPassIOManaged<double>;
@@ -14,6 +14,7 @@
 
 #include "rng.h"
 #include "rpu_pulsed_meta_parameter.h"
+#include "weight_modifier.h"
 #include <memory>
 
 namespace RPU {
@@ -37,9 +38,75 @@ public:
   virtual void backwardVector(
       T **weights, const T *d_input, const int d_inc, T *x_output, const int x_inc, const T alpha);
 
+  /* matrix (batch) versions. Format is x-major (or d-major) as for
+     the vector versions, batch dimension comes first if x_trans or
+     d_trans is set. */
+  virtual void forwardMatrix(
+      T **weights,
+      const T *X_input,
+      const int m_batch,
+      const bool x_trans,
+      T *D_output,
+      const bool d_trans,
+      const T alpha,
+      const bool is_test);
+
+  virtual void backwardMatrix(
+      T **weights,
+      const T *D_input,
+      const int m_batch,
+      const bool d_trans,
+      T *X_output,
+      const bool x_trans,
+      const T alpha);
+
+  /* If set, the given weights are modified lazily (per block of rows)
+     by the (prepared) weight modifier in the following passes. */
+  void setLazyWeightModifier(WeightModifier<T> *weight_modifier) {
+    lazy_weight_modifier_ = weight_modifier;
+  };
+  /* Whether the passes can be computed with lazily modified weights */
+  virtual bool supportsLazyWeights() const { return true; };
+
 protected:
+  void gemvForward(
+      T **weights,
+      const T alpha,
+      const T *x_input,
+      const int x_inc,
+      const T beta,
+      T *d_output,
+      const int d_inc);
+  void gemvBackward(
+      T **weights,
+      const T alpha,
+      const T *d_input,
+      const int d_inc,
+      const T beta,
+      T *x_output,
+      const int x_inc);
+  void gemmForward(
+      T **weights,
+      const T alpha,
+      const T *X_input,
+      const int m_batch,
+      const bool x_trans,
+      const T beta,
+      T *D_output,
+      const bool d_trans);
+  void gemmBackward(
+      T **weights,
+      const T alpha,
+      const T *D_input,
+      const int m_batch,
+      const bool d_trans,
+      const T beta,
+      T *X_output,
+      const bool x_trans);
+
   int x_size_ = 0;
   int d_size_ = 0;
+  WeightModifier<T> *lazy_weight_modifier_ = nullptr;
 };
 
 /* RPU stochastic version of the forward pass with noise and management ntechniques*/
@@ -62,8 +129,35 @@ public:
       T **weights, const T *d_input, const int d_inc, T *x_output, const int x_inc, const T alpha)
       override;
 
+  void forwardMatrix(
+      T **weights,
+      const T *X_input,
+      const int m_batch,
+      const bool x_trans,
+      T *D_output,
+      const bool d_trans,
+      const T alpha,
+      const bool is_test) override;
+
+  void backwardMatrix(
+      T **weights,
+      const T *D_input,
+      const int m_batch,
+      const bool d_trans,
+      T *X_output,
+      const bool x_trans,
+      const T alpha) override;
+
   void setIOPar(const IOMetaParameter<T> &f_io_, const IOMetaParameter<T> &b_io_);
 
+  /* IR drop and the PCM read noise need the full (abs) weights */
+  bool supportsLazyWeights() const override;
+
+  /* Number of bound management iterations of the last forward pass. In
+     the matrix version only the samples that failed the bound test are
+     re-computed in each further iteration. */
+  int getBMIterations() const { return bm_iterations_; };
+
 protected:
   void applyOutputWeightNoise(
       T **weights,
@@ -85,6 +179,29 @@ protected:
       IOMetaParameter<T> &io,
       bool transposed);
 
+  void computeAbsWeights(T **weights);
+
+  void applyOutputWeightNoiseMatrix(
+      T *out_values,
+      const int out_size,
+      const T *in_values,
+      const int in_size,
+      const int m_batch,
+      IOMetaParameter<T> &io,
+      bool transposed,
+      int n_threads);
+
+  void applyIrDropMatrix(
+      T **weights,
+      T *out_values,
+      const int out_size,
+      const T *in_values,
+      const int in_size,
+      const int m_batch,
+      IOMetaParameter<T> &io,
+      bool transposed,
+      int n_threads);
+
 private:
   void ensureImplemented();
 
@@ -95,7 +212,20 @@ private:
   std::vector<T> tmp_out_values_;
   std::vector<T> tmp_c_values_;
 
+  // batch buffers for the matrix versions (batch-major)
+  std::vector<T> tmp_X_values_;
+  std::vector<T> tmp_D_values_;
+  std::vector<T> tmp_nm_scale_values_;
+  std::vector<T> tmp_bm_reduction_values_;
+  std::vector<int> tmp_bm_passed_;
+  std::vector<int> tmp_bm_pending_;
+  std::vector<T> tmp_abs_weights_;
+  std::vector<T> tmp_in_batch_values_;
+  std::vector<T> tmp_out_batch_values_;
+  std::vector<T> tmp_c_batch_values_;
+
   T aux_nm_value_ = -1.0;
+  int bm_iterations_ = 0;
   IOMetaParameter<T> f_io_;
   IOMetaParameter<T> b_io_;
   bool checked_implemented_ = false;
@@ -0,0 +1,296 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "rng.h"
+#include "rpu_forward_backward_pass.h"
+#include "utility_functions.h"
+#include "gtest/gtest.h"
+#include <memory>
+#include <random>
+
+#define TOLERANCE 1e-5
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+class ForwardBackwardPassTestFixture : public ::testing::TestWithParam<bool> {
+public:
+  void SetUp() {
+    x_size = 17;
+    d_size = 9;
+    m_batch = 13;
+    trans = GetParam();
+
+    rng = std::make_shared<RNG<num_t>>(0);
+
+    weights = Array_2D_Get<num_t>(d_size, x_size);
+    for (int i = 0; i < x_size * d_size; i++) {
+      weights[0][i] = rw_rng.sampleGauss() * 0.3;
+    }
+    x_input.resize(x_size * m_batch);
+    for (int i = 0; i < x_size * m_batch; i++) {
+      x_input[i] = rw_rng.sampleGauss();
+    }
+    d_input.resize(d_size * m_batch);
+    for (int i = 0; i < d_size * m_batch; i++) {
+      d_input[i] = rw_rng.sampleGauss();
+    }
+
+    // noise free version without resolution to compare exactly
+    io.inp_res = -1;
+    io.out_res = -1;
+    io.out_noise = 0.0;
+    io.w_noise = 0.0;
+    io.inp_noise = 0.0;
+  };
+
+  void TearDown() { Array_2D_Free<num_t>(weights); };
+
+  void forwardVectorLooped(ForwardBackwardPassIOManaged<num_t> &fb, num_t *d_output) {
+    int x_offset = trans ? 1 : x_size;
+    int d_offset = trans ? 1 : d_size;
+    int x_inc = trans ? m_batch : 1;
+    int d_inc = trans ? m_batch : 1;
+    for (int i = 0; i < m_batch; i++) {
+      fb.forwardVector(
+          weights, x_input.data() + i * x_offset, x_inc, d_output + i * d_offset, d_inc, 1.0,
+          false);
+    }
+  }
+
+  void backwardVectorLooped(ForwardBackwardPassIOManaged<num_t> &fb, num_t *x_output) {
+    int x_offset = trans ? 1 : x_size;
+    int d_offset = trans ? 1 : d_size;
+    int x_inc = trans ? m_batch : 1;
+    int d_inc = trans ? m_batch : 1;
+    for (int i = 0; i < m_batch; i++) {
+      fb.backwardVector(
+          weights, d_input.data() + i * d_offset, d_inc, x_output + i * x_offset, x_inc, 1.0);
+    }
+  }
+
+  int x_size, d_size, m_batch;
+  bool trans;
+  num_t **weights;
+  std::vector<num_t> x_input;
+  std::vector<num_t> d_input;
+  IOMetaParameter<num_t> io;
+  std::shared_ptr<RNG<num_t>> rng;
+  RealWorldRNG<num_t> rw_rng{1};
+};
+
+// define the tests
+INSTANTIATE_TEST_CASE_P(Transposed, ForwardBackwardPassTestFixture, ::testing::Bool());
+
+TEST_P(ForwardBackwardPassTestFixture, ForwardMatrixNoNoise) {
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+
+  forwardVectorLooped(fb, d_vec.data());
+  fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+
+  for (int i = 0; i < d_size * m_batch; i++) {
+    ASSERT_NEAR(d_vec[i], d_mat[i], TOLERANCE);
+  }
+}
+
+TEST_P(ForwardBackwardPassTestFixture, ForwardMatrixBoundManagement) {
+
+  io.out_bound = 0.5;
+  io.bound_management = BoundManagementType::Iterative;
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+
+  int x_offset = trans ? 1 : x_size;
+  int d_offset = trans ? 1 : d_size;
+  int inc = trans ? m_batch : 1;
+  int max_iterations = 0;
+  for (int i = 0; i < m_batch; i++) {
+    fb.forwardVector(
+        weights, x_input.data() + i * x_offset, inc, d_vec.data() + i * d_offset, inc, 1.0, false);
+    max_iterations = MAX(max_iterations, fb.getBMIterations());
+  }
+  fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+
+  for (int i = 0; i < d_size * m_batch; i++) {
+    ASSERT_NEAR(d_vec[i], d_mat[i], TOLERANCE);
+  }
+  ASSERT_GT(max_iterations, 1);
+  ASSERT_EQ(fb.getBMIterations(), max_iterations);
+}
+
+TEST_P(ForwardBackwardPassTestFixture, MatrixParallel) {
+
+  io.out_bound = 0.5;
+  io.bound_management = BoundManagementType::Iterative;
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+  std::vector<num_t> x_vec(x_size * m_batch);
+  std::vector<num_t> x_mat(x_size * m_batch);
+
+  forwardVectorLooped(fb, d_vec.data());
+  backwardVectorLooped(fb, x_vec.data());
+
+  setNumThreads(4);
+  fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+  fb.backwardMatrix(weights, d_input.data(), m_batch, trans, x_mat.data(), trans, 1.0);
+  setNumThreads(0);
+
+  for (int i = 0; i < d_size * m_batch; i++) {
+    ASSERT_NEAR(d_vec[i], d_mat[i], TOLERANCE);
+  }
+  for (int i = 0; i < x_size * m_batch; i++) {
+    ASSERT_NEAR(x_vec[i], x_mat[i], TOLERANCE);
+  }
+}
+
+TEST_P(ForwardBackwardPassTestFixture, BackwardMatrixNoNoise) {
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+
+  std::vector<num_t> x_vec(x_size * m_batch);
+  std::vector<num_t> x_mat(x_size * m_batch);
+
+  backwardVectorLooped(fb, x_vec.data());
+  fb.backwardMatrix(weights, d_input.data(), m_batch, trans, x_mat.data(), trans, 1.0);
+
+  for (int i = 0; i < x_size * m_batch; i++) {
+    ASSERT_NEAR(x_vec[i], x_mat[i], TOLERANCE);
+  }
+}
+
+TEST_P(ForwardBackwardPassTestFixture, MatrixIrDrop) {
+
+  io.ir_drop = 1.0;
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+  std::vector<num_t> x_vec(x_size * m_batch);
+  std::vector<num_t> x_mat(x_size * m_batch);
+
+  forwardVectorLooped(fb, d_vec.data());
+  backwardVectorLooped(fb, x_vec.data());
+  fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+  fb.backwardMatrix(weights, d_input.data(), m_batch, trans, x_mat.data(), trans, 1.0);
+
+  for (int i = 0; i < d_size * m_batch; i++) {
+    ASSERT_NEAR(d_vec[i], d_mat[i], TOLERANCE);
+  }
+  for (int i = 0; i < x_size * m_batch; i++) {
+    ASSERT_NEAR(x_vec[i], x_mat[i], TOLERANCE);
+  }
+}
+
+TEST_P(ForwardBackwardPassTestFixture, ForwardMatrixPCMReadNoiseStatistics) {
+
+  io.w_noise = 0.1;
+  io.w_noise_type = OutputWeightNoiseType::PCMRead;
+  io.noise_management = NoiseManagementType::None;
+  io.inp_bound = 100.0;
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+  IOMetaParameter<num_t> io_perfect;
+  io_perfect.is_perfect = true;
+  ForwardBackwardPassIOManaged<num_t> fb_perfect(x_size, d_size, rng);
+  fb_perfect.setIOPar(io_perfect, io_perfect);
+
+  std::vector<num_t> d_ref(d_size * m_batch);
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+  fb_perfect.forwardMatrix(
+      weights, x_input.data(), m_batch, trans, d_ref.data(), trans, 1.0, false);
+
+  int n_repeats = 200;
+  double var_vec = 0.0;
+  double var_mat = 0.0;
+  for (int k = 0; k < n_repeats; k++) {
+    forwardVectorLooped(fb, d_vec.data());
+    fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+    for (int i = 0; i < d_size * m_batch; i++) {
+      var_vec += (d_vec[i] - d_ref[i]) * (d_vec[i] - d_ref[i]);
+      var_mat += (d_mat[i] - d_ref[i]) * (d_mat[i] - d_ref[i]);
+    }
+  }
+  var_vec /= n_repeats * d_size * m_batch;
+  var_mat /= n_repeats * d_size * m_batch;
+
+  ASSERT_GT(var_vec, 0.0);
+  ASSERT_NEAR(sqrt(var_mat), sqrt(var_vec), 0.1 * sqrt(var_vec));
+}
+
+TEST_P(ForwardBackwardPassTestFixture, ForwardMatrixOutputNoiseStatistics) {
+
+  io.out_noise = 0.1;
+  io.noise_management = NoiseManagementType::None;
+  io.inp_bound = 100.0;
+
+  ForwardBackwardPassIOManaged<num_t> fb(x_size, d_size, rng);
+  fb.setIOPar(io, io);
+  IOMetaParameter<num_t> io_perfect;
+  io_perfect.is_perfect = true;
+  ForwardBackwardPassIOManaged<num_t> fb_perfect(x_size, d_size, rng);
+  fb_perfect.setIOPar(io_perfect, io_perfect);
+
+  std::vector<num_t> d_ref(d_size * m_batch);
+  std::vector<num_t> d_vec(d_size * m_batch);
+  std::vector<num_t> d_mat(d_size * m_batch);
+  fb_perfect.forwardMatrix(
+      weights, x_input.data(), m_batch, trans, d_ref.data(), trans, 1.0, false);
+
+  int n_repeats = 200;
+  double var_vec = 0.0;
+  double var_mat = 0.0;
+  for (int k = 0; k < n_repeats; k++) {
+    forwardVectorLooped(fb, d_vec.data());
+    fb.forwardMatrix(weights, x_input.data(), m_batch, trans, d_mat.data(), trans, 1.0, false);
+    for (int i = 0; i < d_size * m_batch; i++) {
+      var_vec += (d_vec[i] - d_ref[i]) * (d_vec[i] - d_ref[i]);
+      var_mat += (d_mat[i] - d_ref[i]) * (d_mat[i] - d_ref[i]);
+    }
+  }
+  var_vec /= n_repeats * d_size * m_batch;
+  var_mat /= n_repeats * d_size * m_batch;
+
+  ASSERT_NEAR(sqrt(var_vec), io.out_noise, 0.1 * io.out_noise);
+  ASSERT_NEAR(sqrt(var_mat), sqrt(var_vec), 0.1 * io.out_noise);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
@@ -126,6 +126,10 @@ public:
   void decayWeights(T **weights, T alpha, bool bias_no_decay) override;
   void diffuseWeights(T **weights, RNG<T> &rng) override;
   void clipWeights(T **weights, T clip) override;
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override {
+    AbstractRPUDevice<T>::postUpdateWeights(weights, diffuse, decay, clip, clip_value, rng);
+  };
   void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) override;
   void
   resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) override;
@@ -101,6 +101,7 @@ OneSidedRPUDevice<T>::OneSidedRPUDevice(const OneSidedRPUDevice<T> &other)
   g_minus_ = other.g_minus_;
   a_indices_ = other.a_indices_;
   b_indices_ = other.b_indices_;
+  indices_stride_ = other.indices_stride_;
 
   refresh_fb_pass_ = make_unique<ForwardBackwardPassIOManaged<T>>(*other.refresh_fb_pass_);
   refresh_pwu_ = make_unique<PulsedRPUWeightUpdater<T>>(*other.refresh_pwu_);
@@ -130,6 +131,7 @@ OneSidedRPUDevice<T> &OneSidedRPUDevice<T>::operator=(OneSidedRPUDevice<T> &&oth
   g_minus_ = other.g_minus_;
   a_indices_ = std::move(other.a_indices_);
   b_indices_ = std::move(other.b_indices_);
+  indices_stride_ = other.indices_stride_;
 
   refresh_fb_pass_ = std::move(other.refresh_fb_pass_);
   refresh_pwu_ = std::move(other.refresh_pwu_);
@@ -210,9 +212,13 @@ void OneSidedRPUDevice<T>::initUpdateCycle(
 
   VectorRPUDevice<T>::initUpdateCycle(weights, up, current_lr, m_batch_info);
 
-  if (a_indices_.size() < (size_t)up.desired_BL) {
-    a_indices_.resize(up.desired_BL);
-    b_indices_.resize(up.desired_BL);
+  // one buffer per thread (rows might be updated in parallel). Indices
+  // might repeat, thus at least desired_BL
+  indices_stride_ = MAX(this->x_size_, up.desired_BL);
+  size_t buffer_size = (size_t)indices_stride_ * getNumThreads();
+  if (a_indices_.size() < buffer_size) {
+    a_indices_.resize(buffer_size);
+    b_indices_.resize(buffer_size);
   }
 }
 
@@ -246,29 +252,31 @@ void OneSidedRPUDevice<T>::doSparseUpdate(
 
   int a_count = 0;
   int b_count = 0;
+  int *a_indices = a_indices_.data() + getThreadNum() * indices_stride_;
+  int *b_indices = b_indices_.data() + getThreadNum() * indices_stride_;
 
   for (int jj = 0; jj < x_count; jj++) {
     int j_signed = x_signed_indices[jj];
     int sign = (j_signed < 0) ? -d_sign : d_sign;
 
     if (sign > 0) { // a per default g-
-      a_indices_[a_count++] =
+      a_indices[a_count++] =
           (j_signed > 0)
               ? j_signed
               : -j_signed; // always one sided update (to positive side, see also -1 below)
 
     } else { // b per default g+
-      b_indices_[b_count++] = (j_signed > 0) ? j_signed : -j_signed;
+      b_indices[b_count++] = (j_signed > 0) ? j_signed : -j_signed;
     }
   }
 
   if (a_count > 0) {
     this->rpu_device_vec_[g_minus_]->doSparseUpdate(
-        this->weights_vec_[g_minus_], d_index, a_indices_.data(), a_count, -1, rng);
+        this->weights_vec_[g_minus_], d_index, a_indices, a_count, -1, rng);
   }
   if (b_count > 0) {
     this->rpu_device_vec_[g_plus_]->doSparseUpdate(
-        this->weights_vec_[g_plus_], d_index, b_indices_.data(), b_count, -1, rng);
+        this->weights_vec_[g_plus_], d_index, b_indices, b_count, -1, rng);
   }
   // update the changed weight indices // note that this is very
   // repetitive since the same indices might be present all the
@@ -295,10 +303,16 @@ void OneSidedRPUDevice<T>::doDenseUpdate(T **weights, int *coincidences, RNG<T>
     coincidences_m_[i] = c > 0 ? -c : 0;
   }
 
-  this->rpu_device_vec_[g_plus_]->doDenseUpdate(
-      this->weights_vec_[g_plus_], coincidences_p_.data(), rng);
-  this->rpu_device_vec_[g_minus_]->doDenseUpdate(
-      this->weights_vec_[g_minus_], coincidences_m_.data(), rng);
+  // both devices in parallel, each with the substream of its index
+  int n_threads = MIN(getNumThreads(), 2);
+  rng->prepareThreadRNGs(2);
+
+#pragma omp parallel for num_threads(n_threads) if (this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < 2; k++) {
+    int idx = k == 0 ? g_plus_ : g_minus_;
+    int *c = k == 0 ? coincidences_p_.data() : coincidences_m_.data();
+    this->rpu_device_vec_[idx]->doDenseUpdate(this->weights_vec_[idx], c, rng->getThreadRNG(idx));
+  }
 
   // TODO: this might be better called in finish update cycle and only once per mini-batch?
   this->reduceToWeights(weights);
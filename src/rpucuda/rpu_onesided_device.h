@@ -89,6 +89,7 @@ public:
     swap(a.g_minus_, b.g_minus_);
     swap(a.a_indices_, b.a_indices_);
     swap(a.b_indices_, b.b_indices_);
+    swap(a.indices_stride_, b.indices_stride_);
     swap(a.refresh_counter_, b.refresh_counter_);
     swap(a.refresh_fb_pass_, b.refresh_fb_pass_);
     swap(a.refresh_pwu_, b.refresh_pwu_);
@@ -148,6 +149,7 @@ private:
 
   std::vector<int> a_indices_;
   std::vector<int> b_indices_;
+  int indices_stride_ = 0;
 
   // temporary: no need to copy
   std::vector<T> refresh_p_tmp_;
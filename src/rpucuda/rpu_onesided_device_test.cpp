@@ -237,6 +237,43 @@ TEST_P(RPUDeviceTestFixture, doSparseUpdateInvert) {
   delete rpu_device;
 }
 
+TEST_P(RPUDeviceTestFixture, doDenseUpdateParallel) {
+  // large enough for the parallel loop
+  int x_sz = 130, d_sz = 130;
+  int size = x_sz * d_sz;
+  this->dp_cs.dw_min_std = 0.3;
+  OneSidedRPUDeviceMetaParameter<num_t> dp_noise(this->dp_cs);
+
+  std::vector<int> coincidences(size);
+  for (int i = 0; i < size; i++) {
+    coincidences[i] = (int)(3 * this->rw_rng.sampleGauss());
+  }
+
+  std::vector<std::vector<num_t>> results;
+  for (int n_threads : {1, 4}) {
+    setNumThreads(n_threads);
+    RealWorldRNG<num_t> rw_rng_dev(12);
+    RNG<num_t> rng_upd(1);
+    std::unique_ptr<OneSidedRPUDevice<num_t>> device(
+        dp_noise.createDevice(x_sz, d_sz, &rw_rng_dev));
+    num_t **w = Array_2D_Get<num_t>(d_sz, x_sz);
+    std::fill(w[0], w[0] + size, (num_t)0.0);
+    device->onSetWeights(w);
+
+    device->initUpdateCycle(w, this->up, 1.0, 1);
+    device->doDenseUpdate(w, coincidences.data(), &rng_upd);
+
+    results.push_back(std::vector<num_t>(w[0], w[0] + size));
+    Array_2D_Free<num_t>(w);
+  }
+  setNumThreads(0);
+
+  // each device uses its own substream independent of the threads
+  for (int i = 0; i < size; i++) {
+    ASSERT_EQ(results[0][i], results[1][i]);
+  }
+}
+
 TEST_P(RPUDeviceTestFixture, Decay) {
 
   for (int i = 0; i < this->x_size * this->d_size; i++) {
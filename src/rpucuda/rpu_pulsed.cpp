@@ -249,6 +249,25 @@ template <typename T> void RPUPulsed<T>::clipWeights(const WeightClipParameter &
   }
 }
 
+template <typename T>
+void RPUPulsed<T>::postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar) {
+
+  CHECK_RPU_DEVICE_INIT;
+
+  bool fixed_clip = wclpar.type == WeightClipType::FixedValue;
+  bool other_clip = !fixed_clip && wclpar.type != WeightClipType::None;
+  if (other_clip && rpu_device_->implements() != DeviceUpdateType::FloatingPoint) {
+    RPU_FATAL("Sophisticated clipping is NOT implemented for most training devices");
+  }
+
+  rpu_device_->postUpdateWeights(
+      this->getWeightsPtr(), diffuse, decay, fixed_clip, (T)wclpar.fixed_value, *this->rng_);
+
+  if (other_clip) {
+    RPUSimple<T>::clipWeights(wclpar);
+  }
+}
+
 template <typename T> void RPUPulsed<T>::setWeightsUniformRandom(T min_value, T max_value) {
   CHECK_RPU_DEVICE_INIT;
   RPUSimple<T>::setWeightsUniformRandom(min_value, max_value);
@@ -425,12 +444,14 @@ void RPUPulsed<T>::populateParameter(
 template <typename T>
 void RPUPulsed<T>::forwardVector(
     const T *x_input, T *d_output, int x_inc, int d_inc, bool is_test) {
+  fb_pass_->setLazyWeightModifier(this->getLazyFBWeightModifier(is_test));
   fb_pass_->forwardVector(
       this->getFBWeights(is_test), x_input, x_inc, d_output, d_inc, this->getFwdAlpha(), is_test);
 };
 
 template <typename T>
 void RPUPulsed<T>::backwardVector(const T *d_input, T *x_output, int d_inc, int x_inc) {
+  fb_pass_->setLazyWeightModifier(this->getLazyFBWeightModifier(false));
   fb_pass_->backwardVector(
       this->getFBWeights(false), d_input, d_inc, x_output, x_inc, this->getBwdAlpha());
 };
@@ -477,6 +498,26 @@ void RPUPulsed<T>::updateVectorWithCounts(
       this->last_update_m_batch_, rpu_device, x_counts32, d_counts32);
 }
 
+/*********************************************************************************/
+/* Matrix forward/backward (batched GEMM with IO management) */
+
+template <typename T>
+void RPUPulsed<T>::forwardMatrix(
+    const T *X_input, T *D_output, int m_batch, bool x_trans, bool d_trans, bool is_test) {
+  fb_pass_->setLazyWeightModifier(this->getLazyFBWeightModifier(is_test));
+  fb_pass_->forwardMatrix(
+      this->getFBWeights(is_test), X_input, m_batch, x_trans, D_output, d_trans,
+      this->getFwdAlpha(), is_test);
+};
+
+template <typename T>
+void RPUPulsed<T>::backwardMatrix(
+    const T *D_input, T *X_output, int m_batch, bool d_trans, bool x_trans) {
+  fb_pass_->setLazyWeightModifier(this->getLazyFBWeightModifier(false));
+  fb_pass_->backwardMatrix(
+      this->getFBWeights(false), D_input, m_batch, d_trans, X_output, x_trans, this->getBwdAlpha());
+};
+
 /*********************************************************************************/
 /* specialized matrix update to be able to run matrix simple */
 
@@ -58,6 +58,7 @@ public:
   void diffuseWeights() override;
   void clipWeights(T clip) override;
   void clipWeights(const WeightClipParameter &wclpar) override;
+  void postUpdateStep(bool diffuse, bool decay, const WeightClipParameter &wclpar) override;
   void resetCols(int start_col, int n_cols, T reset_prob) override;
 
   void updateVectorWithCounts(
@@ -76,6 +77,7 @@ public:
   void applyWeightUpdate(T *dw_and_current_weights_out) override;
 
   virtual const PulsedMetaParameter<T> &getMetaPar() const { return par_; };
+  int getBMIterations() const { return fb_pass_->getBMIterations(); };
 
   void getDeviceParameterNames(std::vector<std::string> &names) const override;
   void getDeviceParameter(std::vector<T *> &data_ptrs) const override;
@@ -97,8 +99,15 @@ protected:
   void backwardVector(const T *d_input, T *x_output, int d_inc = 1, int x_inc = 1) override;
   void updateVector(const T *x_input, const T *d_input, int x_inc = 1, int d_inc = 1) override;
 
-  USE_LOOPED_MATRIX_FORWARD(T);
-  USE_LOOPED_MATRIX_BACKWARD(T);
+  void forwardMatrix(
+      const T *X_input, T *D_output, int m_batch, bool x_trans, bool d_trans, bool is_test)
+      override;
+  void backwardMatrix(
+      const T *D_input,
+      T *X_output,
+      int m_batch,
+      bool d_trans = false,
+      bool x_trans = false) override;
   void updateMatrix(
       const T *X_input,
       const T *D_input,
@@ -106,6 +115,8 @@ protected:
       bool x_trans = false,
       bool d_trans = false) override;
 
+  bool supportsLazyFBWeights() const override { return fb_pass_->supportsLazyWeights(); };
+
   std::unique_ptr<AbstractRPUDevice<T>> rpu_device_ = nullptr;
 
 private:
@@ -443,6 +443,48 @@ template <typename T> void PulsedRPUDevice<T>::clipWeights(T **weights, T clip)
   applyUpdateWriteNoise(weights);
 }
 
+template <typename T>
+void PulsedRPUDevice<T>::postUpdateWeights(
+    T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) {
+
+  if (!diffuse && !decay && !clip) {
+    return;
+  }
+
+  // one sweep with the same order (and random numbers) as the separate calls
+  T *w = getPar().usesPersistentWeight() ? w_persistent_[0] : weights[0];
+  T *diffusion_rate = w_diffusion_rate_[0];
+  T *wd = w_decay_scale_[0];
+  T *b = w_reset_bias_[0];
+  T *max_bound = w_max_bound_[0];
+  T *min_bound = w_min_bound_[0];
+  bool add_clip = clip && clip_value >= 0.0;
+
+  PRAGMA_SIMD
+  for (int i = 0; i < this->size_; ++i) {
+    T w_i = w[i];
+    if (diffuse) {
+      w_i += diffusion_rate[i] * rng.sampleGauss();
+      w_i = MIN(w_i, max_bound[i]);
+      w_i = MAX(w_i, min_bound[i]);
+    }
+    if (decay) {
+      w_i = (w_i - b[i]) * wd[i] + b[i];
+      w_i = MIN(w_i, max_bound[i]);
+      w_i = MAX(w_i, min_bound[i]);
+    }
+    if (add_clip) {
+      w_i = MIN(w_i, MIN(max_bound[i], clip_value));
+      w_i = MAX(w_i, MAX(min_bound[i], -clip_value));
+    } else if (clip) {
+      w_i = MIN(w_i, max_bound[i]);
+      w_i = MAX(w_i, min_bound[i]);
+    }
+    w[i] = w_i;
+  }
+  applyUpdateWriteNoise(weights);
+}
+
 template <typename T>
 void PulsedRPUDevice<T>::resetCols(
     T **weights, int start_col, int n_col, T reset_prob, RealWorldRNG<T> &rng) {
@@ -135,6 +135,12 @@ public:
     RPU_FATAL("copyInvertDeviceParameter not available for this device!");
   }
 
+  // separate calls (the fused floating point sweep does not apply)
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override {
+    AbstractRPUDevice<T>::postUpdateWeights(weights, diffuse, decay, clip, clip_value, rng);
+  };
+
   bool isPulsedDevice() const override { return true; };
   PulsedRPUDeviceBase<T> *clone() const override { RPU_FATAL("Needs implementation"); };
 
@@ -236,6 +242,8 @@ public:
   void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) override;
   void diffuseWeights(T **weights, RNG<T> &rng) override;
   void clipWeights(T **weights, T add_clip) override;
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override;
   bool onSetWeights(T **weights) override;
   void
   resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) override;
@@ -133,6 +133,38 @@ template <typename T> void SimpleRPUDevice<T>::clipWeights(T **weights, T clip)
   }
 }
 
+template <typename T>
+void SimpleRPUDevice<T>::postUpdateWeights(
+    T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) {
+
+  T diffusion = diffuse ? getPar().diffusion : (T)0.0;
+  T lifetime = getPar().lifetime;
+  T decay_scale = (decay && lifetime > 1) ? (T)1.0 - (T)1.0 / lifetime : (T)1.0;
+  if (decay_scale <= 0) {
+    decay_scale = 1.0;
+  }
+  clip = clip && clip_value >= 0;
+
+  if (diffusion <= 0.0 && decay_scale == 1.0 && !clip) {
+    return;
+  }
+
+  // one sweep with the same order (and random numbers) as the separate calls
+  T *w = weights[0];
+  PRAGMA_SIMD
+  for (int i = 0; i < this->size_; ++i) {
+    T w_i = w[i];
+    if (diffusion > 0.0) {
+      w_i += diffusion * rng.sampleGauss();
+    }
+    w_i *= decay_scale;
+    if (clip) {
+      w_i = MIN(MAX(w_i, -clip_value), clip_value);
+    }
+    w[i] = w_i;
+  }
+}
+
 template <typename T>
 void SimpleRPUDevice<T>::populate(const SimpleRPUDeviceMetaParameter<T> &p, RealWorldRNG<T> *rng) {
 
@@ -160,6 +160,20 @@ public:
   virtual void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) = 0;
   virtual void diffuseWeights(T **weights, RNG<T> &rng) = 0;
   virtual void clipWeights(T **weights, T clip) = 0;
+  /* Post-update step: diffusion, decay and clipping (in this
+     order). Devices might fuse these into one sweep over the weights */
+  virtual void
+  postUpdateWeights(T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) {
+    if (diffuse) {
+      diffuseWeights(weights, rng);
+    }
+    if (decay) {
+      decayWeights(weights, false);
+    }
+    if (clip) {
+      clipWeights(weights, clip_value);
+    }
+  };
   virtual void
   resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) = 0;
   virtual bool onSetWeights(T **weights) = 0;
@@ -230,6 +244,8 @@ public:
   void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) override;
   void diffuseWeights(T **weights, RNG<T> &rng) override;
   void clipWeights(T **weights, T clip) override;
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override;
   bool onSetWeights(T **weights) override { return false; };
   void
   resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) override {
@@ -0,0 +1,209 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "rng.h"
+#include "rpu.h"
+#include "utility_functions.h"
+#include "gtest/gtest.h"
+#include <algorithm>
+#include <memory>
+#include <vector>
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+class IndexedRPU : public RPUSimple<num_t> {
+public:
+  IndexedRPU(int x_size, int d_size) : RPUSimple<num_t>(x_size, d_size) {};
+  using RPUSimple<num_t>::copyIndexedInput;
+  using RPUSimple<num_t>::copyIndexedOutput;
+  using RPUSimple<num_t>::getIndexGatherPlan;
+};
+
+class RPUIndexedTestFixture : public ::testing::TestWithParam<bool> {
+public:
+  void SetUp() {
+    trans = GetParam();
+
+    // 3x3 convolution with padding 1 of 2 x 6 x 5 images (and bias)
+    channels = 2;
+    height = 6;
+    width = 5;
+    kernel = 3;
+    dim3 = 32; // large enough for the parallel loops
+
+    x_size = channels * kernel * kernel + 1;
+    m_batch = height * width;
+    image_size = channels * height * width;
+
+    // indices are shifted by 2: 0 is padding and 1 is the bias
+    indices.resize(x_size * m_batch);
+    for (int i_m = 0; i_m < m_batch; i_m++) {
+      int h_out = i_m / width;
+      int w_out = i_m % width;
+      for (int i_x = 0; i_x < x_size; i_x++) {
+        int j_shifted = 1;
+        if (i_x < x_size - 1) {
+          int c = i_x / (kernel * kernel);
+          int h = h_out + (i_x / kernel) % kernel - 1;
+          int w = w_out + i_x % kernel - 1;
+          bool in_image = h >= 0 && h < height && w >= 0 && w < width;
+          j_shifted = in_image ? c * height * width + h * width + w + 2 : 0;
+        }
+        indices[trans ? (i_m + i_x * m_batch) : (i_x + i_m * x_size)] = j_shifted;
+      }
+    }
+
+    input.resize(image_size * dim3);
+    for (size_t i = 0; i < input.size(); i++) {
+      input[i] = rng.sampleGauss();
+    }
+    rpu = RPU::make_unique<IndexedRPU>(x_size, 7);
+  }
+
+  // per-element reference (without batch slices)
+  void referenceInput(num_t *out_tensor) {
+    int sz_all = x_size * m_batch * dim3;
+    int M = m_batch * x_size;
+    int L = m_batch * dim3;
+    for (int idx = 0; idx < sz_all; idx++) {
+      int i = trans ? (idx % L) / m_batch * M + (idx % m_batch) + idx / L * m_batch : idx;
+      int j_shifted = indices[i % M];
+      out_tensor[idx] =
+          (j_shifted <= 1) ? (num_t)j_shifted : input[(j_shifted - 2) + i / M * image_size];
+    }
+  }
+
+  void referenceOutput(num_t *out_tensor, const num_t *src_tensor) {
+    int sz_all = x_size * m_batch * dim3;
+    int M = m_batch * x_size;
+    int L = m_batch * dim3;
+    for (int idx = 0; idx < sz_all; idx++) {
+      int i = trans ? (idx % L) / m_batch * M + (idx % m_batch) + idx / L * m_batch : idx;
+      int j_shifted = indices[i % M];
+      if (j_shifted > 1) {
+        out_tensor[(j_shifted - 2) + i / M * image_size] += src_tensor[idx];
+      }
+    }
+  }
+
+  bool trans;
+  int channels, height, width, kernel, dim3;
+  int x_size, m_batch, image_size;
+  std::vector<int> indices;
+  std::vector<num_t> input;
+  std::unique_ptr<IndexedRPU> rpu;
+  RealWorldRNG<num_t> rng{12};
+};
+
+INSTANTIATE_TEST_CASE_P(Trans, RPUIndexedTestFixture, ::testing::Bool());
+
+TEST_P(RPUIndexedTestFixture, CopyIndexedInput) {
+  int sz_all = x_size * m_batch * dim3;
+  std::vector<num_t> out(sz_all), out_ref(sz_all);
+
+  referenceInput(out_ref.data());
+  rpu->setMatrixIndices(indices.data());
+
+  // twice to use the cached plan
+  for (int loop = 0; loop < 2; loop++) {
+    std::fill(out.begin(), out.end(), (num_t)-1.0);
+    rpu->copyIndexedInput(
+        out.data(), input.data(), image_size * dim3, indices.data(), x_size, m_batch, dim3, trans);
+    for (int i = 0; i < sz_all; i++) {
+      ASSERT_EQ(out[i], out_ref[i]);
+    }
+  }
+}
+
+TEST_P(RPUIndexedTestFixture, CopyIndexedOutput) {
+  int sz_all = x_size * m_batch * dim3;
+  std::vector<num_t> src(sz_all);
+  for (int i = 0; i < sz_all; i++) {
+    src[i] = rng.sampleGauss();
+  }
+  std::vector<num_t> out(image_size * dim3, (num_t)0.0), out_ref(image_size * dim3, (num_t)0.0);
+
+  referenceOutput(out_ref.data(), src.data());
+  rpu->setMatrixIndices(indices.data());
+  rpu->copyIndexedOutput(
+      out.data(), src.data(), image_size * dim3, indices.data(), x_size, m_batch, dim3, trans);
+
+  for (int i = 0; i < image_size * dim3; i++) {
+    ASSERT_FLOAT_EQ(out[i], out_ref[i]);
+  }
+}
+
+TEST_P(RPUIndexedTestFixture, CachedGatherPlans) {
+  int sz_all = x_size * m_batch * dim3;
+  std::vector<num_t> out(sz_all), out_ref(sz_all);
+  std::vector<int> other_indices(indices.size(), 1);
+
+  auto checkIndexedInput = [&]() {
+    referenceInput(out_ref.data());
+    std::fill(out.begin(), out.end(), (num_t)-1.0);
+    rpu->copyIndexedInput(
+        out.data(), input.data(), image_size * dim3, indices.data(), x_size, m_batch, dim3, trans);
+    for (int i = 0; i < sz_all; i++) {
+      ASSERT_EQ(out[i], out_ref[i]);
+    }
+  };
+
+  rpu->setMatrixIndices(indices.data());
+  checkIndexedInput();
+  const IndexGatherPlan::Run *runs =
+      rpu->getIndexGatherPlan(indices.data(), x_size, m_batch, trans).runs.data();
+
+  // other indices in between
+  rpu->setMatrixIndices(other_indices.data());
+  rpu->copyIndexedInput(
+      out.data(), input.data(), image_size * dim3, other_indices.data(), x_size, m_batch, dim3,
+      trans);
+
+  // plan of the unchanged indices is re-used
+  rpu->setMatrixIndices(indices.data(), true);
+  checkIndexedInput();
+  ASSERT_EQ(rpu->getIndexGatherPlan(indices.data(), x_size, m_batch, trans).runs.data(), runs);
+
+  // changed content needs a new plan
+  std::reverse(indices.begin(), indices.end());
+  rpu->setMatrixIndices(indices.data());
+  checkIndexedInput();
+}
+
+TEST_P(RPUIndexedTestFixture, GatherPlanRuns) {
+  IndexGatherPlan plan;
+  plan.build(indices.data(), x_size, m_batch, trans);
+
+  // runs cover all indices and are more compact
+  int n = 0;
+  for (const auto &run : plan.runs) {
+    ASSERT_EQ(run.start, n);
+    n += run.length;
+  }
+  ASSERT_EQ(n, x_size * m_batch);
+  ASSERT_LT((int)plan.runs.size(), x_size * m_batch / 2);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
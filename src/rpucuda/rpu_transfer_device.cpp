@@ -415,6 +415,35 @@ void TransferRPUDevice<T>::writeVector(
   }
 }
 
+template <typename T>
+void TransferRPUDevice<T>::readMatrix(
+    int device_idx, const T *in_vec, T *out_vec, int m_batch, T alpha) {
+  T **W = getDeviceWeights(device_idx);
+  if (getPar().transfer_columns) {
+    transfer_fb_pass_->forwardMatrix(W, in_vec, m_batch, false, out_vec, false, alpha, false);
+  } else {
+    transfer_fb_pass_->backwardMatrix(W, in_vec, m_batch, false, out_vec, false, alpha);
+  }
+}
+
+template <typename T>
+void TransferRPUDevice<T>::writeMatrix(
+    int device_idx,
+    const T *in_vec,
+    const T *out_vec,
+    const int m_batch,
+    const T lr,
+    const int m_batch_info) {
+  const auto &par = getPar();
+  int in_size = par.getInSize();
+  int out_size = par.getOutSize();
+
+  // the pulsed update is done vector by vector (as for the tile update)
+  for (int i = 0; i < m_batch; i++) {
+    writeVector(device_idx, in_vec + i * in_size, out_vec + i * out_size, lr, m_batch_info);
+  }
+}
+
 template <typename T>
 void TransferRPUDevice<T>::readAndUpdate(
     int to_device_idx,
@@ -425,7 +454,7 @@ void TransferRPUDevice<T>::readAndUpdate(
     const T reset_prob,
     const int i_slice) {
 
-  if (lr == 0.0) {
+  if (lr == 0.0 || n_vec <= 0) {
     return;
   }
 
@@ -435,27 +464,24 @@ void TransferRPUDevice<T>::readAndUpdate(
   }
   const auto &par = getPar();
 
-  int in_size = par.getInSize();
   int out_size = par.getOutSize();
 
-  transfer_tmp_.resize(out_size);
+  transfer_tmp_.resize(n_vec * out_size);
 
-  // forward or backward / update
-  for (int i = 0; i < n_vec; i++) {
-    const T *v = vec + i * in_size;
-
-    readVector(from_device_idx, v, transfer_tmp_.data(), -1.0); // scale -1 for pos update
+  // read all vectors at once (forward or backward)
+  readMatrix(from_device_idx, vec, transfer_tmp_.data(), n_vec, -1.0); // scale -1 for pos update
 
+  // potentially reset here (after reading, because of possible same device to-from):
+  // NOTE that with_reset_prob is COL-wise prob (elem device prob is 1)
+  for (int i = 0; i < n_vec; i++) {
     if (this->rw_rng_.sampleUniform() < reset_prob && par.transfer_columns) {
-      // potentially reset here (because of possible same device to-from):
-      // NOTE that with_reset_prob is COL-wise prob (elem device prob is 1)
       T **W_from = getDeviceWeights(from_device_idx);
       this->rpu_device_vec_[from_device_idx]->resetCols(W_from, i_slice, n_vec, 1, this->rw_rng_);
     }
-
-    // update according to device
-    writeVector(to_device_idx, v, transfer_tmp_.data(), lr, n_vec);
   }
+
+  // update according to device
+  writeMatrix(to_device_idx, vec, transfer_tmp_.data(), n_vec, lr, n_vec);
 }
 
 template <typename T>
@@ -515,10 +541,21 @@ void TransferRPUDevice<T>::doDenseUpdate(T **weights, int *coincidences, RNG<T>
   // we do reduce to weights in the finishUpdateCycle, because transfer is done there, too.
 }
 
+template <typename T>
+void TransferRPUDevice<T>::initUpdateCycle(
+    T **weights, const PulsedUpdateMetaParameter<T> &up, T current_lr, int m_batch_info) {
+
+  VectorRPUDevice<T>::initUpdateCycle(weights, up, current_lr, m_batch_info);
+  update_start_ = std::chrono::high_resolution_clock::now();
+}
+
 template <typename T>
 void TransferRPUDevice<T>::finishUpdateCycle(
     T **weights, const PulsedUpdateMetaParameter<T> &up, T current_lr, int m_batch_info) {
 
+  auto transfer_start = std::chrono::high_resolution_clock::now();
+  update_time_ += std::chrono::duration<double>(transfer_start - update_start_).count();
+
   VectorRPUDevice<T>::finishUpdateCycle(
       weights, up, current_lr, m_batch_info); // first increment to avoid zero first transfer
 
@@ -531,9 +568,22 @@ void TransferRPUDevice<T>::finishUpdateCycle(
     if (every > 0 && this->current_update_idx_ % every == 0) {
       // last is self-update (does nothing per default, but could implement refresh in child)
       transfer(MIN(j + 1, this->n_devices_ - 1), j, current_lr);
+      n_transfers_++;
     }
   }
   this->reduceToWeights(weights);
+
+  transfer_time_ +=
+      std::chrono::duration<double>(std::chrono::high_resolution_clock::now() - transfer_start)
+          .count();
+}
+
+template <typename T>
+void TransferRPUDevice<T>::getTimings(
+    double &update_time, double &transfer_time, int &n_transfers) const {
+  update_time = update_time_;
+  transfer_time = transfer_time_;
+  n_transfers = n_transfers_;
 }
 
 template <typename T> bool TransferRPUDevice<T>::onSetWeights(T **weights) {
@@ -617,6 +667,13 @@ template <typename T> void TransferRPUDevice<T>::clipWeights(T **weights, T clip
   LOOP_WITH_HIDDEN(clipWeights, COMMA clip);
 }
 
+template <typename T>
+void TransferRPUDevice<T>::postUpdateWeights(
+    T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) {
+  LOOP_WITH_HIDDEN(
+      postUpdateWeights, COMMA diffuse COMMA decay COMMA clip COMMA clip_value COMMA rng);
+}
+
 template <typename T>
 void TransferRPUDevice<T>::driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) {
   LOOP_WITH_HIDDEN(driftWeights, COMMA time_since_last_call COMMA rng);
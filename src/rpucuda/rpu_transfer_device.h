@@ -17,6 +17,7 @@
 #include "rpu_simple_device.h"
 #include "rpu_vector_device.h"
 #include "rpu_weight_updater.h"
+#include <chrono>
 #include <sstream>
 #include <stdio.h>
 
@@ -168,12 +169,16 @@ public:
   void driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) override;
   void diffuseWeights(T **weights, RNG<T> &rng) override;
   void clipWeights(T **weights, T clip) override;
+  void postUpdateWeights(
+      T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) override;
   void
   resetCols(T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) override;
 
   void setDeviceParameter(T **out_weights, const std::vector<T *> &data_ptrs) override;
   void setHiddenUpdateIdx(int idx) override{};
 
+  void initUpdateCycle(
+      T **weights, const PulsedUpdateMetaParameter<T> &up, T current_lr, int m_batch_info) override;
   void finishUpdateCycle(
       T **weights, const PulsedUpdateMetaParameter<T> &up, T current_lr, int m_batch_info) override;
   T getPulseCountLearningRate(T learning_rate) override;
@@ -193,6 +198,19 @@ public:
   virtual void writeVector(
       int device_idx, const T *in_vec, const T *out_vec, const T lr, const int m_batch_info);
   virtual void readVector(int device_idx, const T *in_vec, T *out_vec, T alpha);
+  virtual void writeMatrix(
+      int device_idx,
+      const T *in_vec,
+      const T *out_vec,
+      const int m_batch,
+      const T lr,
+      const int m_batch_info);
+  virtual void readMatrix(int device_idx, const T *in_vec, T *out_vec, int m_batch, T alpha);
+
+  /* Accumulated wall-clock times (in sec) of the gradient updates
+     onto the first device and of the transfers between the devices
+     (including reading) together with the number of transfers. */
+  void getTimings(double &update_time, double &transfer_time, int &n_transfers) const;
 
   void doSparseUpdate(
       T **weights, int i, const int *x_signed_indices, int x_count, int d_sign, RNG<T> *rng)
@@ -216,6 +234,10 @@ protected:
 
   // no need to swap/copy.
   std::vector<T> transfer_tmp_;
+  std::chrono::high_resolution_clock::time_point update_start_;
+  double update_time_ = 0.0;
+  double transfer_time_ = 0.0;
+  int n_transfers_ = 0;
 };
 
 } // namespace RPU
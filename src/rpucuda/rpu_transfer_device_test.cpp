@@ -298,6 +298,45 @@ TEST_P(RPUDeviceTestFixture, doSparseUpdateWithTransferRows) {
   delete rpu_device;
 }
 
+TEST_P(RPUDeviceTestFixture, doSparseUpdateWithBatchedTransfer) {
+  // all columns are read and written in one transfer
+  this->dp->n_reads_per_transfer = this->x_size;
+  rpu_device = this->dp->createDevice(this->x_size, this->d_size, &this->rw_rng);
+  rpu_device->onSetWeights(this->weights); // all zero
+  rpu_device->initUpdateCycle(this->weights, this->up, 1, 1);
+
+  float dx = rpu_device->getWeightGranularity() * (n_pos - n_neg);
+  int rowidx = this->d_size - 1;
+  rpu_device->doSparseUpdate(
+      this->weights, rowidx, this->x_indices, this->n_neg + this->n_pos, (num_t)-1.0, this->rng);
+  rpu_device->finishUpdateCycle(this->weights, this->up, 1, 1); // transfers all columns
+
+  num_t ***w_vec = rpu_device->getWeightVec();
+  for (int j = 0; j < this->d_size; j++) {
+    for (int i = 0; i < this->x_size; i++) {
+      if (j == rowidx && i == this->colidx) {
+        ASSERT_FLOAT_EQ(w_vec[0][j][i], dx);
+        if (GetParam() != 0) {
+          ASSERT_FLOAT_EQ(w_vec[1][j][i], dx);
+        }
+        ASSERT_FLOAT_EQ(this->weights[j][i], (GetParam() + 1) * dx);
+      } else {
+        ASSERT_FLOAT_EQ(w_vec[0][j][i], 0);
+        ASSERT_FLOAT_EQ(this->weights[j][i], 0);
+      }
+    }
+  }
+
+  double update_time, transfer_time;
+  int n_transfers;
+  rpu_device->getTimings(update_time, transfer_time, n_transfers);
+  ASSERT_EQ(n_transfers, 1);
+  ASSERT_GE(update_time, 0.0);
+  ASSERT_GT(transfer_time, 0.0);
+
+  delete rpu_device;
+}
+
 TEST_P(RPUDeviceTestFixture, Decay) {
 
   for (int i = 0; i < this->x_size * this->d_size; i++) {
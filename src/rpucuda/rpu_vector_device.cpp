@@ -435,21 +435,26 @@ void VectorRPUDevice<T>::doSparseUpdate(
     rpu_device_vec_[current_device_idx_]->doSparseUpdate(
         weights_vec_[current_device_idx_], i, x_signed_indices, x_count, d_sign, rng);
   } else {
-
+    // rows are already distributed across threads by the weight updater
     for (size_t k = 0; k < rpu_device_vec_.size(); k++) {
       rpu_device_vec_[k]->doSparseUpdate(
           weights_vec_[k], i, x_signed_indices, x_count, d_sign, rng);
     }
   }
 
-  size_t m = rpu_device_vec_.size();
+  // hidden weights are contiguous and device-major
+  const T *w_row = weights_vec_[0][i];
+  const T *gamma = reduce_weightening_.data();
+  int m = n_devices_;
+  int size = this->size_;
   for (int jj = 0; jj < x_count; jj++) {
     int j = x_signed_indices[jj];
     j = (j < 0) ? -j - 1 : j - 1;
 
     T w = (T)0.0;
-    for (size_t k = 0; k < m; k++) {
-      w += reduce_weightening_[k] * weights_vec_[k][i][j];
+    PRAGMA_SIMD
+    for (int k = 0; k < m; k++) {
+      w += gamma[k] * w_row[k * size + j];
     }
     weights[i][j] = w;
   }
@@ -461,9 +466,15 @@ void VectorRPUDevice<T>::doDenseUpdate(T **weights, int *coincidences, RNG<T> *r
     rpu_device_vec_[current_device_idx_]->doDenseUpdate(
         weights_vec_[current_device_idx_], coincidences, rng);
   } else {
-
-    for (size_t k = 0; k < rpu_device_vec_.size(); k++) {
-      rpu_device_vec_[k]->doDenseUpdate(weights_vec_[k], coincidences, rng);
+    // each device uses its own substream, so that the result does
+    // not depend on the number of threads
+    int n = n_devices_;
+    int n_threads = MIN(getNumThreads(), n);
+    rng->prepareThreadRNGs(n);
+
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+    for (int k = 0; k < n; k++) {
+      rpu_device_vec_[k]->doDenseUpdate(weights_vec_[k], coincidences, rng->getThreadRNG(k));
     }
   }
   this->reduceToWeights(weights);
@@ -502,8 +513,10 @@ template <typename T> void VectorRPUDevice<T>::decayWeights(T **weights, bool bi
 template <typename T>
 void VectorRPUDevice<T>::decayWeights(T **weights, T alpha, bool bias_no_decay) {
 
-#pragma omp parallel for
-  for (int k = 0; k < (int)rpu_device_vec_.size(); k++) {
+  int n = n_devices_;
+  int n_threads = MIN(getNumThreads(), n);
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n; k++) {
     rpu_device_vec_[k]->decayWeights(weights_vec_[k], alpha, bias_no_decay);
   }
   reduceToWeights(weights);
@@ -512,33 +525,58 @@ void VectorRPUDevice<T>::decayWeights(T **weights, T alpha, bool bias_no_decay)
 template <typename T>
 void VectorRPUDevice<T>::driftWeights(T **weights, T time_since_last_call, RNG<T> &rng) {
 
-#pragma omp parallel for
-  for (int k = 0; k < (int)rpu_device_vec_.size(); k++) {
-    rpu_device_vec_[k]->driftWeights(weights_vec_[k], time_since_last_call, rng);
+  int n = n_devices_;
+  int n_threads = MIN(getNumThreads(), n);
+  rng.prepareThreadRNGs(n);
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n; k++) {
+    rpu_device_vec_[k]->driftWeights(weights_vec_[k], time_since_last_call, *rng.getThreadRNG(k));
   }
   reduceToWeights(weights);
 }
 
 template <typename T> void VectorRPUDevice<T>::diffuseWeights(T **weights, RNG<T> &rng) {
-#pragma omp parallel for
-  for (int k = 0; k < (int)rpu_device_vec_.size(); k++) {
-    rpu_device_vec_[k]->diffuseWeights(weights_vec_[k], rng);
+  int n = n_devices_;
+  int n_threads = MIN(getNumThreads(), n);
+  rng.prepareThreadRNGs(n);
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n; k++) {
+    rpu_device_vec_[k]->diffuseWeights(weights_vec_[k], *rng.getThreadRNG(k));
   }
   reduceToWeights(weights);
 }
 
 template <typename T> void VectorRPUDevice<T>::clipWeights(T **weights, T clip) {
-#pragma omp parallel for
-  for (int k = 0; k < (int)rpu_device_vec_.size(); k++) {
+  int n = n_devices_;
+  int n_threads = MIN(getNumThreads(), n);
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n; k++) {
     rpu_device_vec_[k]->clipWeights(weights_vec_[k], clip);
   }
   reduceToWeights(weights);
 }
 
+template <typename T>
+void VectorRPUDevice<T>::postUpdateWeights(
+    T **weights, bool diffuse, bool decay, bool clip, T clip_value, RNG<T> &rng) {
+  if (!diffuse && !decay && !clip) {
+    return;
+  }
+  int n = n_devices_;
+  int n_threads = MIN(getNumThreads(), n);
+  rng.prepareThreadRNGs(n);
+#pragma omp parallel for num_threads(n_threads) if (n * this->size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n; k++) {
+    rpu_device_vec_[k]->postUpdateWeights(
+        weights_vec_[k], diffuse, decay, clip, clip_value, *rng.getThreadRNG(k));
+  }
+  reduceToWeights(weights);
+}
+
 template <typename T>
 void VectorRPUDevice<T>::resetCols(
     T **weights, int start_col, int n_cols, T reset_prob, RealWorldRNG<T> &rng) {
-#pragma omp parallel for
+  // serial, since the real world RNG is shared
   for (int k = 0; k < (int)rpu_device_vec_.size(); k++) {
     rpu_device_vec_[k]->resetCols(weights_vec_[k], start_col, n_cols, reset_prob, rng);
   }
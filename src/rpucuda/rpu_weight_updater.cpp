@@ -211,24 +211,65 @@ void PulsedRPUWeightUpdater<T>::updateVectorWithDevice(
       bool do_negative_separatly = sblm_->getCountsAndIndices(
           x_counts_p, x_counts_n, d_counts, x_indices_p, x_indices_n, d_indices);
 
+      // each row uses its own random substream, thus the result does
+      // not depend on the number of threads. The (bit line, row)
+      // entries are bucketed per thread once, and each thread goes
+      // through its bit lines in order, so that the sequence of pulses
+      // per row is the same as in the serial case.
+      rng_->prepareThreadRNGs(this->d_size_);
+
+      int64_t n_work = 0;
       for (int k = 0; k < BL; k++) {
-        if (d_counts[k] > 0) {
-          for (int ii = 0; ii < d_counts[k]; ii++) {
+        int x_count = x_counts_p[k] + (do_negative_separatly ? x_counts_n[k] : 0);
+        n_work += (int64_t)d_counts[k] * x_count;
+      }
+      int n_threads = n_work > RPU_OMP_MIN_SIZE ? MIN(getNumThreads(), this->d_size_) : 1;
+
+      auto update_row = [&](int k, int ii) {
+        int i_signed = d_indices[k][ii];
+        int d_sign = i_signed < 0 ? -lr_sign : lr_sign;
+        int i = i_signed < 0 ? -i_signed - 1 : i_signed - 1;
+        RNG<T> *rng = rng_->getThreadRNG(i);
+
+        // let rpu_device decide how to update w
+        if (x_counts_p[k] > 0) {
+          rpu_device->doSparseUpdate(weights, i, x_indices_p[k], x_counts_p[k], d_sign, rng);
+        }
+        if (do_negative_separatly) {
+          if (x_counts_n[k] > 0) {
+            rpu_device->doSparseUpdate(weights, i, x_indices_n[k], x_counts_n[k], d_sign, rng);
+          }
+        }
+      };
 
+      if (n_threads <= 1) {
+        for (int k = 0; k < BL; k++) {
+          for (int ii = 0; ii < d_counts[k]; ii++) {
+            update_row(k, ii);
+          }
+        }
+      } else {
+        if ((int)row_buckets_.size() < n_threads) {
+          row_buckets_.resize(n_threads);
+        }
+        for (int t = 0; t < n_threads; t++) {
+          row_buckets_[t].clear();
+        }
+        for (int k = 0; k < BL; k++) {
+          for (int ii = 0; ii < d_counts[k]; ii++) {
             int i_signed = d_indices[k][ii];
-            int d_sign = i_signed < 0 ? -lr_sign : lr_sign;
             int i = i_signed < 0 ? -i_signed - 1 : i_signed - 1;
+            std::vector<int> &bucket = row_buckets_[i % n_threads];
+            bucket.push_back(k);
+            bucket.push_back(ii);
+          }
+        }
 
-            // let rpu_device decide how to update w
-            if (x_counts_p[k] > 0) {
-              rpu_device->doSparseUpdate(weights, i, x_indices_p[k], x_counts_p[k], d_sign, &*rng_);
-            }
-            if (do_negative_separatly) {
-              if (x_counts_n[k] > 0) {
-                rpu_device->doSparseUpdate(
-                    weights, i, x_indices_n[k], x_counts_n[k], d_sign, &*rng_);
-              }
-            }
+#pragma omp parallel for schedule(static, 1) num_threads(n_threads)
+        for (int t = 0; t < n_threads; t++) {
+          const std::vector<int> &bucket = row_buckets_[t];
+          for (size_t e = 0; e < bucket.size(); e += 2) {
+            update_row(bucket[e], bucket[e + 1]);
           }
         }
       }
@@ -18,6 +18,7 @@
 #include "rpu_pulsed_meta_parameter.h"
 #include "sparse_bit_line_maker.h"
 #include <memory>
+#include <vector>
 
 namespace RPU {
 
@@ -105,6 +106,9 @@ private:
   std::unique_ptr<DenseBitLineMaker<T>> dblm_ = nullptr;
 
   PulsedUpdateMetaParameter<T> up_;
+
+  // temporary: (bit line, row) entries of the sparse update per thread. no need to copy
+  std::vector<std::vector<int>> row_buckets_;
 };
 
 } // namespace RPU
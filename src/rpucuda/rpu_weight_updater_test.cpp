@@ -0,0 +1,93 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "rng.h"
+#include "rpu_constantstep_device.h"
+#include "rpu_weight_updater.h"
+#include "utility_functions.h"
+#include "gtest/gtest.h"
+#include <memory>
+#include <vector>
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+TEST(RPUWeightUpdaterTest, SparseUpdateIndependentOfThreads) {
+  // large enough to use the parallel sparse update
+  int x_size = 300;
+  int d_size = 200;
+
+  ConstantStepRPUDeviceMetaParameter<num_t> dp;
+  dp.dw_min = 0.001;
+  dp.dw_min_dtod = 0.0;
+  dp.dw_min_std = 0.1;
+  dp.w_max = 10;
+  dp.w_min = -10;
+
+  PulsedUpdateMetaParameter<num_t> up;
+  up.pulse_type = PulseType::StochasticCompressed;
+  up.update_bl_management = false;
+  up.update_management = true;
+  up.desired_BL = 31;
+
+  RealWorldRNG<num_t> rw_rng(1234);
+  std::vector<num_t> x(x_size), d(d_size);
+  for (int j = 0; j < x_size; j++) {
+    x[j] = rw_rng.sampleGauss();
+  }
+  for (int i = 0; i < d_size; i++) {
+    d[i] = rw_rng.sampleGauss();
+  }
+
+  std::vector<std::vector<num_t>> results;
+  int n_threads_orig = getNumThreads();
+  for (int n_threads : {1, 4}) {
+    setNumThreads(n_threads);
+
+    RealWorldRNG<num_t> dev_rng(1234);
+    std::unique_ptr<ConstantStepRPUDevice<num_t>> device(dp.createDevice(x_size, d_size, &dev_rng));
+    num_t **w = Array_2D_Get<num_t>(d_size, x_size);
+    for (int i = 0; i < x_size * d_size; i++) {
+      w[0][i] = 0.0;
+    }
+    auto rng = std::make_shared<RNG<num_t>>(12);
+    PulsedRPUWeightUpdater<num_t> updater(x_size, d_size, rng);
+    updater.setUpPar(up);
+    for (int loop = 0; loop < 5; loop++) {
+      updater.updateVectorWithDevice(w, x.data(), 1, d.data(), 1, 0.01, 1, &*device);
+    }
+    results.emplace_back(w[0], w[0] + x_size * d_size);
+    Array_2D_Free<num_t>(w);
+  }
+  setNumThreads(n_threads_orig);
+
+  int n_nonzero = 0;
+  for (int i = 0; i < x_size * d_size; i++) {
+    ASSERT_FLOAT_EQ(results[0][i], results[1][i]);
+    n_nonzero += results[0][i] != 0;
+  }
+  ASSERT_GT(n_nonzero, 0);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
@@ -0,0 +1,32 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "utility_functions.h"
+
+namespace RPU {
+
+static int g_num_threads = 0;
+
+void setNumThreads(int n_threads) { g_num_threads = n_threads > 0 ? n_threads : 0; }
+
+int getNumThreads() {
+  if (g_num_threads > 0) {
+    return g_num_threads;
+  }
+#ifdef _OPENMP
+  return omp_get_max_threads();
+#else
+  return 1;
+#endif
+}
+
+} // namespace RPU
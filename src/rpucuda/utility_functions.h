@@ -16,8 +16,15 @@
 #include <stdexcept>
 #include <string.h>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 #define UNUSED(X) (void)X
 
+// minimal number of elements for which an OpenMP parallel region is started
+#define RPU_OMP_MIN_SIZE 16384
+
 #ifdef _MSC_VER
 #define PRAGMA(DIRECTIVE) __pragma(DIRECTIVE)
 #define PRAGMA_SIMD
@@ -95,6 +102,21 @@ template <typename T, typename... Args> std::unique_ptr<T> make_unique(Args &&..
   return std::unique_ptr<T>(new T(std::forward<Args>(args)...));
 }
 
+/* Number of threads used for the (OpenMP) parallel loops of the CPU
+   simulator. Non-positive values reset to the OpenMP default. Kept
+   separately from omp_set_num_threads to not interfere with the
+   threading of the calling library (e.g. torch). */
+void setNumThreads(int n_threads);
+int getNumThreads();
+
+inline int getThreadNum() {
+#ifdef _OPENMP
+  return omp_get_thread_num();
+#else
+  return 0;
+#endif
+}
+
 template <typename T, typename RNGClass>
 inline T getDiscretizedValue(T value, T res, bool sto_round, RNGClass &rng) {
 
@@ -23,52 +23,31 @@ template <typename T>
 WeightModifier<T>::WeightModifier(int x_size, int d_size)
     : x_size_(x_size), d_size_(d_size), size_(d_size * x_size) {}
 
-template <typename T> void WeightModifier<T>::dropConnections(T *weights, T prob) {
+// rounds to the nearest integer (ties to even) without library call or
+// branches: adding and subtracting 1.5 * 2^(mantissa bits) drops the
+// fraction (exact below 2^(mantissa bits - 1), larger values are kept)
+template <typename T> inline T roundNearest(T value) {
+  const T magic = sizeof(T) == 4 ? (T)12582912.0 : (T)6755399441055744.0;
+  const T rounded = (value + magic) - magic;
+  return fabs(value) < magic / (T)3.0 ? rounded : value;
+}
 
-  PRAGMA_SIMD
-  for (int i = 0; i < size_; i++) {
-    if (rw_rng_.sampleUniform() < prob) {
-      weights[i] = 0.0;
-    }
-  }
+template <typename T> inline T discretize(T value, T inv_res, T res, bool sto_round, T rnd_value) {
+  return roundNearest(value * inv_res + (sto_round ? rnd_value - (T)0.5 : (T)0.0)) * res;
 }
 
 template <typename T>
-void WeightModifier<T>::apply(
-    T *new_weights, const T *weights, const WeightModifierParameter &wmpar) {
+void WeightModifier<T>::modifyRow(
+    T *new_weights, const T *weights, const int n, T *rnd_values, RNG<T> &rng) {
 
-  // just copy always if not in-place [also handles WeightModifierType::Copy]
-  if (new_weights != weights) {
-    RPU::math::copy<T>(size_, weights, 1, new_weights, 1);
-  }
-
-  if (wmpar.copy_last_column) {
-    saved_bias_.resize(d_size_);
-    for (int j = 0; j < d_size_; j++) {
-      saved_bias_[j] = weights[(j + 1) * x_size_ - 1];
-    }
-  }
-  enable_during_test_ = wmpar.enable_during_test;
-
-  T amax = wmpar.assumed_wmax; // assumed max
-  if (wmpar.rel_to_actual_wmax && wmpar.type != WeightModifierType::Copy) {
-    amax = 0.0;
-    PRAGMA_SIMD
-    for (int i = 0; i < size_; i++) {
-      if (wmpar.copy_last_column && (i % x_size_) == x_size_ - 1) {
-        continue;
-      }
-      T a = fabs(new_weights[i]);
-      amax = a > amax ? a : amax;
-    }
-    amax = amax > 0.0 ? amax : (T)1.0;
-  }
+  const T amax = amax_;
+  const WeightModifierParameter &wmpar = wmpar_;
 
   switch (wmpar.type) {
   case WeightModifierType::Copy: {
-    // do not allow in place
-    if (new_weights == weights) {
-      RPU_FATAL("Copy is not possible for in-place weights! ");
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      new_weights[j] = weights[j];
     }
     break; // maybe dropping below
   }
@@ -76,75 +55,88 @@ void WeightModifier<T>::apply(
   case WeightModifierType::Discretize: {
 
     const T res = wmpar.res;
-    if (res > 0) {
-      const bool sto_round = wmpar.sto_round;
+    const bool sto_round = wmpar.sto_round;
+    if (res <= 0) {
       PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        T w = new_weights[i];
-        new_weights[i] = amax * getDiscretizedValueRound(w / amax, res, sto_round, rw_rng_);
+      for (int j = 0; j < n; j++) {
+        new_weights[j] = weights[j];
       }
+      break;
+    }
+    const T amax_res = amax * res;
+    const T inv_amax_res = (T)1.0 / amax_res;
+    if (sto_round) {
+      rng.fillUniform(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      new_weights[j] = discretize(weights[j], inv_amax_res, amax_res, sto_round, rnd_values[j]);
     }
     break;
   }
   case WeightModifierType::MultNormal: {
 
-    if (wmpar.std_dev > 0) {
-      const T std = wmpar.std_dev * amax;
-      PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        T w = new_weights[i];
-        new_weights[i] += w * std * rw_rng_.sampleGauss();
-      }
+    const T std = wmpar.std_dev * amax;
+    if (std > 0) {
+      rng.fillGauss(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      T w = weights[j];
+      new_weights[j] = std > 0 ? w + w * std * rnd_values[j] : w;
     }
     break;
   }
   case WeightModifierType::AddNormal: {
 
-    if (wmpar.std_dev > 0) {
-      const T std = wmpar.std_dev * amax;
-      PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        new_weights[i] += std * rw_rng_.sampleGauss();
-      }
+    const T std = wmpar.std_dev * amax;
+    if (std > 0) {
+      rng.fillGauss(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      T w = weights[j];
+      new_weights[j] = std > 0 ? w + std * rnd_values[j] : w;
     }
-
     break;
   }
 
   case WeightModifierType::Poly: {
 
-    if (wmpar.std_dev > 0) {
-      const T std = wmpar.std_dev;
-      const T p0 = wmpar.coeff0;
-      const T p1 = wmpar.coeff1;
-      const T p2 = wmpar.coeff2;
-
-      PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        T aw = fabs(new_weights[i]) / amax;
+    const T std = wmpar.std_dev;
+    const T p0 = wmpar.coeff0;
+    const T p1 = wmpar.coeff1;
+    const T p2 = wmpar.coeff2;
+    if (std > 0) {
+      rng.fillGauss(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      T w = weights[j];
+      if (std > 0) {
+        T aw = fabs(w) / amax;
         T sig = std * (p0 + p1 * aw + p2 * aw * aw);
-        new_weights[i] += amax * sig * rw_rng_.sampleGauss();
+        w += amax * sig * rnd_values[j];
       }
+      new_weights[j] = w;
     }
-
     break;
   }
 
   case WeightModifierType::DoReFa: {
 
     const T res = wmpar.res;
-
-    if (res > 0) {
-      const bool sto_round = wmpar.sto_round;
-      const T scale = fabs(wmpar.dorefa_clip / tanh(amax));
-
-      PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        T w = tanh(new_weights[i]) * scale;
-        new_weights[i] = getDiscretizedValueRound(w, res, sto_round, rw_rng_);
-      }
+    const bool sto_round = wmpar.sto_round;
+    const T scale = fabs(wmpar.dorefa_clip / tanh(amax));
+    if (res > 0 && sto_round) {
+      rng.fillUniform(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      T w = weights[j];
+      new_weights[j] =
+          res > 0 ? discretize(tanh(w) * scale, (T)1.0 / res, res, sto_round, rnd_values[j]) : w;
     }
-
     break;
   }
 
@@ -152,18 +144,30 @@ void WeightModifier<T>::apply(
 
     const T res = wmpar.res;
     const T std = wmpar.std_dev * amax;
-
-    if (res > 0 || std > 0) {
-      const bool sto_round = wmpar.sto_round;
-
+    const bool sto_round = wmpar.sto_round;
+    if (res <= 0 && std <= 0) {
       PRAGMA_SIMD
-      for (int i = 0; i < size_; i++) {
-        T w = new_weights[i];
-        w = amax * getDiscretizedValueRound(w / amax, res, sto_round, rw_rng_);
-        new_weights[i] = w + std * rw_rng_.sampleGauss();
+      for (int j = 0; j < n; j++) {
+        new_weights[j] = weights[j];
       }
+      break;
+    }
+    const T amax_res = amax * res;
+    const T inv_amax_res = res > 0 ? (T)1.0 / amax_res : (T)0.0;
+    if (sto_round) {
+      rng.fillUniform(rnd_values, n);
+    }
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      T w = weights[j];
+      new_weights[j] =
+          res > 0 ? discretize(w, inv_amax_res, amax_res, sto_round, rnd_values[j]) : w;
+    }
+    rng.fillGauss(rnd_values, n);
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      new_weights[j] += std * rnd_values[j];
     }
-
     break;
   }
 
@@ -171,13 +175,217 @@ void WeightModifier<T>::apply(
     RPU_FATAL("Requested WeightModifierType not implemented in CPU version.");
   }
 
-  if (wmpar.pdrop > 0.0) {
-    dropConnections(new_weights, wmpar.pdrop);
+  if (wmpar.pdrop >= 1.0) {
+    PRAGMA_SIMD
+    for (int j = 0; j < n; j++) {
+      new_weights[j] = 0.0;
+    }
+  } else if (wmpar.pdrop > 0.0) {
+    // skip to the next dropped weight: the number of kept weights in
+    // between is geometrically distributed, thus only one random
+    // number per dropped weight is needed
+    const T log_keep = log1p(-(T)wmpar.pdrop);
+    int j = 0;
+    while (true) {
+      T n_skip = floor(log(rng.sampleUniform()) / log_keep);
+      if (!(n_skip < (T)(n - j))) {
+        break;
+      }
+      j += (int)n_skip;
+      new_weights[j++] = 0.0;
+    }
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::modifyRows(
+    T *new_weights, const T *weights, const int row_start, const int n_rows) {
+
+  // the last column is not modified (but copied)
+  const int n_cols = wmpar_.copy_last_column ? x_size_ - 1 : x_size_;
+  const int n_threads = MIN(getNumThreads(), n_rows);
+  if ((int)rnd_values_.size() < n_threads * x_size_) {
+    rnd_values_.resize(n_threads * x_size_);
+  }
+
+#pragma omp parallel for num_threads(n_threads)                                                    \
+    schedule(static) if (n_rows * x_size_ > RPU_OMP_MIN_SIZE)
+  for (int k = 0; k < n_rows; k++) {
+    const int i = row_start + k;
+    const T *w_row = weights + i * x_size_;
+    T *new_w_row = new_weights + k * x_size_;
+
+    // each row has its own substream, thus the values do not depend
+    // on the threads or the blocks
+    RNG<T> row_rng(*rng_, i, counter_);
+    modifyRow(new_w_row, w_row, n_cols, rnd_values_.data() + getThreadNum() * x_size_, row_rng);
+
+    if (n_cols < x_size_) {
+      new_w_row[n_cols] = w_row[n_cols];
+    }
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::prepare(
+    const T *weights, const WeightModifierParameter &wmpar, RNG<T> &rng) {
+
+  enable_during_test_ = wmpar.enable_during_test;
+  wmpar_ = wmpar;
+  rng_ = &rng;
+  lazy_ = true;
+  // new modification: offset the counters of the row substreams
+  counter_ = ((uint64_t)rng.sample() + 1) << 32;
+
+  amax_ = wmpar.assumed_wmax; // assumed max
+  if (wmpar.rel_to_actual_wmax && wmpar.type != WeightModifierType::Copy) {
+    T amax = 0.0;
+    if (wmpar.copy_last_column) {
+      // without the last column
+      for (int i = 0; i < d_size_; i++) {
+        const T *w_row = weights + i * x_size_;
+        T a = fabs(w_row[RPU::math::iamax<T>(x_size_ - 1, w_row, 1)]);
+        amax = a > amax ? a : amax;
+      }
+    } else {
+      amax = fabs(weights[RPU::math::iamax<T>(size_, weights, 1)]);
+    }
+    amax_ = amax > 0.0 ? amax : (T)1.0;
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::apply(
+    T *new_weights, const T *weights, const WeightModifierParameter &wmpar, RNG<T> &rng) {
+
+  // do not allow in place [also copies the weights for WeightModifierType::Copy]
+  if (new_weights == weights) {
+    RPU_FATAL("Weight modifier is not possible for in-place weights! ");
   }
+  prepare(weights, wmpar, rng);
+  lazy_ = false;
 
-  if (wmpar.copy_last_column) {
-    for (int j = 0; j < d_size_; j++) {
-      new_weights[(j + 1) * x_size_ - 1] = saved_bias_[j];
+  modifyRows(new_weights, weights, 0, d_size_);
+}
+
+/***********************************************************/
+// lazy products
+
+template <typename T> int WeightModifier<T>::getBlockSize() const {
+  if (rng_ == nullptr) {
+    RPU_FATAL("Weight modifier needs to be prepared first.");
+  }
+  return MAX(MIN(wmpar_.lazy_block_size, d_size_), 1);
+}
+
+template <typename T>
+void WeightModifier<T>::gemvForward(
+    const T *weights,
+    const T alpha,
+    const T *x_input,
+    const int x_inc,
+    const T beta,
+    T *d_output,
+    const int d_inc) {
+
+  const int block_size = getBlockSize();
+  block_values_.resize(block_size * x_size_);
+
+  for (int i = 0; i < d_size_; i += block_size) {
+    const int n_rows = MIN(block_size, d_size_ - i);
+    modifyRows(block_values_.data(), weights, i, n_rows);
+    RPU::math::gemv<T>(
+        CblasRowMajor, CblasNoTrans, n_rows, x_size_, alpha, block_values_.data(), x_size_, x_input,
+        x_inc, beta, d_output + i * d_inc, d_inc);
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::gemvBackward(
+    const T *weights,
+    const T alpha,
+    const T *d_input,
+    const int d_inc,
+    const T beta,
+    T *x_output,
+    const int x_inc) {
+
+  const int block_size = getBlockSize();
+  block_values_.resize(block_size * x_size_);
+
+  // the blocks are accumulated
+  for (int i = 0; i < d_size_; i += block_size) {
+    const int n_rows = MIN(block_size, d_size_ - i);
+    modifyRows(block_values_.data(), weights, i, n_rows);
+    RPU::math::gemv<T>(
+        CblasRowMajor, CblasTrans, n_rows, x_size_, alpha, block_values_.data(), x_size_,
+        d_input + i * d_inc, d_inc, i == 0 ? beta : (T)1.0, x_output, x_inc);
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::gemmForward(
+    const T *weights,
+    const T alpha,
+    const T *X_input,
+    const int m_batch,
+    const bool x_trans,
+    const T beta,
+    T *D_output,
+    const bool d_trans) {
+
+  const int block_size = getBlockSize();
+  block_values_.resize(block_size * x_size_);
+  const int ldx = x_trans ? m_batch : x_size_;
+
+  for (int i = 0; i < d_size_; i += block_size) {
+    const int n_rows = MIN(block_size, d_size_ - i);
+    const T *w = block_values_.data();
+    modifyRows(block_values_.data(), weights, i, n_rows);
+
+    if (d_trans) {
+      RPU::math::gemm<T>(
+          CblasRowMajor, CblasNoTrans, x_trans ? CblasNoTrans : CblasTrans, n_rows, m_batch,
+          x_size_, alpha, w, x_size_, X_input, ldx, beta, D_output + i * m_batch, m_batch);
+    } else {
+      RPU::math::gemm<T>(
+          CblasRowMajor, x_trans ? CblasTrans : CblasNoTrans, CblasTrans, m_batch, n_rows, x_size_,
+          alpha, X_input, ldx, w, x_size_, beta, D_output + i, d_size_);
+    }
+  }
+}
+
+template <typename T>
+void WeightModifier<T>::gemmBackward(
+    const T *weights,
+    const T alpha,
+    const T *D_input,
+    const int m_batch,
+    const bool d_trans,
+    const T beta,
+    T *X_output,
+    const bool x_trans) {
+
+  const int block_size = getBlockSize();
+  block_values_.resize(block_size * x_size_);
+  const int ldd = d_trans ? m_batch : d_size_;
+
+  // the blocks are accumulated
+  for (int i = 0; i < d_size_; i += block_size) {
+    const int n_rows = MIN(block_size, d_size_ - i);
+    const T *w = block_values_.data();
+    const T *d = D_input + (d_trans ? i * m_batch : i);
+    const T b = i == 0 ? beta : (T)1.0;
+    modifyRows(block_values_.data(), weights, i, n_rows);
+
+    if (x_trans) {
+      RPU::math::gemm<T>(
+          CblasRowMajor, CblasTrans, d_trans ? CblasNoTrans : CblasTrans, x_size_, m_batch, n_rows,
+          alpha, w, x_size_, d, ldd, b, X_output, m_batch);
+    } else {
+      RPU::math::gemm<T>(
+          CblasRowMajor, d_trans ? CblasTrans : CblasNoTrans, CblasNoTrans, m_batch, x_size_,
+          n_rows, alpha, d, ldd, w, x_size_, b, X_output, x_size_);
     }
   }
 }
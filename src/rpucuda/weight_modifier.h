@@ -14,6 +14,7 @@
 
 #include "rng.h"
 #include <memory>
+#include <vector>
 
 namespace RPU {
 
@@ -46,6 +47,10 @@ struct WeightModifierParameter {
   double coeff1 = 0.0768;
   double coeff2 = -0.001877 * 25.0;
 
+  // if > 0, the modified weights are not stored but generated in
+  // blocks of this many rows during each forward and backward
+  int lazy_block_size = 0;
+
   WeightModifierType type = WeightModifierType::Copy;
 
   inline std::string getTypeName() const {
@@ -105,6 +110,9 @@ struct WeightModifierParameter {
     if (enable_during_test) {
       ss << "\t enabled during test." << std::endl;
     }
+    if (lazy_block_size > 0) {
+      ss << "\t lazy_block_size:\t" << lazy_block_size << std::endl;
+    }
 
     ss << std::endl;
   }
@@ -124,20 +132,79 @@ public:
   explicit WeightModifier(int x_size, int d_size);
   WeightModifier(){};
 
-  /* buffers the weight changes and redraws the drop connection*/
-  void apply(T *new_weights, const T *weights, const WeightModifierParameter &wmpar);
-
-  inline bool enableDuringTest() { return enable_during_test_; };
+  /* Modifies the weights (and copies them) in one sweep and redraws
+     the drop connection. Rows are distributed across threads, each
+     row uses its own RNG substream. */
+  void apply(T *new_weights, const T *weights, const WeightModifierParameter &wmpar, RNG<T> &rng);
+
+  /* Prepares a lazy modification: only the abs max and a new random
+     counter offset are computed. The modified weights are then
+     generated per block of rows (``lazy_block_size``) within the
+     gemv / gemm below, always with the identical values until the
+     next prepare. The RNG needs to stay valid until then. */
+  void prepare(const T *weights, const WeightModifierParameter &wmpar, RNG<T> &rng);
+
+  /* Products with the (d_size x x_size) modified weights, which are
+     generated from the given weights. Arguments as for the
+     forward and backward of ForwardBackwardPass. Results are
+     scaled by alpha and added to beta times the output. */
+  void gemvForward(
+      const T *weights,
+      const T alpha,
+      const T *x_input,
+      const int x_inc,
+      const T beta,
+      T *d_output,
+      const int d_inc);
+  void gemvBackward(
+      const T *weights,
+      const T alpha,
+      const T *d_input,
+      const int d_inc,
+      const T beta,
+      T *x_output,
+      const int x_inc);
+  void gemmForward(
+      const T *weights,
+      const T alpha,
+      const T *X_input,
+      const int m_batch,
+      const bool x_trans,
+      const T beta,
+      T *D_output,
+      const bool d_trans);
+  void gemmBackward(
+      const T *weights,
+      const T alpha,
+      const T *D_input,
+      const int m_batch,
+      const bool d_trans,
+      const T beta,
+      T *X_output,
+      const bool x_trans);
+
+  inline bool enableDuringTest() const { return enable_during_test_; };
+  inline bool isLazy() const { return lazy_; };
 
 private:
-  void dropConnections(T *weights, T prob);
+  void modifyRows(T *new_weights, const T *weights, const int row_start, const int n_rows);
+  void modifyRow(T *new_weights, const T *weights, const int n, T *rnd_values, RNG<T> &rng);
+  int getBlockSize() const;
 
   int x_size_ = 0;
   int d_size_ = 0;
   int size_ = 0;
-  std::vector<T> saved_bias_;
   bool enable_during_test_ = false;
-  RealWorldRNG<T> rw_rng_{0};
+  bool lazy_ = false;
+
+  // state of the last prepare
+  WeightModifierParameter wmpar_;
+  T amax_ = 1.0;
+  RNG<T> *rng_ = nullptr;
+  uint64_t counter_ = 0;
+
+  std::vector<T> rnd_values_;
+  std::vector<T> block_values_;
 };
 
 } // namespace RPU
@@ -0,0 +1,167 @@
+/**
+ * (C) Copyright 2020, 2021, 2022 IBM. All Rights Reserved.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#include "math_util.h"
+#include "rng.h"
+#include "utility_functions.h"
+#include "weight_modifier.h"
+#include "gtest/gtest.h"
+#include <memory>
+#include <vector>
+
+#ifdef RPU_USE_DOUBLE
+typedef double num_t;
+#else
+typedef float num_t;
+#endif
+
+namespace {
+
+using namespace RPU;
+
+class WeightModifierTestFixture : public ::testing::Test {
+public:
+  void SetUp() {
+    x_size = 513;
+    d_size = 400;
+    size = x_size * d_size;
+
+    weights.resize(size);
+    new_weights.resize(size);
+    RealWorldRNG<num_t> rw_rng(12);
+    for (int i = 0; i < size; i++) {
+      weights[i] = 0.5 * (2 * rw_rng.sampleUniform() - 1);
+    }
+    weights[7] = 1.0; // abs max
+
+    modifier = RPU::make_unique<WeightModifier<num_t>>(x_size, d_size);
+  }
+
+  int x_size, d_size, size;
+  std::vector<num_t> weights, new_weights;
+  std::unique_ptr<WeightModifier<num_t>> modifier;
+  WeightModifierParameter wmpar;
+  RNG<num_t> rng{42};
+};
+
+TEST_F(WeightModifierTestFixture, AddNormal) {
+  wmpar.type = WeightModifierType::AddNormal;
+  wmpar.std_dev = 0.1;
+  modifier->apply(new_weights.data(), weights.data(), wmpar, rng);
+
+  num_t mean = 0, var = 0;
+  for (int i = 0; i < size; i++) {
+    num_t d = new_weights[i] - weights[i];
+    mean += d / size;
+    var += d * d / size;
+  }
+  ASSERT_NEAR(mean, 0.0, 0.01);
+  ASSERT_NEAR(sqrt(var - mean * mean), 0.1, 0.01);
+}
+
+TEST_F(WeightModifierTestFixture, DropConnectKeepsLastColumn) {
+  wmpar.type = WeightModifierType::Copy;
+  wmpar.pdrop = 0.3;
+  wmpar.copy_last_column = true;
+  modifier->apply(new_weights.data(), weights.data(), wmpar, rng);
+
+  int n_dropped = 0;
+  for (int i = 0; i < size; i++) {
+    if ((i % x_size) == x_size - 1) {
+      ASSERT_EQ(new_weights[i], weights[i]);
+    } else if (new_weights[i] == 0) {
+      n_dropped++;
+    } else {
+      ASSERT_EQ(new_weights[i], weights[i]);
+    }
+  }
+  ASSERT_NEAR((num_t)n_dropped / (d_size * (x_size - 1)), 0.3, 0.01);
+}
+
+TEST_F(WeightModifierTestFixture, Reproducible) {
+  wmpar.type = WeightModifierType::MultNormal;
+  wmpar.std_dev = 0.1;
+  wmpar.pdrop = 0.1;
+  std::vector<num_t> new_weights2(size);
+
+  rng.setSeed(1);
+  modifier->apply(new_weights.data(), weights.data(), wmpar, rng);
+  rng.setSeed(1);
+  modifier->apply(new_weights2.data(), weights.data(), wmpar, rng);
+
+  for (int i = 0; i < size; i++) {
+    ASSERT_EQ(new_weights[i], new_weights2[i]);
+  }
+}
+
+TEST_F(WeightModifierTestFixture, LazyEqualsApplied) {
+  wmpar.type = WeightModifierType::DiscretizeAddNormal;
+  wmpar.std_dev = 0.1;
+  wmpar.sto_round = true;
+  wmpar.pdrop = 0.1;
+  wmpar.copy_last_column = true;
+  wmpar.lazy_block_size = 64;
+  int m_batch = 7;
+  std::vector<num_t> x(x_size * m_batch), d(d_size * m_batch), d_lazy(d_size * m_batch),
+      x_out(x_size * m_batch), x_out_lazy(x_size * m_batch);
+  for (int i = 0; i < x_size * m_batch; i++) {
+    x[i] = rng.sampleGauss();
+  }
+  for (int i = 0; i < d_size * m_batch; i++) {
+    d[i] = rng.sampleGauss();
+  }
+
+  for (bool trans : {false, true}) {
+    rng.setSeed(3);
+    modifier->apply(new_weights.data(), weights.data(), wmpar, rng);
+    rng.setSeed(3);
+    modifier->prepare(weights.data(), wmpar, rng);
+
+    RPU::math::gemm<num_t>(
+        CblasRowMajor, CblasNoTrans, CblasTrans, m_batch, d_size, x_size, 1.0, x.data(), x_size,
+        new_weights.data(), x_size, 0.0, d_lazy.data(), d_size);
+    modifier->gemmForward(weights.data(), 1.0, x.data(), m_batch, false, 0.0, d.data(), false);
+    for (int i = 0; i < d_size * m_batch; i++) {
+      ASSERT_NEAR(d[i], d_lazy[i], 1e-4);
+    }
+
+    RPU::math::gemm<num_t>(
+        CblasRowMajor, CblasNoTrans, CblasNoTrans, m_batch, x_size, d_size, 1.0, d.data(), d_size,
+        new_weights.data(), x_size, 0.0, x_out.data(), x_size);
+    modifier->gemmBackward(
+        weights.data(), 1.0, d.data(), m_batch, false, 0.0, x_out_lazy.data(), false);
+    for (int i = 0; i < x_size * m_batch; i++) {
+      ASSERT_NEAR(x_out[i], x_out_lazy[i], 1e-4);
+    }
+
+    // vector versions with the transposed batch as increment
+    RPU::math::gemv<num_t>(
+        CblasRowMajor, CblasTrans, d_size, x_size, 1.0, new_weights.data(), x_size, d.data(),
+        m_batch, 0.0, x_out.data(), m_batch);
+    modifier->gemvBackward(weights.data(), 1.0, d.data(), m_batch, 0.0, x_out_lazy.data(), m_batch);
+    for (int i = 0; i < x_size; i++) {
+      ASSERT_NEAR(x_out[i * m_batch], x_out_lazy[i * m_batch], 1e-4);
+    }
+    wmpar.lazy_block_size = d_size + 1;
+  }
+}
+
+TEST_F(WeightModifierTestFixture, InPlaceNotSupported) {
+  EXPECT_THROW(modifier->apply(weights.data(), weights.data(), wmpar, rng), std::runtime_error);
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
@@ -12,20 +12,25 @@
 
 """Tests for the RPU array bindings."""
 
-from unittest import SkipTest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import SkipTest, TestCase
+from warnings import catch_warnings, simplefilter
 
 from numpy import array, std, dot, reshape
 from numpy.random import uniform
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
-from torch import Tensor, from_numpy
+from torch import Tensor, from_numpy, float32, float64
 from torch.cuda import init
 
-from aihwkit.simulator.rpu_base import tiles, cuda
+from aihwkit.simulator.rpu_base import tiles, cuda, set_num_threads, get_num_threads
 
 from aihwkit.simulator.configs import FloatingPointRPUConfig, SingleRPUConfig
 from aihwkit.simulator.configs.devices import FloatingPointDevice, ConstantStepDevice, IdealDevice
-from aihwkit.simulator.configs.utils import IOParameters, DriftParameter
+from aihwkit.simulator.configs.utils import IOParameters, DriftParameter, RPUDataType
+from aihwkit.simulator.configs.helpers import get_bindings_class
+from aihwkit.exceptions import ConfigError
+from aihwkit.simulator.tiles import AnalogTile
 
 from .helpers.decorators import parametrize_over_tiles
 from .helpers.testcases import ParametrizedTestCase
@@ -128,6 +133,28 @@ class BindingsTilesTest(ParametrizedTestCase):
         self.assertLess(deviation_std, 1.1*diffusion_rate)
         self.assertGreater(deviation_std, 0.9*diffusion_rate)
 
+    def test_post_update_step(self):
+        """Check that the post update step is the same as the separate calls."""
+        python_tile = self.get_custom_tile(100, 122, diffusion=0.1, lifetime=10.0)
+        cpp_tile = python_tile.tile
+
+        init_weights = cpp_tile.get_weights().copy()
+        cpp_tile.set_random_seed(42)
+        cpp_tile.diffuse_weights()
+        cpp_tile.decay_weights(1.0)
+        expected_weights = cpp_tile.get_weights().copy()
+
+        cpp_tile.set_weights(init_weights)
+        cpp_tile.set_random_seed(42)
+        cpp_tile.post_update_step(True, True)
+        weights = cpp_tile.get_weights()
+
+        if 'Cuda' in self.parameter:
+            # different random numbers for the CUDA diffusion
+            self.assertGreater(std((weights - expected_weights).flatten()), 0.0)
+            return
+        assert_array_almost_equal(weights, expected_weights)
+
     def test_drift_weights(self):
         """Check drifting the weights."""
         nu = 0.1
@@ -215,6 +242,27 @@ class FloatingPointTileTest(ParametrizedTestCase):
         cpp_tile.set_weights(input_weights)
         assert_array_equal(cpp_tile.get_weights(), input_weights)
 
+    def test_setters_weights_tensor(self):
+        """Check setting the weights from tensors and getting views."""
+        python_tile = self.get_tile(2, 3)
+        cpp_tile = python_tile.tile
+
+        input_weights = Tensor([[1, 2, 3], [4, 5, 6]])
+        cpp_tile.set_weights(input_weights)
+        assert_array_equal(cpp_tile.get_weights(), input_weights)
+
+        if python_tile.is_cuda:
+            with self.assertRaises(RuntimeError):
+                cpp_tile.get_weights_view()
+            return
+
+        weights_view = cpp_tile.get_weights_view()
+        assert_array_equal(weights_view, input_weights)
+
+        # The view shares the memory with the tile.
+        cpp_tile.set_weights(2 * input_weights)
+        assert_array_equal(weights_view, 2 * input_weights)
+
     def test_setters_weights_realistic(self):
         """Check setting and getting the weights."""
         python_tile = self.get_tile(2, 3)
@@ -340,3 +388,97 @@ class AnalogTileTest(ParametrizedTestCase):
         input_weights = array([[6, 5, 4], [3, 2, 1]])
         cpp_tile.set_weights_realistic(input_weights, 10)
         self.assertEqual(cpp_tile.get_weights().shape, (2, 3))
+
+
+class SimulatorThreadsTest(TestCase):
+    """Test the thread settings of the CPU simulator."""
+
+    def tearDown(self) -> None:
+        set_num_threads(0)
+
+    def test_set_num_threads(self):
+        """Check setting and resetting the number of threads."""
+        set_num_threads(3)
+        self.assertEqual(get_num_threads(), 3)
+
+        set_num_threads(0)
+        self.assertGreaterEqual(get_num_threads(), 1)
+
+    def test_forward_num_threads(self):
+        """Check that the forward does not depend on the number of threads."""
+        rpu_config = SingleRPUConfig(
+            forward=IOParameters(out_noise=0.0, inp_res=-1, out_res=-1, w_noise=0.0),
+            device=IdealDevice()
+        )
+        python_tile = AnalogTile(10, 12, rpu_config=rpu_config)
+        x_input = from_numpy(uniform(-1.0, 1.0, size=(50, 12))).float()
+
+        set_num_threads(1)
+        y_single = python_tile.forward(x_input)
+        set_num_threads(4)
+        y_parallel = python_tile.forward(x_input)
+
+        assert_array_almost_equal(y_single.numpy(), y_parallel.numpy())
+
+    def test_forward_concurrent_tiles(self):
+        """Check that different tiles can be used from several threads."""
+        rpu_config = SingleRPUConfig(
+            forward=IOParameters(out_noise=0.0, inp_res=-1, out_res=-1, w_noise=0.0),
+            device=IdealDevice()
+        )
+        python_tiles = [AnalogTile(10, 12, rpu_config=rpu_config) for _ in range(4)]
+        x_input = from_numpy(uniform(-1.0, 1.0, size=(50, 12))).float()
+
+        y_serial = [python_tile.forward(x_input) for python_tile in python_tiles]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            y_concurrent = list(executor.map(lambda tile: tile.forward(x_input), python_tiles))
+
+        for y_ser, y_con in zip(y_serial, y_concurrent):
+            assert_array_almost_equal(y_ser.numpy(), y_con.numpy())
+
+
+class TileDataTypeTest(TestCase):
+    """Tests the data types of the tiles."""
+
+    @staticmethod
+    def get_rpu_config(data_type):
+        """Return a noise free rpu config with the given data type."""
+        return SingleRPUConfig(
+            forward=IOParameters(is_perfect=True),
+            backward=IOParameters(is_perfect=True),
+            device=IdealDevice(),
+            dtype=data_type
+        )
+
+    def test_float_tile(self):
+        """Check the data type of the single precision tiles."""
+        python_tile = AnalogTile(3, 4, rpu_config=self.get_rpu_config(RPUDataType.FLOAT))
+        self.assertEqual(python_tile.dtype, float32)
+
+        weights = from_numpy(uniform(-0.5, 0.5, size=(3, 4))).float()
+        python_tile.set_weights(weights)
+        with catch_warnings():
+            simplefilter('error')
+            tile_weights, _ = python_tile.get_weights()
+        self.assertEqual(tile_weights.dtype, float32)
+        assert_array_equal(tile_weights.numpy(), weights.numpy())
+
+        x_input = from_numpy(uniform(-1.0, 1.0, size=(5, 4))).float()
+        y_output = python_tile.forward(x_input)
+        self.assertEqual(y_output.dtype, float32)
+
+    def test_double_tile(self):
+        """Check the double precision tiles."""
+        if not hasattr(tiles, 'FloatingPointTileDouble'):
+            with self.assertRaises(ConfigError):
+                get_bindings_class(tiles.AnalogTile, RPUDataType.DOUBLE)
+            raise SkipTest('not compiled with double precision tiles')
+
+        python_tile = AnalogTile(3, 4, rpu_config=self.get_rpu_config(RPUDataType.DOUBLE))
+        self.assertIsInstance(python_tile.tile, tiles.AnalogTileDouble)
+
+        weights = from_numpy(uniform(-0.5, 0.5, size=(3, 4)))
+        python_tile.set_weights(weights)
+        tile_weights, _ = python_tile.get_weights()
+        self.assertEqual(tile_weights.dtype, float64)
+        assert_array_equal(tile_weights.numpy(), weights.numpy())
@@ -45,6 +45,23 @@ class NoiseModelTest(AihwkitTestCase):
 
         self.assertNotAlmostEqualTensor(noisy_weights, weights)
 
+    def test_apply_drift_noise_sweep(self):
+        """Test the drift of several inference times at once."""
+        weights = randn(10, 35)
+        t_inference_list = [0., 1., 1000., 1e5]
+
+        for noise_model in [PCMLikeNoiseModel(read_noise_scale=0.0),
+                            StateIndependentNoiseModel(read_noise_scale=0.0)]:
+            programmed_weights, nu_drift_list = noise_model.apply_programming_noise(weights)
+            drifted_weights = noise_model.apply_drift_noise_sweep(
+                programmed_weights, nu_drift_list, t_inference_list)
+
+            self.assertEqual(drifted_weights.shape, (len(t_inference_list), 10, 35))
+            for t_inference, weights_t in zip(t_inference_list, drifted_weights):
+                expected_weights = noise_model.apply_drift_noise(
+                    programmed_weights, nu_drift_list, t_inference)
+                self.assertTensorAlmostEqual(weights_t, expected_weights)
+
 
 class ConductanceConverterTest(AihwkitTestCase):
     """Conductance converter test."""
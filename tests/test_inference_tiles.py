@@ -12,16 +12,19 @@
 
 """Tests for inference tiles."""
 
+from copy import deepcopy
 from typing import Optional
+from unittest import SkipTest
 
 from parameterized import parameterized
-from torch import ones
+from torch import manual_seed, ones, randn
 from torch import Tensor
 from torch.nn.functional import mse_loss
 from torch.optim import SGD
 from torch.nn import Linear
 
-from aihwkit.nn import AnalogLinear
+from aihwkit.exceptions import ModuleError
+from aihwkit.nn import AnalogLinear, AnalogSequential, AnalogRNN, AnalogVanillaRNNCell
 from aihwkit.optim import AnalogSGD
 from aihwkit.simulator.configs import FloatingPointRPUConfig
 from aihwkit.simulator.configs.utils import (
@@ -163,6 +166,89 @@ class InferenceTileTest(ParametrizedTestCase):
 
         self.assertNotAlmostEqualTensor(model.analog_tile.alpha, ones((1,)))
 
+    def test_drift_sweep(self):
+        """Test drifting to several inference times in one sweep."""
+        layer, x = self.get_model_and_x()
+        model = AnalogSequential(layer)
+        t_inference_list = [0., 1., 20., 1000., 1e5]
+
+        model.eval()
+        pred_last = model(x)
+        t_visited = []
+        for t_inference in model.drift_analog_weights_sweep(t_inference_list):
+            t_visited.append(t_inference)
+            pred_drift = model(x)
+            self.assertNotAlmostEqualTensor(pred_last, pred_drift)
+            pred_last = pred_drift
+
+        self.assertEqual(t_visited, t_inference_list)
+        self.assertNotAlmostEqualTensor(layer.analog_tile.alpha, ones((1,)))
+
+        model.train()
+        with self.assertRaises(ModuleError):
+            next(model.drift_analog_weights_sweep(t_inference_list))
+
+    def test_weights_ensemble(self):
+        """Test evaluating an ensemble of weight realizations at once."""
+        x = Tensor([[0.1, 0.2, 0.4, 0.3], [0.2, 0.1, 0.1, 0.3], [-0.3, 0.2, 0.0, 0.1]])
+        labels = Tensor([0, 1, 1]).long()
+
+        rpu_config = self.get_rpu_config()
+        rpu_config.forward.is_perfect = True
+        rpu_config.noise_model = PCMLikeNoiseModel(g_max=25.0)
+
+        layer = AnalogLinear(4, 2, bias=True, rpu_config=rpu_config)
+        layer.set_weights(Tensor([[0.5, -0.2, 0.1, 0.3], [-0.4, 0.3, 0.2, -0.1]]),
+                          Tensor([0.1, -0.1]))
+        model = AnalogSequential(layer)
+        if self.use_cuda:
+            x = x.cuda()
+            labels = labels.cuda()
+            model.cuda()
+
+        analog_tile = layer.analog_tile
+        weights_before = Tensor(analog_tile.tile.get_weights())
+
+        model.eval()
+        with self.assertRaises(ModuleError):
+            model.forward_ensemble(x)
+
+        model.program_analog_weights_ensemble(3, t_inference=100.)
+        self.assertEqual(model.get_ensemble_size(), 3)
+        output = model.forward_ensemble(x)
+        self.assertEqual(output.shape, (3, 3, 2))
+        # The realizations do not replace the tile weights.
+        self.assertTensorAlmostEqual(Tensor(analog_tile.tile.get_weights()), weights_before)
+
+        for weights, alpha, output_k in zip(analog_tile.ensemble_weights,
+                                            analog_tile.ensemble_alpha, output):
+            self.assertTensorAlmostEqual(
+                output_k.cpu(),
+                (x.cpu() @ weights.cpu().T) * alpha.cpu() + layer.bias.detach().cpu())
+        self.assertNotAlmostEqualTensor(output[0], output[1])
+
+        accuracies, mean, std = model.ensemble_accuracy([(x, labels), (x, labels)])
+        self.assertEqual(accuracies.shape, (3,))
+        self.assertAlmostEqual(mean.item(), accuracies.mean().item())
+        self.assertAlmostEqual(std.item(), accuracies.std().item())
+
+        model.clear_analog_weights_ensemble()
+        self.assertEqual(analog_tile.get_ensemble_size(), 0)
+        self.assertTensorAlmostEqual(Tensor(analog_tile.tile.get_weights()), weights_before)
+
+    def test_weights_ensemble_rnn(self):
+        """Test that ensembles of analog RNNs cannot be evaluated at once."""
+        x = Tensor([[0.1, 0.2, 0.4, 0.3], [0.2, 0.1, 0.1, 0.3], [-0.3, 0.2, 0.0, 0.1]])
+        rpu_config = self.get_rpu_config()
+        rpu_config.noise_model = PCMLikeNoiseModel(g_max=25.0)
+
+        # Analog RNNs expect the sequence first.
+        rnn = AnalogRNN(AnalogVanillaRNNCell, 4, 2, rpu_config=rpu_config)
+        rnn.eval()
+        rnn.program_analog_weights_ensemble(3)
+        with self.assertRaises(ModuleError):
+            rnn.forward_ensemble(x.unsqueeze(0))
+
     def test_post_update_step_clip(self):
         """Tests whether post update diffusion is performed."""
         rpu_config = self.get_rpu_config()
@@ -183,6 +269,36 @@ class InferenceTileTest(ParametrizedTestCase):
         self.assertNotAlmostEqualTensor(tile_weights, weights)
         self.assertNotAlmostEqualTensor(tile_biases, biases)
 
+    def test_parameter_bindings_cache(self):
+        """Tests that the parameter bindings are only re-generated on changes."""
+        rpu_config = self.get_rpu_config()
+        rpu_config.clip.type = WeightClipType.FIXED_VALUE
+        rpu_config.clip.fixed_value = 0.3
+        analog_tile = self.get_tile(2, 3, rpu_config=rpu_config)
+
+        for _ in range(3):
+            analog_tile.post_update_step()
+        self.assertEqual(analog_tile.get_bindings_cache_misses(), 1)
+
+        config_version = analog_tile.rpu_config.get_version()
+        analog_tile.rpu_config.clip.fixed_value = 0.2
+        self.assertGreater(analog_tile.rpu_config.get_version(), config_version)
+        weight_clip_params = analog_tile.get_parameter_bindings('clip')
+        self.assertAlmostEqual(weight_clip_params.fixed_value, 0.2)
+        for _ in range(3):
+            analog_tile.post_update_step()
+        self.assertEqual(analog_tile.get_bindings_cache_misses(), 2)
+
+        # The parent references of the nested fields survive a copy.
+        rpu_config_copy = deepcopy(analog_tile.rpu_config)
+        config_version = rpu_config_copy.get_version()
+        rpu_config_copy.clip.fixed_value = 0.1
+        self.assertGreater(rpu_config_copy.get_version(), config_version)
+
+        analog_tile.get_parameter_bindings('modifier')
+        analog_tile.post_update_step()
+        self.assertEqual(analog_tile.get_bindings_cache_misses(), 3)
+
     @parameterized.expand([
         ('none', None,),
         ('dorefa', WeightModifierType.DOREFA,),
@@ -229,6 +345,31 @@ class InferenceTileTest(ParametrizedTestCase):
 
         self.assertTensorAlmostEqual(x_output, x_output_post_true)
 
+    def test_lazy_modifier(self):
+        """Tests that the lazily modified weights equal the stored ones."""
+        if self.use_cuda:
+            raise SkipTest('Lazy weight modifier only supported by CPU tiles')
+
+        manual_seed(1)
+        weights = randn(30, 40) * 0.1
+        x_input = randn(5, 40)
+        d_input = randn(5, 30)
+
+        results = []
+        for lazy_block_size in [0, 7]:
+            rpu_config = self.get_rpu_config()
+            rpu_config.modifier = self.get_modifier(WeightModifierType.MULT_NORMAL)
+            rpu_config.modifier.pdrop = 0.2
+            rpu_config.modifier.lazy_block_size = lazy_block_size
+
+            analog_tile = self.get_tile(30, 40, rpu_config=rpu_config)
+            analog_tile.set_weights(weights)
+            analog_tile.set_seed(123)
+            results.append((analog_tile.forward(x_input), analog_tile.backward(d_input)))
+
+        self.assertTensorAlmostEqual(results[0][0], results[1][0])
+        self.assertTensorAlmostEqual(results[0][1], results[1][1])
+
     @staticmethod
     def get_modifier(
             modifier_type: Optional[WeightModifierType]
@@ -67,9 +67,9 @@ class ConvolutionLayerTest(ParametrizedTestCase):
         return weights, biases
 
     @staticmethod
-    def train_model(model, loss_func, x_b, y_b):
+    def train_model(model, loss_func, x_b, y_b, **kwargs):
         """Train the model."""
-        opt = AnalogSGD(model.parameters(), lr=0.1)
+        opt = AnalogSGD(model.parameters(), lr=0.1, **kwargs)
         opt.regroup_param_groups(model)
 
         epochs = 10
@@ -133,6 +133,35 @@ class Convolution1dLayerTest(ConvolutionLayerTest):
         if self.bias:
             self.assertTensorAlmostEqual(bias_analog, bias)
 
+    def test_torch_train_original_layer_chunked_update(self):
+        """Test the chunked, eager and background update, having the digital layer as
+        reference."""
+        loss_func = mse_loss
+        y_b = randn(3, 3, 5)
+        x_b = randn(3, 2, 4)
+
+        if self.use_cuda:
+            y_b = y_b.cuda()
+            x_b = x_b.cuda()
+
+        for eager_update, async_update in [(False, False), (True, False), (False, True)]:
+            model = self.get_digital_layer(in_channels=2, out_channels=3, kernel_size=4,
+                                           padding=2)
+            analog_model = self.get_layer(in_channels=2, out_channels=3, kernel_size=4,
+                                          padding=2)
+            self.set_weights_from_digital_model(analog_model, model)
+
+            self.train_model(model, loss_func, x_b, y_b)
+            self.train_model(analog_model, loss_func, x_b, y_b, update_chunk_size=7,
+                             eager_update=eager_update, async_update=async_update)
+
+            weight, bias = self.get_weights_from_digital_model(analog_model, model)
+            weight_analog, bias_analog = self.get_weights_from_analog_model(analog_model)
+
+            self.assertTensorAlmostEqual(weight_analog, weight)
+            if self.bias:
+                self.assertTensorAlmostEqual(bias_analog, bias)
+
     def test_torch_train_original_layer_multiple(self):
         """Test the backward pass, having the digital layer as reference."""
         model = Sequential(
@@ -258,6 +287,38 @@ class Convolution2dLayerTest(ConvolutionLayerTest):
 
     digital_layer_cls = torch_Conv2d
 
+    def test_fold_indices_cache(self):
+        """Test switching between input shapes with the fold indices cache."""
+        model = self.get_digital_layer(in_channels=2, out_channels=3, kernel_size=3, padding=1)
+        analog_model = self.get_layer(in_channels=2, out_channels=3, kernel_size=3, padding=1)
+        self.set_weights_from_digital_model(analog_model, model)
+
+        # The first two shapes have the same number of elements.
+        shapes = [(4, 6), (6, 4), (5, 5), (4, 6), (6, 4)]
+        for shape in shapes:
+            x = randn(3, 2, *shape)
+            if self.use_cuda:
+                x = x.cuda()
+
+            # Repeated calls with the same shape do not use the cache.
+            for _ in range(2):
+                self.assertTensorAlmostEqual(analog_model(x), model(x))
+
+        cache = analog_model.fold_indices_cache
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(len(cache), 3)
+
+        # Evicted indices are re-calculated (and their gather plans re-built).
+        cache.max_size = 1
+        for shape in [(3, 3), (4, 6)]:
+            x = randn(3, 2, *shape)
+            if self.use_cuda:
+                x = x.cuda()
+            self.assertTensorAlmostEqual(analog_model(x), model(x))
+        self.assertEqual(cache.misses, 5)
+        self.assertEqual(len(cache), 1)
+
     def test_torch_original_layer(self):
         """Test a single layer, having the digital layer as reference."""
         # This tests the forward pass
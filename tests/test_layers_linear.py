@@ -14,7 +14,7 @@
 
 from numpy.testing import assert_array_almost_equal
 
-from torch import Tensor, manual_seed
+from torch import Tensor, cat, manual_seed, ones, rand
 from torch.nn import Sequential, Linear as torchLinear
 from torch.nn.functional import mse_loss
 from torch.optim import SGD
@@ -39,9 +39,9 @@ class LinearLayerTest(ParametrizedTestCase):
     """Linear layer abstractions tests."""
 
     @staticmethod
-    def train_model(model, loss_func, x_b, y_b):
+    def train_model(model, loss_func, x_b, y_b, **kwargs):
         """Train the model."""
-        opt = AnalogSGD(model.parameters(), lr=0.5)
+        opt = AnalogSGD(model.parameters(), lr=0.5, **kwargs)
         opt.regroup_param_groups(model)
 
         epochs = 100
@@ -102,6 +102,74 @@ class LinearLayerTest(ParametrizedTestCase):
         self.train_model(model, loss_func, x_b, y_b)
         self.assertLess(loss_func(model(x_b), y_b), initial_loss)
 
+    def test_gradient_buffer(self):
+        """Check that the activations and errors are stored in the buffers."""
+        manual_seed(4321)
+        model = self.get_layer(3, 2)
+        x_bs = [rand(n_rows, 3) for n_rows in [2, 5, 1]]
+        if self.use_cuda:
+            x_bs = [x_b.cuda() for x_b in x_bs]
+            model = model.cuda()
+
+        opt = AnalogSGD(model.parameters(), lr=0.1)
+        opt.regroup_param_groups(model)
+        analog_ctx = model.analog_tile.get_analog_ctx()
+
+        data_ptr = None
+        for _ in range(2):
+            opt.zero_grad()
+            sum(model(x_b).sum() for x_b in x_bs).backward()
+            if analog_ctx.use_torch_update:
+                self.assertFalse(analog_ctx.has_gradient())
+                return
+
+            self.assertEqual(analog_ctx.gradient_trace.n_buffered, 8)
+            self.assertEqual(analog_ctx.analog_input, [])
+            x_input, d_input = analog_ctx.get_gradient()
+            # The backward passes might be in any order.
+            self.assertEqual(x_input.shape, (8, 3))
+            self.assertTensorAlmostEqual(x_input.sum(0), cat(x_bs).sum(0))
+            self.assertEqual(d_input.shape, (8, 2))
+            self.assertTensorAlmostEqual(d_input, ones(8, 2, device=d_input.device))
+            if data_ptr is not None:
+                # The buffers are re-used.
+                self.assertEqual(x_input.data_ptr(), data_ptr)
+            data_ptr = x_input.data_ptr()
+
+            opt.step()
+            self.assertFalse(analog_ctx.has_gradient())
+
+        analog_ctx.release_buffers()
+        self.assertIsNone(analog_ctx.gradient_trace.input_buffer)
+        self.assertIsNone(analog_ctx.gradient_trace.grad_output_buffer)
+
+    def test_chunked_update(self):
+        """Check the chunked, eager and background update."""
+        x_b = rand(10, 4)
+        y_b = rand(10, 2)
+        if self.use_cuda:
+            x_b = x_b.cuda()
+            y_b = y_b.cuda()
+
+        losses = []
+        for chunk_size, eager_update, async_update in [
+                (0, False, False), (3, False, False), (3, True, False), (0, True, False),
+                (0, False, True), (3, False, True)]:
+            manual_seed(4321)
+            rpu_config = self.get_rpu_config()
+            model = self.get_layer(4, 2, rpu_config=rpu_config)
+            if self.use_cuda:
+                model = model.cuda()
+
+            initial_loss = mse_loss(model(x_b), y_b)
+            self.train_model(model, mse_loss, x_b, y_b, update_chunk_size=chunk_size,
+                             eager_update=eager_update, async_update=async_update)
+            losses.append(mse_loss(model(x_b), y_b).item())
+            self.assertLess(losses[-1], initial_loss)
+
+            if isinstance(rpu_config, FloatingPointRPUConfig):
+                self.assertAlmostEqual(losses[-1], losses[0], places=5)
+
     def test_seed(self):
         """Check layer seed."""
 
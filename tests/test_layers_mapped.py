@@ -168,6 +168,53 @@ class MappedLayerLinearTest(ParametrizedTestCase):
         # Make sure that the train model produces the same forward pass
         self.assertTensorAlmostEqual(model(in_vectors), mapped_model(in_vectors), decimal=DECIMAL)
 
+    def test_training_concurrent(self):
+        """ Test of training of a mapped layer with concurrent tiles"""
+        manual_seed(123)
+
+        in_features = 12
+        out_features = 13
+        batch_size = 10
+
+        rpu_config = self.get_rpu_config()
+        rpu_config.mapping.max_input_size = 10
+        rpu_config.mapping.max_output_size = 6
+
+        model = self.get_layer(in_features, out_features, rpu_config=rpu_config)
+        weight, bias = model.get_weights()
+
+        weight = randn(*weight.shape)
+        if self.bias:
+            bias = randn(*bias.shape)
+
+        mapped_model = self.get_mapped_model(model, rpu_config)
+        mapped_model.set_weights(weight, bias)
+
+        rpu_config.mapping.tile_workers = 4
+        concurrent_model = self.get_mapped_model(model, rpu_config)
+        concurrent_model.set_weights(weight, bias)
+
+        in_vectors = randn(*([batch_size, in_features] + self.get_image_size(model)))
+
+        if self.use_cuda:
+            in_vectors = in_vectors.cuda()
+            mapped_model = mapped_model.cuda()
+            concurrent_model = concurrent_model.cuda()
+
+        out_vectors = randn(*mapped_model(in_vectors).shape)
+        if self.use_cuda:
+            out_vectors = out_vectors.cuda()
+
+        self.assertTensorAlmostEqual(mapped_model(in_vectors), concurrent_model(in_vectors),
+                                     decimal=DECIMAL)
+
+        loss = self.train_model(mapped_model, in_vectors, out_vectors)
+        concurrent_loss = self.train_model(concurrent_model, in_vectors, out_vectors)
+
+        self.assertTensorAlmostEqual(loss, concurrent_loss, decimal=DECIMAL)
+        self.assertTensorAlmostEqual(mapped_model(in_vectors), concurrent_model(in_vectors),
+                                     decimal=DECIMAL)
+
     def test_training_after_save(self):
         """ Test training after it was saved """
         manual_seed(123)
@@ -11,12 +11,16 @@
 # that they have been altered from the originals.
 
 """Tests for RNN layers."""
+from unittest import SkipTest
+
 from torch import randn, ones, no_grad
 from torch.nn import MSELoss
 from numpy.testing import assert_array_almost_equal, assert_raises
 
 from aihwkit.optim import AnalogSGD
 from aihwkit.optim.context import AnalogContext
+from aihwkit.nn.modules.rnn.layers import AnalogRNNLayer
+from aihwkit.simulator.configs.utils import WeightModifierType
 
 from .helpers.decorators import parametrize_over_layers
 from .helpers.layers import LSTM, LSTMCuda, GRU, GRUCuda, VanillaRNN, VanillaRNNCuda, \
@@ -62,6 +66,12 @@ class RNNLayerTest(ParametrizedTestCase):
 
         return pred.detach().cpu().numpy()
 
+    @staticmethod
+    def get_analog_tiles(model):
+        """Returns the analog tiles of a model."""
+        return [param.analog_tile for param in model.parameters()
+                if isinstance(param, AnalogContext)]
+
     @staticmethod
     def train_once_bidir(model, y_in, y_out, analog_if):
         """Train once."""
@@ -216,6 +226,72 @@ class RNNLayerTest(ParametrizedTestCase):
             assert_array_almost_equal(par_item.detach().cpu().numpy(),
                                       rnn_analog_pars[par_name].detach().cpu().numpy())
 
+    def test_layer_training_hoisted_input(self):
+        """Test AnalogLSTM layer training with hoisted input projections."""
+        input_size = 4
+        hidden_size = 5
+        seq_length = 6
+        batch_size = 3
+
+        y_in = randn(seq_length, batch_size, input_size)
+        y_out = ones(seq_length, batch_size, 1)
+
+        for bidir in [False, True]:
+            rnn_analog = self.get_layer(input_size=input_size,
+                                        hidden_size=hidden_size,
+                                        num_layers=2,
+                                        bidir=bidir)
+            rnn_hoisted = self.get_layer(input_size=input_size,
+                                         hidden_size=hidden_size,
+                                         num_layers=2,
+                                         bidir=bidir,
+                                         hoist_input=True)
+            rnn_hoisted.load_state_dict(rnn_analog.state_dict())
+
+            if self.use_cuda:
+                y_in = y_in.cuda()
+                y_out = y_out.cuda()
+                rnn_analog.cuda()
+                rnn_hoisted.cuda()
+
+            with no_grad():
+                assert_array_almost_equal(rnn_analog(y_in)[0].cpu(),
+                                          rnn_hoisted(y_in)[0].cpu())
+
+            pred = self.train_once_bidir(rnn_analog, y_in, y_out, True)
+            pred_hoisted = self.train_once_bidir(rnn_hoisted, y_in, y_out, True)
+            assert_array_almost_equal(pred, pred_hoisted)
+
+            for analog_tile, analog_tile_hoisted in zip(self.get_analog_tiles(rnn_analog),
+                                                        self.get_analog_tiles(rnn_hoisted)):
+                assert_array_almost_equal(analog_tile.tile.get_weights(),
+                                          analog_tile_hoisted.tile.get_weights())
+
+    def test_hoisted_input_weight_modifier(self):
+        """Test that the input is not hoisted with a weight modifier in training."""
+        rpu_config = self.get_rpu_config()
+        if not hasattr(rpu_config, 'modifier'):
+            raise SkipTest('Weight modifier not available')
+        rpu_config.modifier.type = WeightModifierType.ADD_NORMAL
+        rpu_config.modifier.std_dev = 0.1
+
+        rnn = self.get_layer(input_size=4, hidden_size=5, rpu_config=rpu_config,
+                             hoist_input=True)
+        layer = next(module for module in rnn.modules()
+                     if isinstance(module, AnalogRNNLayer))
+        y_in = randn(6, 3, 4)
+        if self.use_cuda:
+            y_in = y_in.cuda()
+            rnn.cuda()
+
+        rnn.train()
+        if hasattr(layer.cell, 'project_input'):
+            self.assertTrue(layer.modifies_input_weights())
+        self.assertIs(layer.get_steps(y_in)[1], layer.cell)
+
+        rnn.eval()
+        self.assertFalse(layer.modifies_input_weights())
+
     def test_bidir_layer_training(self):
         """Test AnalogLSTM bidirectional layer training."""
         # pylint: disable=too-many-locals, too-many-statements
@@ -12,12 +12,16 @@
 
 """Tests for optimizers."""
 
-from torch import Tensor, manual_seed
+from time import sleep
+
+from torch import Tensor, manual_seed, rand
 from torch.nn import Linear
 from torch.optim import SGD, AdamW
 from torch.nn.functional import mse_loss
 
-from aihwkit.optim import AnalogOptimizer
+from aihwkit.nn import AnalogLinear
+from aihwkit.optim import AnalogOptimizer, AnalogSGD
+from aihwkit.simulator.configs import FloatingPointRPUConfig
 
 from .helpers.testcases import AihwkitTestCase
 
@@ -98,3 +102,105 @@ class InferenceOptimizerTest(AihwkitTestCase):
 
         self.assertAlmostEqual(loss1, loss2)
         self.assertTensorAlmostEqual(model1.weight, model2.weight)
+
+
+class AnalogSGDTest(AihwkitTestCase):
+    """Tests for the update options of the AnalogSGD."""
+
+    @staticmethod
+    def get_model(tile_workers=0, **kwargs):
+        """Return an analog layer and its optimizer."""
+        rpu_config = FloatingPointRPUConfig()
+        rpu_config.mapping.tile_workers = tile_workers
+        manual_seed(4321)
+        model = AnalogLinear(4, 2, rpu_config=rpu_config)
+        optimizer = AnalogSGD(model.parameters(), lr=0.1, **kwargs)
+        optimizer.regroup_param_groups(model)
+
+        return model, optimizer
+
+    def test_update_options(self):
+        """Test setting the update options in the analog contexts."""
+        model, _ = self.get_model(update_chunk_size=3, async_update=True)
+        analog_ctx = model.analog_tile.analog_ctx
+
+        self.assertEqual(analog_ctx.update_chunk_size, 3)
+        self.assertFalse(analog_ctx.eager_update)
+        self.assertTrue(analog_ctx.async_update)
+
+    def test_async_update_error(self):
+        """Test re-raising the error of a background update in the step."""
+        model, optimizer = self.get_model(async_update=True)
+
+        def _update(*_):
+            raise RuntimeError('update failed')
+
+        model.analog_tile.update = _update
+        model(rand(3, 4)).sum().backward()
+
+        with self.assertRaises(RuntimeError):
+            optimizer.step()
+        self.assertIsNone(model.analog_tile.analog_ctx.gradient_trace.pending_update)
+
+    def test_async_update_order(self):
+        """Test applying several background updates of a tile in order."""
+        model, optimizer = self.get_model(tile_workers=4, async_update=True)
+        ref_model, ref_optimizer = self.get_model()
+
+        analog_tile = model.analog_tile
+        tile_update = analog_tile.update
+        n_started = []
+        x_updated = []
+
+        def _update(x_input, d_input):
+            # The first update is the slowest.
+            n_started.append(1)
+            if len(n_started) == 1:
+                sleep(0.2)
+            x_updated.append(x_input.clone())
+            tile_update(x_input, d_input)
+
+        analog_tile.update = _update
+
+        x_inputs = [rand(3, 4) for _ in range(3)]
+        optimizer.zero_grad()
+        ref_optimizer.zero_grad()
+        for x_input in x_inputs:
+            model(x_input).sum().backward()
+            ref_model(x_input).sum().backward()
+        optimizer.step()
+        ref_optimizer.step()
+
+        self.assertEqual(len(x_updated), len(x_inputs))
+        for x_input, x_expected in zip(x_updated, x_inputs):
+            self.assertTensorAlmostEqual(x_input, x_expected)
+        self.assertTensorAlmostEqual(model.get_weights()[0], ref_model.get_weights()[0])
+
+    def test_async_update_backward(self):
+        """Test the backward passes after a background update of the tile."""
+        model, optimizer = self.get_model(tile_workers=1, async_update=True)
+        ref_model, ref_optimizer = self.get_model(eager_update=True)
+
+        tile_update = model.analog_tile.update
+
+        def _update(x_input, d_input):
+            sleep(0.2)
+            tile_update(x_input, d_input)
+
+        model.analog_tile.update = _update
+
+        x_inputs = [rand(3, 4, requires_grad=True) for _ in range(2)]
+        x_refs = [x_input.detach().clone().requires_grad_() for x_input in x_inputs]
+        optimizer.zero_grad()
+        ref_optimizer.zero_grad()
+        outputs = [model(x_input).sum() for x_input in x_inputs]
+        ref_outputs = [ref_model(x_ref).sum() for x_ref in x_refs]
+        for output, ref_output in zip(outputs, ref_outputs):
+            output.backward()
+            ref_output.backward()
+        optimizer.step()
+        ref_optimizer.step()
+
+        for x_input, x_ref in zip(x_inputs, x_refs):
+            self.assertTensorAlmostEqual(x_input.grad, x_ref.grad)
+        self.assertTensorAlmostEqual(model.get_weights()[0], ref_model.get_weights()[0])
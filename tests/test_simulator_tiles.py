@@ -21,6 +21,7 @@ from aihwkit.simulator.configs.devices import (
     ReferenceUnitCell)
 from aihwkit.simulator.configs.utils import VectorUnitCellUpdatePolicy
 from aihwkit.simulator.configs import UnitCellRPUConfig
+from aihwkit.exceptions import TileError
 
 from .helpers.decorators import parametrize_over_tiles
 from .helpers.testcases import ParametrizedTestCase
@@ -123,6 +124,27 @@ class TileTest(ParametrizedTestCase):
         self.assertEqual(tile_biases, None)
         self.assertTensorAlmostEqual(tile_weights, weights)
 
+    def test_get_weights_view(self):
+        """Test the views of the tile weights."""
+        analog_tile = self.get_tile(2, 3, bias=True)
+        if analog_tile.is_cuda and analog_tile.shared_weights is None:
+            with self.assertRaises(TileError):
+                analog_tile.get_weights_view()
+            return
+
+        weights = Tensor([[0.1, 0.2, 0.3], [0.4, 0.5, 0.1]])
+        biases = Tensor([-0.1, -0.2])
+        analog_tile.set_weights(weights, biases)
+
+        weights_view, biases_view = analog_tile.get_weights_view()
+        self.assertTensorAlmostEqual(weights_view, weights)
+        self.assertTensorAlmostEqual(biases_view, biases)
+
+        # Views follow the tile weights.
+        analog_tile.set_weights(-weights, -biases)
+        self.assertTensorAlmostEqual(weights_view, -weights)
+        self.assertTensorAlmostEqual(biases_view, -biases)
+
     def test_get_hidden_parameters(self):
         """Test getting hidden parameters."""
         analog_tile = self.get_tile(4, 5)
@@ -287,3 +309,21 @@ class TileTest(ParametrizedTestCase):
                                          hidden_par_after['hidden_weights_0'])
             self.assertNotAlmostEqualTensor(hidden_par['hidden_weights_1'],
                                             hidden_par_after['hidden_weights_1'])
+
+    def test_set_seed(self):
+        """Test that the seed makes the forward pass reproducible."""
+        if self.use_cuda:
+            raise SkipTest('Seed only used by CPU tiles')
+
+        analog_tile = self.get_tile(4, 5)
+        analog_tile.set_weights(Tensor([[0.1, 0.2, 0.3, 0.4, 0.5]] * 4), Tensor([0.1] * 4))
+        x_input = Tensor([[0.1, 0.2, 0.3, 0.4, 0.5], [0.5, -0.4, 0.3, -0.2, 0.1]])
+
+        analog_tile.set_seed(123)
+        self.assertEqual(analog_tile.get_seed(), 123)
+        y_1 = analog_tile.forward(x_input, is_test=True)
+
+        analog_tile.set_seed(123)
+        y_2 = analog_tile.forward(x_input, is_test=True)
+
+        self.assertTensorAlmostEqual(y_1, y_2)
@@ -12,6 +12,8 @@
 
 """Some more tests for specific tiles."""
 
+from unittest import SkipTest
+
 from torch import ones, Tensor
 from torch.nn.functional import mse_loss
 
@@ -161,3 +163,30 @@ class TransferCompoundTest(ParametrizedTestCase):
             self.assertAlmostEqual(bias[0].item(), gamma*(a - b) + c - d, 5)
 
         self.assertAlmostEqual(weight[0][0].item(), gamma*(a - b) + c - d, 5)
+
+    def test_transfer_timings(self):
+        """Test the batched transfer and its timings."""
+        if self.use_cuda:
+            raise SkipTest('Transfer timings only available for CPU tiles')
+
+        rpu_config = self.get_transfer_compound(gamma=0.1)
+        rpu_config.device.n_reads_per_transfer = 3
+        rpu_config.device.transfer_every = 1
+
+        model = self.get_layer(in_features=4, out_features=3, rpu_config=rpu_config)
+        opt = AnalogSGD(model.parameters(), lr=0.1)
+
+        x_b = Tensor([[0.1, 0.2, 0.3, 0.4], [0.2, 0.4, 0.1, 0.3]])
+        y_b = Tensor([[0.3, 0.1, 0.2], [0.6, 0.2, 0.4]])
+
+        epochs = 3
+        for _ in range(epochs):
+            opt.zero_grad()
+            loss = mse_loss(model(x_b), y_b)
+            loss.backward()
+            opt.step()
+
+        timings = model.analog_tile.get_transfer_timings()
+        self.assertEqual(timings['n_transfers'], epochs)
+        self.assertGreater(timings['update_time'], 0.0)
+        self.assertGreater(timings['transfer_time'], 0.0)
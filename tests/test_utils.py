@@ -13,7 +13,8 @@
 # pylint: disable=too-many-locals, too-many-public-methods, no-member
 """Test for different utility functionality."""
 
-from tempfile import TemporaryFile
+from os import path as os_path
+from tempfile import TemporaryDirectory, TemporaryFile
 from copy import deepcopy
 from unittest import SkipTest
 
@@ -37,6 +38,7 @@ from aihwkit.simulator.configs.utils import IOParameters, UpdateParameters, Mapp
 from aihwkit.simulator.rpu_base import cuda
 from aihwkit.exceptions import TileError, ModuleError
 from aihwkit.nn.conversion import convert_to_analog
+from aihwkit.utils.checkpoint import load_analog_checkpoint, save_analog_checkpoint
 
 from .helpers.decorators import parametrize_over_layers
 from .helpers.layers import (
@@ -415,6 +417,55 @@ class SerializationTest(ParametrizedTestCase):
         new_hidden_parameters = new_analog_tile.tile.get_hidden_parameters()
         assert_array_almost_equal(hidden_parameters, new_hidden_parameters)
 
+    def test_save_load_analog_checkpoint(self):
+        """Test saving and loading a streaming checkpoint."""
+        model = self.get_layer()
+
+        loss_func = mse_loss
+        if isinstance(model, (AnalogConv2d, AnalogConv2dMapped)):
+            input_x = Tensor(rand(2, 2, 3, 3))*0.2
+            input_y = Tensor(rand(2, 3, 5, 5))*0.2
+        else:
+            input_x = Tensor(rand(2, model.in_features))*0.2
+            input_y = Tensor(rand(2, model.out_features))*0.2
+
+        if self.use_cuda:
+            input_x = input_x.cuda()
+            input_y = input_y.cuda()
+
+        self.train_model(model, loss_func, input_x, input_y)
+        (_, _, tile_weights, tile_biases, _) = self.get_layer_and_tile_weights(model)
+        hidden_parameters = self.get_analog_tile(model).tile.get_hidden_parameters()
+
+        with TemporaryDirectory() as checkpoint_dir:
+            # Tile files of an earlier checkpoint are removed.
+            stale_file = os_path.join(checkpoint_dir, 'tile_99.bin')
+            with open(stale_file, 'wb'):
+                pass
+            save_analog_checkpoint(model, checkpoint_dir)
+            self.assertFalse(os_path.exists(stale_file))
+            self.assertTrue(os_path.exists(os_path.join(checkpoint_dir, 'tile_0.bin')))
+
+            for n_workers in [1, None]:
+                new_model = self.get_layer()
+                load_analog_checkpoint(new_model, checkpoint_dir, n_workers=n_workers)
+
+                (new_model_weights, new_model_biases,
+                 new_tile_weights, new_tile_biases, _) = \
+                    self.get_layer_and_tile_weights(new_model)
+                assert_array_almost_equal(tile_weights, new_model_weights)
+                assert_array_almost_equal(tile_weights, new_tile_weights)
+                if self.bias:
+                    assert_array_almost_equal(tile_biases, new_model_biases)
+                    assert_array_almost_equal(tile_biases, new_tile_biases)
+
+                new_hidden_parameters = \
+                    self.get_analog_tile(new_model).tile.get_hidden_parameters()
+                assert_array_almost_equal(hidden_parameters, new_hidden_parameters)
+
+                # training continues after loading
+                self.train_model(new_model, loss_func, input_x, input_y)
+
     def test_save_load_out_scaling_alpha(self):
         """Test saving and loading a device with out_scaling_alpha."""
         # Create the device and the array.